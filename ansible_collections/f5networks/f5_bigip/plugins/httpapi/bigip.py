@@ -29,6 +29,10 @@ options:
   send_telemetry:
     description:
       - If C(yes) anonymous telemetry data is sent to F5
+      - Telemetry records are queued in the C(~/.ansible/f5_teem_spool.jsonl) spool file on the controller and
+        sent in batches by the persistent connection in the background, tasks do not wait for them to be sent.
+      - No request is sent to the device for telemetry, the software version of the device is reported when
+        the module read it or when it is in the metadata cache, see C(metadata_ttl).
     default: True
     ini:
     - section: defaults
@@ -37,21 +41,152 @@ options:
       - name: F5_TELEMETRY_OFF
     vars:
       - name: f5_telemetry
+  download_concurrency:
+    description:
+      - The number of file chunks requested at the same time when downloading files from the device,
+        for example with the C(bigip_ucs_fetch), C(bigip_qkview) or C(bigip_asm_policy_fetch) modules.
+      - With the default value of C(1), files are downloaded one chunk after another.
+      - With values greater than C(1), each chunk is written directly to its position in the destination file,
+        and the chunk size adapts to the measured transfer time. The size of the downloaded file is verified when
+        the transfer completes.
+      - Interrupted parallel downloads are resumed by the next download to the same destination, only the
+        missing chunks are requested again. Progress is tracked in a C(.ranges) file next to the destination,
+        which is removed once the download completes.
+    type: int
+    default: 1
+    ini:
+    - section: defaults
+      key: f5_download_concurrency
+    env:
+      - name: F5_DOWNLOAD_CONCURRENCY
+    vars:
+      - name: f5_download_concurrency
+    version_added: "2.1.0"
+  upload_concurrency:
+    description:
+      - The number of file chunks sent at the same time when uploading files to the device,
+        for example with the C(bigip_ucs), C(bigip_software_image) or C(bigip_ssl_key_cert) modules.
+      - With the default value of C(1), files are uploaded one chunk after another.
+      - With values greater than C(1), the first chunk of the file is sent on its own, the following chunks
+        are sent concurrently, and the final chunk is sent once every other chunk was received by the device.
+      - Regardless of this setting, a failed chunk is retried on its own, without restarting the upload, and the
+        chunk size adapts to the measured transfer time.
+    type: int
+    default: 1
+    ini:
+    - section: defaults
+      key: f5_upload_concurrency
+    env:
+      - name: F5_UPLOAD_CONCURRENCY
+    vars:
+      - name: f5_upload_concurrency
+    version_added: "2.1.0"
+  metadata_ttl:
+    description:
+      - The number of seconds device metadata, such as the software version, the provisioned modules and the
+        installed ATC packages, is cached by the persistent connection and shared between tasks.
+      - The default value of C(0) disables the cache, every task then requests the metadata it needs from the device.
+      - Modules which change the cached metadata, for example C(bigip_software_install), C(bigip_lx_package), or
+        C(bigip_config) when resetting the configuration, invalidate the cache.
+    type: int
+    default: 0
+    ini:
+    - section: defaults
+      key: f5_metadata_ttl
+    env:
+      - name: F5_METADATA_TTL
+    vars:
+      - name: f5_metadata_ttl
+    version_added: "2.1.0"
+  token_cache:
+    description:
+      - The path to a file on the controller where authentication tokens are kept between persistent connections.
+      - When set, a connection to the same device with the same user and login provider reuses a cached token
+        which is still valid instead of logging in again, and tokens are not deleted when the connection closes.
+      - The file is created readable only by its owner, it contains valid authentication tokens.
+      - Independently of this setting, tokens are extended before they expire, and a new login is done only once
+        a token reached the longest lifetime accepted by the device.
+    type: path
+    ini:
+    - section: defaults
+      key: f5_token_cache
+    env:
+      - name: F5_TOKEN_CACHE
+    vars:
+      - name: f5_token_cache
+    version_added: "2.1.0"
+  perf_stats:
+    description:
+      - If C(yes) the persistent connection records the method, endpoint, status, size and duration of every
+        request sent to the device, and modules return a summary of their requests in the C(_f5_perf) key.
+      - The summary lists the request count and totals of the module run, and the endpoints which took the most
+        time. Object names in request paths are replaced with C({name}), so requests to objects of the same kind
+        are added up.
+    type: bool
+    default: False
+    ini:
+    - section: defaults
+      key: f5_perf_stats
+    env:
+      - name: F5_PERF_STATS
+    vars:
+      - name: f5_perf_stats
+    version_added: "2.1.0"
+  perf_trace:
+    description:
+      - The path to a file on the controller where a record of every request sent to the device is appended,
+        to profile plays offline.
+      - Setting this option records requests even when C(perf_stats) is disabled.
+    type: path
+    ini:
+    - section: defaults
+      key: f5_perf_trace
+    env:
+      - name: F5_PERF_TRACE
+    vars:
+      - name: f5_perf_trace
+    version_added: "2.1.0"
+  perf_trace_format:
+    description:
+      - The format of the C(perf_trace) file.
+      - With C(jsonl) every request is written as a JSON object on its own line.
+      - With C(chrome) requests are written as Chrome trace events, the file can be loaded in
+        C(chrome://tracing) or U(https://ui.perfetto.dev).
+    type: str
+    choices:
+      - jsonl
+      - chrome
+    default: jsonl
+    ini:
+    - section: defaults
+      key: f5_perf_trace_format
+    env:
+      - name: F5_PERF_TRACE_FORMAT
+    vars:
+      - name: f5_perf_trace_format
+    version_added: "2.1.0"
 version_added: "1.0.0"
 author:
   - Wojciech Wypior <w.wypior@f5.com>
 """
 import os
+import threading
+import time
+import uuid
 
-from tempfile import NamedTemporaryFile
+from concurrent.futures import ThreadPoolExecutor
 
-from ansible.module_utils.basic import to_text
+from ansible.module_utils.basic import to_bytes, to_text
 from ansible.plugins.httpapi import HttpApiBase
 from ansible.module_utils.six.moves.urllib.error import HTTPError
 from ansible.errors import AnsibleConnectionFailure
 
+from ansible_collections.f5networks.f5_bigip.plugins.module_utils.jsoncodec import loads as json_loads
+from ansible_collections.f5networks.f5_bigip.plugins.module_utils.perf import RequestRecorder, summarize
+from ansible_collections.f5networks.f5_bigip.plugins.module_utils.teem import TeemSpool
+from ansible_collections.f5networks.f5_bigip.plugins.module_utils.tokens import TokenCache, token_cache_key
 from ansible_collections.f5networks.f5_bigip.plugins.module_utils.constants import (
-    LOGIN, LOGOUT, BASE_HEADERS
+    LOGIN, LOGOUT, BASE_HEADERS, TOKEN_REFRESH_MARGIN, TOKEN_MAX_TIMEOUT
 )
 from ansible_collections.f5networks.f5_bigip.plugins.module_utils.common import F5ModuleError
 
@@ -62,23 +197,182 @@ except ImportError:
     import simplejson as json
 
 
+class TransferRanges(object):
+    """Hands out the byte ranges of a chunked file transfer
+
+    The size of the ranges handed out adapts to the time the previous ranges took to
+    transfer, growing on fast links and shrinking on slow or unreliable ones.
+    """
+
+    # The time a single range request should take, in seconds.
+    target_time = 2
+    min_chunk_size = 128 * 1024
+    max_chunk_size = 1024 * 1024
+
+    def __init__(self, size, chunk_size):
+        self.size = size
+        self.chunk_size = chunk_size
+        self.pending = [(0, size)] if size else []
+        self.lock = threading.Lock()
+
+    def next(self):
+        """Returns the next range to transfer, or None when every range was handed out"""
+        with self.lock:
+            if not self.pending:
+                return None
+            start, end = self.pending[0]
+            stop = min(start + self.chunk_size, end)
+            if stop == end:
+                self.pending.pop(0)
+            else:
+                self.pending[0] = (stop, end)
+            return start, stop
+
+    def adapt(self, elapsed):
+        """Adjust the size of the next ranges to the time the last range took to transfer"""
+        with self.lock:
+            if elapsed < self.target_time / 2:
+                self.chunk_size = min(self.chunk_size * 2, self.max_chunk_size)
+            elif elapsed > self.target_time * 2:
+                self.chunk_size = max(self.chunk_size // 2, self.min_chunk_size)
+
+
+class DownloadRanges(TransferRanges):
+    """Tracks the byte ranges of a parallel download
+
+    The ranges already written to the destination file are persisted in a state file
+    next to the destination, so a failed download can be resumed by requesting only
+    the ranges that are still missing.
+    """
+
+    def __init__(self, url, dest, size, chunk_size=512 * 1024):
+        super(DownloadRanges, self).__init__(size, chunk_size)
+        self.url = url
+        self.dest = dest
+        self.state_file = '{0}.ranges'.format(dest)
+        self.done = []
+
+    def load(self):
+        """Load the ranges completed by a previous attempt
+
+        Returns:
+            bool: True if a previous attempt of the same download was found. False otherwise.
+        """
+        if not os.path.exists(self.state_file) or not os.path.exists(self.dest):
+            return False
+        try:
+            with open(self.state_file) as fh:
+                state = json.load(fh)
+        except ValueError:
+            return False
+        if state.get('url') != self.url or state.get('size') != self.size:
+            return False
+        self.done = [tuple(x) for x in state.get('done', [])]
+        return True
+
+    def save(self):
+        tmp = '{0}.tmp'.format(self.state_file)
+        with open(tmp, 'w') as fh:
+            json.dump(dict(url=self.url, size=self.size, done=self.done), fh)
+        os.replace(tmp, self.state_file)
+
+    def remove(self):
+        if os.path.exists(self.state_file):
+            os.remove(self.state_file)
+
+    def missing(self):
+        """Returns the ranges, as (start, end) tuples with exclusive end, not yet downloaded"""
+        result = []
+        start = 0
+        for done_start, done_end in sorted(self.done):
+            if done_start > start:
+                result.append((start, done_start))
+            start = max(start, done_end)
+        if start < self.size:
+            result.append((start, self.size))
+        return result
+
+    def plan(self):
+        self.pending = self.missing()
+
+    def complete(self, start, stop, elapsed):
+        with self.lock:
+            merged = []
+            for done_start, done_end in sorted(self.done + [(start, stop)]):
+                if merged and done_start <= merged[-1][1]:
+                    merged[-1] = (merged[-1][0], max(merged[-1][1], done_end))
+                else:
+                    merged.append((done_start, done_end))
+            self.done = merged
+            self.save()
+        self.adapt(elapsed)
+
+    def verify(self):
+        if self.missing():
+            raise F5ModuleError(
+                "Download of {0} is incomplete, missing byte ranges: {1}".format(self.url, self.missing())
+            )
+        actual = os.stat(self.dest).st_size
+        if actual != self.size:
+            raise F5ModuleError(
+                "Downloaded file size {0} does not match the expected size {1}.".format(actual, self.size)
+            )
+
+
+class UploadRanges(TransferRanges):
+    """Hands out the byte ranges of a chunked upload
+
+    Uploads start with the largest chunk iControl REST accepts in a single request,
+    smaller chunks are only used on links too slow to send a full chunk in time.
+    """
+
+    target_time = 5
+    min_chunk_size = 1024 * 1024
+    max_chunk_size = 1024 * 7168
+
+    def __init__(self, size):
+        super(UploadRanges, self).__init__(size, self.max_chunk_size)
+
+    def last(self):
+        """Reserves the final range of the file, or returns None when every range was handed out"""
+        with self.lock:
+            if not self.pending:
+                return None
+            start, end = self.pending[-1]
+            begin = max(start, end - self.chunk_size)
+            if begin == start:
+                self.pending.pop()
+            else:
+                self.pending[-1] = (start, begin)
+            return begin, end
+
+
 class HttpApi(HttpApiBase):
     def __init__(self, connection):
         super(HttpApi, self).__init__(connection)
         self.connection = connection
         self.access_token = None
         self.user = None
+        self.token_lifetime = None
+        self.token_timeout = None
+        self.token_started = None
+        self.token_expires = None
+        self._metadata = dict()
+        self._teem = TeemSpool()
+        self._recorder = None
 
     def login(self, username, password):
         provider = self.get_option("bigip_provider")
 
         if username and password:
+            self.user = username
+            if self._reuse_token(provider):
+                return
             payload = {
                 'username': username,
                 'password': password,
                 'loginProviderName': provider if provider else 'tmos'
             }
-            self.user = username
             response = self.send_request(path=LOGIN, method='POST', payload=payload, headers=BASE_HEADERS)
         else:
             raise AnsibleConnectionFailure('Username and password are required for login.')
@@ -87,6 +381,7 @@ class HttpApi(HttpApiBase):
             self.access_token = response['contents']['token'].get('token', None)
             if self.access_token:
                 self.connection._auth = {'X-F5-Auth-Token': self.access_token}
+                self._track_token(response['contents']['token'].get('timeout'))
             else:
                 raise AnsibleConnectionFailure('Server returned invalid response during connection authentication.')
         else:
@@ -97,6 +392,9 @@ class HttpApi(HttpApiBase):
     def logout(self):
         if not self.connection._auth:
             return
+        if self._token_cache() and self.token_expires:
+            # the token stays valid for the next connections of the controller
+            return
         token = self.connection._auth.get('X-F5-Auth-Token', None)
         logout_uri = '{0}{1}'.format(LOGOUT, token)
         self.send_request(path=logout_uri, method='DELETE')
@@ -110,26 +408,118 @@ class HttpApi(HttpApiBase):
             if self.connection._auth is not None:
                 # only attempt to refresh token if we were connected before not when we get 401 on first attempt
                 self.connection._auth = None
+                self._forget_token()
+                self._count('auth_refreshes')
                 return True
         return False
 
+    def _ensure_token(self):
+        """Extend the lifetime of the token, or log in again, when the token is about to expire
+
+        Tokens are extended with a PATCH of their timeout, up to the longest lifetime the
+        device accepts. A token which cannot be extended any further is replaced by a new
+        login, before it expires rather than after a request failed with a 401.
+        """
+        if not self.token_expires or not self.connection._auth:
+            return
+        remaining = self.token_expires - time.time()
+        if remaining > TOKEN_REFRESH_MARGIN:
+            return
+        self._count('auth_refreshes')
+        if remaining > 0 and self._extend_token():
+            return
+        self.connection._auth = None
+        self._forget_token()
+        self.login(self.connection.get_option('remote_user'), self.connection.get_option('password'))
+
+    def _extend_token(self):
+        timeout = min(int(time.time() - self.token_started) + self.token_lifetime, TOKEN_MAX_TIMEOUT)
+        if timeout <= self.token_timeout:
+            return False
+        response = self.send_request(
+            path='{0}{1}'.format(LOGOUT, self.access_token), method='PATCH', payload={'timeout': timeout}
+        )
+        if response['code'] != 200:
+            return False
+        self.token_timeout = timeout
+        self.token_expires = self.token_started + timeout
+        self._save_token()
+        return True
+
+    def _track_token(self, timeout):
+        self.token_lifetime = int(timeout or 1200)
+        self.token_timeout = self.token_lifetime
+        self.token_started = time.time()
+        self.token_expires = self.token_started + self.token_timeout
+        self._save_token()
+
+    def _token_cache(self):
+        path = self.get_option('token_cache')
+        return TokenCache(path) if path else None
+
+    def _token_key(self, provider=None):
+        if provider is None:
+            provider = self.get_option("bigip_provider")
+        return token_cache_key(self.connection, self.user, provider or 'tmos')
+
+    def _reuse_token(self, provider):
+        cache = self._token_cache()
+        if not cache:
+            return False
+        entry = cache.get(self._token_key(provider), margin=TOKEN_REFRESH_MARGIN)
+        if not entry:
+            return False
+        self.access_token = entry['token']
+        self.connection._auth = {'X-F5-Auth-Token': self.access_token}
+        self.token_lifetime = entry['lifetime']
+        self.token_timeout = entry['timeout']
+        self.token_started = entry['started']
+        self.token_expires = entry['expires']
+        return True
+
+    def _save_token(self):
+        cache = self._token_cache()
+        if cache:
+            cache.set(self._token_key(), dict(
+                token=self.access_token, lifetime=self.token_lifetime, timeout=self.token_timeout,
+                started=self.token_started, expires=self.token_expires
+            ))
+
+    def _forget_token(self):
+        cache = self._token_cache()
+        if cache and self.token_expires:
+            cache.set(self._token_key(), None)
+        self.token_expires = None
+
     def send_request(self, **kwargs):
         url = kwargs.pop('path', '/')
         body = kwargs.pop('payload', None)
         method = kwargs.pop('method', None)
+        recorder = self._perf()
+        mark = recorder.mark() if recorder else None
+        if not url.startswith((LOGIN, LOGOUT)):
+            self._ensure_token()
         # allow for empty json to be passed as payload, useful for some endpoints
         data = json.dumps(body) if body or body == {} else None
+        started = time.time()
         try:
             self._display_request(method, url, body)
             response, response_data = self.connection.send(url, data, method=method, **kwargs)
             response_value = self._get_response_value(response_data)
+            code = response.getcode()
+            if recorder:
+                recorder.record(method, url, code, started, len(data or ''), len(response_value), mark)
             return dict(
-                code=response.getcode(),
+                code=code,
                 contents=self._response_to_json(response_value),
                 headers=response.getheaders()
             )
         except HTTPError as e:
-            return dict(code=e.code, contents=json.loads(e.read()))
+            error = e.read()
+            if recorder:
+                recorder.record(method, url, e.code, started, len(data or ''), len(error), mark)
+            headers = list(e.headers.items()) if e.headers else []
+            return dict(code=e.code, contents=json_loads(error), headers=headers)
 
     def upload_file(self, url, src, dest=None, true_path=True):
         """Upload a file to an arbitrary URL.
@@ -147,10 +537,12 @@ class HttpApi(HttpApiBase):
             bool: True on success. False otherwise.
 
         Raises:
-            AnsibleConnectionFailure: Raised if ``retries`` limit is exceeded.
+            AnsibleConnectionFailure: Raised if ``retries`` limit is exceeded for any chunk.
         """
+        # chunks are sent straight through the connection, make sure the token outlives the transfer
+        self._ensure_token()
 
-        # This appears to be the largest chunk size that iControlREST can handle.
+        # The upload starts with the largest chunk size that iControlREST appears to handle.
         #
         # The trade-off you are making by choosing a chunk size is speed, over size of
         # transmission. A lower chunk size will be slower because a smaller amount of
@@ -161,12 +553,10 @@ class HttpApi(HttpApiBase):
         # go, and therefore more data is transmitted to the BIG-IP in one HTTP request.
         #
         # If you are transmitting over a slow link though, it may be more reliable to
-        # transmit many small chunks that fewer large chunks. It will clearly take
-        # longer, but it may be more robust.
+        # transmit many small chunks that fewer large chunks. ``UploadRanges`` shrinks
+        # the chunks when a chunk takes too long to send, and grows them back once the
+        # link speeds up again.
         basename = None
-        chunk_size = 1024 * 7168
-        start = 0
-        retries = 0
 
         if true_path:
             size = os.stat(src).st_size
@@ -174,60 +564,111 @@ class HttpApi(HttpApiBase):
                 basename = os.path.basename(src)
 
         if not true_path:
-            # This is a workaround to the ansible-connection limitation where only strings, numbers,
-            # lists and dicts can go through JSON-RPC (the way ansible-connection and module talk to each other),
-            # this means we need to cheat if we want to pass a string payload as a file to BIG-IP, this means
-            # writing the data (strings) to a temporary file so it can be uploaded to via the connection plugin.
-            tmp = NamedTemporaryFile()
-            tmp.write(src.encode())
-            tmp.seek(0)
-            size = os.stat(tmp.name).st_size
-            src = tmp.name
+            # Only strings, numbers, lists and dicts can go through JSON-RPC (the way ansible-connection
+            # and module talk to each other), so a payload arrives here as a string. It is encoded once and
+            # the chunks are sliced out of a memoryview over the encoded buffer, which avoids copying the
+            # payload again for every chunk.
+            payload = memoryview(to_bytes(src))
+            size = payload.nbytes
             if not dest:
-                basename = os.path.basename(tmp.name)
+                basename = 'tmp{0}'.format(uuid.uuid4().hex[:8])
 
         if not basename:
             basename = dest
         url = '{0}/{1}'.format(url.rstrip('/'), basename)
 
+        if not true_path:
+            self._upload_ranges(url, lambda start, stop: payload[start:stop], UploadRanges(size))
+            return True
+
         with open(src, 'rb') as fileobj:
-            while True:
-                if retries == 3:
-                    # Retries are used here to allow the REST API to recover if you kill
-                    # an upload mid-transfer.
-                    #
-                    # There exists a case where retrying a new upload will result in the
-                    # API returning the POSTed payload (in bytes) with a non-200 response
-                    # code.
-                    #
-                    # Retrying (after seeking back to 0) seems to resolve this problem.
-                    raise AnsibleConnectionFailure(
-                        "Failed to upload file too many times."
-                    )
-                try:
-                    file_slice = fileobj.read(chunk_size)
-                    if not file_slice:
-                        break
-                    current_bytes = len(file_slice)
-                    if current_bytes < chunk_size:
-                        end = size
-                    else:
-                        end = start + current_bytes
-                    headers = {
-                        'Content-Range': '%s-%s/%s' % (start, end - 1, size),
-                        'Content-Type': 'application/octet-stream',
-                        'Connection': 'keep-alive'
-                    }
-                    self.connection.send(url, file_slice, method='POST', headers=headers)
-                    start += current_bytes
-                except HTTPError:
-                    # You must seek back to the beginning of the file upon exception.
-                    #
-                    # If this is not done, then you risk uploading a partial file.
-                    fileobj.seek(0)
-                    retries += 1
+            fd = fileobj.fileno()
+            self._upload_ranges(url, lambda start, stop: os.pread(fd, stop - start, start), UploadRanges(size))
         return True
 
+    def _upload_ranges(self, url, read, ranges):
+        if self._upload_concurrency() > 1:
+            self._upload_parallel(url, read, ranges)
+            return
+        while True:
+            chunk = ranges.next()
+            if chunk is None:
+                break
+            self._upload_range(url, read, chunk[0], chunk[1], ranges)
+
+    def _upload_concurrency(self):
+        return int(self.get_option('upload_concurrency') or 1)
+
+    def _upload_range(self, url, read, start, stop, ranges):
+        """Upload a single byte range of a file, retrying only that range on failure
+
+        Retries are used here to allow the REST API to recover if you kill an upload
+        mid-transfer. The device writes every range at the offset given in its
+        Content-Range header, so the ranges already uploaded do not need to be sent again.
+
+        Raises:
+            AnsibleConnectionFailure: Raised if ``retries`` limit is exceeded.
+        """
+        headers = {
+            'Content-Range': '%s-%s/%s' % (start, stop - 1, ranges.size),
+            'Content-Type': 'application/octet-stream',
+            'Connection': 'keep-alive'
+        }
+        file_slice = read(start, stop)
+        recorder = self._perf()
+        for retry in range(3):
+            if retry:
+                self._count('retries')
+            mark = recorder.mark() if recorder else None
+            started = time.time()
+            try:
+                result = self.connection.send(url, file_slice, method='POST', headers=headers)
+            except HTTPError as e:
+                if recorder:
+                    recorder.record('POST', url, e.code, started, len(file_slice), 0, mark)
+                continue
+            if recorder:
+                recorder.record('POST', url, result[0].getcode(), started, len(file_slice), 0, mark)
+            ranges.adapt(time.time() - started)
+            return
+        raise AnsibleConnectionFailure(
+            "Failed to upload file too many times."
+        )
+
+    def _upload_parallel(self, url, read, ranges):
+        """Upload the byte ranges of a file with several requests in flight
+
+        The first range is sent on its own, as it creates the file on the device, and
+        the final range is held back until every other range was uploaded, as the
+        device considers the file complete once the final range is received.
+        """
+        first = ranges.next()
+        if first is None:
+            return
+        self._upload_range(url, read, first[0], first[1], ranges)
+        last = ranges.last()
+        if last is None:
+            return
+        stop = threading.Event()
+
+        def worker():
+            while not stop.is_set():
+                chunk = ranges.next()
+                if chunk is None:
+                    return
+                try:
+                    self._upload_range(url, read, chunk[0], chunk[1], ranges)
+                except Exception:
+                    stop.set()
+                    raise
+
+        workers = self._upload_concurrency()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(worker) for x in range(workers)]
+        for future in futures:
+            future.result()
+        self._upload_range(url, read, last[0], last[1], ranges)
+
     def download_asm_file(self, url, dest, file_size):
         """Download a large ASM file from the remote device
 
@@ -245,6 +686,11 @@ class HttpApi(HttpApiBase):
         """
         if not file_size:
             raise F5ModuleError("File size value cannot be None")
+        self._ensure_token()
+
+        if self._download_concurrency() > 1:
+            self._download_parallel(url, dest, file_size, check_length=True)
+            return
 
         with open(dest, 'wb') as fileobj:
             chunk_size = 512 * 1024
@@ -294,6 +740,12 @@ class HttpApi(HttpApiBase):
         Returns:
             bool: True on success. False otherwise.
         """
+        self._ensure_token()
+        if self._download_concurrency() > 1:
+            size = self._read_download_size(url)
+            self._download_parallel(url, dest, size)
+            return True
+
         with open(dest, 'wb') as fileobj:
             chunk_size = 512 * 1024
             start = 0
@@ -342,6 +794,170 @@ class HttpApi(HttpApiBase):
                     raise
         return True
 
+    def _download_concurrency(self):
+        return int(self.get_option('download_concurrency') or 1)
+
+    def _send_range(self, url, start, end, size):
+        headers = {
+            'Content-Range': "%s-%s/%s" % (start, end, size),
+            'Content-Type': 'application/octet-stream',
+            'Connection': 'keep-alive'
+        }
+        recorder = self._perf()
+        if not recorder:
+            return self.connection.send(url, None, headers=headers)
+        mark = recorder.mark()
+        started = time.time()
+        try:
+            result = self.connection.send(url, None, headers=headers)
+        except HTTPError as e:
+            recorder.record('GET', url, e.code, started, 0, 0, mark)
+            raise
+        recorder.record('GET', url, result[0].status, started, 0, end - start + 1, mark)
+        return result
+
+    def _read_download_size(self, url):
+        """Returns the size of a file to download, in bytes
+
+        The device reports the total size of the file in the Content-Range header
+        of a response to any range request, the body of this first response is not used.
+        """
+        response, response_buffer = self._send_range(url, 0, 512 * 1024 - 1, 0)
+        if 'Content-Range' not in response.headers:
+            raise F5ModuleError("The Content-Range header is not present.")
+        return int(response.headers['Content-Range'].split('/')[-1])
+
+    def _download_parallel(self, url, dest, size, check_length=False):
+        """Download a file in byte ranges requested concurrently
+
+        Each range is written at its offset in the destination file as soon as it is
+        received. The ranges written so far are tracked by ``DownloadRanges``, so a
+        failed download resumes from the ranges that are already on disk.
+
+        Arguments:
+            url (string): The URL to download.
+            dest (string): The location on (Ansible controller) disk to store the file.
+            size (integer): The size of the remote file.
+            check_length (bool): Require a positive Content-Length header on every response,
+                as the ASM file endpoints do.
+        """
+        ranges = DownloadRanges(url, dest, size)
+        resumed = ranges.load()
+        flags = os.O_RDWR | os.O_CREAT
+        if not resumed:
+            flags |= os.O_TRUNC
+        fd = os.open(dest, flags, 0o644)
+        try:
+            if not resumed:
+                os.ftruncate(fd, size)
+                ranges.save()
+            else:
+                self._display_message(
+                    'BIG-IP download of {0} resumed, missing ranges: {1}'.format(url, ranges.missing())
+                )
+            ranges.plan()
+            stop = threading.Event()
+
+            def worker():
+                while not stop.is_set():
+                    chunk = ranges.next()
+                    if chunk is None:
+                        return
+                    start, end = chunk
+                    started = time.time()
+                    try:
+                        response, response_buffer = self._send_range(url, start, end - 1, size)
+                        if check_length:
+                            length = response.headers.get('Content-Length', None)
+                            if length is None:
+                                raise F5ModuleError("The Content-Length header is not present.")
+                            if int(length) <= 0:
+                                raise F5ModuleError(
+                                    "Invalid Content-Length value returned: %s ,"
+                                    "the value should be greater than 0" % length
+                                )
+                        data = response_buffer.getbuffer()
+                        if len(data) != end - start:
+                            raise F5ModuleError(
+                                "Received {0} bytes for range {1}-{2} of {3}, expected {4}.".format(
+                                    len(data), start, end - 1, url, end - start
+                                )
+                            )
+                        os.pwrite(fd, data, start)
+                    except Exception:
+                        stop.set()
+                        raise
+                    ranges.complete(start, end, time.time() - started)
+
+            workers = self._download_concurrency()
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(worker) for x in range(workers)]
+            for future in futures:
+                # Re-raises the first error hit by any of the workers. The ranges completed
+                # so far remain recorded so that the next attempt can resume.
+                future.result()
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        ranges.verify()
+        ranges.remove()
+
+    def get_metadata(self, key):
+        """Returns a device metadata entry cached by the connection
+
+        The value is wrapped in a dictionary, so a cached ``None`` or empty value can be
+        told apart from an entry which is not cached.
+
+        Arguments:
+            key (string): The name of the metadata entry.
+
+        Returns:
+            dict: The entry as ``{'value': value}``, or None when the entry is not cached or expired.
+        """
+        entry = self._metadata.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if time.time() >= expires:
+            del self._metadata[key]
+            return None
+        return dict(value=value)
+
+    def set_metadata(self, key, value):
+        """Cache a device metadata entry for ``metadata_ttl`` seconds"""
+        ttl = int(self.get_option('metadata_ttl') or 0)
+        if ttl > 0:
+            self._metadata[key] = (time.time() + ttl, value)
+
+    def invalidate_metadata(self, keys=None):
+        """Drop the given device metadata entries, or all of them when no keys are given"""
+        if keys is None:
+            self._metadata.clear()
+            return
+        for key in keys:
+            self._metadata.pop(key, None)
+
+    def _perf(self):
+        """Returns the recorder of the requests of this connection, or None when requests are not recorded"""
+        trace = self.get_option('perf_trace')
+        if not (self.get_option('perf_stats') or trace):
+            return None
+        if self._recorder is None:
+            self._recorder = RequestRecorder(host=self.connection.get_option('host'))
+        self._recorder.trace = trace
+        self._recorder.trace_format = self.get_option('perf_trace_format')
+        return self._recorder
+
+    def _count(self, name):
+        if self._recorder:
+            self._recorder.count(name)
+
+    def perf_report(self, since):
+        """Summarize the requests sent since the given timestamp, when perf_stats is enabled"""
+        if not self.get_option('perf_stats') or not self._recorder:
+            return None
+        return summarize(self._recorder.since(since))
+
     def _display_request(self, method, url, data=None):
         if data:
             self._display_message(
@@ -356,18 +972,31 @@ class HttpApi(HttpApiBase):
         self.connection._log_messages(msg)
 
     def _get_response_value(self, response_data):
-        return to_text(response_data.getvalue())
+        # the raw bytes are decoded as JSON directly, large responses are not copied to text first
+        return response_data.getvalue()
 
     def _response_to_json(self, response_text):
         try:
-            return json.loads(response_text) if response_text else {}
+            return json_loads(response_text) if response_text else {}
         # JSONDecodeError only available on Python 3.5+
         except ValueError:
-            raise F5ModuleError('Invalid JSON response: %s' % response_text)
+            raise F5ModuleError('Invalid JSON response: %s' % to_text(response_text))
 
     def telemetry(self):
         return self.get_option('send_telemetry')
 
+    def queue_telemetry(self, record):
+        """Spool the telemetry record of a module run, it is sent to F5 in the background
+
+        The platform and the software version of the device are added to the record, the
+        version is taken from the metadata cache, it is not read from the device.
+        """
+        record['platform'] = 'bigip'
+        if not record.get('version'):
+            entry = self.get_metadata('tmos_version')
+            record['version'] = entry['value'] if entry else None
+        self._teem.queue(record)
+
     def network_os(self):
         return self.connection._network_os
 
@@ -31,6 +31,10 @@ options:
   send_telemetry:
     description:
       - If C(yes) anonymous telemetry data is sent to F5
+      - Telemetry records are queued in the C(~/.ansible/f5_teem_spool.jsonl) spool file on the controller and
+        sent in batches by the persistent connection in the background, tasks do not wait for them to be sent.
+      - No request is sent to the device for telemetry, the software version of the device is reported when
+        the module read it or when it is in the metadata cache, see C(metadata_ttl).
     default: True
     ini:
     - section: defaults
@@ -39,19 +43,106 @@ options:
       - name: F5_TELEMETRY_OFF
     vars:
       - name: f5_telemetry
+  metadata_ttl:
+    description:
+      - The number of seconds device metadata, such as the software version, is cached by the persistent
+        connection and shared between tasks.
+      - The default value of C(0) disables the cache, every task then requests the metadata it needs from the device.
+    type: int
+    default: 0
+    ini:
+    - section: defaults
+      key: f5_metadata_ttl
+    env:
+      - name: F5_METADATA_TTL
+    vars:
+      - name: f5_metadata_ttl
+    version_added: "2.1.0"
+  token_cache:
+    description:
+      - The path to a file on the controller where authentication tokens are kept between persistent connections.
+      - When set, a connection to the same device with the same user and login provider reuses cached tokens
+        which are still valid instead of logging in again, and tokens are not deleted when the connection closes.
+      - The file is created readable only by its owner, it contains valid authentication tokens.
+      - Independently of this setting, the access token is exchanged for a new one before it expires, and a new
+        login is done only once the refresh token is about to expire.
+    type: path
+    ini:
+    - section: defaults
+      key: f5_token_cache
+    env:
+      - name: F5_TOKEN_CACHE
+    vars:
+      - name: f5_token_cache
+    version_added: "2.1.0"
+  perf_stats:
+    description:
+      - If C(yes) the persistent connection records the method, endpoint, status, size and duration of every
+        request sent to the device, and modules return a summary of their requests in the C(_f5_perf) key.
+      - The summary lists the request count and totals of the module run, and the endpoints which took the most
+        time. Object names in request paths are replaced with C({name}), so requests to objects of the same kind
+        are added up.
+    type: bool
+    default: False
+    ini:
+    - section: defaults
+      key: f5_perf_stats
+    env:
+      - name: F5_PERF_STATS
+    vars:
+      - name: f5_perf_stats
+    version_added: "2.1.0"
+  perf_trace:
+    description:
+      - The path to a file on the controller where a record of every request sent to the device is appended,
+        to profile plays offline.
+      - Setting this option records requests even when C(perf_stats) is disabled.
+    type: path
+    ini:
+    - section: defaults
+      key: f5_perf_trace
+    env:
+      - name: F5_PERF_TRACE
+    vars:
+      - name: f5_perf_trace
+    version_added: "2.1.0"
+  perf_trace_format:
+    description:
+      - The format of the C(perf_trace) file.
+      - With C(jsonl) every request is written as a JSON object on its own line.
+      - With C(chrome) requests are written as Chrome trace events, the file can be loaded in
+        C(chrome://tracing) or U(https://ui.perfetto.dev).
+    type: str
+    choices:
+      - jsonl
+      - chrome
+    default: jsonl
+    ini:
+    - section: defaults
+      key: f5_perf_trace_format
+    env:
+      - name: F5_PERF_TRACE_FORMAT
+    vars:
+      - name: f5_perf_trace_format
+    version_added: "2.1.0"
 version_added: "1.0.0"
 author:
   - Wojciech Wypior <w.wypior@f5.com>
 """
 import os
+import time
 from ansible.module_utils.basic import to_text
 from ansible.plugins.httpapi import HttpApiBase
 from ansible.module_utils.six.moves.urllib.error import HTTPError
 from ansible.errors import AnsibleConnectionFailure
 
 from ansible_collections.f5networks.f5_bigip.plugins.module_utils.common import F5ModuleError
+from ansible_collections.f5networks.f5_bigip.plugins.module_utils.jsoncodec import loads as json_loads
+from ansible_collections.f5networks.f5_bigip.plugins.module_utils.perf import RequestRecorder, summarize
+from ansible_collections.f5networks.f5_bigip.plugins.module_utils.teem import TeemSpool
+from ansible_collections.f5networks.f5_bigip.plugins.module_utils.tokens import TokenCache, token_cache_key
 from ansible_collections.f5networks.f5_bigip.plugins.module_utils.constants import (
-    LOGIN, LOGOUT, BASE_HEADERS
+    LOGIN, LOGOUT, BASE_HEADERS, TOKEN_EXCHANGE, TOKEN_REFRESH_MARGIN
 )
 
 try:
@@ -66,11 +157,20 @@ class HttpApi(HttpApiBase):
         self.connection = connection
         self.access_token = None
         self.refresh_token = None
+        self.user = None
+        self.token_expires = None
+        self.refresh_expires = None
+        self._metadata = dict()
+        self._teem = TeemSpool()
+        self._recorder = None
 
     def login(self, username, password):
         provider = self.get_option("bigiq_provider")
 
         if username and password:
+            self.user = username
+            if self._reuse_token(provider):
+                return
             payload = {
                 'username': username,
                 'password': password,
@@ -78,7 +178,7 @@ class HttpApi(HttpApiBase):
             if provider and provider != 'local':
                 login_ref = self._get_login_ref(provider)
                 payload.update(login_ref)
-            response = self.send_request(path=LOGIN, method='POST', data=payload, headers=BASE_HEADERS)
+            response = self.send_request(path=LOGIN, method='POST', payload=payload, headers=BASE_HEADERS)
         else:
             raise AnsibleConnectionFailure('Username and password are required for login.')
 
@@ -87,6 +187,7 @@ class HttpApi(HttpApiBase):
             self.refresh_token = response['contents']['refreshToken'].get('token', None)
             if self.access_token:
                 self.connection._auth = {'X-F5-Auth-Token': self.access_token}
+                self._track_tokens(response['contents'])
             else:
                 raise AnsibleConnectionFailure('Server returned invalid response during connection authentication.')
         else:
@@ -97,6 +198,9 @@ class HttpApi(HttpApiBase):
     def logout(self):
         if not self.connection._auth:
             return
+        if self._token_cache() and self.token_expires:
+            # the tokens stay valid for the next connections of the controller
+            return
         token = self.connection._auth.get('X-F5-Auth-Token', None)
         logout_uri = '{0}{1}'.format(LOGOUT, token)
         self.send_request(path=logout_uri, method='DELETE')
@@ -110,6 +214,7 @@ class HttpApi(HttpApiBase):
             if self.connection._auth is not None:
                 # only attempt to refresh token if we were connected before not when we get 401 on first attempt
                 self.connection._auth = None
+                self._count('auth_refreshes')
                 self.token_refresh()
                 return True
         return False
@@ -122,7 +227,7 @@ class HttpApi(HttpApiBase):
         }
 
         response = self.send_request(
-            path="/mgmt/shared/authn/exchange", method='POST', data=payload, headers=BASE_HEADERS
+            path=TOKEN_EXCHANGE, method='POST', payload=payload, headers=BASE_HEADERS
         )
 
         if response['code'] == 200 and 'token' in response['contents']:
@@ -130,6 +235,7 @@ class HttpApi(HttpApiBase):
             self.refresh_token = response['contents']['refreshToken'].get('token', None)
             if self.access_token:
                 self.connection._auth = {'X-F5-Auth-Token': self.access_token}
+                self._track_tokens(response['contents'])
             else:
                 raise AnsibleConnectionFailure('Server returned invalid response during token refresh.')
         else:
@@ -137,24 +243,146 @@ class HttpApi(HttpApiBase):
                 response['contents'])
             )
 
+    def _ensure_token(self):
+        """Exchange the refresh token for a new access token before the access token expires
+
+        A new login is done only when the refresh token itself is about to expire.
+        """
+        if not self.token_expires or not self.connection._auth:
+            return
+        now = time.time()
+        if self.token_expires - now > TOKEN_REFRESH_MARGIN:
+            return
+        self._count('auth_refreshes')
+        if self.refresh_token and self.refresh_expires - now > TOKEN_REFRESH_MARGIN:
+            self.token_refresh()
+            return
+        self.connection._auth = None
+        self._forget_tokens()
+        self.login(self.connection.get_option('remote_user'), self.connection.get_option('password'))
+
+    def _track_tokens(self, contents):
+        now = time.time()
+        self.token_expires = now + int(contents['token'].get('timeout') or 300)
+        self.refresh_expires = now + int((contents.get('refreshToken') or {}).get('timeout') or 36000)
+        self._save_tokens()
+
+    def _token_cache(self):
+        path = self.get_option('token_cache')
+        return TokenCache(path) if path else None
+
+    def _token_key(self, provider=None):
+        if provider is None:
+            provider = self.get_option("bigiq_provider")
+        return token_cache_key(self.connection, self.user, provider or 'local')
+
+    def _reuse_token(self, provider):
+        cache = self._token_cache()
+        if not cache:
+            return False
+        entry = cache.get(self._token_key(provider), margin=TOKEN_REFRESH_MARGIN)
+        if not entry:
+            return False
+        self.access_token = entry['token']
+        self.refresh_token = entry['refresh_token']
+        self.connection._auth = {'X-F5-Auth-Token': self.access_token}
+        self.token_expires = entry['access_expires']
+        self.refresh_expires = entry['expires']
+        return True
+
+    def _save_tokens(self):
+        cache = self._token_cache()
+        if cache:
+            # the cached entry remains usable for as long as its refresh token is valid
+            cache.set(self._token_key(), dict(
+                token=self.access_token, refresh_token=self.refresh_token,
+                access_expires=self.token_expires, expires=self.refresh_expires
+            ))
+
+    def _forget_tokens(self):
+        cache = self._token_cache()
+        if cache and self.token_expires:
+            cache.set(self._token_key(), None)
+        self.token_expires = None
+
     def send_request(self, **kwargs):
         url = kwargs.pop('path', '/')
         body = kwargs.pop('payload', None)
         method = kwargs.pop('method', None)
+        recorder = self._perf()
+        mark = recorder.mark() if recorder else None
+        if not url.startswith((LOGIN, LOGOUT, TOKEN_EXCHANGE)):
+            self._ensure_token()
         data = json.dumps(body) if body else None
+        started = time.time()
 
         try:
             self._display_request(method, url, body)
             response, response_data = self.connection.send(url, data, method=method, **kwargs)
             response_value = self._get_response_value(response_data)
+            code = response.getcode()
+            if recorder:
+                recorder.record(method, url, code, started, len(data or ''), len(response_value), mark)
             return dict(
-                code=response.getcode(),
+                code=code,
                 contents=self._response_to_json(response_value),
                 headers=response.getheaders()
             )
 
         except HTTPError as e:
-            return dict(code=e.code, contents=json.loads(e.read()))
+            error = e.read()
+            if recorder:
+                recorder.record(method, url, e.code, started, len(data or ''), len(error), mark)
+            headers = list(e.headers.items()) if e.headers else []
+            return dict(code=e.code, contents=json_loads(error), headers=headers)
+
+    def get_metadata(self, key):
+        """Returns a device metadata entry cached by the connection
+
+        Returns:
+            dict: The entry as ``{'value': value}``, or None when the entry is not cached or expired.
+        """
+        entry = self._metadata.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if time.time() >= expires:
+            del self._metadata[key]
+            return None
+        return dict(value=value)
+
+    def set_metadata(self, key, value):
+        ttl = int(self.get_option('metadata_ttl') or 0)
+        if ttl > 0:
+            self._metadata[key] = (time.time() + ttl, value)
+
+    def invalidate_metadata(self, keys=None):
+        if keys is None:
+            self._metadata.clear()
+            return
+        for key in keys:
+            self._metadata.pop(key, None)
+
+    def _perf(self):
+        """Returns the recorder of the requests of this connection, or None when requests are not recorded"""
+        trace = self.get_option('perf_trace')
+        if not (self.get_option('perf_stats') or trace):
+            return None
+        if self._recorder is None:
+            self._recorder = RequestRecorder(host=self.connection.get_option('host'))
+        self._recorder.trace = trace
+        self._recorder.trace_format = self.get_option('perf_trace_format')
+        return self._recorder
+
+    def _count(self, name):
+        if self._recorder:
+            self._recorder.count(name)
+
+    def perf_report(self, since):
+        """Summarize the requests sent since the given timestamp, when perf_stats is enabled"""
+        if not self.get_option('perf_stats') or not self._recorder:
+            return None
+        return summarize(self._recorder.since(since))
 
     def _display_request(self, method, url, data=None):
         if data:
@@ -170,14 +398,15 @@ class HttpApi(HttpApiBase):
         self.connection._log_messages(msg)
 
     def _get_response_value(self, response_data):
-        return to_text(response_data.getvalue())
+        # the raw bytes are decoded as JSON directly, large responses are not copied to text first
+        return response_data.getvalue()
 
     def _response_to_json(self, response_text):
         try:
-            return json.loads(response_text) if response_text else {}
+            return json_loads(response_text) if response_text else {}
         # JSONDecodeError only available on Python 3.5+
         except ValueError:
-            raise F5ModuleError('Invalid JSON response: %s' % response_text)
+            raise F5ModuleError('Invalid JSON response: %s' % to_text(response_text))
 
     def _get_login_ref(self, provider):
         info = self._read_providers_on_device()
@@ -207,6 +436,18 @@ class HttpApi(HttpApiBase):
     def telemetry(self):
         return self.get_option('send_telemetry')
 
+    def queue_telemetry(self, record):
+        """Spool the telemetry record of a module run, it is sent to F5 in the background
+
+        The platform and the software version of the device are added to the record, the
+        version is taken from the metadata cache, it is not read from the device.
+        """
+        record['platform'] = 'bigiq'
+        if not record.get('version'):
+            entry = self.get_metadata('bigiq_version')
+            record['version'] = entry['value'] if entry else None
+        self._teem.queue(record)
+
     def network_os(self):
         return self.connection._network_os
 
@@ -6,29 +6,39 @@
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
+import copy
+import re
+import time
+
+from ansible.module_utils.connection import ConnectionError
 from ansible.module_utils.urls import urlparse
 
 from .common import F5ModuleError
+from .tasks import TaskWaiter
 from .teem import TeemClient
 from ..module_utils.constants import BASE_HEADERS
 
 
+# the fields telling whether an object changed, requested to validate cached responses
+GENERATION_FIELDS = ['generation', 'lastUpdateMicros']
+
+
 def header(method):
     def wrap(self, *args, **kwargs):
         if 'headers' not in kwargs:
             if self.transact is not None:
                 kwargs['headers'] = {'X-F5-REST-Coordination-Id': self.transact}
                 kwargs['headers'].update(BASE_HEADERS)
-                return method(self, *args, **kwargs)
+                return self._timed(method, *args, **kwargs)
             kwargs['headers'] = BASE_HEADERS
-            return method(self, *args, **kwargs)
+            return self._timed(method, *args, **kwargs)
         else:
             if self.transact is not None:
                 kwargs['headers'].update({'X-F5-REST-Coordination-Id': self.transact})
                 kwargs['headers'].update(BASE_HEADERS)
-                return method(self, *args, **kwargs)
+                return self._timed(method, *args, **kwargs)
             kwargs['headers'].update(BASE_HEADERS)
-            return method(self, *args, **kwargs)
+            return self._timed(method, *args, **kwargs)
     return wrap
 
 
@@ -39,27 +49,70 @@ class F5Client:
         self.plugin = kwargs.get('client', None)
         self.transact = None
         self.tmos_version = None
+        self._metadata_ttl = None
+        self.cache = ResponseCache() if kwargs.get('response_cache') else None
+        self.started = time.time()
+        self.requests = 0
+        self.request_time = 0.0
+
+    def _timed(self, method, *args, **kwargs):
+        # the time spent in the module, including the calls to the persistent connection
+        started = time.time()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.requests += 1
+            self.request_time += time.time() - started
 
     @header
     def delete(self, url, **kwargs):
+        self._invalidate(url)
         return self.plugin.send_request(path=url, method='DELETE', **kwargs)
 
     @header
     def get(self, url, **kwargs):
-        return self.plugin.send_request(path=url, method='GET', **kwargs)
+        if self.cache is None or self.transact is not None:
+            return self.plugin.send_request(path=url, method='GET', **kwargs)
+        return self._cached_get(url, **kwargs)
 
     @header
     def patch(self, url, data=None, **kwargs):
+        self._invalidate(url)
         return self.plugin.send_request(path=url, method='PATCH', payload=data, **kwargs)
 
     @header
     def post(self, url, data=None, **kwargs):
+        self._invalidate(url)
         return self.plugin.send_request(path=url, method='POST', payload=data, **kwargs)
 
     @header
     def put(self, url, data=None, **kwargs):
+        self._invalidate(url)
         return self.plugin.send_request(path=url, method='PUT', payload=data, **kwargs)
 
+    def _invalidate(self, url):
+        if self.cache is not None:
+            self.cache.invalidate(url)
+
+    def _cached_get(self, url, **kwargs):
+        key = 'GET {0}'.format(url)
+        entry = self.cache.get(key)
+        if entry is not None:
+            # only the generation of the object, or of each collection item, is requested
+            # to find out whether the cached response is still current
+            check = self.plugin.send_request(path=select_generation(url), method='GET', **kwargs)
+            if check['code'] == 200 and generation_of(check['contents']) == entry['generation']:
+                self.cache.hits += 1
+                return copy_response(entry['response'])
+        self.cache.misses += 1
+        response = self.plugin.send_request(path=select_generation(url, keep=True), method='GET', **kwargs)
+        generation = generation_of(response['contents']) if response['code'] == 200 else None
+        if generation is None:
+            self.cache.set(key, None)
+        else:
+            self.cache.set(key, dict(generation=generation, response=copy_response(response)))
+        return response
+
     @property
     def platform(self):
         network_os = self.plugin.network_os()
@@ -72,6 +125,13 @@ class F5Client:
             version = bigiq_version(self)
         return network_os.split('.')[2], version
 
+    @property
+    def metadata_ttl(self):
+        """The number of seconds device metadata is cached by the persistent connection"""
+        if self._metadata_ttl is None:
+            self._metadata_ttl = int(self.plugin.get_option('metadata_ttl') or 0)
+        return self._metadata_ttl
+
     @property
     def ansible_version(self):
         return self.module.ansible_version
@@ -81,7 +141,172 @@ class F5Client:
         return self.module._name
 
 
+class ResponseCache(object):
+    """Responses to GET requests kept for the run of a module
+
+    Modules opt in by creating their F5Client with ``response_cache=True``. A cached
+    response is returned again only after a request for the bare generation of the
+    object, or of the items of the collection, shows that it did not change. Responses
+    without a generation, such as errors or statistics, are not cached.
+
+    Requests changing the configuration through the client drop the entries of every
+    URL on the same path, of the changed object and of the collections holding it.
+    """
+
+    def __init__(self):
+        self.entries = dict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        return self.entries.get(key)
+
+    def set(self, key, value):
+        if value is None:
+            self.entries.pop(key, None)
+        else:
+            self.entries[key] = value
+
+    def invalidate(self, url):
+        changed = url_path(url)
+        for key in list(self.entries):
+            cached = url_path(key.split(' ', 1)[1])
+            if cached.startswith(changed) or changed.startswith(cached):
+                del self.entries[key]
+
+
+def copy_response(response):
+    """Copies a response, so that callers changing its contents do not alter the cached one"""
+    result = dict(response)
+    result['contents'] = copy.deepcopy(response['contents'])
+    if 'headers' in response:
+        result['headers'] = list(response['headers'])
+    return result
+
+
+def select_generation(url, keep=False):
+    """Adds the generation fields to the ``$select`` query of the URL
+
+    Arguments:
+        url (string): The URL of the request.
+        keep (bool): Keep the fields already selected by the URL. When False, or when the URL
+            selects no fields, only the generation fields are requested.
+    """
+    fields = ','.join(GENERATION_FIELDS)
+    match = re.search(r'([?&])\$select=([^&]*)', url)
+    if match is None:
+        if keep:
+            return url
+        return '{0}{1}$select={2}'.format(url, '&' if '?' in url else '?', fields)
+    selected = match.group(2).split(',')
+    if keep:
+        fields = ','.join(selected + [x for x in GENERATION_FIELDS if x not in selected])
+    return url[:match.start()] + '{0}$select={1}'.format(match.group(1), fields) + url[match.end():]
+
+
+def url_path(url):
+    """Returns the path of the URL, without its query and with a trailing slash"""
+    return urlparse(url).path.rstrip('/') + '/'
+
+
+def generation_of(contents):
+    """Returns the generation of an object, or the generations of the items of a collection
+
+    ASM objects carry no generation, their ``lastUpdateMicros`` is used instead.
+
+    Returns:
+        The generation, or None when the response does not carry a generation for all of its content.
+    """
+    generation = _object_generation(contents)
+    if generation is not None:
+        return generation
+    items = contents.get('items') if isinstance(contents, dict) else None
+    if not items:
+        return None
+    generations = [_object_generation(x) for x in items]
+    if any(x is None for x in generations):
+        return None
+    return generations
+
+
+def _object_generation(contents):
+    if not isinstance(contents, dict):
+        return None
+    generation = [contents.get(x) for x in GENERATION_FIELDS]
+    if all(x is None for x in generation):
+        return None
+    return generation
+
+
+def cached_metadata(client, key, read):
+    """Returns device metadata, using the cache of the persistent connection
+
+    The metadata is read from the device with ``read`` when the connection has no
+    valid cache entry for ``key``. When the cache is disabled, with the default
+    ``metadata_ttl`` of 0, the metadata is read without asking the connection.
+
+    Args:
+        client: Client connection to the BIG-IP
+        key: The name of the metadata entry
+        read: A function reading the metadata from the device, called with the client
+
+    Returns:
+        The metadata value.
+    """
+    if not client.metadata_ttl:
+        return read(client)
+    entry = client.plugin.get_metadata(key)
+    if isinstance(entry, dict) and 'value' in entry:
+        return entry['value']
+    value = read(client)
+    client.plugin.set_metadata(key, value)
+    return value
+
+
+def invalidate_metadata(client, *keys):
+    """Drops device metadata cached by the persistent connection
+
+    Modules changing the software, configuration, provisioning or installed packages of
+    the device call this after the change, so that later tasks read the metadata again.
+
+    Args:
+        client: Client connection to the BIG-IP
+        keys: The names of the entries to drop, all entries are dropped when none are given
+    """
+    client.plugin.invalidate_metadata(list(keys) if keys else None)
+
+
+def perf_report(client, *clients):
+    """Returns the summary of the requests sent by a module, when perf_stats is enabled
+
+    The summary recorded by the persistent connection is completed with the number of
+    client calls and the time the module spent waiting for them, which includes the
+    overhead of the calls to the persistent connection.
+
+    Arguments:
+        client (F5Client): The client of the module, or the first one it created.
+        clients (F5Client): Other clients of the module, whose calls are added up.
+
+    Returns:
+        dict: The summary in the ``_f5_perf`` key, or an empty dict when requests are not recorded.
+    """
+    report = client.plugin.perf_report(client.started)
+    if not isinstance(report, dict):
+        return dict()
+    clients = (client,) + clients
+    report.update(
+        client_requests=sum(x.requests for x in clients),
+        client_time=round(sum(x.request_time for x in clients), 3),
+        elapsed=round(time.time() - client.started, 3),
+    )
+    return dict(_f5_perf=report)
+
+
 def tmos_version(client):
+    return cached_metadata(client, 'tmos_version', read_tmos_version)
+
+
+def read_tmos_version(client):
     uri = "/mgmt/tm/sys/"
     response = client.get(uri)
 
@@ -95,6 +320,10 @@ def tmos_version(client):
 
 
 def sslo_version(client):
+    return cached_metadata(client, 'sslo_version', read_sslo_version)
+
+
+def read_sslo_version(client):
     uri = "/mgmt/shared/iapp/installed-packages"
     response = client.get(uri)
     if response['code'] in [200, 201, 202]:
@@ -108,6 +337,10 @@ def sslo_version(client):
 
 
 def bigiq_version(client):
+    return cached_metadata(client, 'bigiq_version', read_bigiq_version)
+
+
+def read_bigiq_version(client):
     uri = "/mgmt/shared/resolver/device-groups/cm-shared-all-big-iqs/devices"
     query = "?$select=version"
     response = client.get(uri + query)
@@ -145,6 +378,10 @@ def packages_installed(client):
         A list of installed packages in their short name for.
         For example, ['as3', 'do', 'ts']
     """
+    return cached_metadata(client, 'packages_installed', read_packages_installed)
+
+
+def read_packages_installed(client):
     packages = {
         "f5-declarative-onboarding": "do",
         "f5-appsvcs": "as3",
@@ -180,6 +417,10 @@ def modules_provisioned(client):
         A list of provisioned modules in their short name for.
         For example, ['afm', 'asm', 'ltm']
     """
+    return cached_metadata(client, 'modules_provisioned', read_modules_provisioned)
+
+
+def read_modules_provisioned(client):
     uri = "/mgmt/tm/sys/provision"
     response = client.get(uri)
 
@@ -192,10 +433,10 @@ def modules_provisioned(client):
 
 
 def send_teem(client, start_time):
-    """ Sends Teem Data if allowed."""
+    """ Queues Teem Data if allowed, the connection plugin sends it in the background."""
     if client.plugin.telemetry():
         teem = TeemClient(client, start_time)
-        teem.send()
+        client.plugin.queue_telemetry(teem.record())
     else:
         return False
 
@@ -228,3 +469,148 @@ class TransactionContextManager(object):
             response = self.client.patch(uri, data=params)
             if response['code'] not in [200, 201, 202]:
                 raise F5ModuleError(response['contents'])
+
+
+class BatchRequest(object):
+    """Queues mutations of tmsh backed resources and applies them in one transaction
+
+    Requests are recorded locally by ``post``, ``patch``, ``put`` and ``delete``, which
+    return the position of the request in the batch. ``commit`` opens a transaction,
+    adds the requests to it in order, commits it and waits until the device applied it.
+    A batch holding a single request sends it directly, without a transaction.
+
+    The results of ``commit`` follow the order of the requests, at the position each request
+    was given. In a transaction the device only queues the requests, so their results echo
+    the queued commands rather than the outcome of the committed transaction.
+
+    The batch can also be used as a context manager, it is committed when the block
+    completes without an exception and the results are then kept in ``results``.
+    """
+
+    def __init__(self, client, validate_only=False, timeout=60):
+        self.client = client
+        self.validate_only = validate_only
+        self.timeout = timeout
+        self.requests = []
+        self.results = None
+        self.transid = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        if exc_type is None:
+            self.commit()
+
+    def _add(self, method, url, data=None):
+        self.requests.append(dict(method=method, url=url, data=data))
+        return len(self.requests) - 1
+
+    def post(self, url, data=None):
+        return self._add('post', url, data)
+
+    def patch(self, url, data=None):
+        return self._add('patch', url, data)
+
+    def put(self, url, data=None):
+        return self._add('put', url, data)
+
+    def delete(self, url):
+        return self._add('delete', url)
+
+    def _send(self, request):
+        method = getattr(self.client, request['method'])
+        if request['method'] == 'delete':
+            response = method(request['url'])
+        else:
+            response = method(request['url'], data=request['data'])
+        return dict(
+            method=request['method'].upper(),
+            url=request['url'],
+            code=response['code'],
+            contents=response['contents']
+        )
+
+    def commit(self):
+        """Applies the queued requests
+
+        Returns:
+            list: A result per request, holding its method, url, and the code and contents of the
+                response to sending it, or to queuing it in the transaction.
+
+        Raises:
+            F5ModuleError: Raised when a request is rejected, or when the transaction fails.
+        """
+        requests, self.requests = self.requests, []
+        if len(requests) == 1:
+            result = self._send(requests[0])
+            if result['code'] not in [200, 201, 202]:
+                raise F5ModuleError(result['contents'])
+            self.results = [result]
+            return self.results
+
+        self.results = []
+        if not requests:
+            return self.results
+
+        response = self.client.post("/mgmt/tm/transaction/", data={})
+        if response['code'] not in [200, 201, 202]:
+            raise F5ModuleError(response['contents'])
+        self.transid = response['contents']['transId']
+
+        self.client.transact = self.transid
+        try:
+            for request in requests:
+                result = self._send(request)
+                if result['code'] not in [200, 201, 202]:
+                    raise F5ModuleError(
+                        "{0} {1} could not be added to the transaction: {2}".format(
+                            result['method'], result['url'], result['contents']
+                        )
+                    )
+                self.results.append(result)
+        except Exception:
+            self.client.transact = None
+            self._delete_transaction()
+            raise
+        finally:
+            self.client.transact = None
+
+        uri = "/mgmt/tm/transaction/{0}".format(self.transid)
+        params = dict(
+            state="VALIDATING",
+            validateOnly=self.validate_only
+        )
+        response = self.client.patch(uri, data=params)
+        if response['code'] not in [200, 201, 202]:
+            raise F5ModuleError(response['contents'])
+        self._wait_for_transaction(uri, response['contents'])
+        return self.results
+
+    def _delete_transaction(self):
+        # the error which stopped the batch is the one reported, not a failure to clean up after it
+        try:
+            self.client.delete("/mgmt/tm/transaction/{0}".format(self.transid))
+        except ConnectionError:
+            pass
+
+    def _wait_for_transaction(self, uri, contents):
+        waiter = TaskWaiter()
+        for x in waiter.polls(self.timeout):
+            if x > 1:
+                response = self.client.get(uri)
+                if response['code'] not in [200, 201, 202]:
+                    raise F5ModuleError(response['contents'])
+                contents = response['contents']
+            state = contents.get('state')
+            if state in ['COMPLETED', 'VALIDATION_SUCCESS']:
+                return
+            if state in ['FAILED', 'VALIDATION_FAILED']:
+                raise F5ModuleError(
+                    "Transaction {0} failed: {1}".format(
+                        self.transid, contents.get('failureReason', contents)
+                    )
+                )
+        raise F5ModuleError(
+            "Transaction {0} did not complete in {1} seconds.".format(self.transid, self.timeout)
+        )
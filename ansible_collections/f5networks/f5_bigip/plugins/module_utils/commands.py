@@ -0,0 +1,331 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2026 F5 Networks Inc.
+# GNU General Public License v3.0 (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import re
+import shlex
+import time
+
+from collections import deque
+
+from ansible.module_utils.six import string_types
+
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.parsing import (
+    FailedConditionsError
+)
+
+from .common import F5ModuleError, AnsibleF5Parameters
+
+# commands which modify the configuration of the device
+CHANGED_COMMAND_PREFIXES = ('modify', 'create', 'delete')
+
+
+class NoChangeReporter(object):
+    stdout_re = [
+        # A general error when a resource already exists
+        re.compile(r"The requested.*already exists"),
+
+        # Returned when creating a duplicate cli alias
+        re.compile(r"Data Input Error: shared.*already exists"),
+    ]
+
+    def find_no_change(self, responses):
+        """Searches the response for something that looks like a change
+
+        This method borrows heavily from Ansible's ``_find_prompt`` method
+        defined in the ``lib/ansible/plugins/connection/network_cli.py::Connection``
+        class.
+
+        Arguments:
+            response (string): The output from the command.
+
+        Returns:
+            bool: True when change is detected. False otherwise.
+        """
+        for response in responses:
+            for regex in self.stdout_re:
+                if regex.search(response):
+                    return True
+        return False
+
+
+class CommandParameters(AnsibleF5Parameters):
+    returnables = ['stdout', 'stdout_lines', 'warnings', 'executed_commands']
+
+    def to_return(self):
+        result = {}
+        try:
+            for returnable in self.returnables:
+                result[returnable] = getattr(self, returnable)
+            result = self._filter_params(result)
+            return result
+        except Exception:  # pragma: no cover
+            return result
+
+    @property
+    def raw_commands(self):
+        if self._values['commands'] is None:
+            return []
+        if isinstance(self._values['commands'], string_types):
+            result = [self._values['commands']]
+        else:
+            result = self._values['commands']
+        return result
+
+    def cmd_has_pipe(self, cmd):
+        lex = shlex.shlex(cmd, posix=True)
+        lex.whitespace = '|'
+        lex.whitespace_split = True
+        return len(list(lex)) > 1
+
+    def convert_commands(self, commands):
+        result = []
+        for command in commands:
+            tmp = dict(
+                command='',
+                pipeline=''
+            )
+
+            command = command.replace("'", "\\'")
+            pipeline = command.split('|', 1) if self.cmd_has_pipe(command) else [command]
+            tmp['command'] = pipeline[0]
+            try:
+                tmp['pipeline'] = pipeline[1]
+            except IndexError:
+                pass
+            result.append(tmp)
+        return result
+
+    def convert_commands_cli(self, commands):
+        result = []
+        for command in commands:
+            tmp = dict(
+                command='',
+                pipeline=''
+            )
+
+            pipeline = command.split('|', 1) if self.cmd_has_pipe(command) else [command]
+            tmp['command'] = pipeline[0]
+            try:
+                tmp['pipeline'] = pipeline[1]
+            except IndexError:
+                pass
+            result.append(tmp)
+        return result
+
+    def merge_command_dict(self, command):
+        if command['pipeline'] != '':
+            escape_patterns = r'([$"])'
+            command['pipeline'] = re.sub(escape_patterns, r'\\\1', command['pipeline'])
+            command['command'] = '{0} | {1}'.format(command['command'], command['pipeline']).strip()
+
+    def merge_command_dict_cli(self, command):
+        if command['pipeline'] != '':
+            command['command'] = '{0} | {1}'.format(command['command'], command['pipeline']).strip()
+
+    @property
+    def rest_commands(self):
+        # ['list ltm virtual']
+        commands = self.normalized_commands
+        commands = self.convert_commands(commands)
+        if self.chdir:
+            # ['cd /Common; list ltm virtual']
+            for command in commands:
+                self.addon_chdir(command)
+        # ['tmsh -c "cd /Common; list ltm virtual"']
+        for command in commands:
+            self.addon_tmsh(command)
+        for command in commands:
+            self.merge_command_dict(command)
+        result = [x['command'] for x in commands]
+        return result
+
+    @property
+    def cli_commands(self):
+        # ['list ltm virtual']
+        commands = self.normalized_commands
+        commands = self.convert_commands_cli(commands)
+        if self.chdir:
+            # ['cd /Common; list ltm virtual']
+            for command in commands:
+                self.addon_chdir(command)
+        if not self.is_tmsh:
+            # ['tmsh -c "cd /Common; list ltm virtual"']
+            for command in commands:
+                self.addon_tmsh_cli(command)
+        for command in commands:
+            self.merge_command_dict_cli(command)
+        result = [x['command'] for x in commands]
+        return result
+
+    @property
+    def normalized_commands(self):
+        if self._values['normalized_commands'] is None:
+            return None
+        return deque(self._values['normalized_commands'])
+
+    @property
+    def chdir(self):
+        if self._values['chdir'] is None:
+            return None
+        if self._values['chdir'].startswith('/'):
+            return self._values['chdir']
+        return '/{0}'.format(self._values['chdir'])
+
+    @property
+    def user_commands(self):  # pragma: no cover
+        commands = self.raw_commands
+        return map(self._ensure_tmsh_prefix, commands)
+
+    @property
+    def wait_for(self):
+        return self._values['wait_for'] or list()
+
+    def addon_tmsh(self, command):
+        escape_patterns = r'([$"])'
+        if command['command'].count('"') % 2 != 0:
+            raise Exception('Double quotes are unbalanced')
+        command['command'] = re.sub(escape_patterns, r'\\\\\\\1', command['command'])
+        command['command'] = 'tmsh -c \\\"{0}\\\"'.format(command['command'])
+
+    def addon_tmsh_cli(self, command):
+        if command['command'].count('"') % 2 != 0:
+            raise Exception('Double quotes are unbalanced')
+        command['command'] = 'tmsh -c "{0}"'.format(command['command'])
+
+    def addon_chdir(self, command):
+        command['command'] = "cd {0}; {1}".format(self.chdir, command['command'])
+
+
+def normalize_commands(raw_commands):
+    """Strips the commands and their ``tmsh`` prefix"""
+    if not raw_commands:
+        return None
+    result = []
+    for command in raw_commands:
+        command = command.strip()
+        if command[0:5] == 'tmsh ':
+            command = command[4:].strip()
+        result.append(command)
+    return result
+
+
+def determine_change(commands, responses):
+    """Check whether the normalized ``commands`` changed the configuration of the device"""
+    changer = NoChangeReporter()
+    if changer.find_no_change(responses):
+        return False
+    if any(x for x in commands if x.startswith(CHANGED_COMMAND_PREFIXES)):
+        return True
+    return False
+
+
+def check_known_errors(responses):
+    for resp in responses:
+        if 'usage: tmsh' in resp:
+            raise F5ModuleError(
+                "tmsh command printed its 'help' message instead of running your command. "
+                "This usually indicates unbalanced quotes."
+            )
+
+
+def referenced_commands(conditionals, count):
+    """Returns the indexes of the commands whose output the conditionals evaluate
+
+    Arguments:
+        conditionals (list): The conditionals which are not satisfied yet.
+        count (int): The number of commands.
+
+    Returns:
+        list: The indexes, of all the commands when a conditional does not reference
+            the output of a single command.
+    """
+    result = set()
+    for item in conditionals:
+        match = re.match(r'^result\[(\d+)\]', item.key)
+        if not match or int(match.group(1)) >= count:
+            return list(range(count))
+        result.add(int(match.group(1)))
+    return sorted(result)
+
+
+def batch_command(commands, delimiter):
+    """Returns a single shell command running ``commands`` one after the other
+
+    The output of each command is followed by ``delimiter``, which should be unique to the
+    run, so the output of the commands cannot be mistaken for it.
+
+    Arguments:
+        commands (list): The commands, as returned by ``CommandParameters.rest_commands``.
+        delimiter (string): The delimiter of the output of the commands.
+    """
+    return ' '.join(
+        '{0}; echo {1};'.format(command.strip().rstrip(';'), delimiter) for command in commands
+    )
+
+
+def split_batch_output(output, delimiter, count):
+    """Splits the output of a ``batch_command`` into the output of each command
+
+    Raises:
+        F5ModuleError: Raised when the output of some of the commands is missing.
+    """
+    parts = output.split(delimiter)
+    if len(parts) != count + 1:
+        raise F5ModuleError(
+            "The output of {0} of the {1} batched commands was returned by the device.".format(
+                len(parts) - 1, count
+            )
+        )
+    return [x.strip() for x in parts[:-1]]
+
+
+def wait_for_conditionals(execute, commands, conditionals, match='all', retries=10, interval=1, rerun=False):
+    """Runs the commands until the conditionals are satisfied
+
+    Arguments:
+        execute (callable): Runs a list of commands and returns their output.
+        commands (list): The commands to run.
+        conditionals (list): The ``Conditional`` objects evaluating the output of the commands.
+        match (string): Whether ``all`` or ``any`` of the conditionals must be satisfied.
+        retries (int): The maximum number of times the commands are run.
+        interval (int): The number of seconds to wait between runs.
+        rerun (bool): Whether only the commands referenced by the conditionals which are not
+            satisfied are run again, rather than all of them.
+
+    Raises:
+        FailedConditionsError: Raised when the conditionals are not satisfied after ``retries`` runs.
+
+    Returns:
+        list: The output of the commands.
+    """
+    conditionals = list(conditionals)
+    responses = None
+    indexes = None
+    while retries > 0:
+        if indexes is None:
+            responses = execute(commands)
+        else:
+            for index, response in zip(indexes, execute([commands[x] for x in indexes])):
+                responses[index] = response
+        check_known_errors(responses)
+        for item in list(conditionals):
+            if item(responses):
+                if match == 'any':
+                    conditionals = list()
+                    break
+                conditionals.remove(item)
+        if not conditionals:
+            return responses
+        if rerun:
+            indexes = referenced_commands(conditionals, len(commands))
+
+        time.sleep(interval)
+        retries -= 1
+    failed_conditions = [item.raw for item in conditionals]
+    errmsg = 'One or more conditional statements have not been satisfied.'
+    raise FailedConditionsError(errmsg, failed_conditions)
@@ -16,6 +16,11 @@ MANAGED_BY_ANNOTATION_MODIFIED = 'f5-ansible.last_modified'
 
 LOGIN = '/mgmt/shared/authn/login'
 LOGOUT = '/mgmt/shared/authz/tokens/'
+TOKEN_EXCHANGE = '/mgmt/shared/authn/exchange'
+# tokens are extended or renewed when fewer than this many seconds of their lifetime remain
+TOKEN_REFRESH_MARGIN = 120
+# the longest lifetime, in seconds, BIG-IP accepts for an authentication token
+TOKEN_MAX_TIMEOUT = 36000
 
 VELOS_LOGIN = '/restconf/data/openconfig-system:system/aaa'
 VELOS_ROOT = '/restconf/data'
@@ -31,6 +36,9 @@ TEEM_ENDPOINT = 'product.apis.f5.com',
 TEEM_KEY = 'mmhJU2sCd63BznXAXDh4kxLIyfIMm3Ar'
 TEEM_TIMEOUT = 10
 TEEM_VERIFY = False
+TEEM_SPOOL = os.path.join(os.path.expanduser('~'), '.ansible', 'f5_teem_spool.jsonl')
+TEEM_BATCH_SIZE = 100
+TEEM_FLUSH_DELAY = 5
 
 CICD_ENV = {
     'bamboo.buildKey': 'Bamboo',
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2026 F5 Networks Inc.
+# GNU General Public License v3.0 (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import json
+
+from ansible.module_utils._text import to_text
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+def _select_backend():
+    if orjson is not None:
+        return 'orjson', orjson.loads
+    if ujson is not None:
+        return 'ujson', ujson.loads
+    return 'json', json.loads
+
+
+BACKEND, _loads = _select_backend()
+
+
+def loads(data):
+    """Decodes a JSON document with the fastest JSON library available
+
+    The orjson and ujson libraries decode UTF-8 bytes directly, without the text copy of
+    the whole document the standard library needs. Documents they reject, such as
+    documents with NaN values or invalid UTF-8 sequences, are decoded again with the
+    standard library.
+
+    Arguments:
+        data (bytes|str): The JSON document.
+
+    Raises:
+        ValueError: Raised when the document is not valid JSON.
+    """
+    try:
+        return _loads(data)
+    except ValueError:
+        if _loads is json.loads:
+            raise
+    return json.loads(to_text(data))
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2026 F5 Networks Inc.
+# GNU General Public License v3.0 (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+class AdaptivePager(object):
+    """Chooses the size of the pages a collection is read with
+
+    The size starts at the page size given by the user. When ``adapt`` is enabled it
+    doubles, up to ``max_size``, after full pages which were quick to read and small,
+    and it is halved, down to ``min_size``, after pages which took longer than
+    ``target`` seconds or were larger than ``max_bytes``. Small collections are then
+    read with few requests, while devices slow to answer large pages get smaller ones.
+
+    The end of the collection is found from the ``totalItems`` or ``totalPages`` values
+    of the responses when the device returns them, which avoids the request for an empty
+    page after the last one.
+    """
+
+    def __init__(self, size, adapt=False, min_size=1, max_size=500, target=1.0, max_bytes=4 * 1024 * 1024):
+        self.size = size
+        self.adapt = adapt
+        self.min_size = min(min_size, size)
+        self.max_size = max(max_size, size)
+        self.target = target
+        self.max_bytes = max_bytes
+
+    def update(self, count, elapsed, size=None):
+        """Adapts the page size to the measurements of the page just read
+
+        Arguments:
+            count (int): The number of items of the page.
+            elapsed (float): The number of seconds the request of the page took.
+            size (int): The size of the response in bytes, or None when it is unknown.
+        """
+        if not self.adapt:
+            return
+        if elapsed > self.target or (size is not None and size > self.max_bytes):
+            self.size = max(self.size // 2, self.min_size)
+        elif count >= self.size and elapsed < self.target / 2 and (size is None or size < self.max_bytes / 2):
+            self.size = min(self.size * 2, self.max_size)
+
+    @staticmethod
+    def last(skip, count, info):
+        """Check whether a page is the last one of the collection
+
+        Arguments:
+            skip (int): The number of items before the page.
+            count (int): The number of items of the page.
+            info (dict): The paging information of the response, see ``page_info``.
+
+        Returns:
+            bool: True if the device reported that no items follow this page. False otherwise.
+        """
+        if info.get('total_items') is not None:
+            return skip + count >= info['total_items']
+        if info.get('total_pages') is not None and info.get('page_index') is not None:
+            return info['page_index'] >= info['total_pages']
+        return False
+
+
+def page_info(response, elapsed):
+    """Returns the paging information of a collection response
+
+    Arguments:
+        response (dict): The response returned by the F5Client.
+        elapsed (float): The number of seconds the request took.
+    """
+    contents = response.get('contents')
+    if not isinstance(contents, dict):
+        contents = dict()
+    return dict(
+        total_items=contents.get('totalItems'),
+        total_pages=contents.get('totalPages'),
+        page_index=contents.get('pageIndex'),
+        size=content_length(response.get('headers')),
+        elapsed=elapsed,
+    )
+
+
+def content_length(headers):
+    """Returns the value of the Content-Length header, or None
+
+    Arguments:
+        headers (list|dict): Response headers, as name and value pairs or as a dictionary.
+    """
+    if not headers:
+        return None
+    if isinstance(headers, dict):
+        headers = headers.items()
+    for name, value in headers:
+        if name.lower() == 'content-length':
+            try:
+                return int(value)
+            except ValueError:
+                return None
+    return None
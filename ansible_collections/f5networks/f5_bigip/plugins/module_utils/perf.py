@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2026 F5 Networks Inc.
+# GNU General Public License v3.0 (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import json
+import os
+import re
+import threading
+import time
+
+from collections import deque
+
+from ansible.module_utils.urls import urlparse
+
+# segments of REST paths naming a single object rather than a collection or endpoint
+OBJECT_SEGMENT = re.compile(r'(~|\.|:|^[0-9]+$|^[0-9a-fA-F-]{32,}$|^[A-Za-z0-9_-]{26,}$)')
+
+
+def path_template(url):
+    """Returns the path of a REST request with object names and ids replaced by a placeholder
+
+    Requests for different objects of the same kind then add up to the same endpoint, for
+    example ``/mgmt/tm/ltm/pool/~Common~web/members/~Common~10.1.1.1:80`` becomes
+    ``/mgmt/tm/ltm/pool/{name}/members/{name}``.
+    """
+    path = urlparse(url).path
+    segments = []
+    for segment in path.split('/'):
+        if segment and OBJECT_SEGMENT.search(segment):
+            segments.append('{name}')
+        else:
+            segments.append(segment)
+    return '/'.join(segments)
+
+
+class RequestRecorder(object):
+    """Records the requests a persistent connection sends to the device
+
+    Every request is recorded with its method, path template, status, the number of
+    bytes sent and received, its latency, and the number of retries and authentication
+    refreshes it caused. The latest records are kept in memory to summarize the requests
+    of a module run, and are appended to ``trace`` when a trace file is set.
+
+    Traces are written as JSON lines, or in the Chrome trace event format which can be
+    loaded in chrome://tracing or Perfetto. Both formats are append-only, so the
+    connections to all hosts of a play can write to the same file.
+    """
+
+    def __init__(self, size=10000, trace=None, trace_format='jsonl', host=None):
+        self.records = deque(maxlen=size)
+        self.trace = trace
+        self.trace_format = trace_format
+        self.host = host
+        self.lock = threading.Lock()
+        self.counters = dict(retries=0, auth_refreshes=0)
+
+    def count(self, name):
+        with self.lock:
+            self.counters[name] += 1
+
+    def mark(self):
+        """Returns the current counters, to attribute retries and refreshes to a request"""
+        with self.lock:
+            return dict(self.counters)
+
+    def record(self, method, url, status, started, bytes_out=0, bytes_in=0, mark=None):
+        elapsed = time.time() - started
+        with self.lock:
+            counters = dict(
+                (k, v - mark.get(k, 0)) for k, v in self.counters.items()
+            ) if mark else dict((k, 0) for k in self.counters)
+        item = dict(
+            ts=started,
+            method=method or 'GET',
+            path=path_template(url),
+            status=status,
+            bytes_out=bytes_out,
+            bytes_in=bytes_in,
+            latency=round(elapsed, 6),
+            **counters
+        )
+        with self.lock:
+            self.records.append(item)
+        if self.trace:
+            self._write_trace(item)
+        return item
+
+    def since(self, started):
+        with self.lock:
+            return [x for x in self.records if x['ts'] >= started]
+
+    def _write_trace(self, item):
+        path = os.path.expanduser(self.trace)
+        if self.trace_format == 'chrome':
+            try:
+                # the opening bracket is written once, Chrome accepts an unterminated event array
+                fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+                os.write(fd, b'[\n')
+                os.close(fd)
+            except OSError:
+                pass
+            event = dict(
+                name='{0} {1}'.format(item['method'], item['path']),
+                cat='icontrol',
+                ph='X',
+                ts=int(item['ts'] * 1000000),
+                dur=int(item['latency'] * 1000000),
+                pid=os.getpid(),
+                tid=threading.current_thread().ident,
+                args=dict(
+                    host=self.host, status=item['status'], bytes_out=item['bytes_out'],
+                    bytes_in=item['bytes_in'], retries=item['retries'], auth_refreshes=item['auth_refreshes']
+                )
+            )
+            line = json.dumps(event) + ',\n'
+        else:
+            line = json.dumps(dict(item, host=self.host)) + '\n'
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line.encode('utf-8'))
+        finally:
+            os.close(fd)
+
+
+def summarize(records, top=10):
+    """Summarizes request records, listing the endpoints which took the most time
+
+    Arguments:
+        records (list): Records returned by ``RequestRecorder.since``.
+        top (int): The number of endpoints to list.
+
+    Returns:
+        dict: The totals of the requests, and the ``top`` endpoints by total time.
+    """
+    endpoints = dict()
+    for item in records:
+        key = (item['method'], item['path'])
+        endpoint = endpoints.setdefault(key, dict(
+            method=item['method'], path=item['path'], count=0, total_time=0.0, max_time=0.0,
+            bytes_out=0, bytes_in=0, errors=0
+        ))
+        endpoint['count'] += 1
+        endpoint['total_time'] += item['latency']
+        endpoint['max_time'] = max(endpoint['max_time'], item['latency'])
+        endpoint['bytes_out'] += item['bytes_out']
+        endpoint['bytes_in'] += item['bytes_in']
+        if item['status'] >= 400:
+            endpoint['errors'] += 1
+    ranked = sorted(endpoints.values(), key=lambda x: x['total_time'], reverse=True)[:top]
+    for endpoint in ranked:
+        endpoint['total_time'] = round(endpoint['total_time'], 3)
+        endpoint['max_time'] = round(endpoint['max_time'], 3)
+    return dict(
+        requests=len(records),
+        total_time=round(sum(x['latency'] for x in records), 3),
+        bytes_out=sum(x['bytes_out'] for x in records),
+        bytes_in=sum(x['bytes_in'] for x in records),
+        errors=sum(1 for x in records if x['status'] >= 400),
+        retries=sum(x['retries'] for x in records),
+        auth_refreshes=sum(x['auth_refreshes'] for x in records),
+        top_endpoints=ranked
+    )
@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2026 F5 Networks Inc.
+# GNU General Public License v3.0 (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import re
+import socket
+
+from ansible.module_utils.connection import ConnectionError
+from ansible.module_utils.six import string_types
+
+from .common import F5ModuleError
+from .tasks import TaskWaiter
+
+# The stages a device goes through while its services restart, in the order they are probed.
+STAGES = ('connect', 'restjavad', 'mcpd', 'config')
+
+MCP_STATE_COMMAND = 'tmsh show sys mcp-state field-fmt'
+MCP_STATE_FIELDS = {
+    'phase': re.compile(r'^\s*phase\s+(\S+)', re.M),
+    'lastConfigLoadStatus': re.compile(r'^\s*last-config-load-status\s+(\S+)', re.M),
+}
+
+# errors of requests which did not reach the device, the built-in ConnectionError included
+REQUEST_ERRORS = (ConnectionError, OSError)
+
+CONFIG_LOAD_SUCCEEDED = 'full-config-load-succeed'
+CONFIG_LOAD_FAILED = 'base-config-load-failed'
+
+
+class ReadinessProbe(object):
+    """Finds out whether a device restarting its services is ready again
+
+    The device is probed in stages, each stage is checked only once the previous ones
+    passed, and the probe stops at the first stage which is not ready:
+
+    * ``connect``, a TCP connection to the management port of the device can be opened.
+    * ``restjavad``, the REST framework answers ``/mgmt/shared/echo``.
+    * ``mcpd``, the ``sys mcp-state`` statistics report the ``running`` phase.
+    * ``config``, the last configuration load status is ``full-config-load-succeed``.
+    * ``service``, the ``service`` URI answers, for services such as Declarative
+      Onboarding which report their own availability.
+
+    Every check is a single request sent with a short timeout, so a device still booting
+    costs a failed connection rather than a hanging request. The ``connect`` stage is
+    skipped when the address of the device is not known to the module.
+
+    ``wait`` repeats the checks with exponential backoff until the device is ready. The
+    stage the device is waiting on, along with the number of probes sent, is reported by
+    ``to_return``.
+    """
+
+    def __init__(self, client, stages=STAGES[:3], service=None, timeout=5,
+                 first_delay=1, max_delay=10):
+        self.client = client
+        self.stages = list(stages)
+        self.service = service
+        self.timeout = timeout
+        self.waiter = TaskWaiter(first_delay=first_delay, max_delay=max_delay)
+        self.stage = None
+        self.ready = None
+        self.probes = 0
+        self.load_status = None
+        self._use_bash = False
+        self._state = None
+
+    def check(self, until=None):
+        """Probes the stages of the device once
+
+        Arguments:
+            until (str): The last stage to probe, all stages are probed when it is None.
+
+        Raises:
+            F5ModuleError: Raised when the device reports that its configuration failed to load.
+
+        Returns:
+            bool: True if the device passed all probed stages. False otherwise.
+        """
+        self._state = None
+        self.probes += 1
+        for stage in self._stages(until):
+            if not getattr(self, '_check_{0}'.format(stage))():
+                self.stage = stage
+                self.ready = False
+                return False
+        self.stage = None
+        self.ready = True
+        return True
+
+    def wait(self, timeout, until=None):
+        """Probes the device until it is ready or ``timeout`` seconds have passed
+
+        Arguments:
+            timeout (int): The number of seconds to wait for the device.
+            until (str): The last stage to wait for, all stages are waited for when it is None.
+
+        Returns:
+            bool: True if the device is ready. False if it was not ready in time.
+        """
+        for x in self.waiter.polls(timeout):
+            if self.check(until):
+                return True
+        return False
+
+    def _stages(self, until):
+        if until is None:
+            return self.stages
+        return self.stages[:self.stages.index(until) + 1]
+
+    def _check_connect(self):
+        address = device_address(self.client)
+        if address is None:
+            return True
+        try:
+            sock = socket.create_connection(address, timeout=self.timeout)
+        except REQUEST_ERRORS:
+            return False
+        sock.close()
+        return True
+
+    def _check_restjavad(self):
+        return self._available('/mgmt/shared/echo')
+
+    def _check_service(self):
+        return self._available(self.service)
+
+    def _check_mcpd(self):
+        return self._mcp_state().get('phase') == 'running'
+
+    def _check_config(self):
+        self.load_status = self._mcp_state().get('lastConfigLoadStatus')
+        if self.load_status == CONFIG_LOAD_FAILED:
+            raise F5ModuleError(
+                "The device failed to load its configuration, the last configuration "
+                "load status is {0}.".format(self.load_status)
+            )
+        return self.load_status == CONFIG_LOAD_SUCCEEDED
+
+    def _available(self, uri):
+        try:
+            response = self.client.get(uri, timeout=self.timeout)
+        except REQUEST_ERRORS:
+            return False
+        return response['code'] in [200, 201, 202]
+
+    def _mcp_state(self):
+        # the mcpd and config stages are read from the same response
+        if self._state is None:
+            self._state = self._read_mcp_state()
+        return self._state
+
+    def _read_mcp_state(self):
+        if not self._use_bash:
+            try:
+                response = self.client.get('/mgmt/tm/sys/mcp-state', timeout=self.timeout)
+            except REQUEST_ERRORS:
+                return dict()
+            if response['code'] not in [200, 201, 202]:
+                return dict()
+            state = mcp_state_from_stats(response['contents'])
+            if 'phase' in state:
+                return state
+            # versions whose statistics lack the phase are asked through tmsh from now on
+            self._use_bash = True
+        params = dict(command='run', utilCmdArgs='-c "{0}"'.format(MCP_STATE_COMMAND))
+        try:
+            response = self.client.post('/mgmt/tm/util/bash', data=params, timeout=self.timeout)
+        except REQUEST_ERRORS:
+            return dict()
+        if response['code'] not in [200, 201, 202] or 'commandResult' not in response['contents']:
+            return dict()
+        return mcp_state_from_output(response['contents']['commandResult'])
+
+    def to_return(self):
+        if not self.probes:
+            return dict()
+        return dict(readiness=dict(
+            ready=self.ready,
+            stage=self.stage,
+            probes=self.probes,
+            waited=round(self.waiter.slept, 2),
+        ))
+
+
+def mcp_state_from_stats(contents):
+    """Returns the phase and last configuration load status of ``sys mcp-state`` statistics
+
+    Arguments:
+        contents (dict): The contents of the ``/mgmt/tm/sys/mcp-state`` response.
+    """
+    result = dict()
+    nodes = [contents]
+    while nodes:
+        node = nodes.pop()
+        if not isinstance(node, dict):
+            continue
+        for key, value in node.items():
+            if key in MCP_STATE_FIELDS and isinstance(value, dict) and 'description' in value:
+                result[key] = value['description']
+            else:
+                nodes.append(value)
+    return result
+
+
+def mcp_state_from_output(output):
+    """Returns the phase and last configuration load status of ``tmsh show sys mcp-state field-fmt``"""
+    result = dict()
+    for key, pattern in MCP_STATE_FIELDS.items():
+        match = pattern.search(output)
+        if match:
+            result[key] = match.group(1)
+    return result
+
+
+def device_address(client):
+    """Returns the host and port of the management interface of the device, or None
+
+    Arguments:
+        client (F5Client): The client of the module.
+    """
+    try:
+        host = client.plugin.get_option('host')
+        port = client.plugin.get_option('port')
+    except (AttributeError, ConnectionError):
+        return None
+    if not host or not isinstance(host, string_types):
+        return None
+    if not isinstance(port, int) or isinstance(port, bool):
+        port = 443
+    return host, port
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2026 F5 Networks Inc.
+# GNU General Public License v3.0 (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+
+# characters kept in the names of snapshot files and directories
+UNSAFE = re.compile(r'[^A-Za-z0-9_.-]')
+
+
+def fingerprint(items):
+    """Returns a digest of the items of a collection
+
+    The digest changes whenever an object of the collection is created, deleted, renamed
+    or modified, because every modification raises the ``generation`` of the object.
+    """
+    data = json.dumps(list(items), sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+class SnapshotStore(object):
+    """Facts gathered from devices, stored on the controller between runs
+
+    Each subset of each device and partition is stored in its own JSON file, along with the
+    fingerprint of the collection it was read from, in a directory per device. Files are
+    readable only by their owner, and replaced atomically, so runs gathering facts from
+    many devices at the same time never read a partially written snapshot. An unreadable
+    snapshot is treated as missing.
+    """
+
+    def __init__(self, path, host):
+        self.path = os.path.join(os.path.expanduser(path), UNSAFE.sub('_', str(host)))
+
+    def _file(self, subset, partition):
+        name = '{0}-{1}.json'.format(subset, partition)
+        return os.path.join(self.path, UNSAFE.sub('_', name))
+
+    def get(self, subset, partition, digest):
+        """Returns the stored facts of ``subset`` if they were read from a collection with the same fingerprint"""
+        try:
+            with open(self._file(subset, partition)) as fh:
+                entry = json.load(fh)
+        except (IOError, OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get('fingerprint') != digest:
+            return None
+        return entry.get('facts')
+
+    def set(self, subset, partition, digest, facts):
+        if not os.path.isdir(self.path):
+            try:
+                os.makedirs(self.path, 0o700)
+            except OSError:
+                # another run created it in the meantime
+                if not os.path.isdir(self.path):
+                    raise
+        fd, tmp = tempfile.mkstemp(dir=self.path, prefix='.snapshot-')
+        try:
+            with os.fdopen(fd, 'w') as fh:
+                json.dump(dict(fingerprint=digest, time=time.time(), facts=facts), fh, sort_keys=True)
+            os.rename(tmp, self._file(subset, partition))
+        except Exception:
+            os.unlink(tmp)
+            raise
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2026 F5 Networks Inc.
+# GNU General Public License v3.0 (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import random
+import time
+
+from email.utils import mktime_tz, parsedate_tz
+
+# Response codes ATC services use to signal that they are too busy to answer right now.
+BUSY_CODES = [429, 503]
+
+
+class TaskWaiter(object):
+    """Polls asynchronous ATC tasks with exponential backoff
+
+    The first poll is sent right away and the interval between the following polls
+    doubles, with random jitter, up to ``max_delay`` seconds. Short tasks complete after
+    a few quick polls, while long running tasks do not keep the REST framework busy
+    with frequent polls.
+
+    The deadline of a wait is enforced in wall-clock seconds rather than in number of
+    polls, so the time taken by the polls themselves counts towards it.
+
+    A single waiter is meant to be used by a ModuleManager for all of its waits, the
+    polling metrics of each wait are added up and reported with ``to_return``.
+    """
+
+    def __init__(self, first_delay=0.5, max_delay=15, factor=2, jitter=0.1):
+        self.first_delay = first_delay
+        self.max_delay = max_delay
+        self.factor = factor
+        self.jitter = jitter
+        self.polls_count = 0
+        self.busy_count = 0
+        self.slept = 0.0
+        self.elapsed = 0.0
+        self._retry_after = None
+
+    def polls(self, timeout):
+        """Yields once for every poll until ``timeout`` seconds have passed
+
+        Callers return from the loop when the task completes, and raise their own timeout
+        error when the loop ends.
+
+        Arguments:
+            timeout (int): The number of seconds to wait for the task.
+        """
+        started = time.time()
+        elapsed_before = self.elapsed
+        delay = self.first_delay
+        self._retry_after = None
+        while True:
+            self.polls_count += 1
+            yield self.polls_count
+            elapsed = time.time() - started
+            self.elapsed = elapsed_before + elapsed
+            remaining = timeout - elapsed
+            if remaining <= 0:
+                return
+            if self._retry_after is not None:
+                pause = self._retry_after
+                self._retry_after = None
+            else:
+                pause = delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+                delay = min(delay * self.factor, self.max_delay)
+            pause = min(pause, remaining)
+            time.sleep(pause)
+            self.slept += pause
+
+    def busy(self, response):
+        """Check whether a task status response asks to poll again later
+
+        Only busy responses carrying a Retry-After header are retried, the next poll is
+        then sent after the number of seconds requested by the service. Other error
+        responses are left to the caller.
+
+        Arguments:
+            response (dict): The response returned by the F5Client.
+
+        Returns:
+            bool: True if the service asked to poll the task status later. False otherwise.
+        """
+        if response['code'] not in BUSY_CODES:
+            return False
+        retry_after = retry_after_seconds(response.get('headers'))
+        if retry_after is None:
+            return False
+        self.busy_count += 1
+        self._retry_after = retry_after
+        return True
+
+    def metrics(self):
+        return dict(
+            polls=self.polls_count,
+            busy_responses=self.busy_count,
+            waited=round(self.slept, 2),
+            elapsed=round(self.elapsed, 2),
+        )
+
+    def to_return(self):
+        if not self.polls_count:
+            return dict()
+        return dict(task_polling=self.metrics())
+
+
+def retry_after_seconds(headers):
+    """Returns the number of seconds requested by a Retry-After header, or None
+
+    Arguments:
+        headers (list|dict): Response headers, as name and value pairs or as a dictionary.
+    """
+    if not headers:
+        return None
+    if isinstance(headers, dict):
+        headers = headers.items()
+    value = None
+    for name, header in headers:
+        if name.lower() == 'retry-after':
+            value = header.strip()
+            break
+    if value is None:
+        return None
+    if value.isdigit():
+        return int(value)
+    parsed = parsedate_tz(value)
+    if parsed is None:
+        return None
+    return max(0, mktime_tz(parsed) - time.time())
@@ -13,6 +13,7 @@ import re
 import random
 import os
 import socket
+import threading
 
 from time import time
 from ssl import SSLError
@@ -24,7 +25,8 @@ from ansible.module_utils.six.moves.urllib.error import (
 )
 
 from .constants import (
-    TEEM_ENDPOINT, TEEM_KEY, TEEM_TIMEOUT, TEEM_VERIFY, BASE_HEADERS, PLATFORM, CICD_ENV
+    TEEM_ENDPOINT, TEEM_KEY, TEEM_TIMEOUT, TEEM_VERIFY, TEEM_SPOOL, TEEM_BATCH_SIZE, TEEM_FLUSH_DELAY,
+    BASE_HEADERS, PLATFORM, CICD_ENV
 )
 
 from .version import CURRENT_COLL_VERSION
@@ -40,76 +42,209 @@ class TeemClient:
 
     def prepare_request(self):
         self.docker = in_docker()
-        dai = generate_asset_id(socket.gethostname())
-        user_agent = f'{self.coll_name}/{CURRENT_COLL_VERSION}'
-        telemetry = self.build_telemetry()
-        url = 'https://%s/ee/v1/telemetry' % TEEM_ENDPOINT
-        headers = {
-            'F5-ApiKey': TEEM_KEY,
-            'F5-DigitalAssetId': str(dai),
-            'F5-TraceId': str(uuid.uuid4()),
-            'User-Agent': user_agent
-        }
-        headers.update(BASE_HEADERS)
-        data = {
-            'digitalAssetName': self.coll_name,
-            'digitalAssetVersion': CURRENT_COLL_VERSION,
-            'digitalAssetId': str(dai),
-            'documentType': f'{self.coll_name} Ansible Collection',
-            'documentVersion': '1',
-            'observationStartTime': self.start_time,
-            'observationEndTime': datetime.now().isoformat(),
-            'epochTime': time(),
-            'telemetryId': str(uuid.uuid4()),
-            'telemetryRecords': telemetry
-        }
-
-        return url, headers, data
+        return prepare_request(
+            self.coll_name, self.start_time, datetime.now().isoformat(), self.build_telemetry()
+        )
 
     def send(self):
         url, headers, data = self.prepare_request()
-        payload = json.dumps(data)
-        try:
-            response = open_url(
-                url=url,
-                method='POST',
-                headers=headers,
-                timeout=TEEM_TIMEOUT,
-                validate_certs=TEEM_VERIFY,
-                data=payload
-            )
-        # we need to ensure that any connection errors to TEEM do not cause failure of module to run.
-        except (HTTPError, URLError, SSLError):
-            return None
+        return post_telemetry(url, headers, data)
 
-        ok = re.search(r'20[01-4]', str(response.code))
-        if ok:
-            return True
-        return False
+    def record(self):
+        """Returns the telemetry of the module run, to be queued in the TEEM spool
 
-    def build_telemetry(self):
+        Unlike ``prepare_request`` this sends no request to the device and does not inspect
+        the controller, only the fields known to the module are recorded. The connection
+        plugin adds the platform and the software version of the device from its metadata
+        cache, the controller fields are added when the spool is flushed.
+        """
+        return dict(
+            collection=self.coll_name,
+            start=self.start_time,
+            end=datetime.now().isoformat(),
+            version=self.f5client.tmos_version,
+            telemetry=[self.task_telemetry()]
+        )
+
+    def task_telemetry(self):
         module_name = self.f5client.module_name
         if self.coll_name.lower() in module_name:
             module_name = module_name.split('.')[2]
-        tmp, version = self.f5client.platform
-        platform = PLATFORM.get(tmp, 'unknown')
         ansible_version = self.f5client.ansible_version
         python_version = sys.version.split(' ', maxsplit=1)[0]
         self.in_ci, ci_name = in_cicd()
 
-        return [{
+        return {
             'CollectionName': f'{self.coll_name}',
             'CollectionVersion': CURRENT_COLL_VERSION,
             'CollectionModuleName': module_name,
-            'f5Platform': platform,
-            'f5SoftwareVersion': version,
             'ControllerAnsibleVersion': ansible_version,
             'ControllerPythonVersion': python_version,
-            'ControllerAsDocker': self.docker,
-            'DockerHostname': socket.gethostname() if self.docker else 'none',
             'RunningInCiEnv': self.in_ci,
             'CiEnvName': ci_name if self.in_ci else 'none'
-        }]
+        }
+
+    def build_telemetry(self):
+        telemetry = self.task_telemetry()
+        tmp, version = self.f5client.platform
+        telemetry.update({
+            'f5Platform': PLATFORM.get(tmp, 'unknown'),
+            'f5SoftwareVersion': version,
+            'ControllerAsDocker': self.docker,
+            'DockerHostname': socket.gethostname() if self.docker else 'none',
+        })
+        return [telemetry]
+
+
+class TeemSpool(object):
+    """Append-only spool of telemetry records waiting to be sent to F5
+
+    Modules hand their telemetry record to the connection plugin, which adds the platform
+    and software version of the device, appends it to the spool and schedules a flush on
+    a background thread. Records queued within ``flush_delay`` seconds of each other are
+    sent together, in batches of up to ``batch_size`` records, so no task waits on the
+    TEEM endpoint.
+
+    The spool file is shared by all connections of the controller. A flush claims the
+    records by renaming the file, records left behind by a connection which exited
+    before its flush are sent by the next flush.
+    """
+
+    def __init__(self, path=TEEM_SPOOL, batch_size=TEEM_BATCH_SIZE, flush_delay=TEEM_FLUSH_DELAY):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_delay = flush_delay
+        self.lock = threading.Lock()
+        self.timer = None
+
+    def append(self, record):
+        dirname = os.path.dirname(self.path)
+        if dirname and not os.path.isdir(dirname):
+            os.makedirs(dirname)
+        line = json.dumps(record) + '\n'
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+        try:
+            os.write(fd, line.encode('utf-8'))
+        finally:
+            os.close(fd)
+
+    def queue(self, record):
+        """Append the record to the spool and schedule a flush, if none is pending"""
+        self.append(record)
+        with self.lock:
+            if self.timer is not None and self.timer.is_alive():
+                return
+            self.timer = threading.Timer(self.flush_delay, self._flush_in_background)
+            self.timer.daemon = True
+            self.timer.start()
+
+    def claim(self):
+        """Moves the spooled records out of the spool file and returns them"""
+        claimed = '{0}.{1}'.format(self.path, uuid.uuid4().hex)
+        try:
+            os.rename(self.path, claimed)
+        except OSError:
+            return []
+        records = []
+        try:
+            with open(claimed) as fh:
+                for line in fh:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        # a partially written line, there is nothing to recover from it
+                        continue
+        finally:
+            os.remove(claimed)
+        return records
+
+    def flush(self):
+        """Sends the spooled records to F5
+
+        Telemetry is best effort, records of a batch which could not be sent are dropped.
+
+        Returns:
+            int: The number of records accepted by the TEEM endpoint.
+        """
+        records = self.claim()
+        if not records:
+            return 0
+        docker = in_docker()
+        hostname = socket.gethostname() if docker else 'none'
+        sent = 0
+        for idx in range(0, len(records), self.batch_size):
+            batch = records[idx:idx + self.batch_size]
+            telemetry = []
+            for record in batch:
+                for item in record['telemetry']:
+                    item.setdefault('f5Platform', PLATFORM.get(record.get('platform'), 'unknown'))
+                    item.setdefault('f5SoftwareVersion', record.get('version') or 'unknown')
+                    item['ControllerAsDocker'] = docker
+                    item['DockerHostname'] = hostname
+                    telemetry.append(item)
+            url, headers, data = prepare_request(
+                batch[0].get('collection', 'F5_BIGIP'),
+                min(x['start'] for x in batch),
+                max(x['end'] for x in batch),
+                telemetry
+            )
+            if post_telemetry(url, headers, data):
+                sent += len(batch)
+        return sent
+
+    def _flush_in_background(self):
+        try:
+            self.flush()
+        except (IOError, OSError, ValueError, KeyError):
+            # telemetry must never disturb the connection serving the tasks
+            pass
+
+
+def prepare_request(coll_name, start_time, end_time, telemetry):
+    dai = generate_asset_id(socket.gethostname())
+    user_agent = f'{coll_name}/{CURRENT_COLL_VERSION}'
+    url = 'https://%s/ee/v1/telemetry' % TEEM_ENDPOINT
+    headers = {
+        'F5-ApiKey': TEEM_KEY,
+        'F5-DigitalAssetId': str(dai),
+        'F5-TraceId': str(uuid.uuid4()),
+        'User-Agent': user_agent
+    }
+    headers.update(BASE_HEADERS)
+    data = {
+        'digitalAssetName': coll_name,
+        'digitalAssetVersion': CURRENT_COLL_VERSION,
+        'digitalAssetId': str(dai),
+        'documentType': f'{coll_name} Ansible Collection',
+        'documentVersion': '1',
+        'observationStartTime': start_time,
+        'observationEndTime': end_time,
+        'epochTime': time(),
+        'telemetryId': str(uuid.uuid4()),
+        'telemetryRecords': telemetry
+    }
+    return url, headers, data
+
+
+def post_telemetry(url, headers, data):
+    payload = json.dumps(data)
+    try:
+        response = open_url(
+            url=url,
+            method='POST',
+            headers=headers,
+            timeout=TEEM_TIMEOUT,
+            validate_certs=TEEM_VERIFY,
+            data=payload
+        )
+    # we need to ensure that any connection errors to TEEM do not cause failure of module to run.
+    except (HTTPError, URLError, SSLError):
+        return None
+
+    ok = re.search(r'20[01-4]', str(response.code))
+    if ok:
+        return True
+    return False
 
 
 def generate_asset_id(seed):
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2026 F5 Networks Inc.
+# GNU General Public License v3.0 (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import fcntl
+import json
+import os
+import time
+
+
+class TokenCache(object):
+    """Authentication tokens shared by the persistent connections of the controller
+
+    A connection which starts while a valid token of the same user and device is cached
+    uses that token instead of logging in again. The cache is a JSON file readable only by
+    its owner, which is locked while it is read or updated. An unreadable cache file is
+    treated as empty.
+
+    Entries are dictionaries with at least the ``token`` and the ``expires`` epoch time.
+    """
+
+    def __init__(self, path):
+        self.path = os.path.expanduser(path)
+
+    def _open(self):
+        dirname = os.path.dirname(self.path)
+        if dirname and not os.path.isdir(dirname):
+            os.makedirs(dirname)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        return os.fdopen(fd, 'r+')
+
+    def _load(self, fh):
+        fh.seek(0)
+        data = fh.read()
+        try:
+            entries = json.loads(data) if data else {}
+        except ValueError:
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def get(self, key, margin=0):
+        """Returns the cached entry of ``key`` if it is valid for more than ``margin`` seconds"""
+        if not os.path.exists(self.path):
+            return None
+        with open(self.path) as fh:
+            fcntl.flock(fh, fcntl.LOCK_SH)
+            entry = self._load(fh).get(key)
+        if not isinstance(entry, dict) or entry.get('expires', 0) - time.time() <= margin:
+            return None
+        return entry
+
+    def set(self, key, value):
+        with self._open() as fh:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+            entries = self._load(fh)
+            now = time.time()
+            # expired tokens are of no use to anyone, drop them while the file is locked
+            entries = dict(
+                (k, v) for k, v in entries.items() if isinstance(v, dict) and v.get('expires', 0) > now
+            )
+            if value is None:
+                entries.pop(key, None)
+            else:
+                entries[key] = value
+            fh.seek(0)
+            fh.truncate()
+            json.dump(entries, fh, sort_keys=True)
+
+
+def token_cache_key(connection, user, provider):
+    """Identifies the tokens of a user, login provider and device in the token cache"""
+    return '{0}@{1}:{2}/{3}'.format(
+        user, connection.get_option('host'), connection.get_option('port'), provider
+    )
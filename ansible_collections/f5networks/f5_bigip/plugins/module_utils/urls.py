@@ -6,6 +6,8 @@
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
+from ansible.module_utils.six.moves.urllib.parse import unquote
+
 
 def build_service_uri(base_uri, partition, name):
     """Build the proper uri for a service resource.
@@ -21,62 +23,162 @@ def build_service_uri(base_uri, partition, name):
 
 
 def parseStats(entry):
+    """Flatten an iControl REST stats response.
+
+    Stats responses nest their counters in ``entries`` and ``nestedStats`` objects,
+    with leaf values held in ``description`` or ``value`` keys. This walks the
+    response depth first with an explicit stack rather than recursion, and splits
+    each distinct counter name only once, as collection stats repeat the same
+    names for every object.
+
+    :param entry: dict -- the JSON body of a stats response, or any entry within it
+    :returns: the leaf value, or a dict or list of the flattened entries
+    """
+    return _parse_stats(entry, dict())
+
+
+def _parse_stats(entry, split_names):
+    """Flatten a stats entry, sharing ``split_names`` across calls.
+
+    ``split_names`` maps each counter name to the name itself for plain names,
+    to ``(key, sub_key)`` for dotted names and to an empty tuple for selfLink names.
+    """
     if 'description' in entry:
         return entry['description']
-    elif 'value' in entry:
+    if 'value' in entry:
         return entry['value']
-    elif 'entries' in entry or 'nestedStats' in entry and 'entries' in entry['nestedStats']:
-        if 'entries' in entry:
-            entries = entry['entries']
-        else:
-            entries = entry['nestedStats']['entries']
-        result = None
-
-        for name in entries:
-            entry = entries[name]
-            if 'https://localhost' in name:
-                name = name.split('/')
-                name = name[-1]
-                if result and isinstance(result, list):
-                    result.append(parseStats(entry))
-                elif result and isinstance(result, dict):
-                    result[name] = parseStats(entry)
-                else:
-                    try:
-                        int(name)
-                        result = list()
-                        result.append(parseStats(entry))
-                    except ValueError:
-                        result = dict()
-                        result[name] = parseStats(entry)
+    entries = _stats_entries(entry)
+    if entries is None:
+        return None
+
+    # The stack holds the state of every parent entry being walked: the iterator
+    # over its entries, the result built from them so far, and the name it is
+    # stored under in its own parent.
+    stack = []
+    walk, result, parent_name = iter(entries.items()), None, None
+    while True:
+        for name, child in walk:
+            if 'description' in child:
+                value = child['description']
+            elif 'value' in child:
+                value = child['value']
             else:
-                if '.' in name:
-                    names = name.split('.')
-                    key = names[0]
-                    value = names[1]
-                    if result is None:
-                        # result can be None if this branch is reached first
-                        #
-                        # For example, the mgmt/tm/net/trunk/NAME/stats API
-                        # returns counters.bitsIn before anything else.
-                        result = dict()
-                        result[key] = dict()
-                    elif key not in result:
-                        result[key] = dict()
-                    elif result[key] is None:
-                        result[key] = dict()
-                    result[key][value] = parseStats(entry)
-                else:
-                    if result and isinstance(result, list):
-                        result.append(parseStats(entry))
-                    elif result and isinstance(result, dict):
-                        result[name] = parseStats(entry)
+                child_entries = _stats_entries(child)
+                if child_entries is not None:
+                    stack.append((walk, result, parent_name))
+                    walk, result, parent_name = iter(child_entries.items()), None, name
+                    break
+                value = None
+
+            # Counters added to an existing dict are by far the most common entries,
+            # so they are stored here rather than through _add_stat.
+            if result.__class__ is dict:
+                names = split_names.get(name)
+                if names is None:
+                    if 'https://localhost' in name:
+                        names = ()
+                    elif '.' in name:
+                        names = tuple(name.split('.', 2)[:2])
                     else:
-                        try:
-                            int(name)
-                            result = list()
-                            result.append(parseStats(entry))
-                        except ValueError:
-                            result = dict()
-                            result[name] = parseStats(entry)
+                        names = name
+                    split_names[name] = names
+                if names.__class__ is str:
+                    result[name] = value
+                    continue
+                if names:
+                    group = result.get(names[0])
+                    if group.__class__ is dict:
+                        group[names[1]] = value
+                        continue
+            result = _add_stat(result, name, value)
+        else:
+            if not stack:
+                return result
+            value, name = result, parent_name
+            walk, result, parent_name = stack.pop()
+            result = _add_stat(result, name, value)
+
+
+def _stats_entries(entry):
+    if 'entries' in entry:
+        return entry['entries']
+    if 'nestedStats' in entry and 'entries' in entry['nestedStats']:
+        return entry['nestedStats']['entries']
+    return None
+
+
+def _add_stat(result, name, value):
+    """Store a parsed stats entry in the result of its parent entry.
+
+    The first entry decides the type of the result. Entries keyed by an integer,
+    such as ``https://localhost/mgmt/tm/net/vlan/~Common~foo1/100``, produce a list
+    and any other key produces a dict. Dotted keys, such as ``counters.bitsIn``,
+    are stored as nested dicts.
+    """
+    is_link = 'https://localhost' in name
+    if not is_link and '.' in name:
+        key, sub_key = name.split('.', 2)[:2]
+        if result is None:
+            # result can be None if this branch is reached first
+            #
+            # For example, the mgmt/tm/net/trunk/NAME/stats API
+            # returns counters.bitsIn before anything else.
+            result = {key: dict()}
+        elif key not in result or result[key] is None:
+            result[key] = dict()
+        result[key][sub_key] = value
         return result
+
+    if is_link:
+        name = name.rsplit('/', 1)[-1]
+    if result and isinstance(result, list):
+        result.append(value)
+    elif result and isinstance(result, dict):
+        result[name] = value
+    elif _is_int(name):
+        result = [value]
+    else:
+        result = {name: value}
+    return result
+
+
+def _is_int(name):
+    if name.isdecimal():
+        return True
+    if name[:1].isalpha():
+        return False
+    # Leading signs, whitespace or underscores are rare enough to leave to int() itself.
+    try:
+        int(name)
+    except ValueError:
+        return False
+    return True
+
+
+def index_stats_by_full_path(entry):
+    """Index a collection stats response by the full path of each object.
+
+    Collection stats endpoints, for example ``/mgmt/tm/ltm/virtual/stats``, return
+    the stats of every object of that type in a single response. Each object entry
+    is parsed the same way ``parseStats`` parses the per-object ``stats`` endpoint,
+    so a value in the returned index is equal to the ``stats`` key of the per-object
+    result.
+
+    Objects are indexed by their ``tmName`` and by the name encoded in the selfLink
+    of the entry, as not every stats endpoint returns ``tmName``.
+
+    :param entry: dict -- the JSON body of a collection stats response
+    :returns: dict -- parsed stats keyed by object full path
+    """
+    result = dict()
+    split_names = dict()
+    for link, stats in entry.get('entries', {}).items():
+        parsed = _parse_stats(stats, split_names)
+        if not isinstance(parsed, dict):
+            continue
+        # https://localhost/mgmt/tm/ltm/virtual/~Common~foo/stats
+        name = unquote(link.rstrip('/').split('/')[-2]).replace('~', '/')
+        result[name] = parsed
+        if isinstance(parsed.get('tmName'), str):
+            result[parsed['tmName']] = parsed
+    return result
@@ -136,7 +136,7 @@ from ..module_utils.common import (
     F5ModuleError, AnsibleF5Parameters, transform_name
 )
 from ..module_utils.client import (
-    F5Client, module_provisioned, tmos_version, send_teem
+    F5Client, module_provisioned, tmos_version, send_teem, perf_report
 )
 
 
@@ -262,6 +262,7 @@ class ModuleManager(object):
         changes = reportable.to_return()
         result.update(**changes)
         result.update(dict(changed=True))
+        result.update(perf_report(self.client))
         send_teem(self.client, start)
         return result
 
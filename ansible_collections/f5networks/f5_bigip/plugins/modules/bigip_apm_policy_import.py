@@ -147,7 +147,7 @@ from ..module_utils.common import (
     F5ModuleError, AnsibleF5Parameters, transform_name
 )
 from ..module_utils.client import (
-    F5Client, module_provisioned, tmos_version, send_teem
+    F5Client, module_provisioned, tmos_version, send_teem, perf_report
 )
 
 
@@ -265,6 +265,7 @@ class ModuleManager(object):
         result.update(**changes)
         result.update(dict(changed=changed))
         self._announce_deprecations(result)
+        result.update(perf_report(self.client))
         send_teem(self.client, start)
         return result
 
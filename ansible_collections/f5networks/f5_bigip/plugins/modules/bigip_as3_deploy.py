@@ -37,6 +37,49 @@ options:
       - An AS3 tenant you want to manage.
       - A value of C(all) when C(state) is C(absent) removes all AS3 declarations from the device.
     type: str
+  declarations:
+    description:
+      - A list of per tenant declarations to deploy, or to remove when C(state) is C(absent), in a single task.
+      - Each declaration is submitted to the AS3 async interface of its tenant, the resulting tasks are then
+        polled together until all of them complete.
+      - The outcome of every tenant is returned in C(tenant_results). The module fails after all tasks
+        complete if any of the tenants failed.
+      - Mutually exclusive with C(content) and C(tenant).
+      - The C(declaration_cache) option is not used with this parameter.
+    type: list
+    elements: dict
+    suboptions:
+      tenant:
+        description:
+          - The AS3 tenant the declaration applies to.
+        type: str
+        required: True
+      content:
+        description:
+          - The declaration of the tenant, as for the C(content) parameter.
+          - Required when C(state) is C(present).
+        type: raw
+    version_added: "2.1.0"
+  max_concurrency:
+    description:
+      - The maximum number of C(declarations) submitted to the device at the same time.
+      - The default value of C(1) submits the declarations one after another, the submitted tasks
+        are still polled together.
+    type: int
+    default: 1
+    version_added: "2.1.0"
+  declaration_cache:
+    description:
+      - Path to a file on the Ansible controller where the module records a hash of the declarations
+        applied to each device and tenant.
+      - When the hash of C(content) matches the recorded hash, and the declaration on the device was not
+        changed since it was recorded, the module reports no change without sending a dry-run
+        declaration to AS3.
+      - The declaration on the device is identified by its C(id) and by the archive timestamp AS3 sets
+        on every change, so changes made outside of this module invalidate the recorded hash.
+      - The file can be shared by all hosts in a play, and is created if it does not exist.
+    type: path
+    version_added: "2.1.0"
   timeout:
     description:
       - The amount of time to wait for the AS3 async interface to complete its task, in seconds.
@@ -74,6 +117,20 @@ EXAMPLES = r'''
       bigip_as3_deploy:
         content: "{{ lookup('file', 'two_tenants.json') }}"
 
+    - name: Declaration with 2 Tenants, skip the dry-run when the declaration was already applied - AS3
+      bigip_as3_deploy:
+        content: "{{ lookup('file', 'two_tenants.json') }}"
+        declaration_cache: "{{ playbook_dir }}/.as3_declarations.json"
+
+    - name: Deploy tenant declarations, four submissions at a time - AS3
+      bigip_as3_deploy:
+        declarations:
+          - tenant: Sample_01
+            content: "{{ lookup('file', 'sample_01.json') }}"
+          - tenant: Sample_02
+            content: "{{ lookup('file', 'sample_02.json') }}"
+        max_concurrency: 4
+
     - name: Remove one tenant - AS3
       bigip_as3_deploy:
         as3_tenant: "Sample_01"
@@ -91,8 +148,45 @@ tenant:
   returned: changed
   type: str
   sample: foobar1
+tenant_results:
+  description: The outcome of each of the C(declarations).
+  returned: when C(declarations) is specified
+  type: complex
+  contains:
+    tenant:
+      description: The AS3 tenant.
+      returned: always
+      type: str
+      sample: Sample_01
+    changed:
+      description: Whether the declaration changed the tenant.
+      returned: always
+      type: bool
+      sample: true
+    message:
+      description: The message reported by AS3 for the tenant.
+      returned: always
+      type: str
+      sample: success
+    errors:
+      description: The errors reported for the tenant, if it failed.
+      returned: when the tenant failed
+      type: list
+      sample: ["declaration is invalid"]
+  sample: [{"tenant": "Sample_01", "changed": true, "message": "success"}]
+task_polling:
+  description:
+    - Metrics collected while polling the asynchronous tasks started by the module.
+    - The number of polls sent, the number of busy responses received, the seconds spent waiting
+      between polls and the seconds elapsed while waiting for the tasks to complete.
+  returned: when the module waited for a task
+  type: dict
+  sample: {"polls": 6, "busy_responses": 0, "waited": 15.42, "elapsed": 17.9}
 '''
-import time
+import fcntl
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from ansible.module_utils.basic import AnsibleModule
@@ -100,11 +194,12 @@ from ansible.module_utils.connection import Connection
 from ansible.module_utils.six import string_types
 
 from ..module_utils.client import (
-    F5Client, send_teem
+    F5Client, send_teem, perf_report
 )
 from ..module_utils.common import (
     F5ModuleError, AnsibleF5Parameters, check_for_atc_errors, F5ATCError
 )
+from ..module_utils.tasks import TaskWaiter
 
 try:
     import json
@@ -150,6 +245,18 @@ class ModuleParameters(Parameters):
 
         return delay, divisor
 
+    @property
+    def declarations(self):
+        if self._values['declarations'] is None:
+            return None
+        result = []
+        for declaration in self._values['declarations']:
+            content = declaration.get('content')
+            if isinstance(content, string_types):
+                content = json.loads(content or 'null')
+            result.append(dict(tenant=declaration['tenant'], content=content))
+        return result
+
 
 class Changes(Parameters):
     def to_return(self):  # pragma: no cover
@@ -171,13 +278,56 @@ class ReportableChanges(Changes):
     pass
 
 
+class DeclarationCache(object):
+    """Records the hash of the declarations applied to each device and tenant
+
+    The cache is a JSON file on the Ansible controller which can be shared by all hosts
+    of a play, so the file is locked while it is read or updated. An unreadable cache
+    file is treated as empty.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def _load(self, fh):
+        fh.seek(0)
+        data = fh.read()
+        try:
+            entries = json.loads(data) if data else {}
+        except ValueError:
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def get(self, key):
+        if not os.path.exists(self.path):
+            return None
+        with open(self.path) as fh:
+            fcntl.flock(fh, fcntl.LOCK_SH)
+            return self._load(fh).get(key)
+
+    def set(self, key, value):
+        with open(self.path, 'a+') as fh:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+            entries = self._load(fh)
+            if value is None:
+                entries.pop(key, None)
+            else:
+                entries[key] = value
+            fh.seek(0)
+            fh.truncate()
+            json.dump(entries, fh, sort_keys=True)
+
+
 class ModuleManager(object):
     def __init__(self, *args, **kwargs):
         self.module = kwargs.get('module', None)
         self.connection = kwargs.get('connection', None)
         self.client = F5Client(module=self.module, client=self.connection)
+        self.waiter = TaskWaiter()
         self.want = ModuleParameters(params=self.module.params)
         self.changes = UsableChanges()
+        self.cache = DeclarationCache(self.want.declaration_cache) if self.want.declaration_cache else None
+        self._cache_key = None
 
     def _set_changed_options(self):
         changed = {}
@@ -201,12 +351,16 @@ class ModuleManager(object):
         result = dict()
         state = self.want.state
 
-        if state == "present":
+        if self.want.declarations is not None:
+            changed = self.deploy_declarations(result)
+        elif state == "present":
             changed = self.present()
         elif state == "absent":
             changed = self.absent()
 
         result.update(dict(changed=changed))
+        result.update(self.waiter.to_return())
+        result.update(perf_report(self.client))
         send_teem(self.client, start)
         return result
 
@@ -215,6 +369,8 @@ class ModuleManager(object):
         if self.module.check_mode:  # pragma: no cover
             return True
         result = self.upsert_on_device()
+        if self.cache:
+            self.record_declaration()
         return result
 
     def present(self):
@@ -233,6 +389,8 @@ class ModuleManager(object):
         result = self.remove_from_device()
         if self.resource_exists():
             raise F5ModuleError("Failed to delete the resource.")
+        if self.cache:
+            self.cache.set(self.cache_key(), None)
         return result
 
     def exists(self):
@@ -248,6 +406,8 @@ class ModuleManager(object):
                 "The provided 'content' could not be converted into valid json. If you "
                 "are using the 'to_nice_json' filter, please remove it."
             )
+        if self.cache and self.declaration_cached():
+            return True
         if declaration.get('class') == 'AS3':
             declaration['action'] = 'dry-run'
         else:
@@ -268,10 +428,65 @@ class ModuleManager(object):
         if response['code'] not in [200, 201, 202, 204, 207]:
             raise F5ModuleError(response['contents'])
 
-        return all(msg.get('message', None) == 'no change' for msg in response['contents']['results'])
+        unchanged = all(msg.get('message', None) == 'no change' for msg in response['contents']['results'])
+        if unchanged and self.cache:
+            self.record_declaration()
+        return unchanged
+
+    def declaration_hash(self):
+        content = json.dumps(self.want.content, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+    def cache_key(self):
+        if self._cache_key is None:
+            uri = "/mgmt/shared/identified-devices/config/device-info"
+            response = self.client.get(uri)
+            if response['code'] not in [200, 201, 202]:
+                raise F5ModuleError(response['contents'])
+            self._cache_key = '{0}/{1}'.format(response['contents']['machineId'], self.want.tenant or '')
+        return self._cache_key
+
+    def read_generation(self):
+        """Returns the id and the archive timestamp of the declaration on the device
+
+        AS3 updates the archive timestamp on every change, so a matching generation means
+        the declaration was not changed since the generation was recorded.
+        """
+        if self.want.tenant:
+            uri = "/mgmt/shared/appsvcs/declare/{0}".format(self.want.tenant)
+        else:
+            uri = "/mgmt/shared/appsvcs/declare"
+        response = self.client.get(uri)
+        if response['code'] in [204, 404]:
+            return None
+        if response['code'] not in [200, 201, 202]:
+            raise F5ModuleError(response['contents'])
+        contents = response['contents']
+        if not isinstance(contents, dict):
+            return None
+        timestamp = contents.get('controls', {}).get('archiveTimestamp')
+        if timestamp is None:
+            return None
+        return dict(id=contents.get('id'), timestamp=timestamp)
+
+    def declaration_cached(self):
+        entry = self.cache.get(self.cache_key())
+        if not entry or entry.get('hash') != self.declaration_hash():
+            return False
+        generation = self.read_generation()
+        return generation is not None and entry.get('generation') == generation
+
+    def record_declaration(self):
+        generation = self.read_generation()
+        if generation is None:
+            self.cache.set(self.cache_key(), None)
+            return
+        self.cache.set(self.cache_key(), dict(hash=self.declaration_hash(), generation=generation))
 
     def _check_task_on_device(self, path):
         response = self.client.get(path)
+        if self.waiter.busy(response):
+            return None
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
         return response['contents']
@@ -293,14 +508,15 @@ class ModuleManager(object):
             return any(msg.get('message', None) != 'no change' for msg in task['results'])
 
     def wait_for_task(self, path, delay, period):
-        for x in range(0, period):
+        for x in self.waiter.polls(delay * period):
             task = self._check_task_on_device(path)
+            if task is None:
+                continue
             errors = check_for_atc_errors(task)
             if errors:
                 raise F5ATCError(errors)
             if any(msg.get('message', None) != 'in progress' for msg in task['results']):
                 return task
-            time.sleep(delay)
         raise F5ModuleError(
             "Module timeout reached, state change is unknown, "
             "please increase the timeout parameter for long lived actions."
@@ -336,6 +552,107 @@ class ModuleManager(object):
         if task:
             return any(msg.get('message', None) != 'no change' for msg in task['results'])
 
+    def deploy_declarations(self, result):
+        """Deploy or remove the declarations of several tenants in one pass
+
+        The declarations are submitted using up to ``max_concurrency`` workers, and the
+        resulting async tasks are polled together. Failures are recorded per tenant so
+        that a failing tenant does not prevent the others from being deployed.
+        """
+        if self.want.max_concurrency < 1:
+            raise F5ModuleError(
+                "The 'max_concurrency' value must be greater than or equal to 1."
+            )
+        declarations = self.want.declarations
+        if self.want.state == 'present' and any(x['content'] is None for x in declarations):
+            raise F5ModuleError(
+                "Empty content cannot be specified when 'state' is 'present'."
+            )
+        if self.module.check_mode:  # pragma: no cover
+            result.update(tenant_results=[dict(tenant=x['tenant'], changed=True, message='check mode')
+                                          for x in declarations])
+            return True
+
+        workers = min(self.want.max_concurrency, len(declarations))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                submitted = list(executor.map(self.submit_declaration, declarations))
+        else:
+            submitted = [self.submit_declaration(x) for x in declarations]
+
+        outcomes = dict()
+        pending = dict()
+        for tenant, task_id, errors in submitted:
+            if errors:
+                outcomes[tenant] = dict(tenant=tenant, changed=False, message='failed', errors=errors)
+            else:
+                pending[tenant] = task_id
+        self.wait_for_tasks(pending, outcomes)
+
+        tenant_results = [outcomes[x['tenant']] for x in declarations]
+        result.update(tenant_results=tenant_results)
+        failed = [x for x in tenant_results if x.get('errors')]
+        if failed:
+            raise F5ModuleError(
+                "AS3 declarations failed for tenants: {0}".format(
+                    '; '.join('{0}: {1}'.format(x['tenant'], ', '.join(x['errors'])) for x in failed)
+                )
+            )
+        return any(x['changed'] for x in tenant_results)
+
+    def submit_declaration(self, declaration):
+        """Submit the declaration of a tenant to the AS3 async interface
+
+        Returns:
+            tuple: The tenant, the id of the AS3 task and a list of submission errors.
+        """
+        tenant = declaration['tenant']
+        uri = "/mgmt/shared/appsvcs/declare/{0}?async=true".format(tenant)
+        if self.want.state == 'absent':
+            response = self.client.delete(uri)
+        else:
+            response = self.client.post(uri, data=declaration['content'])
+        if response['code'] not in [200, 201, 202, 204, 207]:
+            return tenant, None, [str(response['contents'])]
+        return tenant, response['contents']['id'], None
+
+    def wait_for_tasks(self, pending, outcomes):
+        """Poll the AS3 tasks of several tenants until all of them complete
+
+        Arguments:
+            pending (dict): The task ids of the tenants still running, keyed by tenant.
+            outcomes (dict): The outcome of each completed tenant, keyed by tenant.
+        """
+        delay, period = self.want.timeout
+        for x in self.waiter.polls(delay * period):
+            for tenant, task_id in list(pending.items()):
+                task = self._check_task_on_device("/mgmt/shared/appsvcs/task/{0}".format(task_id))
+                if task is None:
+                    continue
+                errors = check_for_atc_errors(task)
+                if errors:
+                    outcomes[tenant] = dict(
+                        tenant=tenant, changed=False, message='failed',
+                        errors=[str(error.status) for error in errors]
+                    )
+                    del pending[tenant]
+                    continue
+                messages = [msg.get('message', None) for msg in task['results']]
+                if any(msg != 'in progress' for msg in messages):
+                    outcomes[tenant] = dict(
+                        tenant=tenant, changed=any(msg != 'no change' for msg in messages),
+                        message=', '.join(str(msg) for msg in messages)
+                    )
+                    del pending[tenant]
+            if not pending:
+                return
+        for tenant in pending:
+            outcomes[tenant] = dict(
+                tenant=tenant, changed=False, message='timeout',
+                errors=["Module timeout reached, state change is unknown, "
+                        "please increase the timeout parameter for long lived actions."]
+            )
+
 
 class ArgumentSpec(object):
     def __init__(self):
@@ -343,6 +660,19 @@ class ArgumentSpec(object):
         argument_spec = dict(
             content=dict(type='raw'),
             tenant=dict(),
+            declarations=dict(
+                type='list',
+                elements='dict',
+                options=dict(
+                    tenant=dict(required=True),
+                    content=dict(type='raw'),
+                )
+            ),
+            max_concurrency=dict(
+                type='int',
+                default=1
+            ),
+            declaration_cache=dict(type='path'),
             timeout=dict(
                 type='int',
                 default=300
@@ -355,8 +685,12 @@ class ArgumentSpec(object):
         self.argument_spec = {}
         self.argument_spec.update(argument_spec)
         self.required_if = [
-            ['state', 'present', ['content']],
-            ['state', 'absent', ['tenant']]
+            ['state', 'present', ['content', 'declarations'], True],
+            ['state', 'absent', ['tenant', 'declarations'], True]
+        ]
+        self.mutually_exclusive = [
+            ['content', 'declarations'],
+            ['tenant', 'declarations']
         ]
 
 
@@ -366,7 +700,8 @@ def main():
     module = AnsibleModule(
         argument_spec=spec.argument_spec,
         supports_check_mode=spec.supports_check_mode,
-        required_if=spec.required_if
+        required_if=spec.required_if,
+        mutually_exclusive=spec.mutually_exclusive
     )
 
     try:
@@ -165,7 +165,7 @@ from ..module_utils.common import (
     F5ModuleError, AnsibleF5Parameters, flatten_boolean, fq_name
 )
 from ..module_utils.client import (
-    F5Client, module_provisioned, send_teem
+    F5Client, module_provisioned, send_teem, perf_report
 )
 
 
@@ -296,7 +296,7 @@ class ModuleManager(object):
     def __init__(self, *args, **kwargs):
         self.module = kwargs.get('module', None)
         self.connection = kwargs.get('connection', None)
-        self.client = F5Client(module=self.module, client=self.connection)
+        self.client = F5Client(module=self.module, client=self.connection, response_cache=True)
         self.want = ModuleParameters(params=self.module.params)
         self.changes = UsableChanges()
 
@@ -331,6 +331,7 @@ class ModuleManager(object):
         changes = reportable.to_return()
         result.update(**changes)
         result.update(dict(changed=True))
+        result.update(perf_report(self.client))
         send_teem(self.client, start)
         return result
 
@@ -384,9 +385,11 @@ class ModuleManager(object):
                 return True
         return False
 
-    def policy_exists(self):
+    def read_policies_from_device(self):
+        # policy_exists and _set_policy_link send the same request, the second one is answered
+        # by the response cache of the client when the policies did not change in the meantime
         uri = "/mgmt/tm/asm/policies/"
-        query = "?$filter=contains(name,'{0}')+and+contains(partition,'{1}')&$select=name,partition".format(
+        query = "?$filter=contains(name,'{0}')+and+contains(partition,'{1}')&$select=name,partition,selfLink".format(
             self.want.name, self.want.partition
         )
         response = self.client.get(uri + query)
@@ -394,11 +397,15 @@ class ModuleManager(object):
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
 
-        if 'items' in response['contents'] and response['contents']['items'] != []:
-            # because api filter on ASM is broken when names contain numbers at the end we need to work around it
-            for policy in response['contents']['items']:
-                if policy['name'] == self.want.name and policy['partition'] == self.want.partition:
-                    return True
+        # because api filter on ASM is broken when names contain numbers at the end we need to work around it
+        return [
+            policy for policy in response['contents'].get('items', [])
+            if policy['name'] == self.want.name and policy['partition'] == self.want.partition
+        ]
+
+    def policy_exists(self):
+        if self.read_policies_from_device():
+            return True
 
         raise F5ModuleError(
             "The specified ASM policy {0} on partition {1} does not exist on device.".format(
@@ -447,22 +454,9 @@ class ModuleManager(object):
 
     def _set_policy_link(self):
         policy_link = None
-        uri = "/mgmt/tm/asm/policies/"
-        query = "?$filter=name+eq+{0}+and+partition+eq+{1}&$select=name,partition".format(
-            self.want.name, self.want.partition
-        )
-        response = self.client.get(uri + query)
-
-        if response['code'] not in [200, 201, 202]:
-            raise F5ModuleError(response['contents'])
-
-        if 'items' in response['contents'] and response['contents']['items'] != []:
-            if len(response['contents']['items']) == 1:
-                policy_link = response['contents']['items'][0]['selfLink']
-            else:
-                for item in response['contents']['items']:
-                    if item['name'] == self.want.name:
-                        policy_link = item['selfLink']
+        policies = self.read_policies_from_device()
+        if policies:
+            policy_link = policies[0]['selfLink']
 
         if not policy_link:
             raise F5ModuleError("The policy was not found")
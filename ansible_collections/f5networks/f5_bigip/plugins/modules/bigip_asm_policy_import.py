@@ -215,7 +215,7 @@ from ..module_utils.common import (
     F5ModuleError, AnsibleF5Parameters, flatten_boolean, fq_name
 )
 from ..module_utils.client import (
-    F5Client, module_provisioned, send_teem
+    F5Client, module_provisioned, send_teem, perf_report
 )
 
 
@@ -385,6 +385,7 @@ class ModuleManager(object):
         result.update(**changes)
         result.update(dict(changed=changed))
         self._announce_deprecations(result)
+        result.update(perf_report(self.client))
         send_teem(self.client, start)
         return result
 
@@ -425,7 +425,7 @@ from ansible.module_utils.six import (
 )
 
 from ..module_utils.client import (
-    F5Client, send_teem
+    F5Client, send_teem, perf_report
 )
 from ..module_utils.common import (
     F5ModuleError, AnsibleF5Parameters, flatten_boolean, fq_name, process_json
@@ -903,6 +903,7 @@ class ModuleManager(object):
             result.update(dict(policy_id=self.policy_id))
             result.update(dict(json=self.json_dump))
         self._announce_deprecations(result)
+        result.update(perf_report(self.client))
         send_teem(self.client, start)
         return result
 
@@ -93,6 +93,17 @@ options:
       - Default connection is always C(httpapi).
     type: bool
     default: false
+  batch:
+    description:
+      - When C(true), all the commands are sent to the device in a single request, and are run by a single
+        shell process, instead of one request and one shell process per command. The output of each command
+        is returned in the same order as with separate requests.
+      - While the I(wait_for) conditionals are evaluated, only the commands referenced by the conditionals
+        which are not yet satisfied are run again.
+      - This setting is ignored when I(use_ssh) is C(true).
+    type: bool
+    default: false
+    version_added: "2.1.0"
 notes:
   - When running this module in an HA environment via SSH connection and using a role other than C(admin)
     or C(root), you may see a C(Change Pending) status, even if you did not make any changes.
@@ -177,211 +188,30 @@ warn:
 '''
 
 
-import re
-import shlex
-import time
+import uuid
 from datetime import datetime
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.six import string_types
 from ansible.module_utils.connection import Connection
 
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.parsing import (
-    FailedConditionsError, Conditional
-)
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.parsing import Conditional
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
     ComplexList, to_list
 )
 
-
-from collections import deque
-
-
 from ..module_utils.client import (
-    F5Client, send_teem
+    F5Client, send_teem, perf_report
+)
+from ..module_utils.commands import (
+    CommandParameters as Parameters, CHANGED_COMMAND_PREFIXES, normalize_commands, determine_change,
+    check_known_errors, batch_command, split_batch_output, wait_for_conditionals
 )
 from ..module_utils.common import (
-    F5ModuleError, AnsibleF5Parameters, run_commands
+    F5ModuleError, run_commands
 )
 
 
-class NoChangeReporter(object):
-    stdout_re = [
-        # A general error when a resource already exists
-        re.compile(r"The requested.*already exists"),
-
-        # Returned when creating a duplicate cli alias
-        re.compile(r"Data Input Error: shared.*already exists"),
-    ]
-
-    def find_no_change(self, responses):
-        """Searches the response for something that looks like a change
-
-        This method borrows heavily from Ansible's ``_find_prompt`` method
-        defined in the ``lib/ansible/plugins/connection/network_cli.py::Connection``
-        class.
-
-        Arguments:
-            response (string): The output from the command.
-
-        Returns:
-            bool: True when change is detected. False otherwise.
-        """
-        for response in responses:
-            for regex in self.stdout_re:
-                if regex.search(response):
-                    return True
-        return False
-
-
-class Parameters(AnsibleF5Parameters):
-    returnables = ['stdout', 'stdout_lines', 'warnings', 'executed_commands']
-
-    def to_return(self):
-        result = {}
-        try:
-            for returnable in self.returnables:
-                result[returnable] = getattr(self, returnable)
-            result = self._filter_params(result)
-            return result
-        except Exception:  # pragma: no cover
-            return result
-
-    @property
-    def raw_commands(self):
-        if self._values['commands'] is None:
-            return []
-        if isinstance(self._values['commands'], string_types):
-            result = [self._values['commands']]
-        else:
-            result = self._values['commands']
-        return result
-
-    def cmd_has_pipe(self, cmd):
-        lex = shlex.shlex(cmd, posix=True)
-        lex.whitespace = '|'
-        lex.whitespace_split = True
-        return len(list(lex)) > 1
-
-    def convert_commands(self, commands):
-        result = []
-        for command in commands:
-            tmp = dict(
-                command='',
-                pipeline=''
-            )
-
-            command = command.replace("'", "\\'")
-            pipeline = command.split('|', 1) if self.cmd_has_pipe(command) else [command]
-            tmp['command'] = pipeline[0]
-            try:
-                tmp['pipeline'] = pipeline[1]
-            except IndexError:
-                pass
-            result.append(tmp)
-        return result
-
-    def convert_commands_cli(self, commands):
-        result = []
-        for command in commands:
-            tmp = dict(
-                command='',
-                pipeline=''
-            )
-
-            pipeline = command.split('|', 1) if self.cmd_has_pipe(command) else [command]
-            tmp['command'] = pipeline[0]
-            try:
-                tmp['pipeline'] = pipeline[1]
-            except IndexError:
-                pass
-            result.append(tmp)
-        return result
-
-    def merge_command_dict(self, command):
-        if command['pipeline'] != '':
-            escape_patterns = r'([$"])'
-            command['pipeline'] = re.sub(escape_patterns, r'\\\1', command['pipeline'])
-            command['command'] = '{0} | {1}'.format(command['command'], command['pipeline']).strip()
-
-    def merge_command_dict_cli(self, command):
-        if command['pipeline'] != '':
-            command['command'] = '{0} | {1}'.format(command['command'], command['pipeline']).strip()
-
-    @property
-    def rest_commands(self):
-        # ['list ltm virtual']
-        commands = self.normalized_commands
-        commands = self.convert_commands(commands)
-        if self.chdir:
-            # ['cd /Common; list ltm virtual']
-            for command in commands:
-                self.addon_chdir(command)
-        # ['tmsh -c "cd /Common; list ltm virtual"']
-        for command in commands:
-            self.addon_tmsh(command)
-        for command in commands:
-            self.merge_command_dict(command)
-        result = [x['command'] for x in commands]
-        return result
-
-    @property
-    def cli_commands(self):
-        # ['list ltm virtual']
-        commands = self.normalized_commands
-        commands = self.convert_commands_cli(commands)
-        if self.chdir:
-            # ['cd /Common; list ltm virtual']
-            for command in commands:
-                self.addon_chdir(command)
-        if not self.is_tmsh:
-            # ['tmsh -c "cd /Common; list ltm virtual"']
-            for command in commands:
-                self.addon_tmsh_cli(command)
-        for command in commands:
-            self.merge_command_dict_cli(command)
-        result = [x['command'] for x in commands]
-        return result
-
-    @property
-    def normalized_commands(self):
-        if self._values['normalized_commands'] is None:
-            return None
-        return deque(self._values['normalized_commands'])
-
-    @property
-    def chdir(self):
-        if self._values['chdir'] is None:
-            return None
-        if self._values['chdir'].startswith('/'):
-            return self._values['chdir']
-        return '/{0}'.format(self._values['chdir'])
-
-    @property
-    def user_commands(self):  # pragma: no cover
-        commands = self.raw_commands
-        return map(self._ensure_tmsh_prefix, commands)
-
-    @property
-    def wait_for(self):
-        return self._values['wait_for'] or list()
-
-    def addon_tmsh(self, command):
-        escape_patterns = r'([$"])'
-        if command['command'].count('"') % 2 != 0:
-            raise Exception('Double quotes are unbalanced')
-        command['command'] = re.sub(escape_patterns, r'\\\\\\\1', command['command'])
-        command['command'] = 'tmsh -c \\\"{0}\\\"'.format(command['command'])
-
-    def addon_tmsh_cli(self, command):
-        if command['command'].count('"') % 2 != 0:
-            raise Exception('Double quotes are unbalanced')
-        command['command'] = 'tmsh -c "{0}"'.format(command['command'])
-
-    def addon_chdir(self, command):
-        command['command'] = "cd {0}; {1}".format(self.chdir, command['command'])
-
-
 class BaseManager(object):
     def __init__(self, *args, **kwargs):
         self.module = kwargs.get('module', None)
@@ -393,7 +223,7 @@ class BaseManager(object):
         self.valid_configs = [
             'list', 'show', 'modify cli preference pager disabled'
         ]
-        self.changed_command_prefixes = ('modify', 'create', 'delete')
+        self.changed_command_prefixes = CHANGED_COMMAND_PREFIXES
         self.warnings = list()
 
     def _to_lines(self, stdout):
@@ -413,6 +243,7 @@ class BaseManager(object):
         result.update(**self.changes.to_return())
         result.update(dict(changed=changed))
         self._announce_warnings(result)
+        result.update(perf_report(self.client))
         send_teem(self.client, start)
         return result
 
@@ -435,15 +266,7 @@ class BaseManager(object):
 
     @staticmethod
     def normalize_commands(raw_commands):
-        if not raw_commands:
-            return None
-        result = []
-        for command in raw_commands:
-            command = command.strip()
-            if command[0:5] == 'tmsh ':
-                command = command[4:].strip()
-            result.append(command)
-        return result
+        return normalize_commands(raw_commands)
 
     def parse_commands(self):
         results = []
@@ -473,30 +296,15 @@ class BaseManager(object):
         self.notify_non_idempotent_commands(self.want.normalized_commands)
 
         commands = self.parse_commands()
-        retries = self.want.retries
         conditionals = [Conditional(c) for c in self.want.wait_for]
 
         if self.module.check_mode:  # pragma: no cover
             return
 
-        while retries > 0:  # pragma: no cover
-            responses = self._execute(commands)
-            self._check_known_errors(responses)
-            for item in list(conditionals):
-                if item(responses):
-                    if self.want.match == 'any':
-                        conditionals = list()
-                        break
-                    conditionals.remove(item)
-            if not conditionals:
-                break
-
-            time.sleep(self.want.interval)
-            retries -= 1
-        else:  # pragma: no cover
-            failed_conditions = [item.raw for item in conditionals]
-            errmsg = 'One or more conditional statements have not been satisfied.'
-            raise FailedConditionsError(errmsg, failed_conditions)
+        responses = wait_for_conditionals(
+            self._execute, commands, conditionals, match=self.want.match, retries=self.want.retries,
+            interval=self.want.interval, rerun=bool(self.want.batch and not self.want.use_ssh)
+        )
         stdout_lines = self._to_lines(responses)
         changes = {
             'stdout': responses,
@@ -509,23 +317,10 @@ class BaseManager(object):
         return self.determine_change(responses)
 
     def determine_change(self, responses):
-        changer = NoChangeReporter()
-        if changer.find_no_change(responses):
-            return False
-        if any(x for x in self.want.normalized_commands if x.startswith(self.changed_command_prefixes)):
-            return True
-        return False
+        return determine_change(self.want.normalized_commands, responses)
 
     def _check_known_errors(self, responses):
-        # A regex to match the error IDs used in the F5 v2 logging framework.
-        # pattern = r'^[0-9A-Fa-f]+:?\d+?:'
-
-        for resp in responses:
-            if 'usage: tmsh' in resp:
-                raise F5ModuleError(
-                    "tmsh command printed its 'help' message instead of running your command. "
-                    "This usually indicates unbalanced quotes."
-                )
+        check_known_errors(responses)
 
     def _transform_to_complex_commands(self, commands):
         spec = dict(
@@ -579,12 +374,38 @@ class V1Manager(BaseManager):
 class V2Manager(BaseManager):
     """Supports REST communication with the remote device."""
     def _execute(self, commands):
+        if self.want.batch:
+            return self.execute_batch_on_device(commands)
         return self.execute_on_device(commands)
 
     @property
     def commands(self):
         return self.want.rest_commands
 
+    def execute_batch_on_device(self, commands):
+        """Runs the commands in a single shell process, and splits its output per command
+
+        The output of each command is followed by a delimiter which is unique to this run,
+        so the output of the commands cannot be mistaken for it.
+
+        Arguments:
+            commands (list): The commands, as returned by ``parse_commands``.
+
+        Returns:
+            list: The output of each command.
+        """
+        commands = to_list(commands)
+        delimiter = '__F5_COMMAND_{0}__'.format(uuid.uuid4().hex)
+        args = dict(
+            command='run',
+            utilCmdArgs='-c "{0}"'.format(batch_command([x['command'] for x in commands], delimiter))
+        )
+        response = self.client.post("/mgmt/tm/util/bash", data=args)
+        if response['code'] not in [200, 201]:
+            raise F5ModuleError(response['contents'])
+        output = u'{0}'.format(response['contents'].get('commandResult', ''))
+        return split_batch_output(output, delimiter, len(commands))
+
     def execute_on_device(self, commands):
         responses = []
         for item in to_list(commands):
@@ -654,6 +475,10 @@ class ArgumentSpec(object):
             use_ssh=dict(
                 type='bool',
                 default='no'
+            ),
+            batch=dict(
+                type='bool',
+                default='no'
             )
         )
 
@@ -140,6 +140,14 @@ message:
   returned: always
   type: dict
   sample: Verification is successful
+readiness:
+  description:
+    - The state of the device the last time its readiness was probed, after its services restarted.
+    - Whether the device was ready, the stage it was waiting on, out of C(connect), C(restjavad)
+      and C(mcpd), the number of probes sent and the seconds spent waiting between them.
+  returned: when the module checked the device
+  type: dict
+  sample: {"ready": false, "stage": "restjavad", "probes": 2, "waited": 0.0}
 '''
 
 import os
@@ -152,11 +160,12 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.connection import Connection
 
 from ..module_utils.client import (
-    F5Client, send_teem, tmos_version
+    F5Client, send_teem, perf_report, tmos_version, invalidate_metadata
 )
 from ..module_utils.common import (
     F5ModuleError, AnsibleF5Parameters
 )
+from ..module_utils.readiness import ReadinessProbe
 
 
 class Parameters(AnsibleF5Parameters):
@@ -188,6 +197,7 @@ class ModuleManager(object):
         self.module = kwargs.get('module', None)
         self.connection = kwargs.get('connection', None)
         self.client = F5Client(module=self.module, client=self.connection)
+        self.probe = ReadinessProbe(self.client)
         self.want = Parameters(params=self.module.params)
         self.changes = Parameters()
 
@@ -201,6 +211,8 @@ class ModuleManager(object):
 
         result.update(**self.changes.to_return())
         result.update(dict(changed=changed))
+        result.update(self.probe.to_return())
+        result.update(perf_report(self.client))
         send_teem(self.client, start)
         return result
 
@@ -236,7 +248,9 @@ class ModuleManager(object):
     def reset(self):
         if self.module.check_mode:  # pragma: no cover
             return True
-        return self.reset_device()
+        task = self.reset_device()
+        invalidate_metadata(self.client)
+        return task
 
     def check_task(self):
         ready = self.device_is_ready()
@@ -403,14 +417,7 @@ class ModuleManager(object):
         )
 
     def device_is_ready(self):
-        uri = "/mgmt/tm/sys/available"
-        try:
-            response = self.client.get(uri)
-            if response['code'] in [200, 201, 202]:
-                return True
-            return False
-        except ConnectionError:
-            return False
+        return self.probe.check()
 
 
 class ArgumentSpec(object):
@@ -20,8 +20,17 @@ options:
   device_group:
     description:
       - The device group on which you want to perform config-sync actions.
+      - One of C(device_group) or C(device_groups) is required.
     type: str
-    required: True
+  device_groups:
+    description:
+      - The device groups on which you want to perform config-sync actions.
+      - The groups which are not in sync are all synchronized at once, and the module then waits
+        for all of them to be in sync.
+      - This option is mutually exclusive with the C(device_group) option.
+    type: list
+    elements: str
+    version_added: "2.1.0"
   sync_device_to_group:
     description:
       - Specifies the system synchronizes configuration data from this
@@ -42,9 +51,14 @@ options:
         the target.
     type: bool
     default: false
-notes:
-  - Requires the objectpath Python package on the host. This is as easy as
-    running C(pip install objectpath).
+  timeout:
+    description:
+      - The number of seconds to wait for the device groups to be in sync after the sync was started.
+      - The sync status is checked after one second, and then less and less often while it does not change,
+        up to every ten seconds.
+    type: int
+    default: 540
+    version_added: "2.1.0"
 author:
   - Wojciech Wypior (@wojtek0806)
 '''
@@ -77,44 +91,41 @@ EXAMPLES = r'''
       bigip_configsync_action:
         device_group: new-device-group
         sync_device_to_group: yes
+
+    - name: Sync configuration from device to all the groups of the cluster
+      bigip_configsync_action:
+        device_groups:
+          - sync-failover-group
+          - sync-only-group
+        sync_device_to_group: yes
 '''
 
 RETURN = r'''
-# only common fields returned
+synced_groups:
+  description: The device groups which were synchronized.
+  returned: changed
+  type: list
+  sample: ['sync-failover-group', 'sync-only-group']
 '''
 
 import re
 import time
-import traceback
 from datetime import datetime
 
-from ansible.module_utils.basic import (
-    AnsibleModule, missing_required_lib
-)
+from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.connection import Connection
 
 from ..module_utils.client import (
-    F5Client, send_teem
+    F5Client, send_teem, perf_report
 )
 from ..module_utils.common import (
     F5ModuleError, AnsibleF5Parameters, flatten_boolean
 )
 
-try:
-    from objectpath import Tree
-    HAS_OBJPATH = True
-except ImportError:  # pragma: no cover
-    HAS_OBJPATH = False
-    Tree = None
-    HAS_OBJPATH_IMPORT_ERROR = traceback.format_exc()
-else:
-    HAS_OBJPATH = True
-    HAS_OBJPATH_IMPORT_ERROR = None
-
 
 class Parameters(AnsibleF5Parameters):
     api_attributes = []
-    returnables = []
+    returnables = ['synced_groups']
 
 
 class ApiParameters(Parameters):
@@ -122,6 +133,12 @@ class ApiParameters(Parameters):
 
 
 class ModuleParameters(Parameters):
+    @property
+    def groups(self):
+        if self._values['device_groups']:
+            return list(self._values['device_groups'])
+        return [self._values['device_group']]
+
     @property
     def direction(self):
         if self.sync_device_to_group:
@@ -185,6 +202,167 @@ class Difference(object):
     pass
 
 
+# the description of a device group in the details of the sync status, for example
+# "sync-failover-group (In Sync): All devices in the device group are in sync"
+GROUP_STATUS = re.compile(r'^(?P<group>[^\s(]+) \((?P<status>[^)]+)\)')
+
+
+def group_statuses(details):
+    """Returns the status, and the details, of each device group listed in the details of the sync status
+
+    Arguments:
+        details (list): The descriptions of the details of the sync status, in their order.
+
+    Returns:
+        dict: The status and the list of details of each device group, by group name.
+    """
+    result = dict()
+    current = None
+    for line in details:
+        match = GROUP_STATUS.match(line.strip())
+        if match:
+            current = match.group('group').split('/')[-1]
+            result[current] = (match.group('status'), [line])
+        elif current:
+            result[current][1].append(line)
+    return result
+
+
+class SyncStatusWatcher(object):
+    """Waits for device groups to be in sync
+
+    Each check first reads the overall sync status of the device alone. When it is not
+    ``In Sync``, the details of the sync status are read, and the status of each device
+    group is taken from the line describing the group, so that a group is recognized to
+    be in sync while other groups are not. Groups which are not described in the details
+    take the overall status.
+
+    The interval between checks starts at ``interval`` and grows by ``backoff`` while the
+    status does not change, up to ``max_interval``, so short syncs are recognized quickly
+    without polling long ones as often.
+
+    Arguments:
+        read_status (callable): Returns the overall sync status.
+        read_details (callable): Returns the overall sync status and the list of details.
+        groups (list): The names of the device groups to wait for.
+        timeout (int): The number of seconds to wait for.
+        grace (int): The number of seconds during which a pending change is expected,
+            because the sync has not started yet, rather than reported as a failure.
+    """
+
+    def __init__(self, read_status, read_details, groups, timeout=540, grace=3,
+                 interval=1, max_interval=10, backoff=1.5):
+        self.read_status = read_status
+        self.read_details = read_details
+        self.groups = list(groups)
+        self.timeout = timeout
+        self.grace = grace
+        self.interval = interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+
+    def statuses(self):
+        status = self.read_status()
+        if status == 'In Sync':
+            return dict((group, (status, [])) for group in self.groups)
+        if status == 'Disconnected':
+            return dict((group, (status, [])) for group in self.groups)
+        if status not in ['Changes Pending', 'Awaiting Initial Sync', 'Not All Devices Synced']:
+            raise F5ModuleError(status)
+        status, details = self.read_details()
+        groups = group_statuses(details)
+        return dict((group, groups.get(group, (status, details))) for group in self.groups)
+
+    def wait(self):
+        started = time.time()
+        pending = list(self.groups)
+        interval = self.interval
+        last = None
+        while True:
+            time.sleep(interval)
+            statuses = self.statuses()
+            for group in list(pending):
+                status, details = statuses[group]
+                if self.check(status, details, time.time() - started > self.grace):
+                    pending.remove(group)
+            if not pending:
+                return
+            if time.time() - started > self.timeout:
+                raise F5ModuleError(
+                    "Timed out waiting for the device groups to be in sync: {0}".format(
+                        ', '.join('{0} ({1})'.format(x, statuses[x][0]) for x in pending)
+                    )
+                )
+            current = dict((x, statuses[x][0]) for x in pending)
+            interval = min(interval * self.backoff, self.max_interval) if current == last else self.interval
+            last = current
+
+    def check(self, status, details, started):
+        """Check whether a device group is in sync
+
+        Arguments:
+            status (string): The status of the device group.
+            details (list): The details of the sync status describing the group.
+            started (bool): Whether the sync is expected to have started.
+
+        Raises:
+            F5ModuleError: Raised when the device group cannot get in sync.
+
+        Returns:
+            bool: True when the group is in sync, False when it is still being synchronized.
+        """
+        # Changes Pending:
+        #     The existing device has changes made to it that
+        #     need to be sync'd to the group.
+        #
+        # Awaiting Initial Sync:
+        #     This is a new device group and has not had any sync
+        #     done yet. You _must_ `sync_device_to_group` in this
+        #     case.
+        #
+        # Not All Devices Synced:
+        #     A device group will go into this state immediately
+        #     after starting the sync and stay until all devices finish.
+        #
+        if status == 'In Sync':
+            return True
+        if status == 'Changes Pending':
+            if started:
+                validate_pending_status(details)
+        elif status in ['Awaiting Initial Sync', 'Not All Devices Synced']:
+            pass
+        elif status == 'Disconnected':
+            raise F5ModuleError(
+                "One or more devices are unreachable (disconnected). "
+                "Resolve any communication problems before attempting to sync."
+            )
+        else:
+            raise F5ModuleError(status)
+        return False
+
+
+def detail_position(key):
+    position = key.rsplit('/', 1)[-1]
+    return int(position) if position.isdigit() else 0
+
+
+def validate_pending_status(details):
+    """Validate the content of a pending sync operation
+
+    This is a hack. The REST API is not consistent with its 'status' values
+    so this method is here to check the returned strings from the operation
+    and see if it reported any of these inconsistencies.
+
+    :param details:
+    :raises F5ModuleError:
+    """
+    pattern1 = r'.*(?P<msg>Recommended\s+action.*)'
+    for detail in details:
+        matches = re.search(pattern1, detail)
+        if matches:
+            raise F5ModuleError(matches.group('msg'))
+
+
 class ModuleManager(object):
     def __init__(self, *args, **kwargs):
         self.module = kwargs.get('module', None)
@@ -192,6 +370,7 @@ class ModuleManager(object):
         self.client = F5Client(module=self.module, client=self.connection)
         self.want = ModuleParameters(params=self.module.params)
         self.changes = UsableChanges()
+        self.select_status = True
 
     def _announce_deprecations(self, result):  # pragma: no cover
         warnings = result.pop('__warnings', [])
@@ -212,32 +391,69 @@ class ModuleManager(object):
         result.update(**changes)
         result.update(dict(changed=changed))
         self._announce_deprecations(result)
+        result.update(perf_report(self.client))
         send_teem(self.client, start)
         return result
 
     def present(self):
+        if self.want.device_groups:
+            return self.present_many()
         if not self._device_group_exists():
             raise F5ModuleError(
                 "The specified 'device_group' does not exist."
             )
-        if self._sync_to_group_required():
+        # the group is judged from its own status, like in present_many, so that
+        # changes pending in another group do not start a sync of this one
+        status = self._get_group_status()
+        if self._sync_to_group_required(status):
             raise F5ModuleError(
                 "This device group needs an initial sync. Please use "
                 "'sync_device_to_group'"
             )
-        if self.exists():
+        if self.exists(status):
             return False
         else:
             return self.execute()
 
-    def _sync_to_group_required(self):
-        status = self._get_status_from_resource()
+    def _get_group_status(self):
+        group = self.want.device_group
+        return self.watcher([group]).statuses()[group][0]
+
+    def _sync_to_group_required(self, status):
         if status == 'Awaiting Initial Sync' and self.want.sync_group_to_device:
             return True
         return False
 
-    def _device_group_exists(self):
-        uri = "/mgmt/tm/cm/device-group/{0}".format(self.want.device_group)
+    def present_many(self):
+        missing = [x for x in self.want.groups if not self._device_group_exists(x)]
+        if missing:
+            raise F5ModuleError(
+                "The specified 'device_groups' do not exist: {0}".format(', '.join(missing))
+            )
+        statuses = self.watcher(self.want.groups).statuses()
+        if self.want.sync_group_to_device:
+            initial = [x for x in self.want.groups if statuses[x][0] == 'Awaiting Initial Sync']
+            if initial:
+                raise F5ModuleError(
+                    "These device groups need an initial sync: {0}. Please use "
+                    "'sync_device_to_group'".format(', '.join(initial))
+                )
+        pending = [x for x in self.want.groups if statuses[x][0] != 'In Sync']
+        if not pending:
+            return False
+        for group in pending:
+            self.execute_on_device(group)
+        self.watcher(pending).wait()
+        self.changes = UsableChanges(params=dict(synced_groups=pending))
+        return True
+
+    def watcher(self, groups):
+        return SyncStatusWatcher(
+            self._get_status_from_resource, self._get_sync_details, groups, timeout=self.want.timeout
+        )
+
+    def _device_group_exists(self, group=None):
+        uri = "/mgmt/tm/cm/device-group/{0}".format(group or self.want.device_group)
         response = self.client.get(uri)
 
         if response['code'] == 404:
@@ -249,19 +465,19 @@ class ModuleManager(object):
     def execute(self):
         self.execute_on_device()
         self._wait_for_sync()
+        self.changes = UsableChanges(params=dict(synced_groups=self.want.groups))
         return True
 
-    def exists(self):
-        status = self._get_status_from_resource()
+    def exists(self, status):
         if status == 'In Sync':
             return True
         else:
             return False
 
-    def execute_on_device(self):
+    def execute_on_device(self, group=None):
         sync_cmd = 'config-sync {0} {1} {2}'.format(
             self.want.direction,
-            self.want.device_group,
+            group or self.want.device_group,
             self.want.force_full_push
         )
         uri = "/mgmt/tm/cm"
@@ -275,41 +491,12 @@ class ModuleManager(object):
             raise F5ModuleError(response['contents'])
 
     def _wait_for_sync(self):
-        # Wait no more than half an hour
-        for x in range(1, 180):
-            time.sleep(3)
-            status = self._get_status_from_resource()
-
-            # Changes Pending:
-            #     The existing device has changes made to it that
-            #     need to be sync'd to the group.
-            #
-            # Awaiting Initial Sync:
-            #     This is a new device group and has not had any sync
-            #     done yet. You _must_ `sync_device_to_group` in this
-            #     case.
-            #
-            # Not All Devices Synced:
-            #     A device group will go into this state immediately
-            #     after starting the sync and stay until all devices finish.
-            #
-            if status in ['Changes Pending']:
-                details = self._get_details_from_resource()
-                self._validate_pending_status(details)
-            elif status in ['Awaiting Initial Sync', 'Not All Devices Synced']:
-                pass
-            elif status == 'In Sync':
-                return
-            elif status == 'Disconnected':
-                raise F5ModuleError(
-                    "One or more devices are unreachable (disconnected). "
-                    "Resolve any communication problems before attempting to sync."
-                )
-            else:
-                raise F5ModuleError(status)
+        self.watcher(self.want.groups).wait()
 
-    def read_current_from_device(self):
+    def read_current_from_device(self, select=None):
         uri = "/mgmt/tm/cm/sync-status/"
+        if select:
+            uri += "?$select={0}".format(select)
         response = self.client.get(uri)
 
         if response['code'] not in [200, 201, 202]:
@@ -317,40 +504,35 @@ class ModuleManager(object):
         return response['contents']
 
     def _get_status_from_resource(self):
+        # only the status is requested, unless the device ignored the $select query before
+        resource = self.read_current_from_device(select='status' if self.select_status else None)
+        entries = resource.get('entries', {}).copy()
+        if entries:
+            k, v = entries.popitem()
+            status = v.get('nestedStats', {}).get('entries', {}).get('status', {}).get('description')
+            if status is not None:
+                return status
+        if not self.select_status:
+            raise F5ModuleError("The sync status was not returned by the device.")
+        self.select_status = False
+        return self._get_status_from_resource()
+
+    def _get_sync_details(self):
+        """Returns the overall sync status and the descriptions of its details, in their order"""
         resource = self.read_current_from_device()
         entries = resource['entries'].copy()
         k, v = entries.popitem()
-        status = v['nestedStats']['entries']['status']['description']
-        return status
-
-    def _get_details_from_resource(self):
-        resource = self.read_current_from_device()
-        stats = resource['entries'].copy()
-        if HAS_OBJPATH:
-            tree = Tree(stats)
-        else:
-            raise F5ModuleError(
-                "objectpath module required, install objectpath module to continue. "
-            )
-        details = list(tree.execute('$..*["details"]["description"]'))
-        result = details[::-1]
-        return result
-
-    def _validate_pending_status(self, details):  # pragma: no cover
-        """Validate the content of a pending sync operation
-
-        This is a hack. The REST API is not consistent with its 'status' values
-        so this method is here to check the returned strings from the operation
-        and see if it reported any of these inconsistencies.
-
-        :param details:
-        :raises F5ModuleError:
-        """
-        pattern1 = r'.*(?P<msg>Recommended\s+action.*)'
-        for detail in details:
-            matches = re.search(pattern1, detail)
-            if matches:
-                raise F5ModuleError(matches.group('msg'))
+        stats = v['nestedStats']['entries']
+        status = stats['status']['description']
+        details = []
+        for key, value in stats.items():
+            if not key.endswith('/details'):
+                continue
+            # the details are keyed by their position, for example .../syncStatus/0/details/3
+            items = value.get('nestedStats', {}).get('entries', {})
+            for name in sorted(items, key=detail_position):
+                details.append(items[name]['nestedStats']['entries']['details']['description'])
+        return status, details
 
 
 class ArgumentSpec(object):
@@ -368,18 +550,26 @@ class ArgumentSpec(object):
                 type='bool',
                 default='no'
             ),
-            device_group=dict(
-                required=True
+            device_group=dict(),
+            device_groups=dict(
+                type='list',
+                elements='str'
+            ),
+            timeout=dict(
+                type='int',
+                default=540
             )
         )
         self.argument_spec = {}
         self.argument_spec.update(argument_spec)
 
         self.required_one_of = [
-            ['sync_device_to_group', 'sync_group_to_device']
+            ['sync_device_to_group', 'sync_group_to_device'],
+            ['device_group', 'device_groups']
         ]
         self.mutually_exclusive = [
-            ['sync_device_to_group', 'sync_group_to_device']
+            ['sync_device_to_group', 'sync_group_to_device'],
+            ['device_group', 'device_groups']
         ]
 
 
@@ -393,12 +583,6 @@ def main():
         required_one_of=spec.required_one_of
     )
 
-    if not HAS_OBJPATH:
-        module.fail_json(
-            msg=missing_required_lib('objectpath'),
-            exception=HAS_OBJPATH_IMPORT_ERROR
-        )
-
     try:
         mm = ModuleManager(module=module, connection=Connection(module._socket_path))
         results = mm.exec_module()
@@ -35,6 +35,65 @@ options:
     type: int
     default: 10
     version_added: "1.12.0"
+  bulk_stats:
+    description:
+      - When C(true), the C(ltm-pools), C(nodes), C(trunks), C(virtual-servers) and C(vlans) subsets read the
+        stats of the whole collection in a single request, instead of one request per object.
+      - The stats are joined to each object by its full path.
+      - With this setting the C(ltm-pools) subset also reads pool members through sub-collection expansion,
+        falling back to a per-pool request only for pools where the device did not expand the members.
+      - This setting greatly reduces the number of requests made on devices with large configurations.
+    type: bool
+    default: false
+    version_added: "2.1.0"
+  max_concurrency:
+    description:
+      - Specifies the maximum number of C(gather_subset) entries that are gathered from the device at the same time.
+      - The default value of C(1) gathers each subset sequentially.
+      - Values greater than C(1) run the independent fact managers in a pool of worker threads which share
+        the persistent httpapi connection. The returned information is merged in the same order regardless
+        of the value used.
+      - The persistent connection still sends the requests to the device one at a time, only the parsing of
+        the responses by the managers overlaps with the requests of the other managers.
+    type: int
+    default: 1
+    version_added: "2.1.0"
+  minimal_fields:
+    description:
+      - When C(true), collection subsets request only the fields of each object this module returns, using
+        the C($select) query parameter of the REST API, instead of every field of every object.
+      - The requested fields are derived from the information returned for each subset.
+      - This setting greatly reduces the size of the responses, and the time spent decoding them, on devices
+        with large configurations.
+    type: bool
+    default: false
+    version_added: "2.1.0"
+  adaptive_paging:
+    description:
+      - When C(true), C(data_increment) is the size of the first page of each collection, the size of the following
+        pages grows while the device answers them quickly, and shrinks when pages take longer than a second or
+        exceed 4 MB.
+      - The next page of a collection is also requested while the items of the current page are parsed. The
+        persistent connection still sends one request at a time, only the parsing overlaps with the requests.
+      - Regardless of this setting, the last page of a collection is recognized from the total number of items
+        returned by the device, when it is available, instead of requesting an empty page after it.
+    type: bool
+    default: false
+    version_added: "2.1.0"
+  snapshot_dir:
+    description:
+      - Directory of the controller where the information gathered from each device is stored between runs,
+        in a subdirectory named after the C(host) of the device.
+      - When set, the subsets whose information is read only from configuration objects first read the
+        name and C(generation) of each object of their collection. When none of the objects changed since the
+        previous run, the information stored by that run is returned instead of being read again.
+      - This covers the profile, monitor, GTM pool, GTM wide IP and SSL subsets among others. Subsets returning
+        statistics or runtime status, such as C(ltm-pools), C(virtual-servers) or C(devices), are always read
+        from the device.
+      - The subsets returned from the stored information, and those read from the device, are listed in the
+        C(_f5_snapshots) return value.
+    type: path
+    version_added: "2.1.0"
   gather_subset:
     description:
       - When supplied, this argument restricts the information returned to a given subset.
@@ -236,6 +295,12 @@ EXAMPLES = r'''
         gather_subset:
           - all
           - "!trunks"
+
+    - name: Collect all BIG-IP information running up to four subsets at a time
+      bigip_device_info:
+        gather_subset:
+          - all
+        max_concurrency: 4
 '''
 
 RETURN = r'''
@@ -7576,11 +7641,13 @@ vlans:
 '''
 
 import datetime
+import heapq
 import math
 import re
 import time
 import traceback
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     from packaging.version import Version
@@ -7605,20 +7672,27 @@ from ansible.module_utils.connection import Connection
 
 from ipaddress import ip_interface
 from ..module_utils.client import (
-    F5Client, tmos_version, modules_provisioned, send_teem, packages_installed
+    F5Client, tmos_version, modules_provisioned, send_teem, perf_report, packages_installed
 )
 from ..module_utils.common import (
     F5ModuleError, AnsibleF5Parameters, transform_name, flatten_boolean, fq_name
 )
-from ..module_utils.urls import parseStats
+from ..module_utils.paging import AdaptivePager, page_info
+from ..module_utils.snapshots import SnapshotStore, fingerprint
+from ..module_utils.urls import parseStats, index_stats_by_full_path
 
 from ..module_utils.ipaddress import is_valid_ip
 
 
 class BaseManager(object):
+    # Whether the facts of the manager are read from the configuration objects of a single
+    # collection only, so that they can be reused from a snapshot while the collection is unchanged.
+    snapshot = False
+
     def __init__(self, *args, **kwargs):
         self.module = kwargs.get('module', None)
         self.client = kwargs.get('client', None)
+        self.subset = kwargs.get('subset', None)
         self.kwargs = kwargs
 
         # A list of modules currently provisioned on the device.
@@ -7655,6 +7729,9 @@ class BaseManager(object):
         # master ModuleManager of this module.
         self.installed_packages = []
 
+        # Whether collections are read for their fingerprint rather than for their facts.
+        self.fingerprinting = False
+
     def exec_module(self):
         start = datetime.datetime.now().isoformat()
         results = []
@@ -7665,6 +7742,172 @@ class BaseManager(object):
         send_teem(self.client, start)
         return results
 
+    @property
+    def data_increment(self):
+        return self.module.params['data_increment']
+
+    def increment_read(self, size=None):
+        """Lazily read a collection from the device, one page at a time
+
+        Pages are requested only when the items of the previous page have been consumed,
+        so no more than a single page of raw API items is held in memory at once. The
+        last page is recognized from the ``totalItems`` the device returns, otherwise
+        reading stops at the first empty page.
+
+        With ``adaptive_paging`` enabled, ``data_increment`` is only the size of the
+        first page, the size of the following pages adapts to the time taken by the
+        previous ones and to their size, and the next page is requested while the items
+        of the current page are being consumed. The persistent connection still sends one
+        request at a time, the prefetch only overlaps the parsing of a page with the
+        request for the next one.
+
+        Args:
+            size (int): The size of the first page, ``data_increment`` when not given.
+
+        Yields:
+            dict: Items of the collection, in the order returned by the API.
+        """
+        adaptive = self.module.params['adaptive_paging']
+        pager = AdaptivePager(size or self.data_increment, adapt=adaptive)
+        executor = ThreadPoolExecutor(max_workers=1) if adaptive else None
+        try:
+            skip = 0
+            future = None
+            while True:
+                if future is None:
+                    items, info = self._read_page(skip, pager.size)
+                else:
+                    items, info = future.result()
+                    future = None
+                if not items:
+                    break
+                last = pager.last(skip, len(items), info)
+                pager.update(len(items), info.get('elapsed', 0), info.get('size'))
+                skip = skip + len(items)
+                if executor and not last:
+                    future = executor.submit(self._read_page, skip, pager.size)
+                yield from items
+                if last:
+                    break
+        finally:
+            if executor:
+                executor.shutdown(wait=True)
+
+    def _read_page(self, skip, size):
+        # the page is read into its own paging information, as the next page may be read
+        # by the prefetch thread while the items of this one are consumed
+        page = dict()
+        items = self.read_collection_from_device(skip=skip, size=size, page=page)
+        return items, page
+
+    def read_page(self, uri, page=None):
+        """Read a page of a collection, along with the paging information of the response
+
+        Args:
+            uri (string): The collection endpoint, with its ``$top`` and ``$skip`` query.
+            page (dict): Filled with the paging information of the response, when given.
+
+        Returns:
+            dict: The response returned by the client.
+        """
+        started = time.time()
+        response = self.client.get(uri)
+        if page is not None:
+            page.update(page_info(response, time.time() - started))
+        return response
+
+    def select_query(self, params_class, *fields):
+        """Return the ``$select`` query parameter of a collection request
+
+        With ``minimal_fields`` enabled the device only sends the fields the returnables of
+        ``params_class`` are read from, rather than every field of every object.
+
+        Args:
+            params_class: The ``Parameters`` class the items of the collection are read into.
+            fields: API fields the fact manager reads from the items itself.
+
+        Returns:
+            string: The query parameter, or an empty string when ``minimal_fields`` is disabled.
+        """
+        if self.fingerprinting:
+            fields = set(x for x in set(params_class.select_fields()) | set(fields) if x.endswith('Reference'))
+            fields |= {'name', 'fullPath', 'generation'}
+        elif not self.module.params['minimal_fields']:
+            return ''
+        else:
+            fields = set(params_class.select_fields()) | set(fields)
+        return '&$select={0}'.format(','.join(sorted(fields)))
+
+    def read_fingerprint(self):
+        """Read the fingerprint of the collection the facts of the manager are read from
+
+        Only the name and the ``generation`` of each object are requested, along with the
+        sub-collections the facts include, in pages of 500 objects. The generation of an
+        object is raised by every change made to it.
+
+        Returns:
+            string: The fingerprint of the collection.
+        """
+        self.fingerprinting = True
+        try:
+            return fingerprint(self.increment_read(size=500))
+        finally:
+            self.fingerprinting = False
+
+    def sort_returnables(self, facts, key='full_path'):
+        """Convert facts to their returnable form, sorted by ``key``
+
+        Facts are converted as they are produced and pushed onto a heap, so the
+        ``Parameters`` object of each item can be released as soon as it has been
+        converted.
+
+        Args:
+            facts: An iterable of ``Parameters`` objects, usually the ``read_facts`` generator.
+            key (string): The returnable used to sort the results.
+
+        Returns:
+            list: The returnable dicts, sorted by ``key``.
+        """
+        heap = []
+        for idx, item in enumerate(facts):
+            attrs = item.to_return()
+            # The index keeps the sort stable and avoids ever comparing the dicts.
+            heapq.heappush(heap, (attrs[key], idx, attrs))
+        return [heapq.heappop(heap)[2] for x in range(len(heap))]
+
+    def read_stats_collection_from_device(self, uri):
+        """Read the stats of a whole collection in a single request
+
+        This is used when ``bulk_stats`` is enabled, instead of sending a request to
+        the ``stats`` endpoint of every object in the collection.
+
+        Args:
+            uri (string): The collection stats endpoint, for example ``/mgmt/tm/ltm/virtual/stats``.
+
+        Returns:
+            dict: Stats of the collection objects, indexed by their full path. None if
+            ``bulk_stats`` is disabled.
+        """
+        if not self.module.params['bulk_stats']:
+            return None
+
+        response = self.client.get(uri)
+
+        if response['code'] not in [200, 201, 202]:
+            raise F5ModuleError(response['contents'])
+
+        return index_stats_by_full_path(response['contents'])
+
+    def join_stats(self, stats, full_path):
+        """Return the stats of a single object
+
+        Objects missing from the collection stats, for example objects created after
+        the stats were read, fall back to the per-object ``stats`` endpoint.
+        """
+        if stats is None or full_path not in stats:
+            return self.read_stats_from_device(full_path)
+        return stats[full_path]
+
 
 class Parameters(AnsibleF5Parameters):
     @property
@@ -7683,6 +7926,22 @@ class Parameters(AnsibleF5Parameters):
 
 
 class BaseParameters(Parameters):
+    # API values the returnables are computed from, besides the values they are named after
+    selectables = []
+
+    @classmethod
+    def select_fields(cls):
+        """Returns the API fields the returnables are read from
+
+        The module side name of each returnable and selectable is mapped back to its API
+        field through the ``api_map`` of the class.
+
+        Returns:
+            list: The sorted API field names.
+        """
+        api_fields = dict((v, k) for k, v in iteritems(cls.api_map or {}))
+        return sorted(set(api_fields.get(x, x) for x in cls.returnables + cls.selectables))
+
     @property
     def enabled(self):
         return flatten_boolean(self._values['enabled'])
@@ -7733,13 +7992,8 @@ class ApmAccessProfileFactManager(BaseManager):
     def _exec_module(self):
         if 'apm' not in self.provisioned_modules:
             return []
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
         results = []
@@ -7774,6 +8028,8 @@ class ApmAccessPolicyFactParameters(BaseParameters):
 
 
 class ApmAccessPolicyFactManager(BaseManager):
+    snapshot = True
+
     def __init__(self, *args, **kwargs):
         self.client = kwargs.get('client', None)
         self.module = kwargs.get('module', None)
@@ -7787,38 +8043,21 @@ class ApmAccessPolicyFactManager(BaseManager):
     def _exec_module(self):
         if 'apm' not in self.provisioned_modules:
             return []
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = ApmAccessProfileFactParameters(params=resource)
-            results.append(params)
-        return results
-
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
+            yield params
 
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/apm/policy/access-policy"
-        query = f"?$top={self.module.params['data_increment']}&" \
+        query = f"?$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(ApmAccessProfileFactParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -8393,37 +8632,24 @@ class AsmPolicyFactManager(BaseManager):
         else:
             return False
 
+    @property
+    def data_increment(self):
+        # ASM policies are read with a fixed page size, expanded policies are large.
+        return 10
+
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = AsmPolicyFactParameters(params=resource)
-            results.append(params)
-        return results
-
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + 10
-        return result
+            yield params
 
 
 class AsmPolicyFactManagerV12(AsmPolicyFactManager):
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/asm/policies"
         to_expand = 'policy-builder,geolocation-enforcement,csrf-protection'
         query = '?$top=10&$skip={0}&$expand={1}&$filter=partition+eq+{2}'.format(skip, to_expand, self.module.params['partition'])
@@ -8440,15 +8666,10 @@ class AsmPolicyFactManagerV12(AsmPolicyFactManager):
 
 class AsmPolicyFactManagerV13(AsmPolicyFactManager):
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/asm/policies"
         to_expand = 'general,signature-settings,header-settings,cookie-settings,antivirus,' \
                     'policy-builder,csrf-protection,csrf-urls'
@@ -8494,11 +8715,7 @@ class AsmServerTechnologyFactManager(BaseManager):
         if self.version_is_less_than_13():
             return results
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['server_technology_name'])
-        return results
+        return self.sort_returnables(facts, key='server_technology_name')
 
     def version_is_less_than_13(self):
         version = tmos_version(self.client)
@@ -8589,35 +8806,19 @@ class AsmSignatureSetsFactManager(BaseManager):
         if 'asm' not in self.provisioned_modules:
             return results
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['name'])
-        return results
+        return self.sort_returnables(facts, key='name')
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = AsmSignatureSetsFactParameters(params=resource)
-            results.append(params)
-        return results
-
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
+            yield params
 
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/asm/signature-sets"
-        query = f"?$top={self.module.params['data_increment']}&$skip={skip}"
-        response = self.client.get(uri + query)
+        query = f"?$top={size or self.data_increment}&$skip={skip}"
+        query += self.select_query(AsmSignatureSetsFactParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -8899,6 +9100,8 @@ class ClientSslProfilesParameters(BaseParameters):
 
 
 class ClientSslProfilesFactManager(BaseManager):
+    snapshot = True
+
     def __init__(self, *args, **kwargs):
         self.client = kwargs.get('client', None)
         self.module = kwargs.get('module', None)
@@ -8910,38 +9113,21 @@ class ClientSslProfilesFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = ClientSslProfilesParameters(params=resource)
-            results.append(params)
-        return results
+            yield params
 
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
-
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/ltm/profile/client-ssl"
-        query = f"?$top={self.module.params['data_increment']}&" \
+        query = f"?$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(ClientSslProfilesParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -9061,6 +9247,8 @@ class DeviceGroupsParameters(BaseParameters):
 
 
 class DeviceGroupsFactManager(BaseManager):
+    snapshot = True
+
     def __init__(self, *args, **kwargs):
         self.client = kwargs.get('client', None)
         self.module = kwargs.get('module', None)
@@ -9072,38 +9260,21 @@ class DeviceGroupsFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = DeviceGroupsParameters(params=resource)
-            results.append(params)
-        return results
-
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
+            yield params
 
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/cm/device-group"
-        query = f"?expandSubcollections=true&$top={self.module.params['data_increment']}" \
+        query = f"?expandSubcollections=true&$top={size or self.data_increment}" \
                 f"&$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(DeviceGroupsParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -9235,38 +9406,21 @@ class DevicesFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = DevicesParameters(params=resource)
-            results.append(params)
-        return results
-
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
+            yield params
 
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/cm/device"
-        query = f"?$top={self.module.params['data_increment']}&" \
+        query = f"?$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(DevicesParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -9376,6 +9530,8 @@ class ExternalMonitorsParameters(BaseParameters):
 
 
 class ExternalMonitorsFactManager(BaseManager):
+    snapshot = True
+
     def __init__(self, *args, **kwargs):
         self.client = kwargs.get('client', None)
         self.module = kwargs.get('module', None)
@@ -9387,38 +9543,21 @@ class ExternalMonitorsFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = ExternalMonitorsParameters(params=resource)
-            results.append(params)
-        return results
-
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
+            yield params
 
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/ltm/monitor/external"
-        query = f"?$top={self.module.params['data_increment']}&" \
+        query = f"?$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(ExternalMonitorsParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -9529,6 +9668,8 @@ class FastHttpProfilesParameters(BaseParameters):
 
 
 class FastHttpProfilesFactManager(BaseManager):
+    snapshot = True
+
     def __init__(self, *args, **kwargs):
         self.client = kwargs.get('client', None)
         self.module = kwargs.get('module', None)
@@ -9540,38 +9681,21 @@ class FastHttpProfilesFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = FastHttpProfilesParameters(params=resource)
-            results.append(params)
-        return results
-
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
+            yield params
 
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/ltm/profile/fasthttp"
-        query = f"?$top={self.module.params['data_increment']}&" \
+        query = f"?$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(FastHttpProfilesParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -9861,6 +9985,8 @@ class FastL4ProfilesParameters(BaseParameters):
 
 
 class FastL4ProfilesFactManager(BaseManager):
+    snapshot = True
+
     def __init__(self, *args, **kwargs):
         self.client = kwargs.get('client', None)
         self.module = kwargs.get('module', None)
@@ -9872,38 +9998,21 @@ class FastL4ProfilesFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = FastL4ProfilesParameters(params=resource)
-            results.append(params)
-        return results
+            yield params
 
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
-
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/ltm/profile/fastl4"
-        query = f"?$top={self.module.params['data_increment']}&" \
+        query = f"?$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(FastL4ProfilesParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -9966,6 +10075,8 @@ class GatewayIcmpMonitorsParameters(BaseParameters):
 
 
 class GatewayIcmpMonitorsFactManager(BaseManager):
+    snapshot = True
+
     def __init__(self, *args, **kwargs):
         self.client = kwargs.get('client', None)
         self.module = kwargs.get('module', None)
@@ -9977,38 +10088,21 @@ class GatewayIcmpMonitorsFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = GatewayIcmpMonitorsParameters(params=resource)
-            results.append(params)
-        return results
-
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
+            yield params
 
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/ltm/monitor/gateway-icmp"
-        query = f"?$top={self.module.params['data_increment']}&" \
+        query = f"?$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(GatewayIcmpMonitorsParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -10209,6 +10303,8 @@ class GtmXPoolsParameters(BaseParameters):
 
 
 class GtmAPoolsFactManager(BaseManager):
+    snapshot = True
+
     def __init__(self, *args, **kwargs):
         self.client = kwargs.get('client', None)
         self.module = kwargs.get('module', None)
@@ -10222,38 +10318,21 @@ class GtmAPoolsFactManager(BaseManager):
     def _exec_module(self):
         if 'gtm' not in self.provisioned_modules:
             return []
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = GtmXPoolsParameters(params=resource)
-            results.append(params)
-        return results
-
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
+            yield params
 
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/gtm/pool/a"
-        query = f"?expandSubcollections=true&$top={self.module.params['data_increment']}&" \
+        query = f"?expandSubcollections=true&$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(GtmXPoolsParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -10265,6 +10344,8 @@ class GtmAPoolsFactManager(BaseManager):
 
 
 class GtmAaaaPoolsFactManager(BaseManager):
+    snapshot = True
+
     def __init__(self, *args, **kwargs):
         self.client = kwargs.get('client', None)
         self.module = kwargs.get('module', None)
@@ -10278,38 +10359,21 @@ class GtmAaaaPoolsFactManager(BaseManager):
     def _exec_module(self):
         if 'gtm' not in self.provisioned_modules:
             return []
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = GtmXPoolsParameters(params=resource)
-            results.append(params)
-        return results
-
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
+            yield params
 
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/gtm/pool/aaaa"
-        query = f"?expandSubcollections=true&$top={self.module.params['data_increment']}&" \
+        query = f"?expandSubcollections=true&$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(GtmXPoolsParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -10321,6 +10385,8 @@ class GtmAaaaPoolsFactManager(BaseManager):
 
 
 class GtmCnamePoolsFactManager(BaseManager):
+    snapshot = True
+
     def __init__(self, *args, **kwargs):
         self.client = kwargs.get('client', None)
         self.module = kwargs.get('module', None)
@@ -10334,38 +10400,21 @@ class GtmCnamePoolsFactManager(BaseManager):
     def _exec_module(self):
         if 'gtm' not in self.provisioned_modules:
             return []
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = GtmXPoolsParameters(params=resource)
-            results.append(params)
-        return results
+            yield params
 
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
-
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/gtm/pool/cname"
-        query = f"?expandSubcollections=true&$top={self.module.params['data_increment']}&" \
+        query = f"?expandSubcollections=true&$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(GtmXPoolsParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -10377,6 +10426,8 @@ class GtmCnamePoolsFactManager(BaseManager):
 
 
 class GtmMxPoolsFactManager(BaseManager):
+    snapshot = True
+
     def __init__(self, *args, **kwargs):
         self.client = kwargs.get('client', None)
         self.module = kwargs.get('module', None)
@@ -10390,38 +10441,21 @@ class GtmMxPoolsFactManager(BaseManager):
     def _exec_module(self):
         if 'gtm' not in self.provisioned_modules:
             return []
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = GtmXPoolsParameters(params=resource)
-            results.append(params)
-        return results
-
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
+            yield params
 
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/gtm/pool/mx"
-        query = f"?expandSubcollections=true&$top={self.module.params['data_increment']}&" \
+        query = f"?expandSubcollections=true&$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(GtmXPoolsParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -10433,6 +10467,8 @@ class GtmMxPoolsFactManager(BaseManager):
 
 
 class GtmNaptrPoolsFactManager(BaseManager):
+    snapshot = True
+
     def __init__(self, *args, **kwargs):
         self.client = kwargs.get('client', None)
         self.module = kwargs.get('module', None)
@@ -10446,38 +10482,21 @@ class GtmNaptrPoolsFactManager(BaseManager):
     def _exec_module(self):
         if 'gtm' not in self.provisioned_modules:
             return []
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = GtmXPoolsParameters(params=resource)
-            results.append(params)
-        return results
-
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
+            yield params
 
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/gtm/pool/naptr"
-        query = f"?expandSubcollections=true&$top={self.module.params['data_increment']}&" \
+        query = f"?expandSubcollections=true&$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(GtmXPoolsParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -10489,6 +10508,8 @@ class GtmNaptrPoolsFactManager(BaseManager):
 
 
 class GtmSrvPoolsFactManager(BaseManager):
+    snapshot = True
+
     def __init__(self, *args, **kwargs):
         self.client = kwargs.get('client', None)
         self.module = kwargs.get('module', None)
@@ -10502,38 +10523,21 @@ class GtmSrvPoolsFactManager(BaseManager):
     def _exec_module(self):
         if 'gtm' not in self.provisioned_modules:
             return []
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = GtmXPoolsParameters(params=resource)
-            results.append(params)
-        return results
+            yield params
 
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
-
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/gtm/pool/srv"
-        query = f"?expandSubcollections=true&$top={self.module.params['data_increment']}&" \
+        query = f"?expandSubcollections=true&$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(GtmXPoolsParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -10804,38 +10808,21 @@ class GtmServersFactManager(BaseManager):
     def _exec_module(self):
         if 'gtm' not in self.provisioned_modules:
             return []
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = GtmServersParameters(client=self.client, params=resource)
-            results.append(params)
-        return results
-
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
+            yield params
 
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/gtm/server"
-        query = f"?expandSubcollections=true&$top={self.module.params['data_increment']}&" \
+        query = f"?expandSubcollections=true&$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(GtmServersParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -10921,6 +10908,8 @@ class GtmXWideIpsParameters(BaseParameters):
 
 
 class GtmAWideIpsFactManager(BaseManager):
+    snapshot = True
+
     def __init__(self, *args, **kwargs):
         self.client = kwargs.get('client', None)
         self.module = kwargs.get('module', None)
@@ -10934,38 +10923,21 @@ class GtmAWideIpsFactManager(BaseManager):
     def _exec_module(self):
         if 'gtm' not in self.provisioned_modules:
             return []
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = GtmXWideIpsParameters(params=resource)
-            results.append(params)
-        return results
+            yield params
 
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
-
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/gtm/wideip/a"
-        query = f"?$top={self.module.params['data_increment']}&" \
+        query = f"?$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(GtmXWideIpsParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -10977,6 +10949,8 @@ class GtmAWideIpsFactManager(BaseManager):
 
 
 class GtmAaaaWideIpsFactManager(BaseManager):
+    snapshot = True
+
     def __init__(self, *args, **kwargs):
         self.client = kwargs.get('client', None)
         self.module = kwargs.get('module', None)
@@ -10990,38 +10964,21 @@ class GtmAaaaWideIpsFactManager(BaseManager):
     def _exec_module(self):
         if 'gtm' not in self.provisioned_modules:
             return []
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = GtmXWideIpsParameters(params=resource)
-            results.append(params)
-        return results
-
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
+            yield params
 
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/gtm/wideip/aaaa"
-        query = f"?$top={self.module.params['data_increment']}&" \
+        query = f"?$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(GtmXWideIpsParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -11033,6 +10990,8 @@ class GtmAaaaWideIpsFactManager(BaseManager):
 
 
 class GtmCnameWideIpsFactManager(BaseManager):
+    snapshot = True
+
     def __init__(self, *args, **kwargs):
         self.client = kwargs.get('client', None)
         self.module = kwargs.get('module', None)
@@ -11046,38 +11005,21 @@ class GtmCnameWideIpsFactManager(BaseManager):
     def _exec_module(self):
         if 'gtm' not in self.provisioned_modules:
             return []
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = GtmXWideIpsParameters(params=resource)
-            results.append(params)
-        return results
+            yield params
 
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
-
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/gtm/wideip/cname"
-        query = f"?$top={self.module.params['data_increment']}&" \
+        query = f"?$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(GtmXWideIpsParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -11089,6 +11031,8 @@ class GtmCnameWideIpsFactManager(BaseManager):
 
 
 class GtmMxWideIpsFactManager(BaseManager):
+    snapshot = True
+
     def __init__(self, *args, **kwargs):
         self.client = kwargs.get('client', None)
         self.module = kwargs.get('module', None)
@@ -11102,38 +11046,21 @@ class GtmMxWideIpsFactManager(BaseManager):
     def _exec_module(self):
         if 'gtm' not in self.provisioned_modules:
             return []
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = GtmXWideIpsParameters(params=resource)
-            results.append(params)
-        return results
-
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
+            yield params
 
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/gtm/wideip/mx"
-        query = f"?$top={self.module.params['data_increment']}&" \
+        query = f"?$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(GtmXWideIpsParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -11145,6 +11072,8 @@ class GtmMxWideIpsFactManager(BaseManager):
 
 
 class GtmNaptrWideIpsFactManager(BaseManager):
+    snapshot = True
+
     def __init__(self, *args, **kwargs):
         self.client = kwargs.get('client', None)
         self.module = kwargs.get('module', None)
@@ -11156,40 +11085,23 @@ class GtmNaptrWideIpsFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         if 'gtm' not in self.provisioned_modules:
             return []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = GtmXWideIpsParameters(params=resource)
-            results.append(params)
-        return results
+            yield params
 
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
-
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/gtm/wideip/naptr"
-        query = f"?$top={self.module.params['data_increment']}&" \
+        query = f"?$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(GtmXWideIpsParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -11201,6 +11113,8 @@ class GtmNaptrWideIpsFactManager(BaseManager):
 
 
 class GtmSrvWideIpsFactManager(BaseManager):
+    snapshot = True
+
     def __init__(self, *args, **kwargs):
         self.client = kwargs.get('client', None)
         self.module = kwargs.get('module', None)
@@ -11214,38 +11128,21 @@ class GtmSrvWideIpsFactManager(BaseManager):
     def _exec_module(self):
         if 'gtm' not in self.provisioned_modules:
             return []
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = GtmXWideIpsParameters(params=resource)
-            results.append(params)
-        return results
-
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
+            yield params
 
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/gtm/wideip/srv"
-        query = f"?$top={self.module.params['data_increment']}&" \
+        query = f"?$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(GtmXWideIpsParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -11296,6 +11193,8 @@ class GtmTopologyRegionParameters(BaseParameters):
 
 
 class GtmTopologyRegionFactManager(BaseManager):
+    snapshot = True
+
     def __init__(self, *args, **kwargs):
         self.client = kwargs.get('client', None)
         self.module = kwargs.get('module', None)
@@ -11309,38 +11208,21 @@ class GtmTopologyRegionFactManager(BaseManager):
     def _exec_module(self):
         if 'gtm' not in self.provisioned_modules:
             return []
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = GtmTopologyRegionParameters(params=resource)
-            results.append(params)
-        return results
+            yield params
 
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
-
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/gtm/region"
-        query = f"?$top={self.module.params['data_increment']}&" \
+        query = f"?$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(GtmTopologyRegionParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -11417,6 +11299,8 @@ class HttpMonitorsParameters(BaseParameters):
 
 
 class HttpMonitorsFactManager(BaseManager):
+    snapshot = True
+
     def __init__(self, *args, **kwargs):
         self.client = kwargs.get('client', None)
         self.module = kwargs.get('module', None)
@@ -11428,38 +11312,21 @@ class HttpMonitorsFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = HttpMonitorsParameters(params=resource)
-            results.append(params)
-        return results
-
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
+            yield params
 
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/ltm/monitor/http"
-        query = f"?$top={self.module.params['data_increment']}&" \
+        query = f"?$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(HttpMonitorsParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -11536,6 +11403,8 @@ class HttpsMonitorsParameters(BaseParameters):
 
 
 class HttpsMonitorsFactManager(BaseManager):
+    snapshot = True
+
     def __init__(self, *args, **kwargs):
         self.client = kwargs.get('client', None)
         self.module = kwargs.get('module', None)
@@ -11547,38 +11416,21 @@ class HttpsMonitorsFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = HttpsMonitorsParameters(params=resource)
-            results.append(params)
-        return results
+            yield params
 
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
-
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/ltm/monitor/https"
-        query = f"?$top={self.module.params['data_increment']}&" \
+        query = f"?$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(HttpsMonitorsParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -11606,6 +11458,13 @@ class HttpProfilesParameters(BaseParameters):
         'pipeline': 'pipeline_action',
     }
 
+    selectables = [
+        'enforcement',
+        'explicit_proxy',
+        'hsts',
+        'sflow',
+    ]
+
     returnables = [
         'full_path',
         'name',
@@ -11792,6 +11651,8 @@ class HttpProfilesParameters(BaseParameters):
 
 
 class HttpProfilesFactManager(BaseManager):
+    snapshot = True
+
     def __init__(self, *args, **kwargs):
         self.client = kwargs.get('client', None)
         self.module = kwargs.get('module', None)
@@ -11803,38 +11664,21 @@ class HttpProfilesFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = HttpProfilesParameters(params=resource)
-            results.append(params)
-        return results
+            yield params
 
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
-
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/ltm/profile/http"
-        query = f"?$top={self.module.params['data_increment']}&" \
+        query = f"?$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(HttpProfilesParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -11896,6 +11740,8 @@ class IappServicesParameters(BaseParameters):
 
 
 class IappServicesFactManager(BaseManager):
+    snapshot = True
+
     def __init__(self, *args, **kwargs):
         self.client = kwargs.get('client', None)
         self.module = kwargs.get('module', None)
@@ -11907,38 +11753,21 @@ class IappServicesFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = IappServicesParameters(params=resource)
-            results.append(params)
-        return results
-
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
+            yield params
 
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/sys/application/service"
-        query = f"?$top={self.module.params['data_increment']}&" \
+        query = f"?$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(IappServicesParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -11976,13 +11805,8 @@ class IapplxPackagesFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['name'])
-        return results
+        return self.sort_returnables(facts, key='name')
 
     def read_facts(self):
         results = []
@@ -12084,6 +11908,8 @@ class IcmpMonitorsParameters(BaseParameters):
 
 
 class IcmpMonitorsFactManager(BaseManager):
+    snapshot = True
+
     def __init__(self, *args, **kwargs):
         self.client = kwargs.get('client', None)
         self.module = kwargs.get('module', None)
@@ -12095,38 +11921,21 @@ class IcmpMonitorsFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = IcmpMonitorsParameters(params=resource)
-            results.append(params)
-        return results
-
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
+            yield params
 
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/ltm/monitor/icmp"
-        query = f"?$top={self.module.params['data_increment']}&" \
+        query = f"?$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(IcmpMonitorsParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -12153,6 +11962,10 @@ class InterfacesParameters(BaseParameters):
         'stpLinkType': 'stp_link_type'
     }
 
+    selectables = [
+        'sflow',
+    ]
+
     returnables = [
         'full_path',
         'name',
@@ -12220,37 +12033,20 @@ class InterfacesFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = InterfacesParameters(params=resource)
-            results.append(params)
-        return results
-
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
+            yield params
 
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/net/interface"
-        query = f"?$top={self.module.params['data_increment']}&$skip={skip}"
-        response = self.client.get(uri + query)
+        query = f"?$top={size or self.data_increment}&$skip={skip}"
+        query += self.select_query(InterfacesParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -12275,6 +12071,8 @@ class InternalDataGroupsParameters(BaseParameters):
 
 
 class InternalDataGroupsFactManager(BaseManager):
+    snapshot = True
+
     def __init__(self, *args, **kwargs):
         self.client = kwargs.get('client', None)
         self.module = kwargs.get('module', None)
@@ -12286,38 +12084,21 @@ class InternalDataGroupsFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = InternalDataGroupsParameters(params=resource)
-            results.append(params)
-        return results
+            yield params
 
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
-
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/ltm/data-group/internal"
-        query = f"?$top={self.module.params['data_increment']}&" \
+        query = f"?$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(InternalDataGroupsParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -12334,6 +12115,10 @@ class IrulesParameters(BaseParameters):
         'ignoreVerification': 'ignore_verification',
     }
 
+    selectables = [
+        'apiAnonymous',
+    ]
+
     returnables = [
         'full_path',
         'name',
@@ -12378,6 +12163,8 @@ class IrulesParameters(BaseParameters):
 
 
 class IrulesFactManager(BaseManager):
+    snapshot = True
+
     def __init__(self, *args, **kwargs):
         self.client = kwargs.get('client', None)
         self.module = kwargs.get('module', None)
@@ -12389,38 +12176,21 @@ class IrulesFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = IrulesParameters(params=resource)
-            results.append(params)
-        return results
+            yield params
 
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
-
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/ltm/rule"
-        query = f"?$top={self.module.params['data_increment']}&" \
+        query = f"?$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(IrulesParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -12877,52 +12647,40 @@ class LtmPoolsFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
+        stats = self.read_stats_collection_from_device("/mgmt/tm/ltm/pool/stats")
         for resource in collection:
             attrs = resource
-            members = self.read_member_from_device(attrs['fullPath'])
+            members = self.read_expanded_members(attrs)
+            if members is None:
+                members = self.read_member_from_device(attrs['fullPath'])
             attrs['members'] = members
-            attrs['stats'] = self.read_stats_from_device(attrs['fullPath'])
+            attrs['stats'] = self.join_stats(stats, attrs['fullPath'])
             params = LtmPoolsParameters(params=attrs)
-            results.append(params)
-        return results
-
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
+            yield params
 
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         """Read the LTM pools collection from the device
 
-        Note that sub-collection expansion does not work with LTM pools. Therefore,
-        one needs to query the ``members`` endpoint separately and add that to the
-        list of ``attrs`` before the full set of attributes is sent to the ``Parameters``
-        class.
+        Note that sub-collection expansion does not work with LTM pools on every TMOS
+        version. Therefore, unless ``bulk_stats`` is enabled, one needs to query the
+        ``members`` endpoint separately and add that to the list of ``attrs`` before
+        the full set of attributes is sent to the ``Parameters`` class.
 
         Returns:
              list: List of ``Pool`` objects
         """
         uri = "/mgmt/tm/ltm/pool"
-        query = f"?$top={self.module.params['data_increment']}&" \
+        query = f"?$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        if self.module.params['bulk_stats']:
+            query += "&expandSubcollections=true"
+        query += self.select_query(LtmPoolsParameters, 'fullPath', 'membersReference')
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -12930,8 +12688,26 @@ class LtmPoolsFactManager(BaseManager):
         if 'items' not in response['contents']:
             return []
         result = response['contents']['items']
+        if self.module.params['bulk_stats'] and any('items' in (x.get('membersReference') or {}) for x in result):
+            # the device expanded the members of the page, the references of empty pools
+            # do not hold any items then, rather than an empty list
+            for item in result:
+                if isinstance(item.get('membersReference'), dict):
+                    item['membersReference'].setdefault('items', [])
         return result
 
+    def read_expanded_members(self, attrs):
+        """Return pool members from an expanded ``membersReference``
+
+        Returns:
+            list: Pool members, or None when the sub-collection was not expanded by the device,
+            in which case the ``members`` endpoint is queried.
+        """
+        reference = attrs.pop('membersReference', None)
+        if not self.module.params['bulk_stats'] or not reference:
+            return None
+        return reference.get('items', None)
+
     def read_member_from_device(self, full_path):
         uri = "/mgmt/tm/ltm/pool/{0}/members".format(
             transform_name(name=full_path)
@@ -13034,6 +12810,8 @@ class LtmPolicyParameters(BaseParameters):
 
 
 class LtmPolicyFactManager(BaseManager):
+    snapshot = True
+
     def __init__(self, *args, **kwargs):
         self.client = kwargs.get('client', None)
         self.module = kwargs.get('module', None)
@@ -13045,38 +12823,21 @@ class LtmPolicyFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = LtmPolicyParameters(params=resource)
-            results.append(params)
-        return results
+            yield params
 
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
-
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/ltm/policy/"
-        query = f"?expandSubcollections=true&$top={self.module.params['data_increment']}&" \
+        query = f"?expandSubcollections=true&$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(LtmPolicyParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -13096,6 +12857,10 @@ class NodesParameters(BaseParameters):
         'monitor': 'monitors'
     }
 
+    selectables = [
+        'fqdn',
+    ]
+
     returnables = [
         'full_path',
         'name',
@@ -13221,40 +12986,24 @@ class NodesFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
+        stats = self.read_stats_collection_from_device("/mgmt/tm/ltm/node/stats")
         for resource in collection:
             attrs = resource
-            attrs['stats'] = self.read_stats_from_device(attrs['fullPath'])
+            attrs['stats'] = self.join_stats(stats, attrs['fullPath'])
             params = NodesParameters(params=attrs)
-            results.append(params)
-        return results
+            yield params
 
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
-
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/ltm/node"
-        query = f"?$top={self.module.params['data_increment']}&" \
+        query = f"?$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(NodesParameters, 'fullPath')
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -13330,6 +13079,8 @@ class OneConnectProfilesParameters(BaseParameters):
 
 
 class OneConnectProfilesFactManager(BaseManager):
+    snapshot = True
+
     def __init__(self, *args, **kwargs):
         self.client = kwargs.get('client', None)
         self.module = kwargs.get('module', None)
@@ -13341,38 +13092,21 @@ class OneConnectProfilesFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = OneConnectProfilesParameters(params=resource)
-            results.append(params)
-        return results
-
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
+            yield params
 
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/ltm/profile/one-connect"
-        query = f"?$top={self.module.params['data_increment']}&" \
+        query = f"?$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(OneConnectProfilesParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -13409,13 +13143,8 @@ class PartitionFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
         results = []
@@ -13468,13 +13197,8 @@ class ProvisionInfoFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
         results = []
@@ -13540,6 +13264,8 @@ class RouteDomainParameters(BaseParameters):
 
 
 class RouteDomainFactManager(BaseManager):
+    snapshot = True
+
     def __init__(self, *args, **kwargs):
         self.client = kwargs.get('client', None)
         self.module = kwargs.get('module', None)
@@ -13551,38 +13277,21 @@ class RouteDomainFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
-        for resource in collection:
-            params = RouteDomainParameters(params=resource)
-            results.append(params)
-        return results
-
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
+        for resource in collection:
+            params = RouteDomainParameters(params=resource)
+            yield params
 
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/net/route-domain"
-        query = f"?$top={self.module.params['data_increment']}&" \
+        query = f"?$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(RouteDomainParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -13658,6 +13367,8 @@ class SelfIpsParameters(BaseParameters):
 
 
 class SelfIpsFactManager(BaseManager):
+    snapshot = True
+
     def __init__(self, *args, **kwargs):
         self.client = kwargs.get('client', None)
         self.module = kwargs.get('module', None)
@@ -13669,38 +13380,21 @@ class SelfIpsFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = SelfIpsParameters(params=resource)
-            results.append(params)
-        return results
+            yield params
 
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
-
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/net/self"
-        query = f"?$top={self.module.params['data_increment']}&" \
+        query = f"?$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(SelfIpsParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -13971,6 +13665,8 @@ class ServerSslProfilesParameters(BaseParameters):
 
 
 class ServerSslProfilesFactManager(BaseManager):
+    snapshot = True
+
     def __init__(self, *args, **kwargs):
         self.client = kwargs.get('client', None)
         self.module = kwargs.get('module', None)
@@ -13982,38 +13678,21 @@ class ServerSslProfilesFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = ServerSslProfilesParameters(params=resource)
-            results.append(params)
-        return results
-
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
+            yield params
 
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/ltm/profile/server-ssl"
-        query = f"?$top={self.module.params['data_increment']}&" \
+        query = f"?$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(ServerSslProfilesParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -14074,13 +13753,8 @@ class SoftwareVolumesFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
         results = []
@@ -14133,13 +13807,8 @@ class SoftwareHotfixesFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
         results = []
@@ -14251,13 +13920,8 @@ class SoftwareImagesFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
         results = []
@@ -14332,6 +13996,8 @@ class SslCertificatesParameters(BaseParameters):
 
 
 class SslCertificatesFactManager(BaseManager):
+    snapshot = True
+
     def __init__(self, *args, **kwargs):
         self.client = kwargs.get('client', None)
         self.module = kwargs.get('module', None)
@@ -14343,38 +14009,21 @@ class SslCertificatesFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = SslCertificatesParameters(params=resource)
-            results.append(params)
-        return results
-
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
+            yield params
 
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/sys/file/ssl-cert"
-        query = f"?$top={self.module.params['data_increment']}&" \
+        query = f"?$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(SslCertificatesParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -14414,6 +14063,8 @@ class SslKeysParameters(BaseParameters):
 
 
 class SslKeysFactManager(BaseManager):
+    snapshot = True
+
     def __init__(self, *args, **kwargs):
         self.client = kwargs.get('client', None)
         self.module = kwargs.get('module', None)
@@ -14425,38 +14076,21 @@ class SslKeysFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = SslKeysParameters(params=resource)
-            results.append(params)
-        return results
-
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
+            yield params
 
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/sys/file/ssl-key"
-        query = f"?$top={self.module.params['data_increment']}&" \
+        query = f"?$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(SslKeysParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -14597,13 +14231,8 @@ class SystemDbFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
         results = []
@@ -15134,6 +14763,8 @@ class TcpMonitorsParameters(BaseParameters):
 
 
 class TcpMonitorsFactManager(BaseManager):
+    snapshot = True
+
     def __init__(self, *args, **kwargs):
         self.client = kwargs.get('client', None)
         self.module = kwargs.get('module', None)
@@ -15145,38 +14776,21 @@ class TcpMonitorsFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = TcpMonitorsParameters(params=resource)
-            results.append(params)
-        return results
+            yield params
 
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
-
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/ltm/monitor/tcp"
-        query = f"?$top={self.module.params['data_increment']}&" \
+        query = f"?$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(TcpMonitorsParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -15226,6 +14840,8 @@ class TcpHalfOpenMonitorsParameters(BaseParameters):
 
 
 class TcpHalfOpenMonitorsFactManager(BaseManager):
+    snapshot = True
+
     def __init__(self, *args, **kwargs):
         self.client = kwargs.get('client', None)
         self.module = kwargs.get('module', None)
@@ -15237,38 +14853,21 @@ class TcpHalfOpenMonitorsFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = TcpHalfOpenMonitorsParameters(params=resource)
-            results.append(params)
-        return results
-
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
+            yield params
 
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/ltm/monitor/tcp-half-open"
-        query = f"?$top={self.module.params['data_increment']}&" \
+        query = f"?$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(TcpHalfOpenMonitorsParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -15655,6 +15254,8 @@ class TcpProfilesParameters(BaseParameters):
 
 
 class TcpProfilesFactManager(BaseManager):
+    snapshot = True
+
     def __init__(self, *args, **kwargs):
         self.client = kwargs.get('client', None)
         self.module = kwargs.get('module', None)
@@ -15666,38 +15267,21 @@ class TcpProfilesFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = TcpProfilesParameters(params=resource)
-            results.append(params)
-        return results
-
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
+            yield params
 
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/ltm/profile/tcp"
-        query = f"?$top={self.module.params['data_increment']}&" \
+        query = f"?$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(TcpProfilesParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -15774,40 +15358,25 @@ class TrafficGroupsFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
+        # the collection stats hold an entry per traffic group and device, which does not
+        # match the per-object stats, so they are always read one traffic group at a time
         for resource in collection:
             attrs = resource
             attrs['stats'] = self.read_stats_from_device(attrs['fullPath'])
             params = TrafficGroupsParameters(params=attrs)
-            results.append(params)
-        return results
-
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
+            yield params
 
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/cm/traffic-group"
-        query = f"?$top={self.module.params['data_increment']}&" \
+        query = f"?$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(TrafficGroupsParameters, 'fullPath')
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -15897,39 +15466,23 @@ class TrunksFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
+        stats = self.read_stats_collection_from_device("/mgmt/tm/net/trunk/stats")
         for resource in collection:
             attrs = resource
-            attrs['stats'] = self.read_stats_from_device(attrs['fullPath'])
+            attrs['stats'] = self.join_stats(stats, attrs['fullPath'])
             params = TrunksParameters(params=attrs)
-            results.append(params)
-        return results
-
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
+            yield params
 
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/net/trunk"
-        query = f"?$top={self.module.params['data_increment']}&$skip={skip}"
-        response = self.client.get(uri + query)
+        query = f"?$top={size or self.data_increment}&$skip={skip}"
+        query += self.select_query(TrunksParameters, 'fullPath')
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -15963,6 +15516,10 @@ class UCSParameters(BaseParameters):
         'apiRawValues': 'variables'
     }
 
+    selectables = [
+        'variables',
+    ]
+
     returnables = [
         'file_name',
         'encrypted',
@@ -16003,38 +15560,21 @@ class UCSFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['file_name'])
-        return results
+        return self.sort_returnables(facts, key='file_name')
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             attrs = resource
             params = UCSParameters(params=attrs)
-            results.append(params)
-        return results
-
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
+            yield params
 
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/sys/ucs"
-        query = f"?$top={self.module.params['data_increment']}&$skip={skip}"
-        response = self.client.get(uri + query)
+        query = f"?$top={size or self.data_increment}&$skip={skip}"
+        query += self.select_query(UCSParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -16088,13 +15628,8 @@ class UsersFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
         results = []
@@ -16181,6 +15716,8 @@ class UdpProfilesParameters(BaseParameters):
 
 
 class UdpProfilesFactManager(BaseManager):
+    snapshot = True
+
     def __init__(self, *args, **kwargs):
         self.client = kwargs.get('client', None)
         self.module = kwargs.get('module', None)
@@ -16192,38 +15729,21 @@ class UdpProfilesFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = UdpProfilesParameters(params=resource)
-            results.append(params)
-        return results
+            yield params
 
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
-
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/ltm/profile/udp"
-        query = f"?$top={self.module.params['data_increment']}&" \
+        query = f"?$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(UdpProfilesParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -16288,13 +15808,8 @@ class VcmpGuestsFactManager(BaseManager):
     def _exec_module(self):
         if 'vcmp' not in self.provisioned_modules:
             return []
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
         results = []
@@ -16382,6 +15897,8 @@ class VirtualAddressesParameters(BaseParameters):
 
 
 class VirtualAddressesFactManager(BaseManager):
+    snapshot = True
+
     def __init__(self, *args, **kwargs):
         self.client = kwargs.get('client', None)
         self.module = kwargs.get('module', None)
@@ -16393,38 +15910,21 @@ class VirtualAddressesFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             params = VirtualAddressesParameters(params=resource)
-            results.append(params)
-        return results
-
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
+            yield params
 
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/ltm/virtual-address"
-        query = f"?$top={self.module.params['data_increment']}&" \
+        query = f"?$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(VirtualAddressesParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -16468,6 +15968,16 @@ class VirtualServersParameters(BaseParameters):
         'policiesReference': 'policies',
     }
 
+    selectables = [
+        'dhcpRelay',
+        'internal',
+        'ipForward',
+        'l2Forward',
+        'mask',
+        'reject',
+        'stateless',
+    ]
+
     returnables = [
         'full_path',
         'name',
@@ -17145,40 +16655,24 @@ class VirtualServersFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
+        stats = self.read_stats_collection_from_device("/mgmt/tm/ltm/virtual/stats")
         for resource in collection:
             attrs = resource
-            attrs['stats'] = self.read_stats_from_device(attrs['fullPath'])
+            attrs['stats'] = self.join_stats(stats, attrs['fullPath'])
             params = VirtualServersParameters(client=self.client, params=attrs)
-            results.append(params)
-        return results
-
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
+            yield params
 
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/ltm/virtual"
-        query = f"?expandSubcollections=true&$top={self.module.params['data_increment']}&" \
+        query = f"?expandSubcollections=true&$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(VirtualServersParameters, 'fullPath')
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -17218,6 +16712,10 @@ class VlansParameters(BaseParameters):
         'fullPath': 'full_path'
     }
 
+    selectables = [
+        'sflow',
+    ]
+
     returnables = [
         'full_path',
         'name',
@@ -17306,40 +16804,24 @@ class VlansFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
+        stats = self.read_stats_collection_from_device("/mgmt/tm/net/vlan/stats")
         for resource in collection:
             attrs = resource
-            attrs['stats'] = self.read_stats_from_device(attrs['fullPath'])
+            attrs['stats'] = self.join_stats(stats, attrs['fullPath'])
             params = VlansParameters(params=attrs)
-            results.append(params)
-        return results
+            yield params
 
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
-
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/net/vlan"
-        query = f"?expandSubcollections=true&$top={self.module.params['data_increment']}&" \
+        query = f"?expandSubcollections=true&$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(VlansParameters, 'fullPath')
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -17381,6 +16863,8 @@ class ManagementRouteParameters(BaseParameters):
 
 
 class ManagementRouteFactManager(BaseManager):
+    snapshot = True
+
     def __init__(self, *args, **kwargs):
         self.client = kwargs.get('client', None)
         self.module = kwargs.get('module', None)
@@ -17392,39 +16876,22 @@ class ManagementRouteFactManager(BaseManager):
         return result
 
     def _exec_module(self):
-        results = []
         facts = self.read_facts()
-        for item in facts:
-            attrs = item.to_return()
-            results.append(attrs)
-        results = sorted(results, key=lambda k: k['full_path'])
-        return results
+        return self.sort_returnables(facts)
 
     def read_facts(self):
-        results = []
         collection = self.increment_read()
         for resource in collection:
             attrs = resource
             params = ManagementRouteParameters(params=attrs)
-            results.append(params)
-        return results
-
-    def increment_read(self):
-        n = 0
-        result = []
-        while True:
-            items = self.read_collection_from_device(skip=n)
-            if not items:
-                break
-            result.extend(items)
-            n = n + self.module.params['data_increment']
-        return result
+            yield params
 
-    def read_collection_from_device(self, skip=0):
+    def read_collection_from_device(self, skip=0, size=None, page=None):
         uri = "/mgmt/tm/sys/management-route"
-        query = f"?expandSubcollections=true&$top={self.module.params['data_increment']}&" \
+        query = f"?expandSubcollections=true&$top={size or self.data_increment}&" \
                 f"$skip={skip}&$filter=partition+eq+{self.module.params['partition']}"
-        response = self.client.get(uri + query)
+        query += self.select_query(ManagementRouteParameters)
+        response = self.read_page(uri + query, page)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
@@ -17592,6 +17059,10 @@ class ModuleManager(object):
             raise F5ModuleError(
                 "The specified 'gather_subset' options are invalid: {0}".format(invalid)
             )
+        if self.module.params['max_concurrency'] < 1:
+            raise F5ModuleError(
+                "The 'max_concurrency' value must be greater than or equal to 1."
+            )
         result = self.filter_excluded_facts()
 
         managers = []
@@ -17713,10 +17184,74 @@ class ModuleManager(object):
         prov = modules_provisioned(client)
         for manager in managers:
             manager.provisioned_modules = prov
-            result = manager.exec_module()
+
+        store = self.snapshot_store(client)
+        snapshots = dict(reused=[], refreshed=[])
+
+        def run(manager):
+            if store is None or not manager.snapshot:
+                return manager.exec_module()
+            return self.exec_from_snapshot(manager, store, snapshots)
+
+        workers = min(self.module.params['max_concurrency'], len(managers))
+        if workers > 1:
+            # Fact managers do not share any state apart from the persistent connection, whose
+            # JSON-RPC calls each use their own socket, so they can safely run side by side. The
+            # connection serves the calls one at a time, so the requests to the device are still
+            # sent sequentially, only the parsing done by the managers overlaps.
+            #
+            # The executor returns results in the order the managers were submitted in, which keeps
+            # the merged output identical to the sequential run.
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                facts = list(executor.map(run, managers))
+        else:
+            facts = [run(manager) for manager in managers]
+
+        for result in facts:
             results.update(result)
+        if store is not None:
+            results['_f5_snapshots'] = dict((k, sorted(v)) for k, v in snapshots.items())
+        results.update(perf_report(client, *[manager.client for manager in managers]))
         return results
 
+    def snapshot_store(self, client):
+        if not self.module.params['snapshot_dir']:
+            return None
+        return SnapshotStore(self.module.params['snapshot_dir'], client.plugin.get_option('host'))
+
+    def exec_from_snapshot(self, manager, store, snapshots):
+        """Return the facts of a manager, from its snapshot when its collection is unchanged
+
+        The fingerprint of the collection is compared with the one stored with the snapshot
+        of the previous run. The facts are read from the device only when they differ, or
+        when there is no snapshot, and are then stored with the new fingerprint.
+
+        Args:
+            manager: The fact manager, whose ``snapshot`` attribute is set.
+            store (SnapshotStore): The snapshots of the device.
+            snapshots (dict): The lists of subsets reused from snapshots and read from the device.
+
+        Returns:
+            dict: The facts of the manager.
+        """
+        partition = self.module.params['partition']
+        try:
+            digest = manager.read_fingerprint()
+        except F5ModuleError:
+            # for example a module which is not provisioned, the manager knows how to handle it
+            return manager.exec_module()
+        facts = store.get(manager.subset, partition, digest)
+        if facts is not None:
+            snapshots['reused'].append(manager.subset)
+            return facts
+        facts = manager.exec_module()
+        try:
+            store.set(manager.subset, partition, digest, facts)
+        except (IOError, OSError) as ex:
+            raise F5ModuleError("Unable to store the snapshot of '{0}': {1}".format(manager.subset, ex))
+        snapshots['refreshed'].append(manager.subset)
+        return facts
+
     def get_manager(self, which):
         result = {}
         manager = self.managers.get(which, None)
@@ -17726,6 +17261,7 @@ class ModuleManager(object):
         kwargs.update(self.kwargs)
 
         kwargs['client'] = F5Client(module=self.module, client=self.connection)
+        kwargs['subset'] = which
         result = manager(**kwargs)
         return result
 
@@ -17743,6 +17279,25 @@ class ArgumentSpec(object):
                 type='int',
                 default=10
             ),
+            max_concurrency=dict(
+                type='int',
+                default=1
+            ),
+            bulk_stats=dict(
+                type='bool',
+                default=False
+            ),
+            minimal_fields=dict(
+                type='bool',
+                default=False
+            ),
+            adaptive_paging=dict(
+                type='bool',
+                default=False
+            ),
+            snapshot_dir=dict(
+                type='path'
+            ),
             gather_subset=dict(
                 type='list',
                 elements='str',
@@ -17939,6 +17494,8 @@ def main():
         ansible_facts = dict()
 
         for key, value in iteritems(results):
+            if key.startswith('_f5_'):
+                continue
             key = 'ansible_net_%s' % key
             ansible_facts[key] = value
 
@@ -139,8 +139,24 @@ diff:
   returned: when dry_run is yes
   type: list
   sample: [{'foo': 'bar'}, {'baz': 'bar'}]
+task_polling:
+  description:
+    - Metrics collected while polling the asynchronous tasks started by the module.
+    - The number of polls sent, the number of busy responses received, the seconds spent waiting
+      between polls and the seconds elapsed while waiting for the tasks to complete.
+  returned: when the module waited for a task
+  type: dict
+  sample: {"polls": 6, "busy_responses": 0, "waited": 15.42, "elapsed": 17.9}
+readiness:
+  description:
+    - The state of the device the last time its readiness was probed, after its services restarted.
+    - Whether the device was ready, the stage it was waiting on, out of C(connect), C(restjavad)
+      and C(service), the availability of the Declarative Onboarding service, the number of probes
+      sent and the seconds spent waiting between them.
+  returned: when the module checked the device
+  type: dict
+  sample: {"ready": false, "stage": "restjavad", "probes": 2, "waited": 0.0}
 '''
-import time
 from datetime import datetime
 
 from ansible.module_utils.basic import AnsibleModule
@@ -150,11 +166,13 @@ from ansible.module_utils.connection import (
 from ansible.module_utils.six import string_types
 
 from ..module_utils.client import (
-    F5Client, send_teem
+    F5Client, send_teem, perf_report, invalidate_metadata
 )
 from ..module_utils.common import (
     F5ModuleError, AnsibleF5Parameters, flatten_boolean
 )
+from ..module_utils.readiness import ReadinessProbe
+from ..module_utils.tasks import TaskWaiter
 
 try:
     import json
@@ -238,6 +256,11 @@ class ModuleManager(object):
         self.module = kwargs.get('module', None)
         self.connection = kwargs.get('connection', None)
         self.client = F5Client(module=self.module, client=self.connection)
+        self.probe = ReadinessProbe(
+            self.client, stages=('connect', 'restjavad', 'service'),
+            service='/mgmt/shared/declarative-onboarding/available'
+        )
+        self.waiter = TaskWaiter()
         self.want = ModuleParameters(params=self.module.params)
         self.changes = UsableChanges()
 
@@ -267,7 +290,10 @@ class ModuleManager(object):
         changes = reportable.to_return()
         result.update(**changes)
         result.update(dict(changed=changed))
+        result.update(self.waiter.to_return())
         self._announce_deprecations(result)
+        result.update(self.probe.to_return())
+        result.update(perf_report(self.client))
         send_teem(self.client, start)
         return result
 
@@ -341,12 +367,16 @@ class ModuleManager(object):
 
         if response['code'] not in [200, 201, 202, 204, 207]:
             raise F5ModuleError(response['contents'])
+        # the declaration changes the provisioning and the software of the device
+        # while its task runs, the cached metadata must be read again
+        invalidate_metadata(self.client)
         return response['contents']['id']
 
     def query_task(self):
         delay, period = self.want.timeout
         task = self.wait_for_task(self.want.task_id, delay, period)
         if task:
+            invalidate_metadata(self.client)
             if 'message' in task['result'] and task['result']['message'] == 'success':
                 return True
         return False
@@ -373,7 +403,7 @@ class ModuleManager(object):
             raise F5ModuleError("The task with the given task_id: {0} does not exist.".format(task))
 
     def wait_for_task(self, task, delay, period):
-        for x in range(0, period):
+        for x in self.waiter.polls(delay * period):
             code, response = self._check_task_on_device(task)
             if code not in [200, 201, 202]:
                 ready = self.device_is_ready()
@@ -387,21 +417,13 @@ class ModuleManager(object):
             if code in [200, 201, 202]:
                 if response['result']['status'] != 'RUNNING':
                     return response
-            time.sleep(delay)
         raise F5ModuleError(
             "Module timeout reached, state change is unknown, "
             "please increase the timeout parameter for long lived actions."
         )
 
     def device_is_ready(self):
-        uri = "/mgmt/shared/declarative-onboarding/available"
-        try:
-            response = self.client.get(uri)
-            if response['code'] in [200, 201, 202]:
-                return True
-            return False
-        except ConnectionError:
-            return False
+        return self.probe.check()
 
 
 class ArgumentSpec(object):
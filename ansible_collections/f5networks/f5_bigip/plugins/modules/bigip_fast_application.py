@@ -130,8 +130,15 @@ template:
   returned: changed
   type: str
   sample: examples/simple_http
+task_polling:
+  description:
+    - Metrics collected while polling the asynchronous tasks started by the module.
+    - The number of polls sent, the number of busy responses received, the seconds spent waiting
+      between polls and the seconds elapsed while waiting for the tasks to complete.
+  returned: when the module waited for a task
+  type: dict
+  sample: {"polls": 6, "busy_responses": 0, "waited": 15.42, "elapsed": 17.9}
 '''
-import time
 from datetime import datetime
 
 from ansible.module_utils.basic import AnsibleModule
@@ -139,11 +146,12 @@ from ansible.module_utils.connection import Connection
 from ansible.module_utils.six import string_types
 
 from ..module_utils.client import (
-    F5Client, send_teem
+    F5Client, send_teem, perf_report
 )
 from ..module_utils.common import (
     F5ModuleError, AnsibleF5Parameters,
 )
+from ..module_utils.tasks import TaskWaiter
 from ..module_utils.version import CURRENT_COLL_VERSION
 
 try:
@@ -217,6 +225,7 @@ class ModuleManager(object):
         self.module = kwargs.get('module', None)
         self.connection = kwargs.get('connection', None)
         self.client = F5Client(module=self.module, client=self.connection)
+        self.waiter = TaskWaiter()
         self.want = ModuleParameters(params=self.module.params)
         self.changes = UsableChanges()
 
@@ -255,7 +264,9 @@ class ModuleManager(object):
         changes = reportable.to_return()
         result.update(**changes)
         result.update(dict(changed=changed))
+        result.update(self.waiter.to_return())
         self._announce_deprecations(result)
+        result.update(perf_report(self.client))
         send_teem(self.client, start)
         return result
 
@@ -361,6 +372,8 @@ class ModuleManager(object):
 
     def _check_task_on_device(self, path):
         response = self.client.get(path)
+        if self.waiter.busy(response):
+            return None
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
         return response['contents']
@@ -393,14 +406,15 @@ class ModuleManager(object):
                 return True
 
     def wait_for_task(self, path, interval, period):
-        for x in range(0, period):
+        for x in self.waiter.polls(interval * period):
             task = self._check_task_on_device(path)
+            if task is None:
+                continue
             if task['code'] != 200:
                 if task['message'] != 'in progress':
                     raise F5ModuleError(task['message'])
             if task['message'] != 'in progress':
                 return task
-            time.sleep(interval)
         raise F5ModuleError(
             "Module timeout reached, state change is unknown, "
             "please increase the timeout parameter for long lived actions."
@@ -0,0 +1,538 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright: (c) 2026, F5 Networks Inc.
+# GNU General Public License v3.0 (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+DOCUMENTATION = r'''
+---
+module: bigip_fleet_command
+short_description: Run TMSH commands on many F5 devices at the same time
+description:
+  - Sends the same TMSH commands to a list of BIG-IP devices over REST, and returns the results
+    read from each device.
+  - Unlike M(f5networks.f5_bigip.bigip_command), which runs on each host of the play through its
+    persistent connection, this module runs once, on the controller, and connects to all the devices
+    itself from a pool of worker threads. The time spent waiting for the responses of one device is
+    then spent on the requests to the others.
+  - Commands are parsed, and I(wait_for) conditionals evaluated, the same way as by
+    M(f5networks.f5_bigip.bigip_command).
+version_added: "2.1.0"
+options:
+  devices:
+    description:
+      - The devices to run the commands on.
+    type: list
+    elements: dict
+    required: True
+    suboptions:
+      server:
+        description:
+          - The address of the device.
+        type: str
+        required: True
+      server_port:
+        description:
+          - The HTTPS port of the device.
+          - When not set, the value of the I(server_port) option is used.
+        type: int
+      name:
+        description:
+          - The name of the device in the results.
+          - When not set, the value of C(server) is used.
+        type: str
+      user:
+        description:
+          - The user to log in to the device as.
+          - When not set, the value of the I(user) option is used.
+        type: str
+      password:
+        description:
+          - The password of C(user).
+          - When not set, the value of the I(password) option is used.
+        type: str
+      validate_certs:
+        description:
+          - Whether the certificate of the device is validated.
+          - When not set, the value of the I(validate_certs) option is used.
+        type: bool
+  user:
+    description:
+      - The user to log in to the devices as, when the device does not set its own.
+    type: str
+  password:
+    description:
+      - The password of I(user).
+    type: str
+  server_port:
+    description:
+      - The HTTPS port of the devices, when the device does not set its own.
+    type: int
+    default: 443
+  validate_certs:
+    description:
+      - Whether the certificates of the devices are validated, when the device does not set its own.
+    type: bool
+    default: true
+  auth_provider:
+    description:
+      - The login provider the devices authenticate the users with.
+    type: str
+    default: tmos
+  commands:
+    description:
+      - The commands to send to each device. The resulting output from the command
+        is returned. If the I(wait_for) argument is provided, the results of a device are
+        not returned until the condition is satisfied or the number of retries has expired.
+      - Only C(tmsh) commands are supported.
+    required: True
+    type: raw
+  wait_for:
+    description:
+      - Specifies what to evaluate from the output of the commands of each device
+        and what conditionals to apply. See M(f5networks.f5_bigip.bigip_command).
+    type: list
+    elements: str
+    aliases: ['waitfor']
+  match:
+    description:
+      - The match policy of the I(wait_for) conditionals. If the value is set to C(all)
+        then all conditionals must be satisfied. If the value is set to C(any) then only one
+        of the values must be satisfied.
+    type: str
+    choices:
+      - any
+      - all
+    default: all
+  retries:
+    description:
+      - Specifies the number of times the commands are run on a device before the
+        I(wait_for) conditionals are considered failed.
+    type: int
+    default: 10
+  interval:
+    description:
+      - The number of seconds to wait between the runs of the commands of a device.
+    type: int
+    default: 1
+  chdir:
+    description:
+      - Change into this directory before running the commands.
+    type: str
+  batch:
+    description:
+      - When C(true), the commands of each device are sent in a single request, and run by
+        a single shell process. See M(f5networks.f5_bigip.bigip_command).
+    type: bool
+    default: false
+  max_concurrency:
+    description:
+      - The maximum number of devices the commands run on at the same time.
+    type: int
+    default: 20
+  timeout:
+    description:
+      - The number of seconds to wait for each response of a device.
+    type: int
+    default: 30
+notes:
+  - This module connects to the devices itself, run it on the controller, for example with
+    C(delegate_to: localhost) and C(run_once: true).
+  - The module fails when the commands fail on any device, the results of all devices are returned
+    regardless.
+author:
+  - Wojciech Wypior (@wojtek0806)
+'''
+
+EXAMPLES = r'''
+- name: Show the version and sync status of the devices
+  bigip_fleet_command:
+    devices:
+      - server: lb1.mydomain.com
+      - server: lb2.mydomain.com
+      - server: 10.1.1.3
+        name: lb3
+        user: operator
+        password: other-secret
+    user: admin
+    password: secret
+    commands:
+      - show sys version
+      - show cm sync-status
+    batch: yes
+  delegate_to: localhost
+  run_once: true
+
+- name: Wait for the devices to be in sync
+  bigip_fleet_command:
+    devices:
+      - server: lb1.mydomain.com
+      - server: lb2.mydomain.com
+        server_port: 8443
+    user: admin
+    password: secret
+    commands:
+      - show cm sync-status
+    wait_for:
+      - result[0] contains In Sync
+  delegate_to: localhost
+  run_once: true
+'''
+
+RETURN = r'''
+results:
+  description: The results of each device, in the order of C(devices).
+  returned: always
+  type: complex
+  contains:
+    name:
+      description: The name of the device.
+      returned: always
+      type: str
+      sample: lb1.mydomain.com
+    stdout:
+      description: The set of responses from the commands.
+      returned: success
+      type: list
+      sample: ['...', '...']
+    stdout_lines:
+      description: The value of stdout split into a list.
+      returned: success
+      type: list
+      sample: [['...', '...'], ['...'], ['...']]
+    changed:
+      description: Whether the commands changed the configuration of the device.
+      returned: always
+      type: bool
+      sample: false
+    failed:
+      description: Whether the commands failed on the device.
+      returned: always
+      type: bool
+      sample: false
+    msg:
+      description: The reason the commands failed on the device.
+      returned: failed
+      type: str
+      sample: Authentication process failed
+    failed_conditions:
+      description: The list of conditionals that have failed.
+      returned: failed
+      type: list
+      sample: ['...', '...']
+failed_devices:
+  description: The names of the devices the commands failed on.
+  returned: always
+  type: list
+  sample: ['lb2.mydomain.com']
+'''
+
+import json
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils._text import to_text
+from ansible.module_utils.six import string_types
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible.module_utils.urls import open_url
+
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.parsing import (
+    FailedConditionsError, Conditional
+)
+
+from ..module_utils.commands import (
+    CommandParameters, normalize_commands, determine_change, batch_command, split_batch_output,
+    wait_for_conditionals
+)
+from ..module_utils.common import F5ModuleError
+from ..module_utils.constants import BASE_HEADERS, LOGIN, LOGOUT
+from ..module_utils.jsoncodec import loads as json_loads
+
+
+class DeviceClient(object):
+    """A REST client of a single device, authenticated with a token
+
+    Arguments:
+        server (string): The address of the device.
+        server_port (int): The HTTPS port of the device.
+        user (string): The user to log in as.
+        password (string): The password of the user.
+        validate_certs (bool): Whether the certificate of the device is validated.
+        provider (string): The login provider of the user.
+        timeout (int): The number of seconds to wait for each response.
+    """
+
+    def __init__(self, server, server_port, user, password, validate_certs=True, provider='tmos', timeout=30):
+        if ':' in server and not server.startswith('['):
+            server = '[{0}]'.format(server)
+        self.url = 'https://{0}:{1}'.format(server, server_port)
+        self.user = user
+        self.password = password
+        self.validate_certs = validate_certs
+        self.provider = provider
+        self.timeout = timeout
+        self.token = None
+
+    def send_request(self, path, method='GET', payload=None):
+        headers = dict(BASE_HEADERS)
+        if self.token:
+            headers['X-F5-Auth-Token'] = self.token
+        data = json.dumps(payload) if payload is not None else None
+        try:
+            response = open_url(
+                self.url + path, method=method, data=data, headers=headers,
+                validate_certs=self.validate_certs, timeout=self.timeout
+            )
+            code = response.getcode()
+            body = response.read()
+        except HTTPError as ex:
+            code = ex.code
+            body = ex.read()
+        try:
+            contents = json_loads(body) if body else dict()
+        except ValueError:
+            contents = to_text(body)
+        return dict(code=code, contents=contents)
+
+    def post(self, path, data=None):
+        return self.send_request(path, method='POST', payload=data)
+
+    def login(self):
+        if not self.user or not self.password:
+            raise F5ModuleError('Username and password are required for login.')
+        payload = dict(username=self.user, password=self.password, loginProviderName=self.provider)
+        response = self.post(LOGIN, data=payload)
+        contents = response['contents']
+        if response['code'] != 200 or not isinstance(contents, dict) or 'token' not in contents:
+            raise F5ModuleError('Authentication process failed, server returned: {0}'.format(contents))
+        self.token = contents['token'].get('token')
+        if not self.token:
+            raise F5ModuleError('Server returned invalid response during connection authentication.')
+
+    def logout(self):
+        if not self.token:
+            return
+        try:
+            self.send_request('{0}{1}'.format(LOGOUT, self.token), method='DELETE')
+        except Exception:
+            # the token expires on its own
+            pass
+        self.token = None
+
+
+class DeviceManager(object):
+    """Runs the commands on a single device
+
+    Arguments:
+        device (dict): The device, with the defaults of the module applied.
+        want (CommandParameters): The commands and the way they are run.
+        module (AnsibleModule): The module.
+    """
+
+    def __init__(self, device, want, module):
+        self.device = device
+        self.want = want
+        self.module = module
+        self.client = DeviceClient(
+            device['server'], device['server_port'], device['user'], device['password'],
+            validate_certs=device['validate_certs'], provider=module.params['auth_provider'],
+            timeout=module.params['timeout']
+        )
+
+    def execute_on_device(self, commands):
+        if self.want.batch:
+            return self.execute_batch_on_device(commands)
+        responses = []
+        for command in commands:
+            args = dict(
+                command='run',
+                utilCmdArgs='-c "{0}"'.format(command)
+            )
+            response = self.client.post("/mgmt/tm/util/bash", data=args)
+            if response['code'] not in [200, 201]:
+                raise F5ModuleError(response['contents'])
+            if 'commandResult' in response['contents']:
+                output = u'{0}'.format(response['contents']['commandResult'])
+                responses.append(output.strip())
+        return responses
+
+    def execute_batch_on_device(self, commands):
+        delimiter = '__F5_COMMAND_{0}__'.format(uuid.uuid4().hex)
+        args = dict(
+            command='run',
+            utilCmdArgs='-c "{0}"'.format(batch_command(commands, delimiter))
+        )
+        response = self.client.post("/mgmt/tm/util/bash", data=args)
+        if response['code'] not in [200, 201]:
+            raise F5ModuleError(response['contents'])
+        output = u'{0}'.format(response['contents'].get('commandResult', ''))
+        return split_batch_output(output, delimiter, len(commands))
+
+    def exec_module(self):
+        result = dict(name=self.device['name'], changed=False, failed=False)
+        conditionals = [Conditional(c) for c in self.want.wait_for]
+        try:
+            self.client.login()
+            responses = wait_for_conditionals(
+                self.execute_on_device, self.want.rest_commands, conditionals, match=self.want.match,
+                retries=self.want.retries, interval=self.want.interval, rerun=bool(self.want.batch)
+            )
+        except FailedConditionsError as ex:
+            result.update(failed=True, msg=str(ex), failed_conditions=ex.failed_conditions)
+            return result
+        except Exception as ex:
+            result.update(failed=True, msg=str(ex))
+            return result
+        finally:
+            self.client.logout()
+        result.update(
+            stdout=responses,
+            stdout_lines=[x.split('\n') if isinstance(x, string_types) else x for x in responses],
+            changed=determine_change(self.want.normalized_commands, responses)
+        )
+        return result
+
+
+class ModuleManager(object):
+    def __init__(self, *args, **kwargs):
+        self.module = kwargs.get('module', None)
+        self.want = CommandParameters(params=self.module.params)
+        self.want.update({'normalized_commands': normalize_commands(self.want.raw_commands)})
+
+    def devices(self):
+        params = self.module.params
+        result = []
+        for device in params['devices']:
+            device = dict(device)
+            for key in ['server_port', 'user', 'password', 'validate_certs']:
+                if device.get(key) is None:
+                    device[key] = params[key]
+            if not device.get('name'):
+                device['name'] = device['server']
+            result.append(device)
+        return result
+
+    def exec_module(self):
+        if not self.want.normalized_commands:
+            raise F5ModuleError("At least one command must be specified.")
+        if self.module.params['max_concurrency'] < 1:
+            raise F5ModuleError(
+                "The 'max_concurrency' value must be greater than or equal to 1."
+            )
+        devices = self.devices()
+        if self.module.check_mode or not devices:
+            return dict(changed=False, results=[], failed_devices=[])
+
+        managers = [DeviceManager(device, self.want, self.module) for device in devices]
+        workers = min(self.module.params['max_concurrency'], len(managers))
+        # results are returned in the order of the devices, regardless of the order they complete in
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(lambda m: m.exec_module(), managers))
+
+        return dict(
+            changed=any(x['changed'] for x in results),
+            results=results,
+            failed_devices=[x['name'] for x in results if x['failed']]
+        )
+
+
+class ArgumentSpec(object):
+    def __init__(self):
+        self.supports_check_mode = True
+        argument_spec = dict(
+            devices=dict(
+                type='list',
+                elements='dict',
+                required=True,
+                options=dict(
+                    server=dict(required=True),
+                    server_port=dict(type='int'),
+                    name=dict(),
+                    user=dict(),
+                    password=dict(no_log=True),
+                    validate_certs=dict(type='bool'),
+                )
+            ),
+            user=dict(),
+            password=dict(no_log=True),
+            server_port=dict(
+                type='int',
+                default=443
+            ),
+            validate_certs=dict(
+                type='bool',
+                default='yes'
+            ),
+            auth_provider=dict(
+                default='tmos'
+            ),
+            commands=dict(
+                type='raw',
+                required=True
+            ),
+            wait_for=dict(
+                type='list',
+                elements='str',
+                aliases=['waitfor']
+            ),
+            match=dict(
+                default='all',
+                choices=['any', 'all']
+            ),
+            retries=dict(
+                default=10,
+                type='int'
+            ),
+            interval=dict(
+                default=1,
+                type='int'
+            ),
+            chdir=dict(),
+            batch=dict(
+                type='bool',
+                default='no'
+            ),
+            max_concurrency=dict(
+                type='int',
+                default=20
+            ),
+            timeout=dict(
+                type='int',
+                default=30
+            ),
+        )
+
+        self.argument_spec = {}
+        self.argument_spec.update(argument_spec)
+
+
+def main():
+    spec = ArgumentSpec()
+
+    module = AnsibleModule(
+        argument_spec=spec.argument_spec,
+        supports_check_mode=spec.supports_check_mode
+    )
+
+    try:
+        mm = ModuleManager(module=module)
+        results = mm.exec_module()
+        if results['failed_devices']:
+            module.fail_json(
+                msg='The commands failed on {0} of the {1} devices.'.format(
+                    len(results['failed_devices']), len(results['results'])
+                ),
+                **results
+            )
+        module.exit_json(**results)
+    except F5ModuleError as ex:
+        module.fail_json(msg=str(ex))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
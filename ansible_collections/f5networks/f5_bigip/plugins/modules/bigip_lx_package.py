@@ -109,7 +109,7 @@ from ansible.module_utils.urls import urlparse
 from ansible.module_utils.connection import Connection
 
 from ..module_utils.client import (
-    F5Client, send_teem
+    F5Client, send_teem, perf_report, invalidate_metadata
 )
 from ..module_utils.common import (
     F5ModuleError, AnsibleF5Parameters, flatten_boolean
@@ -231,6 +231,7 @@ class ModuleManager(object):
         changes = self.changes.to_return()
         result.update(**changes)
         result.update(dict(changed=changed))
+        result.update(perf_report(self.client))
         send_teem(self.client, start)
         return result
 
@@ -250,6 +251,7 @@ class ModuleManager(object):
         if self.module.check_mode:  # pragma: no cover
             return True
         self.remove_from_device()
+        invalidate_metadata(self.client, 'packages_installed', 'sslo_version')
         if self.exists():
             raise F5ModuleError("Failed to delete the LX package.")
         return True
@@ -269,6 +271,7 @@ class ModuleManager(object):
         if not self.check_file_exists_on_device():
             self.upload_to_device()
         self.create_on_device()
+        invalidate_metadata(self.client, 'packages_installed', 'sslo_version')
         self.enable_iapplx_on_device()
         if self.want.retain_package_file == 'no':
             self.remove_package_file_from_device()
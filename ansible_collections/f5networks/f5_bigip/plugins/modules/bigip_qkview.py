@@ -145,7 +145,7 @@ except ImportError:
 
 
 from ..module_utils.client import (
-    F5Client, tmos_version, send_teem
+    F5Client, tmos_version, send_teem, perf_report
 )
 from ..module_utils.common import (
     F5ModuleError, AnsibleF5Parameters, transform_name, fq_name
@@ -303,6 +303,7 @@ class BaseManager(object):
 
         result.update(**self.changes.to_return())
         result.update(dict(changed=False))
+        result.update(perf_report(self.client))
         send_teem(self.client, start)
         return result
 
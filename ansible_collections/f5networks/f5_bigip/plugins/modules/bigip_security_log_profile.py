@@ -1876,7 +1876,7 @@ from ansible.module_utils.basic import (
 from ansible.module_utils.connection import Connection
 
 from ..module_utils.client import (
-    F5Client, send_teem
+    F5Client, BatchRequest, send_teem, perf_report
 )
 from ..module_utils.common import (
     F5ModuleError, AnsibleF5Parameters, fq_name, flatten_boolean, transform_name
@@ -4494,6 +4494,7 @@ class ModuleManager(object):
         result.update(**changes)
         result.update(dict(changed=changed))
         self._announce_deprecations(result)
+        result.update(perf_report(self.client))
         send_teem(self.client, start)
         return result
 
@@ -4610,58 +4611,43 @@ class ModuleManager(object):
         sip_sec = params.pop('sip_security', None)
         net_sec = params.pop('network_security', None)
 
+        # the profile and its sub-resources are created in a single transaction
+        batch = BatchRequest(self.client)
         uri = "/mgmt/tm/security/log/profile/"
-        response = self.client.post(uri, data=params)
-
-        if response['code'] not in [200, 201, 202]:
-            raise F5ModuleError(response['contents'])
+        batch.post(uri, data=params)
 
         if dns_sec:
-            self._create_dns_security(dns_sec)
+            self._create_dns_security(batch, dns_sec)
 
         if sip_sec:
-            self._create_sip_security(sip_sec)
+            self._create_sip_security(batch, sip_sec)
 
         if net_sec:
-            self._create_net_security(net_sec)
+            self._create_net_security(batch, net_sec)
 
+        batch.commit()
         return True
 
-    def _create_dns_security(self, params):
+    def _create_dns_security(self, batch, params):
         params['name'] = self.want.name
         params['partition'] = self.want.partition
 
         uri = f"/mgmt/tm/security/log/profile/{transform_name(self.want.partition, self.want.name)}/protocol-dns/"
-        response = self.client.post(uri, data=params)
-
-        if response['code'] not in [200, 201, 202]:
-            raise F5ModuleError(response['contents'])
-
-        return True
+        batch.post(uri, data=params)
 
-    def _create_sip_security(self, params):
+    def _create_sip_security(self, batch, params):
         params['name'] = self.want.name
         params['partition'] = self.want.partition
 
         uri = f"/mgmt/tm/security/log/profile/{transform_name(self.want.partition, self.want.name)}/protocol-sip/"
-        response = self.client.post(uri, data=params)
+        batch.post(uri, data=params)
 
-        if response['code'] not in [200, 201, 202]:
-            raise F5ModuleError(response['contents'])
-
-        return True
-
-    def _create_net_security(self, params):
+    def _create_net_security(self, batch, params):
         params['name'] = self.want.name
         params['partition'] = self.want.partition
 
         uri = f"/mgmt/tm/security/log/profile/{transform_name(self.want.partition, self.want.name)}/network/"
-        response = self.client.post(uri, data=params)
-
-        if response['code'] not in [200, 201, 202]:
-            raise F5ModuleError(response['contents'])
-
-        return True
+        batch.post(uri, data=params)
 
     def update_on_device(self):
         params = self._add_missing_options(self.changes.api_params())
@@ -4669,62 +4655,44 @@ class ModuleManager(object):
         sip_sec = params.pop('sip_security', None)
         net_sec = params.pop('network_security', None)
 
+        # the profile and its sub-resources are updated in a single transaction
+        batch = BatchRequest(self.client)
         if params:
             uri = f"/mgmt/tm/security/log/profile/{transform_name(self.want.partition, self.want.name)}"
-            response = self.client.patch(uri, data=params)
-
-            if response['code'] not in [200, 201, 202]:
-                raise F5ModuleError(response['contents'])
+            batch.patch(uri, data=params)
 
         if dns_sec and self.have.dns_sec_exists:
-            self._update_dns_security(dns_sec)
+            self._update_dns_security(batch, dns_sec)
         elif dns_sec and not self.have.dns_sec_exists:
-            self._create_dns_security(dns_sec)
+            self._create_dns_security(batch, dns_sec)
 
         if sip_sec and self.have.sip_sec_exists:
-            self._update_sip_security(sip_sec)
+            self._update_sip_security(batch, sip_sec)
         elif sip_sec and not self.have.sip_sec_exists:
-            self._create_sip_security(sip_sec)
+            self._create_sip_security(batch, sip_sec)
 
         if net_sec and self.have.net_sec_exists:
-            self._update_net_security(net_sec)
+            self._update_net_security(batch, net_sec)
         elif net_sec and not self.have.net_sec_exists:
-            self._create_net_security(net_sec)
+            self._create_net_security(batch, net_sec)
 
+        batch.commit()
         return True
 
-    def _update_dns_security(self, params):
+    def _update_dns_security(self, batch, params):
         uri = f"/mgmt/tm/security/log/profile/{transform_name(self.want.partition, self.want.name)}/protocol-dns/" \
               f"{transform_name(self.want.partition, self.want.name)}"
+        batch.patch(uri, data=params)
 
-        response = self.client.patch(uri, data=params)
-
-        if response['code'] not in [200, 201, 202]:
-            raise F5ModuleError(response['contents'])
-
-        return True
-
-    def _update_sip_security(self, params):
+    def _update_sip_security(self, batch, params):
         uri = f"/mgmt/tm/security/log/profile/{transform_name(self.want.partition, self.want.name)}/protocol-sip/" \
               f"{transform_name(self.want.partition, self.want.name)}"
+        batch.patch(uri, data=params)
 
-        response = self.client.patch(uri, data=params)
-
-        if response['code'] not in [200, 201, 202]:
-            raise F5ModuleError(response['contents'])
-
-        return True
-
-    def _update_net_security(self, params):
+    def _update_net_security(self, batch, params):
         uri = f"/mgmt/tm/security/log/profile/{transform_name(self.want.partition, self.want.name)}/network/" \
               f"{transform_name(self.want.partition, self.want.name)}"
-
-        response = self.client.patch(uri, data=params)
-
-        if response['code'] not in [200, 201, 202]:
-            raise F5ModuleError(response['contents'])
-
-        return True
+        batch.patch(uri, data=params)
 
     def remove_from_device(self):
         uri = f"/mgmt/tm/security/log/profile/{transform_name(self.want.partition, self.want.name)}"
@@ -29,7 +29,22 @@ options:
   volume:
     description:
       - The volume on which to install the software image.
+      - Mutually exclusive with C(volumes).
     type: str
+  volumes:
+    description:
+      - The volumes on which to install the software image at the same time.
+      - Volumes which do not exist are created. Volumes already installed with the image, or
+        still installing it, are not installed again, so running the module again with the same
+        volumes resumes tracking installations which did not complete before the C(timeout).
+      - The installations on all volumes are tracked together until they complete or fail, and their
+        progress is returned in C(progress). The module fails when installations are still running
+        once the C(timeout) is reached.
+      - Only the C(installed) state is supported, as a single volume can be booted from.
+      - Mutually exclusive with C(volume) and C(volume_uri).
+    type: list
+    elements: str
+    version_added: "2.1.0"
   state:
     description:
       - When C(installed), ensures the software is installed on the volume
@@ -62,6 +77,7 @@ options:
       - The accepted value range is between C(150) and C(3600) seconds.
       - If the device needs to restart the module will return with no change and an appropriate message. In such case,
         it is up to the user to pause task execution until device is ready, see C(EXAMPLES) section.
+      - When C(volumes) is used, the time to wait for the installations on all volumes to finish.
     type: int
     default: 300
 notes:
@@ -108,6 +124,16 @@ EXAMPLES = r'''
       when:
         - result.message == "Device is restarting services, unable to check software installation status."
 
+    - name: Install an image on the standby volumes of both units of an HA pair
+      bigip_software_install:
+        image: BIGIP-17.1.0-0.0.16.iso
+        volumes:
+          - HD1.2
+          - HD1.3
+        state: installed
+        timeout: 1800
+      register: result
+
     - name: Ensure an existing image is activated in specified volume - Idempotent check
       bigip_software_install:
         image: BIGIP-13.0.0.0.0.1645.iso
@@ -132,8 +158,39 @@ message:
   returned: changed
   type: dict
   sample: hash/dictionary of values
+readiness:
+  description:
+    - The state of the device the last time its readiness was probed, after its services restarted.
+    - Whether the device was ready, the stage it was waiting on, out of C(connect), C(restjavad)
+      and C(mcpd), the number of probes sent and the seconds spent waiting between them.
+  returned: when the module checked the device
+  type: dict
+  sample: {"ready": false, "stage": "restjavad", "probes": 2, "waited": 0.0}
+progress:
+  description:
+    - The progress of the installation on each of the C(volumes).
+    - The status reported by the device, the percentage of the installation done, the version and
+      build installed on the volume, and whether the installation was started by this task.
+  returned: when volumes are given
+  type: list
+  sample: [{"name": "HD1.2", "status": "installing 27.000 pct", "percent": 27, "version": "17.1.0",
+            "build": "0.0.16", "started": true}]
+failed_volumes:
+  description: The names of the volumes the installation failed on.
+  returned: when volumes are given
+  type: list
+  sample: ['HD1.3']
+task_polling:
+  description:
+    - Metrics collected while polling the installations on the C(volumes).
+    - The number of polls sent, the number of busy responses received, the seconds spent waiting
+      between polls and the seconds elapsed while waiting for the installations to complete.
+  returned: when the module waited for installations
+  type: dict
+  sample: {"polls": 12, "busy_responses": 0, "waited": 304.8, "elapsed": 311.2}
 '''
 
+import re
 import time
 from datetime import datetime
 
@@ -144,11 +201,18 @@ from ansible.module_utils.connection import (
 )
 
 from ..module_utils.client import (
-    F5Client, send_teem
+    F5Client, send_teem, perf_report, invalidate_metadata
 )
 from ..module_utils.common import (
     F5ModuleError, AnsibleF5Parameters, transform_name
 )
+from ..module_utils.readiness import ReadinessProbe
+from ..module_utils.tasks import TaskWaiter
+
+VOLUME_URI = "/mgmt/tm/sys/software/volume/"
+
+# the volume statuses an installation ends with, every other status is reported while installing
+DONE_STATUSES = ['complete', 'failed']
 
 
 class Parameters(AnsibleF5Parameters):
@@ -351,7 +415,9 @@ class ModuleParameters(Parameters):
 class Changes(Parameters):
     returnables = [
         'message',
-        'volume_uri'
+        'volume_uri',
+        'progress',
+        'failed_volumes',
     ]
 
     def to_return(self):
@@ -400,10 +466,13 @@ class ModuleManager(object):
         self.module = kwargs.get('module', None)
         self.connection = kwargs.get('connection', None)
         self.client = F5Client(module=self.module, client=self.connection)
+        self.probe = ReadinessProbe(self.client)
         self.want = ModuleParameters(client=self.client, params=self.module.params)
         self.have = ApiParameters(client=self.client)
         self.changes = UsableChanges()
+        self.waiter = TaskWaiter()
         self.volume_url = None
+        self.volumes = None
 
     def _set_changed_options(self):
         changed = {}
@@ -443,6 +512,8 @@ class ModuleManager(object):
 
         if self.want.volume_uri:
             changed = self.check_progress()
+        elif self.want.volumes:
+            changed = self.present_many()
         else:
             changed = self.present()
 
@@ -451,6 +522,9 @@ class ModuleManager(object):
         result.update(**changes)
         result.update(dict(changed=changed))
         self._announce_deprecations(result)
+        result.update(self.waiter.to_return())
+        result.update(self.probe.to_return())
+        result.update(perf_report(self.client))
         send_teem(self.client, start)
         return result
 
@@ -479,39 +553,42 @@ class ModuleManager(object):
     def _set_volume_url(self, item):
         self.volume_url = urlparse(item['selfLink']).path
 
-    def volume_exists(self):
-        uri = "/mgmt/tm/sys/software/volume/"
-        response = self.client.get(uri)
+    def read_volumes_from_device(self):
+        # the volumes are read once, before any installation is started
+        if self.volumes is not None:
+            return self.volumes
+        response = self.client.get(VOLUME_URI)
 
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
 
-        for item in response['contents']['items']:
+        self.volumes = response['contents'].get('items', [])
+        return self.volumes
+
+    def read_volume_from_device(self):
+        for item in self.read_volumes_from_device():
             if item['name'].startswith(self.want.volume):
                 self._set_volume_url(item)
-                break
-
-        if not self.volume_url:
-            self.volume_url = uri + self.want.volume
-
-        response = self.client.get(self.volume_url)
+                return item
+        self.volume_url = VOLUME_URI + self.want.volume
+        return None
 
-        if response['code'] == 404:
+    def volume_exists(self):
+        volume = self.read_volume_from_device()
+        if volume is None:
             return False
-        if response['code'] not in [200, 201, 202]:
-            raise F5ModuleError(response['contents'])
 
         # version key can be missing in the event that an existing volume has
         # no installed software in it.
-        if self.want.version != response['contents'].get('version', None):
+        if self.want.version != volume.get('version', None):
             return False
-        if self.want.build != response['contents'].get('build', None):
+        if self.want.build != volume.get('build', None):
             return False
 
         if self.want.state == 'installed':
             return True
         if self.want.state == 'activated':
-            if 'defaultBootLocation' in response['contents']['media'][0]:
+            if 'defaultBootLocation' in volume['media'][0]:
                 return True
         return False
 
@@ -523,19 +600,24 @@ class ModuleManager(object):
             return 400, None
 
     def device_is_ready(self):
-        uri = "/mgmt/tm/sys/available"
-        try:
-            response = self.client.get(uri)
-            if response['code'] in [200, 201, 202]:
-                return True
-            return False
-        except ConnectionError:
-            return False
+        return self.probe.check()
 
     def update(self):
         if self.module.check_mode:
             return True
 
+        self.check_image_on_device()
+        options = list()
+        if not self.volume_exists():
+            options.append({'create-volume': True})
+        if self.want.state == 'activated':
+            options.append({'reboot': True})
+        self.want.update({'options': options})
+        self.update_on_device()
+        invalidate_metadata(self.client)
+        return True
+
+    def check_image_on_device(self):
         if self.want.type == "standard":
             if self.want.image and self.want.image not in self.have.image_names:
                 raise F5ModuleError(
@@ -549,16 +631,21 @@ class ModuleManager(object):
                     "The specified block_device_image was not found on the device."
                 )
 
-        options = list()
-        if not self.volume_exists():
-            options.append({'create-volume': True})
-        if self.want.state == 'activated':
-            options.append({'reboot': True})
-        self.want.update({'options': options})
-        self.update_on_device()
+    def update_on_device(self):
+        if self.want.type == "standard":
+            self.changes.update({'message': 'Started software image installation {0} on volume {1}.'.format(
+                self.want.image, self.want.volume)})
+        elif self.want.type == "vcmp":
+            self.changes.update({'message': 'Started block software image installation {0} on volume {1}.'.format(
+                self.want.block_device_image, self.want.volume)})
+
+        response = self.install_on_device()
+        vol_uri = urlparse(self.volume_url).path
+        self.changes.update({'volume_uri': '{0}'.format(vol_uri)})
+        self._check_install_response(response)
         return True
 
-    def update_on_device(self):
+    def install_on_device(self):
         uri = None
         params = None
         if self.want.type == "standard":
@@ -568,8 +655,6 @@ class ModuleManager(object):
             }
             params.update(self.want.api_params())
             uri = "/mgmt/tm/sys/software/{0}".format(self.want.image_type)
-            self.changes.update({'message': 'Started software image installation {0} on volume {1}.'.format(
-                self.want.image, self.want.volume)})
         elif self.want.type == "vcmp":
             params = {
                 "command": "install",
@@ -577,18 +662,116 @@ class ModuleManager(object):
             }
             params.update(self.want.api_params())
             uri = "/mgmt/tm/sys/software/{0}".format(transform_name(name=self.want.block_device_image_type))
-            self.changes.update({'message': 'Started block software image installation {0} on volume {1}.'.format(
-                self.want.block_device_image, self.want.volume)})
+        return self.client.post(uri, data=params)
 
-        response = self.client.post(uri, data=params)
-        vol_uri = urlparse(self.volume_url).path
-        self.changes.update({'volume_uri': '{0}'.format(vol_uri)})
+    def _check_install_response(self, response):
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
 
         if 'commandResult' in response['contents'] and len(response['contents']['commandResult'].strip()) > 0:
             raise F5ModuleError(response['contents']['commandResult'])
-        return True
+
+    def present_many(self):
+        if self.want.state == 'activated':
+            raise F5ModuleError(
+                "Only one volume can be activated, set 'state' to 'installed' to install on several volumes."
+            )
+        self.check_image_on_device()
+        volumes = dict((x['name'], x) for x in self.read_volumes_from_device())
+
+        progress = dict()
+        baselines = dict()
+        for name in self.want.volumes:
+            volume = volumes.get(name)
+            if self._installing_image(volume):
+                progress[name] = install_progress(volume)
+                continue
+            progress[name] = install_progress(None, name, started=True)
+            if self.module.check_mode:
+                continue
+            options = list()
+            if volume is None:
+                options.append({'create-volume': True})
+            else:
+                baselines[name] = volume.get('generation')
+            self.want.update({'volume': name, 'options': options})
+            self._check_install_response(self.install_on_device())
+
+        changed = any(x['started'] for x in progress.values())
+        if changed and not self.module.check_mode:
+            invalidate_metadata(self.client)
+        if not self.module.check_mode:
+            self.wait_for_installs_on_device(progress, baselines)
+
+        progress = [progress[name] for name in self.want.volumes]
+        failed = [x['name'] for x in progress if x['status'] == 'failed']
+        installing = [x['name'] for x in progress if x['status'] not in DONE_STATUSES]
+        if failed:
+            message = 'Software installation failed on volumes: {0}.'.format(', '.join(failed))
+        elif installing:
+            message = 'Software installation in progress on volumes: {0}.'.format(', '.join(installing))
+        else:
+            message = 'Software installation on volumes: {0} complete.'.format(', '.join(self.want.volumes))
+        self.changes.update(dict(message=message, progress=progress, failed_volumes=failed))
+        return changed
+
+    def _installing_image(self, volume):
+        # installations still running, or done, with the requested software are not started again
+        if volume is None or volume.get('status') == 'failed':
+            return False
+        return self.want.version == volume.get('version') and self.want.build == volume.get('build')
+
+    def _install_done(self, volume, baseline):
+        # a volume keeps the status of its previous installation until the new one begins, so
+        # a done status counts only once the volume changed since this task started installing,
+        # or at once for a volume created by this task, and a completion needs the requested software
+        if baseline is not None and volume.get('generation') == baseline:
+            return False
+        if volume.get('status') == 'failed':
+            return True
+        return self.want.version == volume.get('version') and self.want.build == volume.get('build')
+
+    def wait_for_installs_on_device(self, progress, baselines):
+        """Tracks the installations on all volumes with a single request per poll
+
+        The progress of the volumes is updated in place. Polls which fail, while the device is
+        busy installing, are skipped.
+
+        Raises:
+            F5ModuleError: Raised when installations are still running once the timeout is reached.
+
+        Arguments:
+            progress (dict): The progress of each volume, by name.
+            baselines (dict): The generation of the volumes which existed before this task
+                started installing on them, by name.
+        """
+        delay, period = self.want.timeout
+        for x in self.waiter.polls(delay * period):
+            if self._installs_done(progress):
+                return
+            try:
+                response = self.client.get(VOLUME_URI)
+            except ConnectionError:
+                continue
+            if response['code'] not in [200, 201, 202]:
+                continue
+            for volume in response['contents'].get('items', []):
+                name = volume['name']
+                if name not in progress:
+                    continue
+                current = install_progress(volume, started=progress[name]['started'])
+                done = current['status'] in DONE_STATUSES
+                if done and current['started'] and not self._install_done(volume, baselines.get(name)):
+                    current.update(status='waiting', percent=0)
+                progress[name] = current
+        if not self._installs_done(progress):
+            raise F5ModuleError(
+                "Module timeout reached, state change is unknown, "
+                "please increase the timeout parameter for long lived actions."
+            )
+
+    def _installs_done(self, progress):
+        return all(v['status'] in DONE_STATUSES for v in progress.values())
 
     def wait_for_software_install_on_device(self):
         delay, period = self.want.timeout
@@ -653,6 +836,28 @@ class ModuleManager(object):
         )
 
 
+def install_progress(volume, name=None, started=False):
+    """Returns the progress of an installation from the state of its volume
+
+    Arguments:
+        volume (dict): The volume, as returned by the device, or None if it does not exist yet.
+        name (str): The name of the volume, when it does not exist yet.
+        started (bool): Whether the installation was started by this task.
+    """
+    if volume is None:
+        return dict(name=name, status='waiting', percent=0, version=None, build=None, started=started)
+    status = volume.get('status', 'waiting')
+    if status == 'complete':
+        percent = 100
+    else:
+        match = re.search(r'(\d+)(\.\d+)?\s+pct', status)
+        percent = int(match.group(1)) if match else 0
+    return dict(
+        name=volume['name'], status=status, percent=percent, version=volume.get('version'),
+        build=volume.get('build'), started=started
+    )
+
+
 class ArgumentSpec(object):
     def __init__(self):
         self.supports_check_mode = True
@@ -660,6 +865,10 @@ class ArgumentSpec(object):
             image=dict(),
             block_device_image=dict(),
             volume=dict(),
+            volumes=dict(
+                type='list',
+                elements='str'
+            ),
             state=dict(
                 default='activated',
                 choices=['activated', 'installed']
@@ -677,6 +886,10 @@ class ArgumentSpec(object):
 
         self.argument_spec = {}
         self.argument_spec.update(argument_spec)
+        self.mutually_exclusive = [
+            ['volume', 'volumes'],
+            ['volume_uri', 'volumes'],
+        ]
 
 
 def main():
@@ -685,11 +898,14 @@ def main():
     module = AnsibleModule(
         argument_spec=spec.argument_spec,
         supports_check_mode=spec.supports_check_mode,
+        mutually_exclusive=spec.mutually_exclusive,
     )
 
     try:
         mm = ModuleManager(module=module, connection=Connection(module._socket_path))
         results = mm.exec_module()
+        if results.get('failed_volumes'):
+            module.fail_json(msg=results['message'], **results)
         module.exit_json(**results)
     except F5ModuleError as ex:
         module.fail_json(msg=str(ex))
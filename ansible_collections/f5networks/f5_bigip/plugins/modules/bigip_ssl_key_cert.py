@@ -108,7 +108,7 @@ from ansible.module_utils.basic import (
 from ansible.module_utils.connection import Connection
 
 from ..module_utils.client import (
-    F5Client, send_teem, TransactionContextManager
+    F5Client, send_teem, perf_report, TransactionContextManager
 )
 from ..module_utils.common import (
     F5ModuleError, AnsibleF5Parameters, transform_name,
@@ -404,6 +404,7 @@ class ModuleManager(object):
         result.update(**changes)
         result.update(dict(changed=changed))
         self._announce_deprecations(result)
+        result.update(perf_report(self.client))
         send_teem(self.client, start)
         return result
 
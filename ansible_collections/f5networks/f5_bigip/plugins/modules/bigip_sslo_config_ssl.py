@@ -391,9 +391,16 @@ bypass_client_cert_failure:
   returned: changed
   type: bool
   sample: true
+task_polling:
+  description:
+    - Metrics collected while polling the asynchronous tasks started by the module.
+    - The number of polls sent, the number of busy responses received, the seconds spent waiting
+      between polls and the seconds elapsed while waiting for the tasks to complete.
+  returned: when the module waited for a task
+  type: dict
+  sample: {"polls": 6, "busy_responses": 0, "waited": 15.42, "elapsed": 17.9}
 '''
 
-import time
 import traceback
 
 try:
@@ -412,12 +419,13 @@ from ansible.module_utils.basic import (
 from ansible.module_utils.connection import Connection
 
 from ..module_utils.client import (
-    F5Client, sslo_version
+    F5Client, sslo_version, perf_report
 )
 from ..module_utils.common import (
     F5ModuleError, AnsibleF5Parameters, process_json,
     flatten_boolean
 )
+from ..module_utils.tasks import TaskWaiter
 from ..module_utils.constants import (
     min_sslo_version, max_sslo_version, json_enable_tls13
 )
@@ -999,6 +1007,7 @@ class ModuleManager(object):
         self.module = kwargs.get('module', None)
         self.connection = kwargs.get('connection', None)
         self.client = F5Client(module=self.module, client=self.connection)
+        self.waiter = TaskWaiter()
         self.want = ModuleParameters(params=self.module.params)
         self.changes = UsableChanges()
         self.have = ApiParameters()
@@ -1059,6 +1068,8 @@ class ModuleManager(object):
         changes = reportable.to_return()
         result.update(**changes)
         result.update(dict(changed=changed))
+        result.update(self.waiter.to_return())
+        result.update(perf_report(self.client))
         if self.json_dump:
             result.update(dict(json=self.json_dump))
         self._announce_deprecations(result)
@@ -1352,14 +1363,15 @@ class ModuleManager(object):
     def wait_for_task(self, task_id):
         error = None
         delay, period = self.want.timeout
-        for x in range(0, period):
+        for x in self.waiter.polls(delay * period):
             task = self._check_task_on_device(task_id)
+            if task is None:
+                continue
             if task['state'] == 'BOUND':
                 return True
             if task['state'] == 'ERROR':
                 error = str(task['error'])
                 break
-            time.sleep(delay)
         if error:
             self.delete_failed_operation_on_device(task_id)
             raise F5ModuleError(f"{self.operation} operation error: {task_id} : {error}")
@@ -1372,6 +1384,8 @@ class ModuleManager(object):
         uri = "/mgmt/shared/iapp/blocks/"
         query = f"?$filter=id+eq+'{task_id}'"
         response = self.client.get(uri + query)
+        if self.waiter.busy(response):
+            return None
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
         return response['contents']['items'][0]
@@ -80,11 +80,17 @@ EXAMPLES = r'''
 '''
 
 RETURN = r'''
-# only common fields returned
+task_polling:
+  description:
+    - Metrics collected while polling the asynchronous tasks started by the module.
+    - The number of polls sent, the number of busy responses received, the seconds spent waiting
+      between polls and the seconds elapsed while waiting for the tasks to complete.
+  returned: when the module waited for a task
+  type: dict
+  sample: {"polls": 6, "busy_responses": 0, "waited": 15.42, "elapsed": 17.9}
 '''
 
 import os
-import time
 import traceback
 
 try:
@@ -104,11 +110,12 @@ from ansible.module_utils.urls import urlparse
 from ansible.module_utils.connection import Connection
 
 from ..module_utils.client import (
-    F5Client, sslo_version
+    F5Client, sslo_version, perf_report, invalidate_metadata
 )
 from ..module_utils.common import (
     F5ModuleError, AnsibleF5Parameters,
 )
+from ..module_utils.tasks import TaskWaiter
 from ..module_utils.constants import (
     min_sslo_version, max_sslo_version
 )
@@ -239,6 +246,7 @@ class ModuleManager(object):
         self.module = kwargs.get('module', None)
         self.connection = kwargs.get('connection', None)
         self.client = F5Client(module=self.module, client=self.connection)
+        self.waiter = TaskWaiter()
         self.want = ModuleParameters(params=self.module.params)
         self.changes = UsableChanges()
 
@@ -259,12 +267,16 @@ class ModuleManager(object):
 
         if utility == 'rpm-update':
             changed = self.create()
+            if changed:
+                invalidate_metadata(self.client, 'sslo_version', 'packages_installed')
         if utility == 'delete-all':
             changed = self.delete()
 
         changes = self.changes.to_return()
         result.update(**changes)
         result.update(dict(changed=changed))
+        result.update(self.waiter.to_return())
+        result.update(perf_report(self.client))
         self._announce_deprecations(result)
         return result
 
@@ -359,15 +371,19 @@ class ModuleManager(object):
     def wait_for_task(self, path):
         delay, period = self.want.timeout
         task = None
-        for x in range(0, period):
-            task = self._check_task_on_device(path)
+        for x in self.waiter.polls(delay * period):
+            status = self._check_task_on_device(path)
+            if status is None:
+                continue
+            task = status
             if task['status'] in ['FINISHED', 'FAILED']:
                 return task
-            time.sleep(delay)
         return task
 
     def _check_task_on_device(self, path):
         response = self.client.get(path)
+        if self.waiter.busy(response):
+            return None
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
         return response['contents']
@@ -381,7 +397,7 @@ class ModuleManager(object):
         if response['code'] not in [200, 201, 202]:
             raise F5ModuleError(response['contents'])
 
-        for x in range(0, period):
+        for x in self.waiter.polls(delay * period):
             response = self.client.get(uri)
             if response['code'] not in [200, 201, 202]:
                 raise F5ModuleError(response['contents'])
@@ -398,7 +414,6 @@ class ModuleManager(object):
                 raise F5ModuleError("Utility(delete-all) failed with the following message: {0}".format(
                     response['contents']['successMessage'][0]['message'])
                 )
-            time.sleep(delay)
         raise F5ModuleError(
             "Module timeout reached, state change is unknown, "
             "please increase the timeout parameter for long lived actions."
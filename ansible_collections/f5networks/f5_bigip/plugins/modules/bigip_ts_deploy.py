@@ -92,7 +92,7 @@ from ansible.module_utils.connection import Connection
 from ansible.module_utils.six import string_types
 
 from ..module_utils.client import (
-    F5Client, send_teem
+    F5Client, send_teem, perf_report
 )
 from ..module_utils.common import (
     F5ModuleError, AnsibleF5Parameters
@@ -186,6 +186,7 @@ class ModuleManager(object):
 
         result.update(dict(changed=changed))
         self._announce_deprecations(result)
+        result.update(perf_report(self.client))
         send_teem(self.client, start)
         return result
 
@@ -198,23 +198,30 @@ EXAMPLES = r'''
 '''
 
 RETURN = r'''
-# only common fields returned
+readiness:
+  description:
+    - The state of the device the last time its readiness was probed, after its services restarted.
+    - Whether the device was ready, the stage it was waiting on, out of C(connect), C(restjavad),
+      C(mcpd) and C(config), the number of probes sent and the seconds spent waiting between them.
+  returned: when the module waited for the device
+  type: dict
+  sample: {"ready": true, "stage": null, "probes": 9, "waited": 7.12}
 '''
 import os
-import re
 import time
 from datetime import datetime
 
 from ansible.module_utils.basic import AnsibleModule
-from ansible.module_utils.connection import Connection, ConnectionError
+from ansible.module_utils.connection import Connection
 
 from ..module_utils.client import (
-    F5Client, send_teem
+    F5Client, send_teem, perf_report, invalidate_metadata
 )
 
 from ..module_utils.common import (
     F5ModuleError, AnsibleF5Parameters, flatten_boolean
 )
+from ..module_utils.readiness import ReadinessProbe, STAGES
 
 
 class Parameters(AnsibleF5Parameters):
@@ -344,6 +351,7 @@ class ModuleManager(object):
         self.client = F5Client(module=self.module, client=self.connection)
         self.want = ModuleParameters(params=self.module.params)
         self.changes = UsableChanges()
+        self.probe = ReadinessProbe(self.client, stages=STAGES)
 
     def _announce_deprecations(self, result):
         warnings = result.pop('__warnings', [])
@@ -369,6 +377,8 @@ class ModuleManager(object):
         result.update(**changes)
         result.update(dict(changed=changed))
         self._announce_deprecations(result)
+        result.update(self.probe.to_return())
+        result.update(perf_report(self.client))
         send_teem(self.client, start)
         return result
 
@@ -495,6 +505,8 @@ class ModuleManager(object):
         response = self.client.put(uri, data=payload)
 
         if response['code'] in [200, 201, 202]:
+            # Loading a UCS replaces the configuration, provisioning and installed packages.
+            invalidate_metadata(self.client)
             return True
 
         raise F5ModuleError(response['contents'])
@@ -510,32 +522,17 @@ class ModuleManager(object):
 
     def async_wait(self, task):
         delay, period = self.want.timeout
-        # in most cases the task is no longer there after service restart, so instead for task we will check mcp state.
+        # in most cases the task is no longer there after service restart, so instead we wait for the
+        # configuration to be loaded again.
         if not self.check_task_exists_on_device(task):
-            for x in range(0, period):
-                params = dict(command="run",
-                              utilCmdArgs='-c "tmsh show sys mcp-state"'
-                              )
-                uri = "/mgmt/tm/util/bash"
-
-                response = self.client.post(uri, data=params)
-
-                if response['code'] not in [200, 201, 202]:
-                    raise F5ModuleError(response['contents'])
-
-                if 'commandResult' not in response['contents']:
-                    continue
-
-                result = response['contents']['commandResult']
-
-                if self._is_config_reloading_failed_on_device(result):
-                    raise F5ModuleError(
-                        "Failed to reload the configuration. This may be due "
-                        "to a cross-version incompatibility. {0}".format(result)
-                    )
-                if self._is_config_reloading_success_on_device(result):
+            try:
+                if self.probe.wait(delay * period):
                     return True
-                time.sleep(delay)
+            except F5ModuleError as ex:
+                raise F5ModuleError(
+                    "Failed to reload the configuration. This may be due "
+                    "to a cross-version incompatibility. {0}".format(ex)
+                )
             raise F5ModuleError(
                 "Module timeout reached, state change is unknown, "
                 "please increase the timeout parameter for long lived actions."
@@ -555,20 +552,6 @@ class ModuleManager(object):
                 "please increase the timeout parameter for long lived actions."
             )
 
-    def _is_config_reloading_success_on_device(self, output):
-        succeed = r'Last Configuration Load Status\s+full-config-load-succeed'
-        matches = re.search(succeed, output)
-        if matches:
-            return True
-        return False
-
-    def _is_config_reloading_failed_on_device(self, output):
-        failed = r'Last Configuration Load Status\s+base-config-load-failed'
-        matches = re.search(failed, output)
-        if matches:
-            return True
-        return False
-
     def read_current_from_device(self):
         result = []
         uri = "/mgmt/tm/sys/ucs/"
@@ -586,16 +569,9 @@ class ModuleManager(object):
     def device_is_ready(self):
         # we need to back off for a moment in case services are not restarting yet
         delay, period = self.want.timeout
-        uri = "/mgmt/tm/sys/available"
         time.sleep(delay)
-        for x in range(0, period):
-            try:
-                response = self.client.get(uri)
-                if response['code'] in [200, 201, 202]:
-                    return True
-                time.sleep(delay)
-            except ConnectionError:
-                time.sleep(delay)
+        if self.probe.wait(delay * period, until='mcpd'):
+            return True
         raise F5ModuleError(
             "Module timeout reached, unable to contact device, most likely due to restarting services, "
             "if this message persists check device logs."
@@ -225,7 +225,7 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.connection import Connection
 
 from ..module_utils.client import (
-    F5Client, send_teem
+    F5Client, send_teem, perf_report
 )
 
 from ..module_utils.common import (
@@ -348,6 +348,7 @@ class ModuleManager(object):
         changes = reportable.to_return()
         result.update(**changes)
         result.update(dict(changed=True))
+        result.update(perf_report(self.client))
         send_teem(self.client, start)
         return result
 
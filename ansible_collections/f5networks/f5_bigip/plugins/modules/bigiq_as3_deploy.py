@@ -103,7 +103,7 @@ from ansible.module_utils.connection import Connection
 from ansible.module_utils.six import string_types
 
 from ..module_utils.client import (
-    F5Client, send_teem
+    F5Client, send_teem, perf_report
 )
 from ..module_utils.common import (
     F5ModuleError, AnsibleF5Parameters,
@@ -209,6 +209,7 @@ class ModuleManager(object):
             changed = self.remove_on_device()
 
         result.update(dict(changed=changed))
+        result.update(perf_report(self.client))
         send_teem(self.client, start)
         return result
 
@@ -301,7 +301,7 @@ from ..module_utils.common import (
     F5ModuleError, AnsibleF5Parameters, flatten_boolean
 )
 from ..module_utils.client import (
-    F5Client, bigiq_version, send_teem
+    F5Client, bigiq_version, send_teem, perf_report
 )
 from ..module_utils.ipaddress import is_valid_ip
 
@@ -689,6 +689,7 @@ class ModuleManager(object):
         result.update(**changes)
         result.update(dict(changed=changed))
         self._announce_deprecations(result)
+        result.update(perf_report(self.client))
         send_teem(self.client, start)
         return result
 
@@ -842,7 +842,7 @@ from ..module_utils.common import (
     F5ModuleError, AnsibleF5Parameters, flatten_boolean, transform_name
 )
 from ..module_utils.client import (
-    bigiq_version, F5Client, send_teem
+    bigiq_version, F5Client, send_teem, perf_report
 )
 
 
@@ -2091,6 +2091,7 @@ class ModuleManager(object):
         for manager in managers:
             result = manager.exec_module()
             results.update(result)
+        results.update(perf_report(*[manager.client for manager in managers]))
         return results
 
     def get_manager(self, which):
@@ -2164,6 +2165,8 @@ def main():
         ansible_facts = dict()
 
         for key, value in iteritems(results):
+            if key.startswith('_f5_'):
+                continue
             key = 'ansible_net_%s' % key
             ansible_facts[key] = value
 
@@ -19,7 +19,8 @@ from ansible.plugins.loader import connection_loader
 from ansible_collections.f5networks.f5_bigip.plugins.module_utils.constants import BASE_HEADERS
 from ansible_collections.f5networks.f5_bigip.plugins.module_utils.client import (
     F5Client, tmos_version, bigiq_version, module_provisioned, modules_provisioned, sslo_version,
-    package_installed, packages_installed, send_teem, TransactionContextManager
+    package_installed, packages_installed, send_teem, TransactionContextManager, invalidate_metadata,
+    BatchRequest, select_generation, perf_report
 )
 from ansible_collections.f5networks.f5_bigip.plugins.module_utils.common import F5ModuleError
 from ansible_collections.f5networks.f5_bigip.tests.utils.common import connection_response
@@ -625,6 +626,196 @@ class TestTMOSVersion(TestCase):
         assert module2 is True
 
 
+class TestMetadataCache(TestCase):
+    def setUp(self):
+        self.pc = PlayContext()
+        self.pc.network_os = "f5networks.f5_bigip.bigip"
+        self.connection = connection_loader.get("httpapi", self.pc, "/dev/null")
+        self.mock_send = Mock()
+        self.connection.send = self.mock_send
+        self.connection.httpapi.set_option('metadata_ttl', 300)
+        self.client = F5Client(client=self.connection.httpapi)
+
+    def test_tmos_version_cached(self):
+        self.connection.send.return_value = connection_response(
+            load_fixture('load_tmos_version.json')
+        )
+
+        assert tmos_version(self.client) == '15.1.0.1'
+        assert tmos_version(F5Client(client=self.connection.httpapi)) == '15.1.0.1'
+        assert self.connection.send.call_count == 1
+
+    def test_modules_provisioned_cached_until_invalidated(self):
+        self.connection.send.return_value = connection_response(
+            load_fixture('load_provisioned_modules.json')
+        )
+
+        assert module_provisioned(self.client, 'afm') is False
+        assert module_provisioned(self.client, 'ltm') is True
+        assert self.connection.send.call_count == 1
+
+        invalidate_metadata(self.client, 'modules_provisioned')
+
+        assert modules_provisioned(self.client) == ['ltm']
+        assert self.connection.send.call_count == 2
+
+    def test_empty_value_cached(self):
+        self.connection.send.side_effect = HTTPError(
+            '/mgmt/shared/iapp/global-installed-packages', 404, '', {}, StringIO('{"errorMessage": "not found"}')
+        )
+
+        assert packages_installed(self.client) == []
+        assert packages_installed(self.client) == []
+        assert self.connection.send.call_count == 1
+
+    def test_errors_not_cached(self):
+        self.connection.send.side_effect = [
+            HTTPError('https://bigip.local/mgmt/tm/sys/', 400, '', {}, StringIO('{"errorMessage": "ERROR"}')),
+            connection_response(load_fixture('load_tmos_version.json')),
+        ]
+
+        with self.assertRaises(F5ModuleError):
+            tmos_version(self.client)
+        assert tmos_version(self.client) == '15.1.0.1'
+
+    def test_cache_entries_expire(self):
+        self.connection.send.return_value = connection_response(
+            load_fixture('load_tmos_version.json')
+        )
+        with patch('time.time', return_value=1000):
+            tmos_version(self.client)
+        with patch('time.time', return_value=1299):
+            tmos_version(self.client)
+        assert self.connection.send.call_count == 1
+        with patch('time.time', return_value=1300):
+            tmos_version(self.client)
+        assert self.connection.send.call_count == 2
+
+    def test_cache_disabled(self):
+        self.connection.httpapi.set_option('metadata_ttl', 0)
+        self.connection.send.return_value = connection_response(
+            load_fixture('load_tmos_version.json')
+        )
+
+        with patch.object(self.connection.httpapi, 'get_metadata') as get_metadata:
+            with patch.object(self.connection.httpapi, 'set_metadata') as set_metadata:
+                tmos_version(self.client)
+                tmos_version(self.client)
+        assert self.connection.send.call_count == 2
+        get_metadata.assert_not_called()
+        set_metadata.assert_not_called()
+
+
+class TestResponseCache(TestCase):
+    def setUp(self):
+        self.pc = PlayContext()
+        self.pc.network_os = "f5networks.f5_bigip.bigip"
+        self.connection = connection_loader.get("httpapi", self.pc, "/dev/null")
+        self.connection.send = Mock()
+        self.client = F5Client(client=self.connection.httpapi, response_cache=True)
+        self.pools = {'items': [{'name': 'foo', 'generation': 10}, {'name': 'bar', 'generation': 12}]}
+
+    def sent_urls(self):
+        return [x[0][0] for x in self.connection.send.call_args_list]
+
+    def test_cached_response_validated_by_generation(self):
+        self.connection.send.side_effect = [
+            connection_response(self.pools),
+            connection_response({'items': [{'generation': 10}, {'generation': 12}]}),
+            connection_response({'items': [{'generation': 10}, {'generation': 13}]}),
+            connection_response(self.pools),
+        ]
+
+        first = self.client.get('/mgmt/tm/ltm/pool/')
+        second = self.client.get('/mgmt/tm/ltm/pool/')
+        third = self.client.get('/mgmt/tm/ltm/pool/')
+
+        assert first['contents'] == second['contents'] == third['contents'] == self.pools
+        assert self.sent_urls() == [
+            '/mgmt/tm/ltm/pool/',
+            '/mgmt/tm/ltm/pool/?$select=generation,lastUpdateMicros',
+            '/mgmt/tm/ltm/pool/?$select=generation,lastUpdateMicros',
+            '/mgmt/tm/ltm/pool/',
+        ]
+        assert (self.client.cache.hits, self.client.cache.misses) == (1, 2)
+
+    def test_mutation_invalidates_overlapping_paths(self):
+        self.connection.send.side_effect = [
+            connection_response(self.pools),
+            connection_response({'name': 'baz', 'generation': 14}),
+            connection_response({'items': [{'generation': 10}]}),
+            connection_response({}),
+            connection_response(self.pools),
+            connection_response({'items': [{'generation': 10}]}),
+        ]
+
+        self.client.get('/mgmt/tm/ltm/pool/')
+        self.client.get('/mgmt/tm/ltm/pool/~Common~baz')
+        self.client.get('/mgmt/tm/ltm/node/?$select=generation')
+        self.client.delete('/mgmt/tm/ltm/pool/~Common~baz')
+        self.client.get('/mgmt/tm/ltm/pool/')
+
+        assert self.sent_urls()[-1] == '/mgmt/tm/ltm/pool/'
+        assert list(self.client.cache.entries) == ['GET /mgmt/tm/ltm/node/?$select=generation', 'GET /mgmt/tm/ltm/pool/']
+
+    def test_responses_without_generation_not_cached(self):
+        self.connection.send.side_effect = [
+            HTTPError('/mgmt/tm/ltm/pool/~Common~foo', 404, '', {}, StringIO('{"code": 404}')),
+            connection_response({'entries': {}}),
+        ]
+
+        self.client.get('/mgmt/tm/ltm/pool/~Common~foo')
+        self.client.get('/mgmt/tm/ltm/pool/~Common~foo/stats')
+
+        assert self.client.cache.entries == {}
+
+    def test_response_cache_disabled_by_default(self):
+        client = F5Client(client=self.connection.httpapi)
+        self.connection.send.return_value = connection_response(self.pools)
+
+        client.get('/mgmt/tm/ltm/pool/')
+        client.get('/mgmt/tm/ltm/pool/')
+
+        assert client.cache is None
+        assert self.sent_urls() == ['/mgmt/tm/ltm/pool/', '/mgmt/tm/ltm/pool/']
+
+    def test_select_generation(self):
+        url = "/mgmt/tm/asm/policies/?$filter=name+eq+foo&$select=name,selfLink"
+
+        assert select_generation(url) == "/mgmt/tm/asm/policies/?$filter=name+eq+foo&$select=generation,lastUpdateMicros"
+        assert select_generation(url, keep=True) == \
+            "/mgmt/tm/asm/policies/?$filter=name+eq+foo&$select=name,selfLink,generation,lastUpdateMicros"
+        assert select_generation('/mgmt/tm/ltm/pool/', keep=True) == '/mgmt/tm/ltm/pool/'
+
+
+class TestPerfReport(TestCase):
+    def setUp(self):
+        self.pc = PlayContext()
+        self.pc.network_os = "f5networks.f5_bigip.bigip"
+        self.connection = connection_loader.get("httpapi", self.pc, "/dev/null")
+        self.connection.send = Mock(return_value=connection_response({'name': 'foo'}))
+        self.client = F5Client(client=self.connection.httpapi)
+
+    def test_no_report_without_perf_stats(self):
+        self.client.get('/mgmt/tm/ltm/pool/~Common~foo')
+
+        assert perf_report(self.client) == dict()
+
+    def test_report_of_module_requests(self):
+        self.connection.httpapi.set_option('perf_stats', True)
+        self.client.get('/mgmt/tm/ltm/pool/~Common~foo')
+        self.client.patch('/mgmt/tm/ltm/pool/~Common~foo', data={'description': 'bar'})
+        other = F5Client(client=self.connection.httpapi)
+        other.get('/mgmt/tm/ltm/pool/~Common~foo')
+
+        report = perf_report(self.client, other)['_f5_perf']
+
+        assert report['requests'] == 3
+        assert report['client_requests'] == 3
+        assert report['top_endpoints'][0]['path'] == '/mgmt/tm/ltm/pool/{name}'
+        assert sorted(x['method'] for x in report['top_endpoints']) == ['GET', 'PATCH']
+
+
 class TestBIGIQVersion(TestCase):
     def setUp(self):
         self.pc = PlayContext()
@@ -809,17 +1000,124 @@ class TestTransactionContextManagerAndOtherFunctions(TestCase):
         assert self.client.transact is None
         self.connection.send.assert_has_calls(calls, any_order=False)
 
+    @patch('ansible_collections.f5networks.f5_bigip.plugins.module_utils.tasks.time.sleep', Mock())
+    def test_batch_request_commits_one_transaction(self):
+        self.connection.send.side_effect = [
+            connection_response({'transId': 'tr123456789'}),
+            connection_response({'commandId': 1, 'evalOrder': 1}),
+            connection_response({'commandId': 2, 'evalOrder': 2}),
+            connection_response({'transId': 'tr123456789', 'state': 'VALIDATING'}),
+            connection_response({'transId': 'tr123456789', 'state': 'COMPLETED'}),
+        ]
+
+        batch = BatchRequest(self.client)
+        first = batch.post('/fake/api/url/', data={'name': 'foo'})
+        second = batch.delete('/fake/api/url/~Common~bar')
+        results = batch.commit()
+
+        assert (first, second) == (0, 1)
+        assert results[first]['method'] == 'POST'
+        assert results[first]['contents'] == {'commandId': 1, 'evalOrder': 1}
+        assert results[second]['url'] == '/fake/api/url/~Common~bar'
+        calls = [
+            call('/mgmt/tm/transaction/', '{}', method='POST', headers={'Content-Type': 'application/json'}),
+            call('/fake/api/url/', '{"name": "foo"}', method='POST',
+                 headers={'X-F5-REST-Coordination-Id': 'tr123456789', 'Content-Type': 'application/json'}),
+            call('/fake/api/url/~Common~bar', None, method='DELETE',
+                 headers={'X-F5-REST-Coordination-Id': 'tr123456789', 'Content-Type': 'application/json'}),
+            call('/mgmt/tm/transaction/tr123456789', '{"state": "VALIDATING", "validateOnly": false}',
+                 method='PATCH', headers={'Content-Type': 'application/json'}),
+            call('/mgmt/tm/transaction/tr123456789', None, method='GET', headers={'Content-Type': 'application/json'})
+        ]
+        self.connection.send.assert_has_calls(calls, any_order=False)
+        assert self.client.transact is None
+
+    def test_batch_request_single_request_without_transaction(self):
+        self.connection.send.return_value = connection_response({'name': 'foo'})
+
+        with BatchRequest(self.client) as batch:
+            batch.patch('/fake/api/url/~Common~foo', data={'description': 'bar'})
+
+        self.connection.send.assert_called_once_with(
+            '/fake/api/url/~Common~foo', '{"description": "bar"}', method='PATCH',
+            headers={'Content-Type': 'application/json'}
+        )
+        assert batch.results[0]['contents'] == {'name': 'foo'}
+
+    def test_batch_request_connection_error_deletes_transaction(self):
+        self.connection.send.side_effect = [
+            connection_response({'transId': 'tr123456789'}),
+            ConnectionError('connection reset'),
+            connection_response({}),
+        ]
+
+        batch = BatchRequest(self.client)
+        batch.post('/fake/api/url/', data={'name': 'foo'})
+        batch.post('/fake/api/url/', data={'name': 'bar'})
+        with self.assertRaises(ConnectionError):
+            batch.commit()
+
+        assert self.client.transact is None
+        self.connection.send.assert_called_with(
+            '/mgmt/tm/transaction/tr123456789', None, method='DELETE', headers={'Content-Type': 'application/json'}
+        )
+
+    def test_batch_request_not_committed_on_error(self):
+        with self.assertRaises(F5ModuleError):
+            with BatchRequest(self.client) as batch:
+                batch.patch('/fake/api/url/~Common~foo', data={'description': 'bar'})
+                raise F5ModuleError('failed')
+
+        self.connection.send.assert_not_called()
+
+    def test_batch_request_rejected_request_deletes_transaction(self):
+        self.connection.send.side_effect = [
+            connection_response({'transId': 'tr123456789'}),
+            HTTPError('/fake/api/url/', 400, '', {}, StringIO('{"errorMessage": "invalid property"}')),
+            connection_response({}),
+        ]
+
+        batch = BatchRequest(self.client)
+        batch.post('/fake/api/url/', data={'name': 'foo'})
+        batch.post('/fake/api/url/', data={'name': 'bar'})
+        with self.assertRaises(F5ModuleError) as err:
+            batch.commit()
+
+        assert "POST /fake/api/url/ could not be added to the transaction" in str(err.exception)
+        assert self.connection.send.call_args == call(
+            '/mgmt/tm/transaction/tr123456789', None, method='DELETE', headers={'Content-Type': 'application/json'}
+        )
+        assert self.client.transact is None
+
+    def test_batch_request_failed_transaction(self):
+        self.connection.send.side_effect = [
+            connection_response({'transId': 'tr123456789'}),
+            connection_response({'commandId': 1}),
+            connection_response({'commandId': 2}),
+            connection_response({'state': 'FAILED', 'failureReason': 'profile /Common/foo already exists'}),
+        ]
+
+        batch = BatchRequest(self.client)
+        batch.post('/fake/api/url/', data={'name': 'foo'})
+        batch.post('/fake/api/url/', data={'name': 'bar'})
+        with self.assertRaises(F5ModuleError) as err:
+            batch.commit()
+
+        assert 'Transaction tr123456789 failed: profile /Common/foo already exists' in str(err.exception)
+
     def test_send_teem(self):
         mock_response = Mock()
         self.connection.httpapi.get_option = mock_response
         self.connection.httpapi.get_option.side_effect = [True, False]
+        self.connection.httpapi.queue_telemetry = Mock()
 
         with patch('ansible_collections.f5networks.f5_bigip.plugins.module_utils.client.TeemClient') as patched:
             send_teem(self.client, 12345)
             result = send_teem(self.client, 12345)
 
         patched.assert_called_once()
-        patched.return_value.send.assert_called_once()
+        patched.return_value.send.assert_not_called()
+        self.connection.httpapi.queue_telemetry.assert_called_once_with(patched.return_value.record.return_value)
         assert result is False
 
     def test_ansible_version_module_name(self):
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright: (c) 2026, F5 Networks Inc.
+# GNU General Public License v3.0 (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+
+from unittest import TestCase
+from unittest.mock import patch
+
+from ansible_collections.f5networks.f5_bigip.plugins.module_utils import jsoncodec
+
+
+class TestLoads(TestCase):
+    def test_loads_bytes_and_text(self):
+        document = {'name': 'política', 'items': [1, 2.5, None, True]}
+        data = json.dumps(document, ensure_ascii=False)
+
+        assert jsoncodec.loads(data.encode('utf-8')) == document
+        assert jsoncodec.loads(data) == document
+
+    def test_64_bit_counters(self):
+        assert jsoncodec.loads(b'{"counter": 18446744073709551615}') == {'counter': 18446744073709551615}
+
+    def test_documents_rejected_by_backend_decoded_by_stdlib(self):
+        assert jsoncodec.loads(b'{"name": "\xff"}') == {'name': '\udcff'}
+        result = jsoncodec.loads(b'{"value": NaN}')
+        assert result['value'] != result['value']
+
+    def test_invalid_json_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            jsoncodec.loads(b'invalid json}')
+
+    def test_stdlib_fallback(self):
+        with patch.object(jsoncodec, 'orjson', None), patch.object(jsoncodec, 'ujson', None):
+            backend, decoder = jsoncodec._select_backend()
+        assert backend == 'json'
+        assert decoder is json.loads
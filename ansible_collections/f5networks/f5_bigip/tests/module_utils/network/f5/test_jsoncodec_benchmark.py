@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright: (c) 2026, F5 Networks Inc.
+# GNU General Public License v3.0 (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+import os
+
+import pytest
+
+from ansible.module_utils._text import to_text
+
+from ansible_collections.f5networks.f5_bigip.plugins.module_utils.jsoncodec import loads
+
+pytest.importorskip('pytest_benchmark')
+
+module_fixture_path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'modules', 'network', 'f5', 'fixtures')
+
+# The largest REST responses of the fixtures, an AWAF policy export and an SSLO topology.
+RESPONSE_FIXTURES = ['awaf_big_policy.json', 'load_sslo_topology.json']
+
+
+def load_response(name):
+    with open(os.path.join(module_fixture_path, name), 'rb') as f:
+        return f.read()
+
+
+# The decoding send_request used before, a text copy of the response parsed by the stdlib.
+def legacy_loads(data):
+    return json.loads(to_text(data))
+
+
+@pytest.mark.parametrize('name', RESPONSE_FIXTURES)
+def test_loads(benchmark, name):
+    data = load_response(name)
+    result = benchmark(loads, data)
+    assert result == legacy_loads(data)
+
+
+@pytest.mark.parametrize('name', RESPONSE_FIXTURES)
+def test_legacy_loads(benchmark, name):
+    data = load_response(name)
+    benchmark(legacy_loads, data)
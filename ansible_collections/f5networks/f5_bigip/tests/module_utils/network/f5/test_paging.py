@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright: (c) 2026, F5 Networks Inc.
+# GNU General Public License v3.0 (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from unittest import TestCase
+
+from ansible_collections.f5networks.f5_bigip.plugins.module_utils.paging import (
+    AdaptivePager, page_info, content_length
+)
+
+
+class TestAdaptivePager(TestCase):
+    def test_fixed_size_without_adapt(self):
+        pager = AdaptivePager(10)
+        pager.update(10, 0.01)
+        pager.update(10, 30)
+        assert pager.size == 10
+
+    def test_size_grows_after_quick_full_pages(self):
+        pager = AdaptivePager(10, adapt=True, max_size=50)
+        pager.update(10, 0.1)
+        assert pager.size == 20
+        pager.update(20, 0.1, size=1024)
+        pager.update(40, 0.1)
+        assert pager.size == 50
+
+    def test_size_kept_after_partial_page(self):
+        pager = AdaptivePager(10, adapt=True)
+        pager.update(3, 0.1)
+        assert pager.size == 10
+
+    def test_size_shrinks_after_slow_or_large_pages(self):
+        pager = AdaptivePager(100, adapt=True, min_size=20)
+        pager.update(100, 2.5)
+        assert pager.size == 50
+        pager.update(50, 0.1, size=8 * 1024 * 1024)
+        assert pager.size == 25
+        pager.update(25, 2.5)
+        assert pager.size == 20
+
+    def test_last_page_from_total_items(self):
+        assert AdaptivePager.last(20, 10, dict(total_items=30)) is True
+        assert AdaptivePager.last(10, 10, dict(total_items=30)) is False
+        assert AdaptivePager.last(0, 10, dict(total_pages=3, page_index=3)) is True
+        assert AdaptivePager.last(0, 10, dict()) is False
+
+
+class TestPageInfo(TestCase):
+    def test_page_info(self):
+        response = dict(
+            code=200,
+            contents=dict(items=[], totalItems=42, totalPages=5, pageIndex=1),
+            headers=[('Content-Type', 'application/json'), ('Content-Length', '1234')]
+        )
+        assert page_info(response, 0.5) == dict(
+            total_items=42, total_pages=5, page_index=1, size=1234, elapsed=0.5
+        )
+
+    def test_content_length(self):
+        assert content_length(None) is None
+        assert content_length({'content-length': '10'}) == 10
+        assert content_length([('Content-Length', 'chunked')]) is None
+        assert content_length([('Content-Type', 'application/json')]) is None
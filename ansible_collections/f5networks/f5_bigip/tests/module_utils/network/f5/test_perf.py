@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright: (c) 2026, F5 Networks Inc.
+# GNU General Public License v3.0 (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+import os
+import shutil
+import tempfile
+import time
+
+from unittest import TestCase
+
+from ansible_collections.f5networks.f5_bigip.plugins.module_utils.perf import (
+    RequestRecorder, path_template, summarize
+)
+
+
+class TestPathTemplate(TestCase):
+    def test_object_names_replaced(self):
+        assert path_template('/mgmt/tm/ltm/pool/~Common~web/members/~Common~10.1.1.1:80') == \
+            '/mgmt/tm/ltm/pool/{name}/members/{name}'
+
+    def test_query_removed(self):
+        assert path_template('/mgmt/tm/ltm/virtual?$select=name&$top=50') == '/mgmt/tm/ltm/virtual'
+
+    def test_ids_replaced(self):
+        assert path_template('/mgmt/shared/appsvcs/task/2d9f6c95-1a3b-4c57-9d66-71d7d3b8a0a2') == \
+            '/mgmt/shared/appsvcs/task/{name}'
+        assert path_template('/mgmt/tm/asm/policies/kTyqx6Ao3w4Yn0ZiL0yY2Q') == '/mgmt/tm/asm/policies/kTyqx6Ao3w4Yn0ZiL0yY2Q'
+        assert path_template('/mgmt/shared/authz/tokens/P42ZHJN5HS5DH4KM4ENK3AFCLP') == \
+            '/mgmt/shared/authz/tokens/{name}'
+        assert path_template('/mgmt/cm/device/tasks/licensing/pool/purchased-pool/licenses/4') == \
+            '/mgmt/cm/device/tasks/licensing/pool/purchased-pool/licenses/{name}'
+
+    def test_endpoints_kept(self):
+        assert path_template('/mgmt/shared/file-transfer/uploads/') == '/mgmt/shared/file-transfer/uploads/'
+        assert path_template('/mgmt/tm/util/bash') == '/mgmt/tm/util/bash'
+
+
+class TestRequestRecorder(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_record_counters(self):
+        recorder = RequestRecorder()
+        recorder.count('auth_refreshes')
+        mark = recorder.mark()
+        recorder.count('retries')
+        recorder.count('retries')
+
+        item = recorder.record('POST', '/mgmt/tm/util/bash', 200, time.time(), 10, 20, mark)
+
+        assert item['retries'] == 2
+        assert item['auth_refreshes'] == 0
+        assert item['bytes_out'] == 10
+        assert item['bytes_in'] == 20
+
+    def test_since(self):
+        recorder = RequestRecorder()
+        recorder.record('GET', '/mgmt/tm/sys', 200, time.time() - 10)
+        started = time.time()
+        recorder.record('GET', '/mgmt/tm/sys/version', 200, started)
+
+        assert [x['path'] for x in recorder.since(started)] == ['/mgmt/tm/sys/version']
+
+    def test_jsonl_trace(self):
+        path = os.path.join(self.tmpdir, 'trace.jsonl')
+        recorder = RequestRecorder(trace=path, host='bigip.local')
+        recorder.record('GET', '/mgmt/tm/sys', 200, time.time())
+        recorder.record('DELETE', '/mgmt/tm/ltm/pool/~Common~web', 404, time.time())
+
+        with open(path) as fh:
+            lines = [json.loads(x) for x in fh]
+        assert [(x['method'], x['path'], x['status'], x['host']) for x in lines] == [
+            ('GET', '/mgmt/tm/sys', 200, 'bigip.local'),
+            ('DELETE', '/mgmt/tm/ltm/pool/{name}', 404, 'bigip.local'),
+        ]
+
+    def test_chrome_trace_shared_between_recorders(self):
+        path = os.path.join(self.tmpdir, 'trace.json')
+        first = RequestRecorder(trace=path, trace_format='chrome', host='one')
+        second = RequestRecorder(trace=path, trace_format='chrome', host='two')
+        first.record('GET', '/mgmt/tm/sys', 200, time.time())
+        second.record('GET', '/mgmt/tm/sys', 200, time.time())
+
+        with open(path) as fh:
+            content = fh.read()
+        assert content.startswith('[\n')
+        events = json.loads(content.rstrip().rstrip(',') + ']')
+        assert [x['args']['host'] for x in events] == ['one', 'two']
+        assert all(x['ph'] == 'X' and x['cat'] == 'icontrol' for x in events)
+
+
+class TestSummarize(TestCase):
+    def test_top_endpoints_by_total_time(self):
+        records = [
+            dict(method='GET', path='/mgmt/tm/ltm/pool/{name}', status=200, latency=0.5,
+                 bytes_out=0, bytes_in=100, retries=0, auth_refreshes=0),
+            dict(method='GET', path='/mgmt/tm/ltm/pool/{name}', status=200, latency=0.75,
+                 bytes_out=0, bytes_in=100, retries=0, auth_refreshes=0),
+            dict(method='POST', path='/mgmt/tm/util/bash', status=400, latency=1.0,
+                 bytes_out=50, bytes_in=10, retries=1, auth_refreshes=1),
+        ]
+
+        summary = summarize(records, top=1)
+
+        assert summary['requests'] == 3
+        assert summary['total_time'] == 2.25
+        assert summary['bytes_in'] == 210
+        assert summary['bytes_out'] == 50
+        assert summary['errors'] == 1
+        assert summary['retries'] == 1
+        assert summary['auth_refreshes'] == 1
+        assert summary['top_endpoints'] == [dict(
+            method='GET', path='/mgmt/tm/ltm/pool/{name}', count=2, total_time=1.25, max_time=0.75,
+            bytes_out=0, bytes_in=200, errors=0
+        )]
+
+    def test_no_records(self):
+        assert summarize([])['requests'] == 0
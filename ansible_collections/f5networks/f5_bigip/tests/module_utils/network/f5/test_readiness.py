@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright: (c) 2026, F5 Networks Inc.
+# GNU General Public License v3.0 (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import copy
+import json
+import os
+import socket
+
+from unittest.mock import Mock, patch
+from unittest import TestCase
+
+from ansible.module_utils.connection import ConnectionError
+
+from ansible_collections.f5networks.f5_bigip.plugins.module_utils.common import F5ModuleError
+from ansible_collections.f5networks.f5_bigip.plugins.module_utils.readiness import (
+    ReadinessProbe, STAGES, device_address, mcp_state_from_output, mcp_state_from_stats
+)
+from ansible_collections.f5networks.f5_bigip.tests.utils.common import FakeClock
+
+fixture_path = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+def load_fixture(name):
+    with open(os.path.join(fixture_path, name)) as f:
+        return json.load(f)
+
+
+def mcp_state(phase='running', status='full-config-load-succeed'):
+    contents = copy.deepcopy(load_fixture('load_sys_mcp_state.json'))
+    entries = contents['entries']['https://localhost/mgmt/tm/sys/mcp-state/0']['nestedStats']['entries']
+    entries['phase']['description'] = phase
+    entries['lastConfigLoadStatus']['description'] = status
+    return dict(code=200, contents=contents)
+
+
+def client(get=None, post=None, host=None, port=None):
+    result = Mock()
+    result.get.side_effect = get
+    result.post.side_effect = post
+    result.plugin.get_option.side_effect = lambda x: dict(host=host, port=port)[x]
+    return result
+
+
+class TestReadinessProbe(TestCase):
+    def setUp(self):
+        self.p1 = FakeClock()
+        self.m1 = self.p1.start()
+        self.p2 = patch('random.uniform', return_value=1)
+        self.p2.start()
+
+    def tearDown(self):
+        self.p1.stop()
+        self.p2.stop()
+
+    def urls(self, client):
+        return [x[0][0] for x in client.get.call_args_list]
+
+    def test_stops_at_first_stage_not_ready(self):
+        device = client(get=[dict(code=503)])
+        probe = ReadinessProbe(device)
+
+        assert probe.check() is False
+        assert self.urls(device) == ['/mgmt/shared/echo']
+        assert probe.to_return() == dict(readiness=dict(ready=False, stage='restjavad', probes=1, waited=0.0))
+
+    def test_stages_share_the_mcp_state_response(self):
+        device = client(get=[dict(code=200), mcp_state()])
+        probe = ReadinessProbe(device, stages=STAGES)
+
+        assert probe.check() is True
+        assert self.urls(device) == ['/mgmt/shared/echo', '/mgmt/tm/sys/mcp-state']
+        assert probe.stage is None
+        assert probe.load_status == 'full-config-load-succeed'
+
+    def test_requests_have_short_timeouts(self):
+        device = client(get=[dict(code=200), mcp_state()])
+        ReadinessProbe(device, timeout=3).check()
+
+        assert all(x[1]['timeout'] == 3 for x in device.get.call_args_list)
+
+    def test_wait_backs_off_until_ready(self):
+        device = client(get=[
+            ConnectionError('connection refused'),
+            dict(code=200), mcp_state(phase='host-config'),
+            dict(code=200), mcp_state(status='none'),
+            dict(code=200), mcp_state(),
+        ])
+        probe = ReadinessProbe(device, stages=STAGES)
+
+        assert probe.wait(300) is True
+        assert [x[0][0] for x in self.m1.call_args_list] == [1, 2, 4]
+        assert probe.to_return() == dict(readiness=dict(ready=True, stage=None, probes=4, waited=7))
+
+    def test_wait_reports_stage_on_timeout(self):
+        device = client(get=lambda *args, **kwargs: mcp_state(phase='host-config') if 'mcp' in args[0] else dict(code=200))
+        probe = ReadinessProbe(device, stages=STAGES, max_delay=10)
+
+        assert probe.wait(30) is False
+        assert probe.stage == 'mcpd'
+        assert probe.waiter.slept == 30
+
+    def test_wait_until_stage(self):
+        device = client(get=[dict(code=200), mcp_state(status='none')])
+        probe = ReadinessProbe(device, stages=STAGES)
+
+        assert probe.wait(60, until='mcpd') is True
+        assert probe.load_status is None
+
+    def test_config_load_failure_raises(self):
+        device = client(get=[dict(code=200), mcp_state(status='base-config-load-failed')])
+        probe = ReadinessProbe(device, stages=STAGES)
+
+        with self.assertRaises(F5ModuleError) as err:
+            probe.wait(60)
+        assert 'base-config-load-failed' in str(err.exception)
+
+    def test_service_stage(self):
+        device = client(get=[dict(code=200), dict(code=404)])
+        probe = ReadinessProbe(device, stages=('connect', 'restjavad', 'service'), service='/mgmt/shared/foo/available')
+
+        assert probe.check() is False
+        assert probe.stage == 'service'
+        assert self.urls(device) == ['/mgmt/shared/echo', '/mgmt/shared/foo/available']
+
+    def test_falls_back_to_tmsh_once(self):
+        output = 'sys mcp-state {\n    end-platform-id-received true\n    last-config-load-status ' \
+                 'full-config-load-succeed\n    phase running\n}\n'
+        device = client(
+            get=[dict(code=200), dict(code=200, contents=dict(kind='tm:sys:mcp-state:mcp-statestats')),
+                 dict(code=200)],
+            post=[dict(code=200, contents=dict(commandResult=output))] * 2
+        )
+        probe = ReadinessProbe(device, stages=STAGES)
+
+        assert probe.check() is True
+        assert probe.check() is True
+        assert self.urls(device) == ['/mgmt/shared/echo', '/mgmt/tm/sys/mcp-state', '/mgmt/shared/echo']
+        assert device.post.call_count == 2
+        assert 'mcp-state field-fmt' in device.post.call_args[1]['data']['utilCmdArgs']
+
+    def test_connect_stage(self):
+        server = socket.socket()
+        server.bind(('127.0.0.1', 0))
+        server.listen(1)
+        port = server.getsockname()[1]
+        try:
+            device = client(get=[dict(code=503)], host='127.0.0.1', port=port)
+            probe = ReadinessProbe(device)
+            assert probe.check() is False
+            assert probe.stage == 'restjavad'
+        finally:
+            server.close()
+
+        device = client(host='127.0.0.1', port=port)
+        probe = ReadinessProbe(device, timeout=1)
+        assert probe.check() is False
+        assert probe.stage == 'connect'
+        device.get.assert_not_called()
+
+
+class TestHelpers(TestCase):
+    def test_mcp_state_from_stats(self):
+        assert mcp_state_from_stats(mcp_state()['contents']) == dict(
+            phase='running', lastConfigLoadStatus='full-config-load-succeed'
+        )
+        assert mcp_state_from_stats(dict(kind='foo')) == dict()
+
+    def test_mcp_state_from_output(self):
+        output = 'sys mcp-state {\n    last-config-load-status base-config-load-failed\n    phase running\n}\n'
+        assert mcp_state_from_output(output) == dict(
+            phase='running', lastConfigLoadStatus='base-config-load-failed'
+        )
+
+    def test_device_address(self):
+        assert device_address(client(host='10.0.0.1', port=8443)) == ('10.0.0.1', 8443)
+        assert device_address(client(host='10.0.0.1')) == ('10.0.0.1', 443)
+        assert device_address(Mock()) is None
+        assert device_address(Mock(plugin=None)) is None
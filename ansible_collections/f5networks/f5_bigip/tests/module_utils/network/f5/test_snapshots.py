@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright: (c) 2026, F5 Networks Inc.
+# GNU General Public License v3.0 (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import os
+import shutil
+import stat
+import tempfile
+
+from unittest import TestCase
+
+from ansible_collections.f5networks.f5_bigip.plugins.module_utils.snapshots import (
+    SnapshotStore, fingerprint
+)
+
+
+class TestFingerprint(TestCase):
+    def test_fingerprint_follows_generations(self):
+        items = [dict(name='a', generation=1), dict(name='b', generation=2)]
+        assert fingerprint(items) == fingerprint([dict(generation=1, name='a'), dict(name='b', generation=2)])
+        assert fingerprint(items) != fingerprint([dict(name='a', generation=1), dict(name='b', generation=3)])
+        assert fingerprint(items) != fingerprint(items[:1])
+
+
+class TestSnapshotStore(TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_get_returns_facts_of_same_fingerprint(self):
+        store = SnapshotStore(self.path, '10.1.1.1')
+        store.set('irules', 'Common', 'abc', dict(irules=[dict(name='rule1')]))
+
+        assert store.get('irules', 'Common', 'abc') == dict(irules=[dict(name='rule1')])
+        assert store.get('irules', 'Common', 'def') is None
+        assert store.get('irules', 'Other', 'abc') is None
+        assert SnapshotStore(self.path, '10.1.1.2').get('irules', 'Common', 'abc') is None
+
+    def test_snapshot_files_readable_by_owner_only(self):
+        store = SnapshotStore(self.path, 'bigip/1:443')
+        store.set('irules', 'Common', 'abc', dict(irules=[]))
+
+        files = os.listdir(os.path.join(self.path, 'bigip_1_443'))
+        assert files == ['irules-Common.json']
+        mode = os.stat(os.path.join(self.path, 'bigip_1_443', files[0])).st_mode
+        assert stat.S_IMODE(mode) == 0o600
+
+    def test_unreadable_snapshot_is_missing(self):
+        store = SnapshotStore(self.path, '10.1.1.1')
+        store.set('irules', 'Common', 'abc', dict(irules=[]))
+        with open(store._file('irules', 'Common'), 'w') as fh:
+            fh.write('{not json')
+
+        assert store.get('irules', 'Common', 'abc') is None
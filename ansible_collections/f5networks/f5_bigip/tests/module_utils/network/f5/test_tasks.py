@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright: (c) 2026, F5 Networks Inc.
+# GNU General Public License v3.0 (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from unittest import TestCase
+
+from ansible_collections.f5networks.f5_bigip.plugins.module_utils.tasks import (
+    TaskWaiter, retry_after_seconds
+)
+from ansible_collections.f5networks.f5_bigip.tests.utils.common import FakeClock
+
+
+class TestTaskWaiter(TestCase):
+    def setUp(self):
+        self.p1 = FakeClock()
+        self.m1 = self.p1.start()
+
+    def tearDown(self):
+        self.p1.stop()
+
+    def sleeps(self):
+        return [x[0][0] for x in self.m1.call_args_list]
+
+    def test_first_poll_is_immediate(self):
+        waiter = TaskWaiter()
+        for x in waiter.polls(60):
+            break
+
+        assert self.m1.call_count == 0
+        assert waiter.to_return() == dict(
+            task_polling=dict(polls=1, busy_responses=0, waited=0.0, elapsed=0.0)
+        )
+
+    def test_backoff_until_deadline(self):
+        waiter = TaskWaiter(jitter=0)
+        polls = [x for x in waiter.polls(60)]
+
+        assert self.sleeps() == [0.5, 1, 2, 4, 8, 15, 15, 14.5]
+        assert len(polls) == 9
+        assert waiter.metrics()['waited'] == 60
+
+    def test_jitter_stays_in_bounds(self):
+        waiter = TaskWaiter(jitter=0.1)
+        for x in waiter.polls(1800):
+            pass
+
+        delays = self.sleeps()[:-1]
+        assert 0.45 <= delays[0] <= 0.55
+        assert all(x <= 15 * 1.1 for x in delays)
+
+    def test_busy_response_honors_retry_after(self):
+        waiter = TaskWaiter(jitter=0)
+        for x in waiter.polls(60):
+            if x == 1:
+                assert waiter.busy(dict(code=503, contents={}, headers=[('Retry-After', '7')])) is True
+                continue
+            assert waiter.busy(dict(code=200, contents={})) is False
+            break
+
+        assert self.sleeps() == [7]
+        assert waiter.metrics()['busy_responses'] == 1
+
+    def test_busy_response_without_retry_after(self):
+        waiter = TaskWaiter()
+        assert waiter.busy(dict(code=503, contents='service not available', headers=[])) is False
+        assert waiter.metrics()['busy_responses'] == 0
+
+    def test_metrics_add_up_over_waits(self):
+        waiter = TaskWaiter(jitter=0)
+        for wait in range(2):
+            for x in waiter.polls(60):
+                if x % 2 == 0:
+                    break
+
+        assert waiter.metrics()['polls'] == 4
+        assert waiter.metrics()['waited'] == 1.0
+
+    def test_no_polls_returns_nothing(self):
+        assert TaskWaiter().to_return() == dict()
+
+    def test_retry_after_seconds(self):
+        assert retry_after_seconds(None) is None
+        assert retry_after_seconds([('Content-Type', 'application/json')]) is None
+        assert retry_after_seconds({'retry-after': ' 5 '}) == 5
+        assert retry_after_seconds([('Retry-After', 'Wed, 21 Oct 2015 07:28:00 GMT')]) == 0
+        assert retry_after_seconds([('Retry-After', 'soon')]) is None
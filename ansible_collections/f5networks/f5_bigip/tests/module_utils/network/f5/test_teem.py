@@ -8,7 +8,9 @@ __metaclass__ = type
 
 import json
 import os
+import shutil
 import sys
+import tempfile
 
 from datetime import datetime
 from unittest.mock import Mock, patch, mock_open
@@ -22,7 +24,7 @@ from ansible.module_utils.six.moves.urllib.error import HTTPError
 from ansible_collections.f5networks.f5_bigip.plugins.module_utils.client import F5Client
 from ansible_collections.f5networks.f5_bigip.plugins.module_utils.constants import TEEM_KEY
 from ansible_collections.f5networks.f5_bigip.plugins.module_utils.teem import (
-    TeemClient, in_cicd, in_docker, generate_asset_id, determine_environment
+    TeemClient, TeemSpool, in_cicd, in_docker, generate_asset_id, determine_environment
 )
 from ansible_collections.f5networks.f5_bigip.plugins.module_utils.version import CURRENT_COLL_VERSION
 from ansible_collections.f5networks.f5_bigip.tests.utils.common import connection_response
@@ -143,6 +145,20 @@ class TestTeemClient(TestCase):
         assert result[0]['RunningInCiEnv'] is False
         assert result[0]['CiEnvName'] == 'none'
 
+    @patch('ansible_collections.f5networks.f5_bigip.plugins.module_utils.teem.in_docker')
+    @patch('ansible_collections.f5networks.f5_bigip.plugins.module_utils.teem.in_cicd', Mock(return_value=(False, None)))
+    def test_teem_client_record_sends_no_request(self, docker):
+        self.client.tmos_version = '16.1.0'
+        teem = TeemClient(self.client, self.start_time)
+        result = teem.record()
+
+        self.connection.send.assert_not_called()
+        docker.assert_not_called()
+        assert result['version'] == '16.1.0'
+        assert result['telemetry'][0]['CollectionModuleName'] == 'fake_module'
+        assert 'f5Platform' not in result['telemetry'][0]
+        assert 'ControllerAsDocker' not in result['telemetry'][0]
+
     def test_teem_client_prepare_request(self):
         self.connection.send.return_value = connection_response(
             load_fixture('load_tmos_version.json')
@@ -188,6 +204,82 @@ class TestTeemClient(TestCase):
         assert result is False
 
 
+class TestTeemSpool(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'spool', 'teem.jsonl')
+        self.spool = TeemSpool(path=self.path, batch_size=2, flush_delay=60)
+
+    def tearDown(self):
+        if self.spool.timer is not None:
+            self.spool.timer.cancel()
+        shutil.rmtree(self.tmpdir)
+
+    def record(self, name, start, end):
+        return dict(
+            collection='F5_BIGIP', start=start, end=end,
+            telemetry=[dict(CollectionModuleName=name, ControllerAsDocker=False, DockerHostname='none')]
+        )
+
+    def test_queue_does_not_send(self):
+        with patch('ansible_collections.f5networks.f5_bigip.plugins.module_utils.teem.open_url') as patched:
+            self.spool.queue(self.record('bigip_pool', '1', '2'))
+            self.spool.queue(self.record('bigip_node', '3', '4'))
+
+        patched.assert_not_called()
+        with open(self.path) as fh:
+            lines = fh.readlines()
+        assert len(lines) == 2
+        assert json.loads(lines[1])['telemetry'][0]['CollectionModuleName'] == 'bigip_node'
+
+    @patch('ansible_collections.f5networks.f5_bigip.plugins.module_utils.teem.in_docker', Mock(return_value=False))
+    @patch('ansible_collections.f5networks.f5_bigip.plugins.module_utils.teem.open_url')
+    def test_flush_sends_batches(self, patched):
+        patched.return_value = FakeHTTPResponse(204)
+        for idx in range(3):
+            self.spool.append(self.record('bigip_{0}'.format(idx), str(idx), str(idx + 5)))
+        with open(self.path, 'a') as fh:
+            fh.write('{"collection": "F5_BI')
+
+        result = self.spool.flush()
+
+        assert result == 3
+        assert patched.call_count == 2
+        data = json.loads(patched.call_args_list[0][1]['data'])
+        assert data['observationStartTime'] == '0'
+        assert data['observationEndTime'] == '6'
+        assert [x['CollectionModuleName'] for x in data['telemetryRecords']] == ['bigip_0', 'bigip_1']
+        assert not os.listdir(os.path.dirname(self.path))
+        assert self.spool.flush() == 0
+
+    @patch('ansible_collections.f5networks.f5_bigip.plugins.module_utils.teem.in_docker', Mock(return_value=False))
+    @patch('ansible_collections.f5networks.f5_bigip.plugins.module_utils.teem.open_url')
+    def test_flush_adds_platform_and_version(self, patched):
+        patched.return_value = FakeHTTPResponse(204)
+        self.spool.append(dict(
+            self.record('bigip_pool', '1', '2'), platform='bigip', version='15.1.0.1'
+        ))
+        self.spool.append(dict(self.record('bigiq_device_info', '3', '4'), platform='bigiq', version=None))
+
+        self.spool.flush()
+
+        data = json.loads(patched.call_args[1]['data'])
+        assert [(x['f5Platform'], x['f5SoftwareVersion']) for x in data['telemetryRecords']] == [
+            ('BIG-IP', '15.1.0.1'), ('BIG-IQ', 'unknown')
+        ]
+
+    @patch('ansible_collections.f5networks.f5_bigip.plugins.module_utils.teem.in_docker', Mock(return_value=False))
+    @patch('ansible_collections.f5networks.f5_bigip.plugins.module_utils.teem.open_url')
+    def test_flush_drops_records_on_error(self, patched):
+        patched.side_effect = HTTPError('https://product.apis.f5.com', 500, '', {}, StringIO('{}'))
+        self.spool.append(self.record('bigip_pool', '1', '2'))
+
+        result = self.spool.flush()
+
+        assert result == 0
+        assert not os.path.exists(self.path)
+
+
 class TestOtherFunctions(TestCase):
     def test_determine_environment_drone(self):
         def mock_os_env_return(value):
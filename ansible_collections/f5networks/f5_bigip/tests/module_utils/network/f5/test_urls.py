@@ -11,7 +11,7 @@ import os
 from unittest import TestCase
 
 from ansible_collections.f5networks.f5_bigip.plugins.module_utils.urls import (
-    parseStats, build_service_uri
+    parseStats, build_service_uri, index_stats_by_full_path
 )
 
 fixture_path = os.path.join(os.path.dirname(__file__), 'fixtures')
@@ -58,6 +58,69 @@ class TestFunctions(TestCase):
         part_result1 = parseStats(partial1)
         assert part_result1 == ['foo']
 
+    def test_parse_stats_nested_entries(self):
+        trunk_stats = {
+            "entries": {
+                "https://localhost/mgmt/tm/net/trunk/foo/stats": {
+                    "nestedStats": {
+                        "entries": {
+                            "counters.bitsIn": {"value": 10},
+                            "counters.bitsOut": {"value": 20},
+                            "operBw": {"value": 1000},
+                            "status": {"nestedStats": {"entries": {}}},
+                            "status.state": {"description": "up"},
+                        }
+                    }
+                }
+            }
+        }
+        result1 = parseStats(trunk_stats)
+        assert result1 == {
+            'stats': {
+                'counters': {'bitsIn': 10, 'bitsOut': 20},
+                'operBw': 1000,
+                'status': {'state': 'up'},
+            }
+        }
+
+        list_stats = {
+            "entries": {
+                "https://localhost/mgmt/tm/net/vlan/~Common~foo1/100": {
+                    "nestedStats": {"entries": {"tmName": {"description": "/Common/foo1"}}}
+                },
+                "https://localhost/mgmt/tm/net/vlan/~Common~foo1/200": {"description": "foo"},
+                "other": {"value": 3},
+            }
+        }
+        result2 = parseStats(list_stats)
+        assert result2 == [{'tmName': '/Common/foo1'}, 'foo', 3]
+
+        assert parseStats({"value": 0}) == 0
+        assert parseStats({"nestedStats": {}}) is None
+        assert parseStats({"entries": {}}) is None
+
+    def test_index_stats_by_full_path(self):
+        virtual_stats = load_fixture('load_stats_virtual.json')
+        result1 = index_stats_by_full_path(virtual_stats)
+
+        assert list(result1.keys()) == ['/Common/for_stats']
+        assert result1['/Common/for_stats'] == parseStats(virtual_stats)['stats']
+
+        partial1 = {
+            "entries": {
+                "https://localhost/mgmt/tm/net/trunk/foo1/stats": {
+                    "nestedStats": {"entries": {"status": {"description": "up"}}}
+                },
+                "https://localhost/mgmt/tm/ltm/pool/~Common~foo%25bar/stats": {
+                    "nestedStats": {"entries": {"tmName": {"description": "/Common/foo%bar"}}}
+                },
+            }
+        }
+        part_result1 = index_stats_by_full_path(partial1)
+        assert part_result1['foo1'] == {'status': 'up'}
+        assert part_result1['/Common/foo%bar'] == {'tmName': '/Common/foo%bar'}
+        assert index_stats_by_full_path({}) == {}
+
     def test_build_service_uri(self):
         result = build_service_uri('foo_url', 'fooPartition', 'fooName')
         assert result == 'foo_url~fooPartition~fooName.app~fooName'
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright: (c) 2026, F5 Networks Inc.
+# GNU General Public License v3.0 (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import copy
+import json
+import os
+
+import pytest
+
+from ansible_collections.f5networks.f5_bigip.plugins.module_utils.urls import (
+    parseStats, index_stats_by_full_path
+)
+
+pytest.importorskip('pytest_benchmark')
+
+fixture_path = os.path.join(os.path.dirname(__file__), 'fixtures')
+module_fixture_path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'modules', 'network', 'f5', 'fixtures')
+fixture_data = {}
+
+
+def load_fixture(name, path=fixture_path):
+    path = os.path.join(path, name)
+
+    if path in fixture_data:
+        return fixture_data[path]
+
+    with open(path) as f:
+        data = f.read()
+
+    try:
+        data = json.loads(data)
+    except Exception:
+        pass
+
+    fixture_data[path] = data
+    return data
+
+
+def build_collection_stats(count):
+    """Build a collection stats response with ``count`` virtual servers from the fixtures"""
+    template = load_fixture('load_stats_virtual.json')
+    link, entry = list(template['entries'].items())[0]
+    result = dict(kind='tm:ltm:virtual:virtualcollectionstats', entries=dict())
+    for idx in range(count):
+        item = copy.deepcopy(entry)
+        item['nestedStats']['entries']['tmName'] = {'description': '/Common/vs{0}'.format(idx)}
+        result['entries'][link.replace('for_stats', 'vs{0}'.format(idx))] = item
+    return result
+
+
+# The recursive implementation parseStats replaced, kept to measure against.
+def legacy_parse_stats(entry):
+    if 'description' in entry:
+        return entry['description']
+    elif 'value' in entry:
+        return entry['value']
+    elif 'entries' in entry or 'nestedStats' in entry and 'entries' in entry['nestedStats']:
+        if 'entries' in entry:
+            entries = entry['entries']
+        else:
+            entries = entry['nestedStats']['entries']
+        result = None
+
+        for name in entries:
+            entry = entries[name]
+            if 'https://localhost' in name:
+                name = name.split('/')
+                name = name[-1]
+                if result and isinstance(result, list):
+                    result.append(legacy_parse_stats(entry))
+                elif result and isinstance(result, dict):
+                    result[name] = legacy_parse_stats(entry)
+                else:
+                    try:
+                        int(name)
+                        result = list()
+                        result.append(legacy_parse_stats(entry))
+                    except ValueError:
+                        result = dict()
+                        result[name] = legacy_parse_stats(entry)
+            else:
+                if '.' in name:
+                    names = name.split('.')
+                    key = names[0]
+                    value = names[1]
+                    if result is None:
+                        # result can be None if this branch is reached first
+                        #
+                        # For example, the mgmt/tm/net/trunk/NAME/stats API
+                        # returns counters.bitsIn before anything else.
+                        result = dict()
+                        result[key] = dict()
+                    elif key not in result:
+                        result[key] = dict()
+                    elif result[key] is None:
+                        result[key] = dict()
+                    result[key][value] = legacy_parse_stats(entry)
+                else:
+                    if result and isinstance(result, list):
+                        result.append(legacy_parse_stats(entry))
+                    elif result and isinstance(result, dict):
+                        result[name] = legacy_parse_stats(entry)
+                    else:
+                        try:
+                            int(name)
+                            result = list()
+                            result.append(legacy_parse_stats(entry))
+                        except ValueError:
+                            result = dict()
+                            result[name] = legacy_parse_stats(entry)
+        return result
+
+
+STATS_FIXTURES = [
+    ('load_stats_vlan.json', fixture_path),
+    ('load_stats_virtual.json', fixture_path),
+    ('load_ltm_virtual_stats_collection.json', module_fixture_path),
+]
+
+
+@pytest.mark.parametrize('name, path', STATS_FIXTURES)
+def test_parse_stats(benchmark, name, path):
+    stats = load_fixture(name, path)
+    result = benchmark(parseStats, stats)
+    assert result == legacy_parse_stats(stats)
+
+
+@pytest.mark.parametrize('name, path', STATS_FIXTURES)
+def test_legacy_parse_stats(benchmark, name, path):
+    stats = load_fixture(name, path)
+    benchmark(legacy_parse_stats, stats)
+
+
+def test_parse_collection_stats(benchmark):
+    stats = build_collection_stats(2000)
+    result = benchmark(parseStats, stats)
+    assert result == legacy_parse_stats(stats)
+
+
+def test_legacy_parse_collection_stats(benchmark):
+    stats = build_collection_stats(2000)
+    benchmark(legacy_parse_stats, stats)
+
+
+def test_index_collection_stats(benchmark):
+    stats = build_collection_stats(2000)
+    result = benchmark(index_stats_by_full_path, stats)
+    assert len(result) == 2000
@@ -8,6 +8,8 @@ __metaclass__ = type
 
 import json
 import os
+import shutil
+import tempfile
 
 from ansible.module_utils.basic import AnsibleModule
 
@@ -21,6 +23,7 @@ from ansible_collections.f5networks.f5_bigip.plugins.module_utils.common import
 from ansible_collections.f5networks.f5_bigip.plugins.module_utils.common import F5ModuleError
 from ansible_collections.f5networks.f5_bigip.tests.compat import unittest
 from ansible_collections.f5networks.f5_bigip.tests.compat.mock import Mock, patch, MagicMock
+from ansible_collections.f5networks.f5_bigip.tests.utils.common import FakeClock
 from ansible_collections.f5networks.f5_bigip.tests.modules.utils import (
     set_module_args, AnsibleFailJson, AnsibleExitJson, fail_json, exit_json
 )
@@ -93,7 +96,7 @@ class TestManager(unittest.TestCase):
 
     def setUp(self):
         self.spec = ArgumentSpec()
-        self.p1 = patch('time.sleep')
+        self.p1 = FakeClock()
         self.p1.start()
         self.p2 = patch('ansible_collections.f5networks.f5_bigip.plugins.modules.bigip_as3_deploy.send_teem')
         self.m2 = self.p2.start()
@@ -165,6 +168,155 @@ class TestManager(unittest.TestCase):
         self.assertEqual(mm.want.timeout, (3, 100))
         self.assertEqual(mm.client.get.call_count, 4)
 
+    def as3_device_get(self, timestamp):
+        def get(uri, **kwargs):
+            if uri == '/mgmt/shared/identified-devices/config/device-info':
+                return {'code': 200, 'contents': {'machineId': 'a1b2c3'}}
+            return {'code': 200, 'contents': {
+                'class': 'ADC', 'id': 'decl-1', 'controls': {'archiveTimestamp': timestamp}
+            }}
+        return get
+
+    def declaration_cache_manager(self, cache):
+        set_module_args(dict(
+            content=load_fixture('as3_declare.json'),
+            tenant='Sample_01',
+            state='present',
+            declaration_cache=cache,
+        ))
+        module = AnsibleModule(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode,
+            required_if=self.spec.required_if
+        )
+        return ModuleManager(module=module)
+
+    def test_declaration_cache_skips_dry_run(self, *args):
+        cache = os.path.join(tempfile.mkdtemp(), 'as3.json')
+        self.addCleanup(shutil.rmtree, os.path.dirname(cache))
+
+        mm = self.declaration_cache_manager(cache)
+        mm.client.get.side_effect = self.as3_device_get('2026-10-01T10:00:00Z')
+        mm.client.post.return_value = {'code': 200, 'contents': {'results': [{'message': 'no change'}]}}
+
+        self.assertFalse(mm.exec_module()['changed'])
+        self.assertEqual(mm.client.post.call_count, 1)
+        with open(cache) as fh:
+            entry = json.load(fh)['a1b2c3/Sample_01']
+        self.assertEqual(entry['generation'], {'id': 'decl-1', 'timestamp': '2026-10-01T10:00:00Z'})
+
+        mm = self.declaration_cache_manager(cache)
+        mm.client.reset_mock()
+        mm.client.get.side_effect = self.as3_device_get('2026-10-01T10:00:00Z')
+
+        self.assertFalse(mm.exec_module()['changed'])
+        self.assertEqual(mm.client.post.call_count, 0)
+
+    def test_declaration_cache_changed_on_device(self, *args):
+        cache = os.path.join(tempfile.mkdtemp(), 'as3.json')
+        self.addCleanup(shutil.rmtree, os.path.dirname(cache))
+
+        mm = self.declaration_cache_manager(cache)
+        mm.client.get.side_effect = self.as3_device_get('2026-10-01T10:00:00Z')
+        mm.client.post.return_value = {'code': 200, 'contents': {'results': [{'message': 'no change'}]}}
+        mm.exec_module()
+
+        # The declaration was changed on the device since it was recorded.
+        mm = self.declaration_cache_manager(cache)
+        mm.client.reset_mock()
+        mm.client.get.side_effect = self.as3_device_get('2026-10-02T08:30:00Z')
+        mm.client.post.return_value = {'code': 200, 'contents': {'results': [{'message': 'success'}]}}
+        mm.upsert_on_device = Mock(return_value=True)
+
+        self.assertTrue(mm.exec_module()['changed'])
+        self.assertEqual(mm.client.post.call_count, 1)
+        with open(cache) as fh:
+            entry = json.load(fh)['a1b2c3/Sample_01']
+        self.assertEqual(entry['generation']['timestamp'], '2026-10-02T08:30:00Z')
+
+    def declarations_manager(self, **kwargs):
+        args = dict(
+            declarations=[
+                dict(tenant='Sample_01', content=load_fixture('as3_declare.json')),
+                dict(tenant='Sample_02', content=json.dumps(load_fixture('as3_declare.json'))),
+                dict(tenant='Sample_03', content=load_fixture('as3_declare.json')),
+            ],
+            max_concurrency=2,
+        )
+        args.update(kwargs)
+        set_module_args(args)
+        module = AnsibleModule(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode,
+            required_if=self.spec.required_if,
+            mutually_exclusive=self.spec.mutually_exclusive
+        )
+        mm = ModuleManager(module=module)
+        mm.client.reset_mock()
+        polls = dict()
+
+        def submit(uri, data=None, **kw):
+            tenant = uri.split('/')[-1].split('?')[0]
+            return {'code': 202, 'contents': {'id': 'task-{0}'.format(tenant)}}
+
+        def task(uri, **kw):
+            tenant = uri.split('task-')[-1]
+            polls[tenant] = polls.get(tenant, 0) + 1
+            if polls[tenant] < 2:
+                return {'code': 200, 'contents': {'results': [{'code': 0, 'message': 'in progress'}]}}
+            if tenant == 'Sample_02':
+                return {'code': 200, 'contents': {'results': [{'code': 200, 'message': 'no change'}]}}
+            return {'code': 200, 'contents': {'results': [{'code': 200, 'message': 'success'}]}}
+
+        mm.client.post.side_effect = submit
+        mm.client.delete.side_effect = submit
+        mm.client.get.side_effect = task
+        return mm, polls
+
+    def test_deploy_declarations(self, *args):
+        mm, polls = self.declarations_manager()
+
+        results = mm.exec_module()
+
+        self.assertTrue(results['changed'])
+        self.assertEqual(results['tenant_results'], [
+            dict(tenant='Sample_01', changed=True, message='success'),
+            dict(tenant='Sample_02', changed=False, message='no change'),
+            dict(tenant='Sample_03', changed=True, message='success'),
+        ])
+        self.assertEqual(mm.client.post.call_count, 3)
+        self.assertEqual(polls, dict(Sample_01=2, Sample_02=2, Sample_03=2))
+        # All tenants are polled in the same loop.
+        self.assertEqual(results['task_polling']['polls'], 2)
+
+    def test_remove_declarations(self, *args):
+        mm, polls = self.declarations_manager(
+            declarations=[dict(tenant='Sample_01'), dict(tenant='Sample_03')], state='absent'
+        )
+
+        results = mm.exec_module()
+
+        self.assertTrue(results['changed'])
+        self.assertEqual(mm.client.delete.call_count, 2)
+        self.assertEqual(mm.client.post.call_count, 0)
+
+    def test_deploy_declarations_reports_failed_tenants(self, *args):
+        mm, polls = self.declarations_manager()
+        submit = mm.client.post.side_effect
+
+        def post(uri, data=None, **kw):
+            if 'Sample_03' in uri:
+                return {'code': 422, 'contents': 'declaration is invalid'}
+            return submit(uri, data)
+
+        mm.client.post.side_effect = post
+
+        with self.assertRaises(F5ModuleError) as err:
+            mm.exec_module()
+
+        self.assertIn('AS3 declarations failed for tenants: Sample_03: declaration is invalid', str(err.exception))
+        self.assertNotIn('Sample_03', polls)
+
     def test_upsert_tenant_declaration_generates_errors(self, *args):
         declaration = load_fixture('as3_declaration_invalid.json')
         set_module_args(dict(
@@ -277,6 +429,33 @@ class TestManager(unittest.TestCase):
 
         self.assertFalse(results['changed'])
 
+    def test_upsert_on_device_retries_busy_task_status(self, *args):
+        set_module_args(dict(
+            content='{}',
+            tenant='fake_tenent',
+            state='present',
+        ))
+
+        module = AnsibleModule(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode,
+            required_if=self.spec.required_if
+        )
+        mm = ModuleManager(module=module)
+        mm.exists = Mock(return_value=False)
+        mm.client.post.return_value = {'code': 200, 'contents': {'id': 1}}
+        mm.client.get.side_effect = [
+            {'code': 503, 'contents': {}, 'headers': [('Retry-After', '3')]},
+            {'code': 200, 'contents': {'results': [{'code': 0, 'message': 'in progress'}]}},
+            {'code': 200, 'contents': {'results': [{'code': 200, 'message': 'success'}]}},
+        ]
+
+        results = mm.exec_module()
+
+        self.assertTrue(results['changed'])
+        self.assertEqual(results['task_polling']['polls'], 3)
+        self.assertEqual(results['task_polling']['busy_responses'], 1)
+
     def test_upsert_on_device_timeout(self, *args):
         set_module_args(dict(
             content='{}',
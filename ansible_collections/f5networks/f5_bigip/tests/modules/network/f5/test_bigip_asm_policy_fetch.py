@@ -347,10 +347,12 @@ class TestManager(unittest.TestCase):
                 'items': [
                     {
                         'name': 'fake_policy',
+                        'partition': 'Common',
                         'selfLink': 'https://selflink1'
                     },
                     {
                         'name': 'fake_policy2',
+                        'partition': 'Common',
                         'selfLink': 'https://selflink2'
                     }
                 ]
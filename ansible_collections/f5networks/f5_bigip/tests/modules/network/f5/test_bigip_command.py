@@ -15,12 +15,14 @@ if sys.version_info < (2, 7):
     pytestmark = pytest.mark.skip("F5 Ansible modules require Python >= 2.7")
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.parsing import Conditional
 
 from ansible_collections.f5networks.f5_bigip.plugins.modules import bigip_command
 from ansible_collections.f5networks.f5_bigip.plugins.modules.bigip_command import (
     Parameters, ModuleManager, V1Manager, V2Manager, BaseManager, ArgumentSpec
 )
 
+from ansible_collections.f5networks.f5_bigip.plugins.module_utils.commands import referenced_commands
 from ansible_collections.f5networks.f5_bigip.plugins.module_utils.common import F5ModuleError
 
 from ansible_collections.f5networks.f5_bigip.tests.compat import unittest
@@ -465,3 +467,94 @@ class TestManager(unittest.TestCase):
         res5 = m1._execute(commands=['list ltm profile html'])
 
         self.assertDictEqual(res5, dict(command="modify cli preference pager disabled"))
+
+    def test_batched_commands(self, *args):
+        set_module_args(dict(
+            commands=[
+                "tmsh show sys version",
+                "list ltm virtual",
+                "list ltm pool",
+            ],
+            batch=True
+        ))
+
+        module = AnsibleModule(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode
+        )
+
+        def post(uri, data=None):
+            delimiter = data['utilCmdArgs'].split('echo ')[1].split(';')[0]
+            output = 'Sys::Version\n{0}\nltm virtual vs1 {{ }}\n{0}\n{0}\n'.format(delimiter)
+            return dict(code=200, contents=dict(commandResult=output))
+
+        m1 = V2Manager(module=module)
+        m1.client.post.side_effect = post
+
+        mm = ModuleManager(module=module)
+        mm.get_manager = Mock(return_value=m1)
+
+        results = mm.exec_module()
+
+        self.assertEqual(m1.client.post.call_count, 1)
+        script = m1.client.post.call_args[1]['data']['utilCmdArgs']
+        self.assertEqual(script.count('tmsh -c'), 3)
+        self.assertEqual(results['stdout'], ['Sys::Version', 'ltm virtual vs1 { }', ''])
+
+    def test_batched_commands_output_missing(self, *args):
+        set_module_args(dict(
+            commands=["show sys version", "list ltm virtual"],
+            batch=True
+        ))
+
+        module = AnsibleModule(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode
+        )
+
+        m1 = V2Manager(module=module)
+        m1.client.post.return_value = dict(code=200, contents=dict(commandResult='killed'))
+
+        with self.assertRaises(F5ModuleError) as err:
+            m1.execute_batch_on_device([dict(command='a'), dict(command='b')])
+
+        self.assertIn('The output of 0 of the 2 batched commands', str(err.exception))
+
+    def test_batched_wait_for_reruns_referenced_commands(self, *args):
+        set_module_args(dict(
+            commands=[
+                "show sys version",
+                "show cm sync-status",
+                "list ltm virtual",
+            ],
+            wait_for=["result[1] contains In Sync"],
+            batch=True
+        ))
+
+        module = AnsibleModule(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode
+        )
+
+        m1 = V2Manager(module=module)
+        m1.execute_batch_on_device = Mock(side_effect=[
+            ['BIG-IP', 'Changes Pending', 'vs1'],
+            ['Changes Pending'],
+            ['In Sync'],
+        ])
+
+        mm = ModuleManager(module=module)
+        mm.get_manager = Mock(return_value=m1)
+
+        results = mm.exec_module()
+
+        self.assertEqual(results['stdout'], ['BIG-IP', 'In Sync', 'vs1'])
+        calls = m1.execute_batch_on_device.call_args_list
+        self.assertEqual(len(calls[0][0][0]), 3)
+        self.assertEqual([x[0][0] for x in calls[1:]], [[calls[0][0][0][1]]] * 2)
+
+    def test_referenced_commands(self, *args):
+        conditionals = [Conditional('result[2] contains a'), Conditional('result[0] contains b')]
+        self.assertEqual(referenced_commands(conditionals, 3), [0, 2])
+        self.assertEqual(referenced_commands([Conditional('result contains a')], 3), [0, 1, 2])
+        self.assertEqual(referenced_commands([Conditional('result[5] contains a')], 3), [0, 1, 2])
@@ -354,18 +354,23 @@ class TestManager(unittest.TestCase):
         mm = ModuleManager(module=module)
 
         # Override methods to force specific logic in the module to happen
+        mcp_state = {'code': 200, 'contents': load_fixture('load_sys_mcp_state.json')}
         mm.client.get.side_effect = [
             {'code': 200},
+            mcp_state,
             {'code': 200},
             {'code': 503},
             {'code': 200},
+            mcp_state,
             {'code': 200, 'contents': {'_taskState': 'COMPLETED'}},
         ]
 
         results = mm.exec_module()
 
         self.assertTrue(results['changed'])
-        self.assertEqual(mm.client.get.call_count, 5)
+        self.assertEqual(mm.client.get.call_count, 7)
+        self.assertEqual(mm.client.get.call_args_list[1][0][0], '/mgmt/tm/sys/mcp-state')
+        self.assertEqual(results['readiness'], dict(ready=True, stage=None, probes=2, waited=0.0))
 
     def test_taskid_device_not_ready(self, *args):
         task_id = "e7550a12-994b-483f-84ee-761eb9af6750"
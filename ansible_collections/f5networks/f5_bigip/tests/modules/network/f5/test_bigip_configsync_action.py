@@ -13,7 +13,7 @@ from ansible.module_utils.basic import AnsibleModule
 
 from ansible_collections.f5networks.f5_bigip.plugins.modules import bigip_configsync_action
 from ansible_collections.f5networks.f5_bigip.plugins.modules.bigip_configsync_action import (
-    Parameters, ModuleManager, ArgumentSpec, ModuleParameters
+    Parameters, ModuleManager, ArgumentSpec, ModuleParameters, SyncStatusWatcher, group_statuses
 )
 from ansible_collections.f5networks.f5_bigip.plugins.module_utils.common import F5ModuleError
 from ansible_collections.f5networks.f5_bigip.tests.compat import unittest
@@ -26,6 +26,20 @@ fixture_path = os.path.join(os.path.dirname(__file__), 'fixtures')
 fixture_data = {}
 
 
+def sync_status(status, *details):
+    """Returns a sync status response, with its details keyed by position like the REST API does"""
+    entries = dict(status=dict(description=status))
+    if details:
+        entries['https://localhost/mgmt/tm/cm/syncStatus/0/details'] = dict(nestedStats=dict(entries=dict(
+            ('https://localhost/mgmt/tm/cm/syncStatus/0/details/{0}'.format(index), dict(
+                nestedStats=dict(entries=dict(details=dict(description=detail)))
+            )) for index, detail in reversed(list(enumerate(details)))
+        )))
+    return dict(code=200, contents=dict(entries={
+        'https://localhost/mgmt/tm/cm/sync-status/0': dict(nestedStats=dict(entries=entries))
+    }))
+
+
 def load_fixture(name):
     path = os.path.join(fixture_path, name)
 
@@ -123,11 +137,10 @@ class TestManager(unittest.TestCase):
         # Override methods to force specific logic in the module to happen
         mm.client.get.side_effect = [
             {'code': 200, 'contents': ''},
-            {'code': 200, 'contents': {'entries': {'http://localhost': {'nestedStats': {'entries': {'status': {'description': 'Standalone'}}}}}}},
-            {'code': 200, 'contents': {'entries': {'http://localhost': {'nestedStats': {'entries': {'status': {'description': 'Changes Pending'}}}}}}},
             {'code': 200, 'contents': {'entries': {'http://localhost': {'nestedStats': {'entries': {'status': {'description': 'Changes Pending'}}}}}}},
             {'code': 200, 'contents': {'entries': {'http://localhost': {'nestedStats': {'entries': {'status': {'description': 'Changes Pending'}}}}}}},
             {'code': 200, 'contents': {'entries': {'http://localhost': {'nestedStats': {'entries': {'status': {'description': 'Not All Devices Synced'}}}}}}},
+            {'code': 200, 'contents': {'entries': {'http://localhost': {'nestedStats': {'entries': {'status': {'description': 'Not All Devices Synced'}}}}}}},
             {'code': 200, 'contents': {'entries': {'http://localhost': {'nestedStats': {'entries': {'status': {'description': 'In Sync'}}}}}}}
         ]
         mm.client.post.return_value = {'code': 200}
@@ -135,7 +148,7 @@ class TestManager(unittest.TestCase):
         results = mm.exec_module()
 
         self.assertTrue(results['changed'])
-        self.assertEqual(mm.client.get.call_count, 7)
+        self.assertEqual(mm.client.get.call_count, 6)
         self.assertEqual(mm.client.post.call_count, 1)
 
     def test_device_group_prerequisites_failure(self, *args):
@@ -154,7 +167,7 @@ class TestManager(unittest.TestCase):
 
         # Override methods to force specific logic in the module to happen
         mm.client.get.side_effect = [{'code': 404}, {'code': 200}]
-        mm._get_status_from_resource = Mock(return_value='Awaiting Initial Sync')
+        mm._get_group_status = Mock(return_value='Awaiting Initial Sync')
 
         with self.assertRaises(F5ModuleError) as err1:
             mm.exec_module()
@@ -227,6 +240,7 @@ class TestManager(unittest.TestCase):
         mm._device_group_exists = Mock(return_value=True)
         mm._sync_to_group_required = Mock(return_value=False)
         mm.exists = Mock(return_value=False)
+        mm._get_group_status = Mock(return_value='Changes Pending')
         mm._get_status_from_resource = Mock(side_effect=['Disconnected', 'device is in unexpected state'])
         mm.client.post.side_effect = [
             {'code': 503, 'contents': 'Unable to execute config-sync on device'},
@@ -273,52 +287,6 @@ class TestManager(unittest.TestCase):
 
         self.assertIn('Unable to check sync status on device', err.exception.args[0])
 
-    @patch.object(bigip_configsync_action, 'HAS_OBJPATH', False)
-    def test_get_details_from_resource_failure(self, * args):
-        set_module_args(dict(
-            sync_group_to_device='yes',
-            device_group='foo'
-        ))
-
-        module = AnsibleModule(
-            argument_spec=self.spec.argument_spec,
-            supports_check_mode=self.spec.supports_check_mode,
-            mutually_exclusive=self.spec.mutually_exclusive,
-            required_one_of=self.spec.required_one_of
-        )
-
-        mm = ModuleManager(module=module)
-        mm.read_current_from_device = Mock(return_value={'entries': {}})
-
-        with self.assertRaises(F5ModuleError) as err:
-            mm._get_details_from_resource()
-
-        self.assertIn(
-            'objectpath module required, install objectpath module to continue.',
-            err.exception.args[0]
-        )
-
-    @patch.object(bigip_configsync_action, 'HAS_OBJPATH', False)
-    @patch.object(bigip_configsync_action, 'Connection')
-    @patch.object(bigip_configsync_action.ModuleManager, 'exec_module',
-                  Mock(return_value={'changed': False}))
-    def test_main_object_path_missing(self, *args):
-        set_module_args(dict(
-            sync_device_to_group='yes',
-            device_group="foo"
-        )
-        )
-
-        with self.assertRaises(AnsibleFailJson) as result:
-            bigip_configsync_action.HAS_OBJPATH_IMPORT_ERROR = "Failed to import the objectpath package."
-            bigip_configsync_action.main()
-
-        self.assertTrue(result.exception.args[0]['failed'])
-        self.assertIn(
-            'Failed to import the required Python library (objectpath)',
-            result.exception.args[0]['msg']
-        )
-
     @patch.object(bigip_configsync_action, 'Connection')
     @patch.object(bigip_configsync_action.ModuleManager, 'exec_module',
                   Mock(return_value={'changed': False}))
@@ -350,3 +318,173 @@ class TestManager(unittest.TestCase):
 
         self.assertTrue(result.exception.args[0]['failed'])
         self.assertIn('This module has failed', result.exception.args[0]['msg'])
+
+
+class TestSyncStatusWatcher(unittest.TestCase):
+    def setUp(self):
+        self.p1 = patch('time.sleep')
+        self.m1 = self.p1.start()
+
+    def tearDown(self):
+        self.p1.stop()
+
+    def test_group_statuses(self):
+        details = [
+            'bigip1.example.com: connected (for 3600 seconds)',
+            'dg1 (In Sync): All devices in the device group are in sync',
+            'dg2 (Changes Pending): There is a possible change conflict between bigip1 and bigip2.',
+            ' - Recommended action: Synchronize bigip1 to group dg2',
+        ]
+        result = group_statuses(details)
+
+        assert result['dg1'] == ('In Sync', [details[1]])
+        assert result['dg2'] == ('Changes Pending', details[2:])
+        assert 'bigip1.example.com' not in result
+
+    def test_groups_in_sync_at_different_times(self):
+        responses = [
+            ('Not All Devices Synced', ['dg1 (In Sync): synced', 'dg2 (Not All Devices Synced): syncing']),
+            ('Not All Devices Synced', ['dg1 (In Sync): synced', 'dg2 (Not All Devices Synced): syncing']),
+            ('Not All Devices Synced', ['dg1 (In Sync): synced', 'dg2 (Not All Devices Synced): syncing']),
+        ]
+        read_status = Mock(side_effect=['Not All Devices Synced'] * 3 + ['In Sync'])
+        read_details = Mock(side_effect=responses)
+
+        SyncStatusWatcher(read_status, read_details, ['dg1', 'dg2']).wait()
+
+        assert read_status.call_count == 4
+        assert read_details.call_count == 3
+        # the interval grows while the status does not change
+        assert [x[0][0] for x in self.m1.call_args_list] == [1, 1, 1.5, 2.25]
+
+    def test_group_failure_detected_from_its_own_details(self):
+        read_status = Mock(return_value='Changes Pending')
+        read_details = Mock(return_value=('Changes Pending', [
+            'dg1 (In Sync): synced',
+            'dg2 (Changes Pending): There is a possible change conflict.',
+            ' - Recommended action: Synchronize bigip1 to group dg2',
+        ]))
+        watcher = SyncStatusWatcher(read_status, read_details, ['dg1', 'dg2'], grace=-1)
+
+        with self.assertRaises(F5ModuleError) as err:
+            watcher.wait()
+
+        assert 'Recommended action: Synchronize bigip1 to group dg2' in str(err.exception)
+
+    def test_timeout(self):
+        read_status = Mock(return_value='Not All Devices Synced')
+        read_details = Mock(return_value=('Not All Devices Synced', []))
+        watcher = SyncStatusWatcher(read_status, read_details, ['dg1'], timeout=-1)
+
+        with self.assertRaises(F5ModuleError) as err:
+            watcher.wait()
+
+        assert 'Timed out waiting for the device groups to be in sync: dg1 (Not All Devices Synced)' in str(err.exception)
+
+
+class TestManyGroups(unittest.TestCase):
+    def setUp(self):
+        self.spec = ArgumentSpec()
+        self.p1 = patch('time.sleep')
+        self.p1.start()
+        self.p2 = patch('ansible_collections.f5networks.f5_bigip.plugins.modules.bigip_configsync_action.send_teem')
+        self.p2.start()
+        self.p3 = patch('ansible_collections.f5networks.f5_bigip.plugins.modules.bigip_configsync_action.F5Client')
+        self.m3 = self.p3.start()
+        self.m3.return_value = MagicMock()
+
+    def tearDown(self):
+        self.p1.stop()
+        self.p2.stop()
+        self.p3.stop()
+
+    def module(self, **kwargs):
+        set_module_args(kwargs)
+        return AnsibleModule(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode,
+            mutually_exclusive=self.spec.mutually_exclusive,
+            required_one_of=self.spec.required_one_of
+        )
+
+    def test_sync_pending_groups_and_watch_them_together(self, *args):
+        module = self.module(sync_device_to_group='yes', device_groups=['dg1', 'dg2', 'dg3'])
+        mm = ModuleManager(module=module)
+        pending = sync_status(
+            'Changes Pending',
+            'dg1 (Changes Pending): There is a possible change conflict.',
+            'dg2 (In Sync): All devices in the device group are in sync',
+            'dg3 (Changes Pending): There is a possible change conflict.',
+        )
+        syncing = sync_status(
+            'Not All Devices Synced',
+            'dg1 (In Sync): All devices in the device group are in sync',
+            'dg2 (In Sync): All devices in the device group are in sync',
+            'dg3 (Not All Devices Synced): Sync is in progress.',
+        )
+        mm.client.get.side_effect = [
+            dict(code=200, contents={}), dict(code=200, contents={}), dict(code=200, contents={}),
+            pending, pending,
+            syncing, syncing,
+            sync_status('In Sync'),
+        ]
+        mm.client.post.return_value = dict(code=200)
+
+        results = mm.exec_module()
+
+        assert results['changed'] is True
+        assert results['synced_groups'] == ['dg1', 'dg3']
+        assert [x[1]['data']['utilCmdArgs'].strip() for x in mm.client.post.call_args_list] == [
+            'config-sync to-group dg1', 'config-sync to-group dg3'
+        ]
+        uris = [x[0][0] for x in mm.client.get.call_args_list]
+        assert uris[3] == '/mgmt/tm/cm/sync-status/?$select=status'
+        assert uris[4] == '/mgmt/tm/cm/sync-status/'
+
+    def test_single_group_in_sync_while_another_group_is_pending(self, *args):
+        module = self.module(sync_device_to_group='yes', device_group='dg2')
+        mm = ModuleManager(module=module)
+        pending = sync_status(
+            'Changes Pending',
+            'dg1 (Changes Pending): There is a possible change conflict.',
+            'dg2 (In Sync): All devices in the device group are in sync',
+        )
+        mm.client.get.side_effect = [dict(code=200, contents={}), pending, pending]
+
+        results = mm.exec_module()
+
+        assert results['changed'] is False
+        assert mm.client.post.call_count == 0
+
+    def test_all_groups_in_sync(self, *args):
+        module = self.module(sync_group_to_device='yes', device_groups=['dg1', 'dg2'])
+        mm = ModuleManager(module=module)
+        mm.client.get.side_effect = [
+            dict(code=200, contents={}), dict(code=200, contents={}), sync_status('In Sync'),
+        ]
+
+        results = mm.exec_module()
+
+        assert results['changed'] is False
+        assert mm.client.post.call_count == 0
+
+    def test_missing_groups(self, *args):
+        module = self.module(sync_group_to_device='yes', device_groups=['dg1', 'dg2'])
+        mm = ModuleManager(module=module)
+        mm.client.get.side_effect = [dict(code=404), dict(code=200, contents={})]
+
+        with self.assertRaises(F5ModuleError) as err:
+            mm.exec_module()
+
+        assert "The specified 'device_groups' do not exist: dg1" in str(err.exception)
+
+    def test_status_read_without_select_when_ignored(self, *args):
+        module = self.module(sync_group_to_device='yes', device_group='dg1')
+        mm = ModuleManager(module=module)
+        mm.client.get.side_effect = [dict(code=200, contents=dict(entries={})), sync_status('In Sync')]
+
+        assert mm._get_status_from_resource() == 'In Sync'
+        assert mm.select_status is False
+        assert [x[0][0] for x in mm.client.get.call_args_list] == [
+            '/mgmt/tm/cm/sync-status/?$select=status', '/mgmt/tm/cm/sync-status/'
+        ]
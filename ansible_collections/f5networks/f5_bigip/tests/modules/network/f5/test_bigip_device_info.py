@@ -8,13 +8,17 @@ __metaclass__ = type
 
 import os
 import json
+import shutil
+import tempfile
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.six import iteritems
 
 from ansible_collections.f5networks.f5_bigip.plugins.modules.bigip_device_info import (
-    Parameters, VirtualAddressesFactManager, ArgumentSpec, ModuleManager
+    Parameters, VirtualAddressesFactManager, VirtualServersFactManager, VirtualAddressesParameters,
+    LtmPoolsFactManager, ArgumentSpec, ModuleManager
 )
+from ansible_collections.f5networks.f5_bigip.plugins.module_utils.common import F5ModuleError
 from ansible_collections.f5networks.f5_bigip.tests.compat import unittest
 from ansible_collections.f5networks.f5_bigip.tests.compat.mock import Mock, patch
 from ansible_collections.f5networks.f5_bigip.tests.modules.utils import set_module_args
@@ -49,6 +53,28 @@ class FakeVirtualAddress:
             setattr(self, key, value)
 
 
+def skip_of(uri):
+    return int(uri.split('$skip=')[1].split('&')[0])
+
+
+def top_of(uri):
+    return int(uri.split('$top=')[1].split('&')[0])
+
+
+def paged_collection(count, generation=1):
+    """Returns a client get side effect serving a collection of virtual addresses one page at a time"""
+    items = [
+        dict(name='addr{0}'.format(x), fullPath='/Common/addr{0}'.format(x), generation=generation)
+        for x in range(count)
+    ]
+
+    def get(uri):
+        skip = skip_of(uri)
+        page = items[skip:skip + top_of(uri)]
+        return dict(code=200, contents=dict(items=page, totalItems=count))
+    return get
+
+
 class TestParameters(unittest.TestCase):
     def test_module_parameters(self):
         args = dict(
@@ -72,11 +98,15 @@ class TestManager(unittest.TestCase):
         self.p3 = patch('ansible_collections.f5networks.f5_bigip.plugins.modules.bigip_device_info.packages_installed')
         self.m3 = self.p3.start()
         self.m3.return_value = []
+        self.p4 = patch('ansible_collections.f5networks.f5_bigip.plugins.modules.bigip_device_info.perf_report')
+        self.m4 = self.p4.start()
+        self.m4.return_value = {}
 
     def tearDown(self):
         self.p1.stop()
         self.p2.stop()
         self.p3.stop()
+        self.p4.stop()
 
     def test_get_trunk_facts(self, *args):
         set_module_args(dict(
@@ -103,3 +133,299 @@ class TestManager(unittest.TestCase):
         assert results['queried'] is True
         assert 'virtual_addresses' in results
         assert len(results['virtual_addresses']) > 0
+
+    def test_get_facts_over_multiple_pages(self, *args):
+        set_module_args(dict(
+            gather_subset=['virtual-addresses'],
+            data_increment=1
+        ))
+
+        fixture1 = load_fixture('load_ltm_virtual_address_collection_1.json')
+        pages = []
+        for address in ['3.3.3.3', '1.1.1.1', '2.2.2.2']:
+            item = dict(fixture1['items'][0], name=address, fullPath='/Common/{0}'.format(address), address=address)
+            pages.append([item])
+
+        module = AnsibleModule(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode
+        )
+
+        tm = VirtualAddressesFactManager(module=module)
+        tm.read_collection_from_device = Mock(side_effect=pages + [[]])
+
+        # Pages are only requested when the previous page has been consumed.
+        collection = tm.increment_read()
+        assert next(collection)['name'] == '3.3.3.3'
+        tm.read_collection_from_device.assert_called_once_with(skip=0, size=1, page={})
+
+        tm.read_collection_from_device.reset_mock(side_effect=True)
+        tm.read_collection_from_device.side_effect = pages + [[]]
+
+        mm = ModuleManager(module=module)
+        mm.get_manager = Mock(return_value=tm)
+
+        results = mm.exec_module()
+
+        assert results['queried'] is True
+        assert [x['full_path'] for x in results['virtual_addresses']] == [
+            '/Common/1.1.1.1', '/Common/2.2.2.2', '/Common/3.3.3.3'
+        ]
+        assert [x.kwargs['skip'] for x in tm.read_collection_from_device.call_args_list] == [0, 1, 2, 3]
+
+    def test_get_virtual_server_facts_with_bulk_stats(self, *args):
+        set_module_args(dict(
+            gather_subset=['virtual-servers'],
+            bulk_stats='yes'
+        ))
+
+        collection = [
+            dict(name='vs2', fullPath='/Common/vs2', destination='/Common/10.10.10.2:443',
+                 profilesReference=dict(), policiesReference=dict(items=[])),
+            dict(name='vs1', fullPath='/Common/vs1', destination='/Common/10.10.10.1:80',
+                 profilesReference=dict(), policiesReference=dict(items=[])),
+        ]
+
+        module = AnsibleModule(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode
+        )
+
+        tm = VirtualServersFactManager(module=module, client=Mock())
+        tm.read_collection_from_device = Mock(side_effect=[collection, []])
+        tm.read_stats_from_device = Mock()
+        tm.client.get.return_value = dict(code=200, contents=load_fixture('load_ltm_virtual_stats_collection.json'))
+
+        mm = ModuleManager(module=module)
+        mm.get_manager = Mock(return_value=tm)
+
+        results = mm.exec_module()
+
+        assert results['queried'] is True
+        assert [x['full_path'] for x in results['virtual_servers']] == ['/Common/vs1', '/Common/vs2']
+        assert results['virtual_servers'][0]['availability_status'] == 'unknown'
+        assert results['virtual_servers'][1]['destination_port'] == 443
+        tm.client.get.assert_called_once_with('/mgmt/tm/ltm/virtual/stats')
+        tm.read_stats_from_device.assert_not_called()
+
+    def test_expanded_empty_pools_do_not_read_members(self, *args):
+        set_module_args(dict(
+            gather_subset=['ltm-pools'],
+            bulk_stats='yes'
+        ))
+
+        module = AnsibleModule(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode
+        )
+
+        member = dict(name='10.0.0.1:80', fullPath='/Common/10.0.0.1:80')
+        link = 'https://localhost/mgmt/tm/ltm/pool/~Common~{0}/members'
+        pools = [
+            dict(name='empty', fullPath='/Common/empty',
+                 membersReference=dict(link=link.format('empty'), isSubcollection=True)),
+            dict(name='web', fullPath='/Common/web',
+                 membersReference=dict(link=link.format('web'), isSubcollection=True, items=[member])),
+        ]
+
+        tm = LtmPoolsFactManager(module=module, client=Mock())
+        tm.client.get.return_value = dict(code=200, contents=dict(items=pools))
+
+        items = tm.read_collection_from_device()
+
+        assert [tm.read_expanded_members(x) for x in items] == [[], [member]]
+
+    def test_get_facts_concurrently(self, *args):
+        set_module_args(dict(
+            gather_subset=['virtual-addresses', 'vlans', 'trunks'],
+            max_concurrency=3
+        ))
+
+        module = AnsibleModule(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode
+        )
+
+        managers = dict(
+            trunks=Mock(exec_module=Mock(return_value=dict(trunks=[]))),
+            vlans=Mock(exec_module=Mock(return_value=dict(vlans=[dict(name='vlan1')]))),
+            virtual_addresses=Mock(exec_module=Mock(return_value=dict(virtual_addresses=[dict(name='1.1.1.1')]))),
+        )
+
+        mm = ModuleManager(module=module)
+        mm.get_manager = Mock(side_effect=lambda name: managers[name.replace('-', '_')])
+
+        results = mm.exec_module()
+
+        assert results['queried'] is True
+        assert list(results.keys()) == ['trunks', 'virtual_addresses', 'vlans', 'queried']
+        assert results['vlans'] == [dict(name='vlan1')]
+        for manager in managers.values():
+            assert manager.provisioned_modules == ['ltm', 'gtm', 'asm']
+            manager.exec_module.assert_called_once()
+
+    def test_invalid_max_concurrency_raises(self, *args):
+        set_module_args(dict(
+            gather_subset=['virtual-addresses'],
+            max_concurrency=0
+        ))
+
+        module = AnsibleModule(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode
+        )
+
+        mm = ModuleManager(module=module)
+
+        with self.assertRaises(F5ModuleError) as err:
+            mm.exec_module()
+
+        assert "The 'max_concurrency' value must be greater than or equal to 1." in str(err.exception)
+
+    def test_minimal_fields_select_query(self, *args):
+        set_module_args(dict(
+            gather_subset=['virtual-servers'],
+            minimal_fields='yes'
+        ))
+
+        module = AnsibleModule(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode
+        )
+
+        tm = VirtualServersFactManager(module=module, client=Mock())
+        tm.client.get.return_value = dict(code=200, contents=dict(items=[]))
+        tm.read_collection_from_device()
+
+        uri = tm.client.get.call_args[0][0]
+        fields = uri.split('&$select=')[1].split(',')
+        assert uri.startswith('/mgmt/tm/ltm/virtual?expandSubcollections=true&$top=10&$skip=0')
+        assert fields == sorted(fields)
+        for field in ['fullPath', 'destination', 'profilesReference', 'policiesReference', 'ipForward', 'mask']:
+            assert field in fields
+        assert 'full_path' not in fields
+
+    def test_minimal_fields_disabled_by_default(self, *args):
+        set_module_args(dict(
+            gather_subset=['virtual-servers'],
+        ))
+
+        module = AnsibleModule(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode
+        )
+
+        tm = VirtualServersFactManager(module=module, client=Mock())
+        tm.client.get.return_value = dict(code=200, contents=dict(items=[]))
+        tm.read_collection_from_device()
+
+        assert '$select' not in tm.client.get.call_args[0][0]
+
+    def test_selected_fields_return_the_same_facts(self, *args):
+        collection = load_fixture('load_ltm_virtual_address_collection_1.json')['items']
+        fields = VirtualAddressesParameters.select_fields()
+
+        for item in collection:
+            selected = dict((k, v) for k, v in iteritems(item) if k in fields)
+            assert len(selected) < len(item)
+            assert VirtualAddressesParameters(params=selected).to_return() == \
+                VirtualAddressesParameters(params=dict(item)).to_return()
+
+    def test_last_page_recognized_from_total_items(self, *args):
+        set_module_args(dict(
+            gather_subset=['virtual-addresses'],
+            data_increment=2
+        ))
+
+        module = AnsibleModule(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode
+        )
+
+        tm = VirtualAddressesFactManager(module=module, client=Mock())
+        tm.client.get.side_effect = paged_collection(3)
+
+        assert [x['name'] for x in tm.increment_read()] == ['addr0', 'addr1', 'addr2']
+        assert [skip_of(x[0][0]) for x in tm.client.get.call_args_list] == [0, 2]
+
+    def test_adaptive_paging_grows_page_size(self, *args):
+        set_module_args(dict(
+            gather_subset=['virtual-addresses'],
+            data_increment=2,
+            adaptive_paging='yes'
+        ))
+
+        module = AnsibleModule(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode
+        )
+
+        tm = VirtualAddressesFactManager(module=module, client=Mock())
+        tm.client.get.side_effect = paged_collection(20)
+
+        assert [x['name'] for x in tm.increment_read()] == ['addr{0}'.format(x) for x in range(20)]
+        uris = [x[0][0] for x in tm.client.get.call_args_list]
+        assert [skip_of(x) for x in uris] == [0, 2, 6, 14]
+        assert [top_of(x) for x in uris] == [2, 4, 8, 16]
+
+    def test_page_read_with_its_own_size_and_paging_information(self, *args):
+        set_module_args(dict(
+            gather_subset=['virtual-addresses'],
+            data_increment=2
+        ))
+
+        module = AnsibleModule(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode
+        )
+
+        tm = VirtualAddressesFactManager(module=module, client=Mock())
+        tm.client.get.side_effect = paged_collection(10)
+        page = dict()
+
+        items = tm.read_collection_from_device(skip=4, size=3, page=page)
+
+        assert [x['name'] for x in items] == ['addr4', 'addr5', 'addr6']
+        assert top_of(tm.client.get.call_args[0][0]) == 3
+        assert page['total_items'] == 10
+        assert tm.data_increment == 2
+
+    def test_snapshot_reused_while_collection_unchanged(self, *args):
+        snapshot_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, snapshot_dir)
+        set_module_args(dict(
+            gather_subset=['virtual-addresses'],
+            snapshot_dir=snapshot_dir
+        ))
+
+        module = AnsibleModule(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode
+        )
+
+        def run(generation):
+            tm = VirtualAddressesFactManager(module=module, client=Mock(), subset='virtual-addresses')
+            tm.client.get.side_effect = paged_collection(3, generation)
+            mm = ModuleManager(module=module, connection=Mock(get_option=Mock(return_value='10.1.1.1')))
+            mm.get_manager = Mock(return_value=tm)
+            return mm.exec_module(), [x[0][0] for x in tm.client.get.call_args_list]
+
+        results, uris = run(1)
+        assert results['_f5_snapshots'] == dict(reused=[], refreshed=['virtual-addresses'])
+        assert [x['name'] for x in results['virtual_addresses']] == ['addr0', 'addr1', 'addr2']
+        assert uris[0].endswith('&$select=fullPath,generation,name')
+        assert len(uris) == 2
+        assert os.listdir(os.path.join(snapshot_dir, '10.1.1.1')) == ['virtual-addresses-Common.json']
+
+        cached, uris = run(1)
+        assert cached['_f5_snapshots'] == dict(reused=['virtual-addresses'], refreshed=[])
+        assert cached['virtual_addresses'] == results['virtual_addresses']
+        assert len(uris) == 1
+
+        results, uris = run(2)
+        assert results['_f5_snapshots'] == dict(reused=[], refreshed=['virtual-addresses'])
+        assert len(uris) == 2
+
+    def test_snapshot_not_used_for_stats_subsets(self, *args):
+        assert VirtualAddressesFactManager.snapshot is True
+        assert VirtualServersFactManager.snapshot is False
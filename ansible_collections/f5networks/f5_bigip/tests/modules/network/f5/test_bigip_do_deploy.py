@@ -21,6 +21,7 @@ from ansible_collections.f5networks.f5_bigip.plugins.module_utils.common import
 
 from ansible_collections.f5networks.f5_bigip.tests.compat import unittest
 from ansible_collections.f5networks.f5_bigip.tests.compat.mock import Mock, patch
+from ansible_collections.f5networks.f5_bigip.tests.utils.common import FakeClock
 from ansible_collections.f5networks.f5_bigip.tests.modules.utils import (
     set_module_args, AnsibleExitJson, AnsibleFailJson, fail_json, exit_json
 )
@@ -92,7 +93,7 @@ class TestManager(unittest.TestCase):
 
     def setUp(self):
         self.spec = ArgumentSpec()
-        self.p1 = patch('time.sleep')
+        self.p1 = FakeClock()
         self.p1.start()
         self.p2 = patch('ansible_collections.f5networks.f5_bigip.plugins.modules.bigip_do_deploy.F5Client')
         self.m2 = self.p2.start()
@@ -133,6 +134,7 @@ class TestManager(unittest.TestCase):
         self.assertTrue(results['changed'])
         self.assertEqual(results['task_id'], uuid)
         self.assertEqual(results['message'], "DO async task started with id: {0}".format(uuid))
+        mm.client.plugin.invalidate_metadata.assert_called_once_with(None)
 
     def test_check_declaration_task_status(self, *args):
         uuid = "e7550a12-994b-483f-84ee-761eb9af6750"
@@ -151,6 +153,7 @@ class TestManager(unittest.TestCase):
         mm.client.get.side_effect = [
             {'code': 300, 'contents': {}},
             {'code': 200},
+            {'code': 200},
             {'code': 202},
             {'code': 200, 'contents': {'result': {'status': 'FINISHED', 'message': 'success'}}}
         ]
@@ -159,7 +162,11 @@ class TestManager(unittest.TestCase):
 
         self.assertTrue(results['changed'])
         self.assertEqual(mm.want.timeout, (5.0, 100))
-        self.assertEqual(mm.client.get.call_count, 4)
+        self.assertEqual(mm.client.get.call_count, 5)
+        self.assertEqual(
+            mm.client.get.call_args_list[2][0][0], '/mgmt/shared/declarative-onboarding/available'
+        )
+        mm.client.plugin.invalidate_metadata.assert_called_once_with(None)
 
     def test_check_declaration_task_status_unit_restarts(self, *args):
         response = (400, None)
@@ -0,0 +1,321 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright: (c) 2026, F5 Networks Inc.
+# GNU General Public License v3.0 (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import datetime
+import json
+import os
+import re
+import shutil
+import ssl
+import tempfile
+import threading
+import time
+
+import pytest
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from ansible.module_utils.basic import AnsibleModule
+
+from ansible_collections.f5networks.f5_bigip.plugins.modules import bigip_fleet_command
+from ansible_collections.f5networks.f5_bigip.plugins.modules.bigip_fleet_command import (
+    ArgumentSpec, ModuleManager, DeviceClient
+)
+from ansible_collections.f5networks.f5_bigip.plugins.module_utils.common import F5ModuleError
+from ansible_collections.f5networks.f5_bigip.tests.compat import unittest
+from ansible_collections.f5networks.f5_bigip.tests.compat.mock import patch
+from ansible_collections.f5networks.f5_bigip.tests.modules.utils import (
+    set_module_args, AnsibleExitJson, AnsibleFailJson, exit_json, fail_json
+)
+
+x509 = pytest.importorskip('cryptography.x509')
+
+
+def create_certificate(path):
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    from cryptography.x509.oid import NameOID
+
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, u'localhost')])
+    now = datetime.datetime.utcnow()
+    cert = x509.CertificateBuilder().subject_name(name).issuer_name(name).public_key(
+        key.public_key()
+    ).serial_number(x509.random_serial_number()).not_valid_before(now).not_valid_after(
+        now + datetime.timedelta(days=1)
+    ).sign(key, hashes.SHA256())
+    certfile = os.path.join(path, 'cert.pem')
+    keyfile = os.path.join(path, 'key.pem')
+    with open(certfile, 'wb') as fh:
+        fh.write(cert.public_bytes(serialization.Encoding.PEM))
+    with open(keyfile, 'wb') as fh:
+        fh.write(key.private_bytes(
+            serialization.Encoding.PEM, serialization.PrivateFormat.TraditionalOpenSSL,
+            serialization.NoEncryption()
+        ))
+    return certfile, keyfile
+
+
+class MockDevice(ThreadingHTTPServer):
+    """A mock iControl REST server, answering logins, logouts and tmsh commands"""
+    daemon_threads = True
+    outputs = {
+        'show sys version': 'Sys::Version\n  Product  BIG-IP\n  Version  17.1.0',
+        'list ltm virtual': 'ltm virtual /Common/vs1 { }',
+    }
+
+    def __init__(self, context, latency=0.0, sync_after=0):
+        super(MockDevice, self).__init__(('127.0.0.1', 0), MockHandler)
+        self.socket = context.wrap_socket(self.socket, server_side=True)
+        self.latency = latency
+        self.sync_after = sync_after
+        self.lock = threading.Lock()
+        self.requests = []
+        self.tokens = set()
+        self.logouts = 0
+        self.sync_checks = 0
+        self.in_flight = 0
+
+    def run_command(self, command):
+        if command == 'show cm sync-status':
+            with self.lock:
+                self.sync_checks += 1
+                return 'In Sync' if self.sync_checks > self.sync_after else 'Changes Pending'
+        return self.outputs.get(command, '')
+
+    def run_script(self, script):
+        output = []
+        for part in script.split('; '):
+            match = re.match(r'^tmsh -c \\"(.*)\\"$', part.strip(';'))
+            if match:
+                output.append(self.run_command(match.group(1)) + '\n')
+            elif part.startswith('echo '):
+                output.append(part[5:].strip(';') + '\n')
+        return ''.join(output)
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def reply(self, code, contents):
+        body = json.dumps(contents).encode('utf-8')
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        device = self.server
+        payload = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        with device.lock:
+            device.requests.append(self.path)
+        if self.path == '/mgmt/shared/authn/login':
+            if payload['password'] != 'secret':
+                return self.reply(401, dict(code=401, message='Authentication failed.'))
+            token = 'token{0}'.format(len(device.requests))
+            device.tokens.add(token)
+            return self.reply(200, dict(token=dict(token=token, timeout=1200)))
+        if self.headers.get('X-F5-Auth-Token') not in device.tokens:
+            return self.reply(401, dict(code=401, message='Unauthorized'))
+        if self.path == '/mgmt/tm/util/bash':
+            with device.lock:
+                device.in_flight += 1
+            try:
+                time.sleep(device.latency)
+                script = payload['utilCmdArgs'][len('-c "'):-1]
+                return self.reply(200, dict(kind='tm:util:bash:runstate', commandResult=device.run_script(script)))
+            finally:
+                with device.lock:
+                    device.in_flight -= 1
+        self.reply(404, dict(code=404, message='Not found'))
+
+    def do_DELETE(self):
+        device = self.server
+        token = self.path.rsplit('/', 1)[1]
+        with device.lock:
+            device.logouts += 1
+            device.tokens.discard(token)
+        self.reply(200, dict())
+
+
+class TestFleetCommand(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.mkdtemp()
+        cls.context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        cls.context.load_cert_chain(*create_certificate(cls.tmpdir))
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmpdir)
+
+    def setUp(self):
+        self.spec = ArgumentSpec()
+        self.p1 = patch('time.sleep')
+        self.m1 = self.p1.start()
+        self.devices = []
+
+    def tearDown(self):
+        self.p1.stop()
+        for device in self.devices:
+            device.shutdown()
+            device.server_close()
+
+    def start_device(self, **kwargs):
+        device = MockDevice(self.context, **kwargs)
+        thread = threading.Thread(target=device.serve_forever, kwargs=dict(poll_interval=0.05))
+        thread.daemon = True
+        thread.start()
+        self.devices.append(device)
+        return device
+
+    def module(self, **kwargs):
+        args = dict(
+            devices=[
+                dict(server='127.0.0.1', server_port=x.server_address[1], name='lb{0}'.format(i))
+                for i, x in enumerate(self.devices)
+            ],
+            user='admin',
+            password='secret',
+            validate_certs=False,
+        )
+        args.update(kwargs)
+        set_module_args(args)
+        return AnsibleModule(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode
+        )
+
+    def test_run_commands_on_all_devices(self, *args):
+        for x in range(3):
+            self.start_device()
+        module = self.module(commands=['tmsh show sys version', 'list ltm virtual'])
+
+        results = ModuleManager(module=module).exec_module()
+
+        assert results['changed'] is False
+        assert results['failed_devices'] == []
+        assert [x['name'] for x in results['results']] == ['lb0', 'lb1', 'lb2']
+        for result in results['results']:
+            assert result['stdout'] == [MockDevice.outputs['show sys version'], 'ltm virtual /Common/vs1 { }']
+            assert result['stdout_lines'][0][0] == 'Sys::Version'
+        for device in self.devices:
+            assert device.requests == ['/mgmt/shared/authn/login'] + ['/mgmt/tm/util/bash'] * 2
+            assert device.logouts == 1
+            assert not device.tokens
+
+    def test_devices_run_concurrently(self, *args):
+        self.p1.stop()
+        started = threading.Event()
+        peak = []
+        for x in range(4):
+            self.start_device(latency=0.3)
+
+        def watch():
+            while not started.is_set():
+                peak.append(sum(x.in_flight for x in self.devices))
+                time.sleep(0.01)
+
+        watcher = threading.Thread(target=watch)
+        watcher.start()
+        try:
+            module = self.module(commands=['show sys version'], max_concurrency=4)
+            results = ModuleManager(module=module).exec_module()
+        finally:
+            started.set()
+            watcher.join()
+            self.p1.start()
+
+        assert results['failed_devices'] == []
+        assert max(peak) > 1
+
+    def test_batched_wait_for_on_all_devices(self, *args):
+        self.start_device(sync_after=0)
+        self.start_device(sync_after=2)
+        module = self.module(
+            commands=['show sys version', 'show cm sync-status'],
+            wait_for=['result[1] contains In Sync'],
+            batch=True
+        )
+
+        results = ModuleManager(module=module).exec_module()
+
+        assert results['failed_devices'] == []
+        assert [x['stdout'][1] for x in results['results']] == ['In Sync', 'In Sync']
+        assert results['results'][1]['stdout'][0] == MockDevice.outputs['show sys version']
+        assert self.devices[0].requests.count('/mgmt/tm/util/bash') == 1
+        assert self.devices[1].requests.count('/mgmt/tm/util/bash') == 3
+        assert self.devices[1].sync_checks == 3
+
+    def test_failed_conditions_reported_per_device(self, *args):
+        self.start_device()
+        self.start_device(sync_after=100)
+        module = self.module(
+            commands=['show cm sync-status'],
+            wait_for=['result[0] contains In Sync'],
+            retries=3
+        )
+
+        results = ModuleManager(module=module).exec_module()
+
+        assert results['failed_devices'] == ['lb1']
+        assert results['results'][0]['failed'] is False
+        assert results['results'][1]['failed_conditions'] == ['result[0] contains In Sync']
+        assert self.devices[1].sync_checks == 3
+        assert self.devices[1].logouts == 1
+
+    def test_main_fails_on_device_errors(self, *args):
+        self.start_device()
+        self.start_device()
+        args = dict(
+            devices=[
+                dict(server='127.0.0.1', server_port=self.devices[0].server_address[1]),
+                dict(server='127.0.0.1', server_port=self.devices[1].server_address[1], name='bad',
+                     password='wrong'),
+            ],
+            user='admin',
+            password='secret',
+            validate_certs=False,
+            commands=['show sys version'],
+        )
+        set_module_args(args)
+
+        with patch.multiple(AnsibleModule, exit_json=exit_json, fail_json=fail_json):
+            with self.assertRaises(AnsibleFailJson) as err:
+                bigip_fleet_command.main()
+
+        result = err.exception.args[0]
+        assert result['msg'] == 'The commands failed on 1 of the 2 devices.'
+        assert result['failed_devices'] == ['bad']
+        assert result['results'][0]['name'] == '127.0.0.1'
+        assert 'Authentication process failed' in result['results'][1]['msg']
+        assert self.devices[1].requests == ['/mgmt/shared/authn/login']
+
+    def test_main_success(self, *args):
+        self.start_device()
+        self.module(commands=['create ltm node foo address 1.1.1.1'])
+
+        with patch.multiple(AnsibleModule, exit_json=exit_json, fail_json=fail_json):
+            with self.assertRaises(AnsibleExitJson) as result:
+                bigip_fleet_command.main()
+
+        assert result.exception.args[0]['changed'] is True
+
+    def test_invalid_max_concurrency_raises(self, *args):
+        module = self.module(devices=[dict(server='127.0.0.1')], commands=['show sys version'], max_concurrency=0)
+
+        with self.assertRaises(F5ModuleError) as err:
+            ModuleManager(module=module).exec_module()
+
+        assert "The 'max_concurrency' value must be greater than or equal to 1." in str(err.exception)
+
+    def test_ipv6_server_address(self, *args):
+        client = DeviceClient('2001:db8::1', 443, 'admin', 'secret')
+        assert client.url == 'https://[2001:db8::1]:443'
@@ -78,9 +78,13 @@ class TestMadmLocationManager(unittest.TestCase):
         self.p1 = patch('ansible_collections.f5networks.f5_bigip.plugins.modules.bigip_qkview.send_teem')
         self.m1 = self.p1.start()
         self.m1.return_value = True
+        self.p2 = patch('ansible_collections.f5networks.f5_bigip.plugins.modules.bigip_qkview.perf_report')
+        self.m2 = self.p2.start()
+        self.m2.return_value = {}
 
     def tearDown(self):
         self.p1.stop()
+        self.p2.stop()
 
     def test_create_qkview_default_options(self, *args):
         set_module_args(dict(
@@ -118,9 +122,13 @@ class TestBulkLocationManager(unittest.TestCase):
         self.p1 = patch('ansible_collections.f5networks.f5_bigip.plugins.modules.bigip_qkview.send_teem')
         self.m1 = self.p1.start()
         self.m1.return_value = True
+        self.p2 = patch('ansible_collections.f5networks.f5_bigip.plugins.modules.bigip_qkview.perf_report')
+        self.m2 = self.p2.start()
+        self.m2.return_value = {}
 
     def tearDown(self):
         self.p1.stop()
+        self.p2.stop()
 
     def test_create_qkview_default_options(self, *args):
         set_module_args(dict(
@@ -15,6 +15,7 @@ from ansible_collections.f5networks.f5_bigip.plugins.modules import bigip_securi
 from ansible_collections.f5networks.f5_bigip.plugins.modules.bigip_security_log_profile import (
     ModuleParameters, ApiParameters, ArgumentSpec, ModuleManager
 )
+from ansible_collections.f5networks.f5_bigip.plugins.module_utils.client import BatchRequest
 from ansible_collections.f5networks.f5_bigip.plugins.module_utils.common import F5ModuleError
 
 from ansible_collections.f5networks.f5_bigip.tests.compat import unittest
@@ -777,7 +778,8 @@ class TestManager(unittest.TestCase):
         # Override methods in the specific type of manager
         mm = ModuleManager(module=module)
         mm.exists = Mock(return_value=False)
-        mm.client.post = Mock(return_value=dict(code=200, contents={}))
+        mm.client.post = Mock(return_value=dict(code=200, contents={'transId': 1}))
+        mm.client.patch = Mock(return_value=dict(code=200, contents={'state': 'COMPLETED'}))
 
         results = mm.exec_module()
 
@@ -796,6 +798,14 @@ class TestManager(unittest.TestCase):
             results['protocol_inspection'], {'log_packet': 'yes', 'publisher': '/Common/local-db-publisher'}
         )
         self.assertEqual(results['dns_security'], expected)
+        self.assertEqual(mm.client.post.call_count, 3)
+        self.assertEqual(mm.client.post.call_args_list[0][0][0], '/mgmt/tm/transaction/')
+        self.assertEqual(
+            mm.client.post.call_args_list[2][0][0], '/mgmt/tm/security/log/profile/~Common~test_log_profile/protocol-dns/'
+        )
+        self.assertDictEqual(
+            mm.client.patch.call_args[1]['data'], {'state': 'VALIDATING', 'validateOnly': False}
+        )
 
     def test_create_log_security_profile_dns_security_no_change(self, *args):
         # Configure the arguments that would be sent to the Ansible module
@@ -939,7 +949,8 @@ class TestManager(unittest.TestCase):
         # Override methods in the specific type of manager
         mm = ModuleManager(module=module)
         mm.exists = Mock(return_value=False)
-        mm.client.post = Mock(return_value=dict(code=200, contents={}))
+        mm.client.post = Mock(return_value=dict(code=200, contents={'transId': 1}))
+        mm.client.patch = Mock(return_value=dict(code=200, contents={'state': 'COMPLETED'}))
 
         results = mm.exec_module()
 
@@ -1083,7 +1094,8 @@ class TestManager(unittest.TestCase):
         # Override methods in the specific type of manager
         mm = ModuleManager(module=module)
         mm.exists = Mock(return_value=False)
-        mm.client.post = Mock(return_value=dict(code=200, contents={}))
+        mm.client.post = Mock(return_value=dict(code=200, contents={'transId': 1}))
+        mm.client.patch = Mock(return_value=dict(code=200, contents={'state': 'COMPLETED'}))
 
         results = mm.exec_module()
 
@@ -1486,7 +1498,10 @@ class TestManager(unittest.TestCase):
             dict(code=200, contents=load_fixture('load_log_security_profile_dns_sec.json')),
             dict(code=404, contents={}), dict(code=404, contents={})
         ])
-        mm.client.patch = Mock(return_value=dict(code=200, contents={}))
+        mm.client.post = Mock(return_value=dict(code=200, contents={'transId': 1}))
+        mm.client.patch = Mock(side_effect=[
+            dict(code=200, contents={}), dict(code=200, contents={}), dict(code=200, contents={'state': 'COMPLETED'})
+        ])
 
         results = mm.exec_module()
 
@@ -2177,15 +2192,21 @@ class TestManager(unittest.TestCase):
         ])
 
         with self.assertRaises(F5ModuleError) as err:
-            mm._create_dns_security(dict())
+            batch = BatchRequest(mm.client)
+            mm._create_dns_security(batch, dict())
+            batch.commit()
         self.assertIn('server error', err.exception.args[0])
 
         with self.assertRaises(F5ModuleError) as err:
-            mm._create_sip_security(dict())
+            batch = BatchRequest(mm.client)
+            mm._create_sip_security(batch, dict())
+            batch.commit()
         self.assertIn('forbidden', err.exception.args[0])
 
         with self.assertRaises(F5ModuleError) as err:
-            mm._create_net_security(dict())
+            batch = BatchRequest(mm.client)
+            mm._create_net_security(batch, dict())
+            batch.commit()
         self.assertIn('access denied', err.exception.args[0])
 
         mm.client.patch = Mock(side_effect=[
@@ -2195,15 +2216,21 @@ class TestManager(unittest.TestCase):
         ])
 
         with self.assertRaises(F5ModuleError) as err:
-            mm._update_dns_security(dict())
+            batch = BatchRequest(mm.client)
+            mm._update_dns_security(batch, dict())
+            batch.commit()
         self.assertIn('access denied', err.exception.args[0])
 
         with self.assertRaises(F5ModuleError) as err:
-            mm._update_sip_security(dict())
+            batch = BatchRequest(mm.client)
+            mm._update_sip_security(batch, dict())
+            batch.commit()
         self.assertIn('forbidden', err.exception.args[0])
 
         with self.assertRaises(F5ModuleError) as err:
-            mm._update_net_security(dict())
+            batch = BatchRequest(mm.client)
+            mm._update_net_security(batch, dict())
+            batch.commit()
         self.assertIn('server error', err.exception.args[0])
 
         mm.client.get = Mock(side_effect=[
@@ -82,10 +82,14 @@ class TestManager(unittest.TestCase):
         self.m1.return_value = True
         self.p2 = patch('ansible_collections.f5networks.f5_bigip.plugins.modules.bigip_software_image.ModuleManager._set_mode_and_ownership')
         self.p2.start()
+        self.p3 = patch('ansible_collections.f5networks.f5_bigip.plugins.modules.bigip_software_image.perf_report')
+        self.m3 = self.p3.start()
+        self.m3.return_value = {}
 
     def tearDown(self):
         self.p1.stop()
         self.p2.stop()
+        self.p3.stop()
 
     def test_create(self, *args):
         set_module_args(dict(
@@ -23,6 +23,7 @@ from ansible_collections.f5networks.f5_bigip.plugins.module_utils.common import
 
 from ansible_collections.f5networks.f5_bigip.tests.compat import unittest
 from ansible_collections.f5networks.f5_bigip.tests.compat.mock import Mock, patch, MagicMock
+from ansible_collections.f5networks.f5_bigip.tests.utils.common import FakeClock
 from ansible_collections.f5networks.f5_bigip.tests.modules.utils import set_module_args
 
 
@@ -70,7 +71,7 @@ class TestManager(unittest.TestCase):
         self.spec = ArgumentSpec()
         self.p1 = patch('ansible_collections.f5networks.f5_bigip.plugins.modules.bigip_software_install.send_teem')
         self.p2 = patch('ansible_collections.f5networks.f5_bigip.plugins.modules.bigip_software_install.F5Client')
-        self.p3 = patch('time.sleep')
+        self.p3 = FakeClock()
         self.p3.start()
         self.m2 = self.p2.start()
         self.m1 = self.p1.start()
@@ -96,8 +97,8 @@ class TestManager(unittest.TestCase):
             ]
         )
 
-        volumes = dict(code=200, contents=load_fixture('load_volumes.json'))
-        volume = dict(code=404, contents=dict())
+        volumes = load_fixture('load_volumes.json')
+        volumes = dict(code=200, contents=dict(volumes, items=volumes['items'][:1]))
         images = dict(code=200, contents=load_fixture('load_software_image.json'))
         hotfixes = dict(code=404, contents=dict())
 
@@ -110,7 +111,7 @@ class TestManager(unittest.TestCase):
         mm = ModuleManager(module=module)
         mm.have = current
         mm.client.get = Mock(
-            side_effect=[volumes, volume, volumes, volume, images, hotfixes]
+            side_effect=[volumes, images, hotfixes]
         )
         mm.client.post = Mock(return_value=dict(code=200, contents=dict()))
 
@@ -118,6 +119,9 @@ class TestManager(unittest.TestCase):
 
         assert results['changed'] is True
         assert results['message'] == 'Started software image installation 13.0.0.iso on volume HD1.2.'
+        # the volumes are read once, rather than before and after the installation is requested
+        assert mm.client.get.call_count == 2
+        assert mm.client.post.call_args[1]['data']['options'] == [{'create-volume': True}, {'reboot': True}]
         assert results['volume_uri'] == '/mgmt/tm/sys/software/volume/HD1.2'
 
     def test_software_install_progress_check(self):
@@ -135,11 +139,12 @@ class TestManager(unittest.TestCase):
         prog_27 = dict(code=200, contents=load_fixture('load_volume_install_27pct.json'))
         prog_75 = dict(code=200, contents=load_fixture('load_volume_install_75pct.json'))
         done = dict(code=200, contents=load_fixture('load_volume_install_complete.json'))
+        mcp_state = dict(code=200, contents=load_fixture('load_sys_mcp_state.json'))
 
         # Override methods in the specific type of manager
         mm = ModuleManager(module=module)
         mm.client.get = Mock(
-            side_effect=[prog_27, prog_75, done]
+            side_effect=[dict(code=200), mcp_state, prog_27, prog_75, done]
         )
 
         results = mm.exec_module()
@@ -161,11 +166,12 @@ class TestManager(unittest.TestCase):
         prog_27 = dict(code=200, contents=load_fixture('load_volume_install_27pct.json'))
         prog_75 = dict(code=200, contents=load_fixture('load_volume_install_75pct.json'))
         done = dict(code=200, contents=load_fixture('load_volume_install_active.json'))
+        mcp_state = dict(code=200, contents=load_fixture('load_sys_mcp_state.json'))
 
         # Override methods in the specific type of manager
         mm = ModuleManager(module=module)
         mm.client.get = Mock(
-            side_effect=[prog_27, prog_75, done]
+            side_effect=[dict(code=200), mcp_state, prog_27, prog_75, done]
         )
 
         results = mm.exec_module()
@@ -318,3 +324,189 @@ class TestManager(unittest.TestCase):
 
         assert results['changed'] is False
         assert results['message'] == 'Device is restarting services, unable to check software installation status.'
+
+
+def volume_collection(generation=29, **statuses):
+    """Returns the volume collection with each named volume in the given status
+
+    Volumes given as a (status, version) tuple have that version installed, other volumes
+    have the version of the test image, volumes missing from the arguments are left out.
+    The named volumes are in the given generation.
+    """
+    volumes = load_fixture('load_volumes.json')
+    template = volumes['items'][1]
+    items = [volumes['items'][0]]
+    for name, status in sorted(statuses.items()):
+        version = '13.0.0'
+        if isinstance(status, tuple):
+            status, version = status
+        items.append(dict(
+            template, name=name, fullPath=name, status=status, version=version, generation=generation
+        ))
+    return dict(code=200, contents=dict(volumes, items=items))
+
+
+class TestManyVolumes(unittest.TestCase):
+    def setUp(self):
+        self.spec = ArgumentSpec()
+        self.p1 = patch('ansible_collections.f5networks.f5_bigip.plugins.modules.bigip_software_install.send_teem')
+        self.p2 = patch('ansible_collections.f5networks.f5_bigip.plugins.modules.bigip_software_install.F5Client')
+        self.p3 = FakeClock()
+        self.p3.start()
+        self.m2 = self.p2.start()
+        self.m1 = self.p1.start()
+        self.m1.return_value = True
+        self.m2.return_value = MagicMock()
+
+    def tearDown(self):
+        self.p1.stop()
+        self.p2.stop()
+        self.p3.stop()
+
+    def manager(self, *responses, **kwargs):
+        args = dict(image='13.0.0.iso', volumes=['HD1.2', 'HD1.3'], state='installed')
+        args.update(kwargs)
+        set_module_args(args)
+        module = AnsibleModule(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode,
+            mutually_exclusive=self.spec.mutually_exclusive
+        )
+        mm = ModuleManager(module=module)
+        mm.have = ApiParameters()
+        mm.have.read_image_from_device = Mock(side_effect=[['13.0.0.iso'], []])
+        mm.client.get = Mock(side_effect=list(responses))
+        mm.client.post = Mock(return_value=dict(code=200, contents=dict()))
+        return mm
+
+    def test_install_on_several_volumes(self, *args):
+        images = dict(code=200, contents=load_fixture('load_software_image.json'))
+        mm = self.manager(
+            volume_collection(**{'HD1.2': ('complete', '12.1.0')}),
+            images,
+            volume_collection(30, **{'HD1.2': 'installing 27.000 pct'}),
+            volume_collection(31, **{'HD1.2': 'installing 75.000 pct', 'HD1.3': 'installing 10.000 pct'}),
+            volume_collection(32, **{'HD1.2': 'complete', 'HD1.3': 'complete'}),
+        )
+
+        results = mm.exec_module()
+
+        assert results['changed'] is True
+        assert results['message'] == 'Software installation on volumes: HD1.2, HD1.3 complete.'
+        assert results['failed_volumes'] == []
+        assert results['progress'] == [
+            dict(name='HD1.2', status='complete', percent=100, version='13.0.0', build='0.0.1645', started=True),
+            dict(name='HD1.3', status='complete', percent=100, version='13.0.0', build='0.0.1645', started=True),
+        ]
+        assert results['task_polling']['polls'] == 4
+        # all installations are started before the volumes are polled, with one request per poll
+        assert mm.client.post.call_count == 2
+        assert [x[1]['data']['volume'] for x in mm.client.post.call_args_list] == ['HD1.2', 'HD1.3']
+        assert [x[1]['data']['options'] for x in mm.client.post.call_args_list] == [[], [{'create-volume': True}]]
+        assert mm.client.get.call_count == 5
+
+    def test_previous_installation_status_is_not_taken_for_the_new_one(self, *args):
+        images = dict(code=200, contents=load_fixture('load_software_image.json'))
+        mm = self.manager(
+            volume_collection(**{'HD1.2': ('complete', '12.1.0'), 'HD1.3': ('failed', '12.1.0')}),
+            images,
+            volume_collection(**{'HD1.2': ('complete', '12.1.0'), 'HD1.3': ('failed', '12.1.0')}),
+            volume_collection(30, **{'HD1.2': 'installing 50.000 pct', 'HD1.3': 'installing 20.000 pct'}),
+            volume_collection(31, **{'HD1.2': 'complete', 'HD1.3': 'complete'}),
+        )
+
+        results = mm.exec_module()
+
+        assert results['changed'] is True
+        assert results['message'] == 'Software installation on volumes: HD1.2, HD1.3 complete.'
+        assert results['failed_volumes'] == []
+        assert [x['version'] for x in results['progress']] == ['13.0.0', '13.0.0']
+        assert mm.client.get.call_count == 5
+
+    def test_failed_installation_retried_on_the_same_version(self, *args):
+        images = dict(code=200, contents=load_fixture('load_software_image.json'))
+        mm = self.manager(
+            volume_collection(**{'HD1.2': 'failed', 'HD1.3': 'complete'}),
+            images,
+            volume_collection(**{'HD1.2': 'failed', 'HD1.3': 'complete'}),
+            volume_collection(30, **{'HD1.2': 'complete', 'HD1.3': 'complete'}),
+        )
+
+        results = mm.exec_module()
+
+        assert results['changed'] is True
+        assert mm.client.post.call_count == 1
+        assert results['failed_volumes'] == []
+        assert [x['status'] for x in results['progress']] == ['complete', 'complete']
+
+    def test_installations_in_progress_are_not_restarted(self, *args):
+        images = dict(code=200, contents=load_fixture('load_software_image.json'))
+        mm = self.manager(
+            volume_collection(**{'HD1.2': 'installing 27.000 pct', 'HD1.3': 'complete'}),
+            images,
+            volume_collection(**{'HD1.2': 'complete', 'HD1.3': 'complete'}),
+        )
+
+        results = mm.exec_module()
+
+        assert results['changed'] is False
+        assert mm.client.post.call_count == 0
+        assert [x['status'] for x in results['progress']] == ['complete', 'complete']
+        assert [x['started'] for x in results['progress']] == [False, False]
+
+    def test_failed_installations_are_reported(self, *args):
+        images = dict(code=200, contents=load_fixture('load_software_image.json'))
+        mm = self.manager(
+            volume_collection(),
+            images,
+            volume_collection(30, **{'HD1.2': 'failed', 'HD1.3': 'complete'}),
+        )
+
+        results = mm.exec_module()
+
+        assert results['changed'] is True
+        assert results['failed_volumes'] == ['HD1.2']
+        assert results['message'] == 'Software installation failed on volumes: HD1.2.'
+
+    def test_failure_reported_before_the_version_is_updated(self, *args):
+        images = dict(code=200, contents=load_fixture('load_software_image.json'))
+        mm = self.manager(
+            volume_collection(**{'HD1.2': ('complete', '12.1.0')}),
+            images,
+            volume_collection(**{'HD1.2': ('complete', '12.1.0'), 'HD1.3': ('failed', None)}),
+            volume_collection(30, **{'HD1.2': ('failed', '12.1.0'), 'HD1.3': ('failed', None)}),
+        )
+
+        results = mm.exec_module()
+
+        assert results['failed_volumes'] == ['HD1.2', 'HD1.3']
+        assert results['message'] == 'Software installation failed on volumes: HD1.2, HD1.3.'
+        assert mm.client.get.call_count == 4
+
+    def test_timeout_raises_while_installing(self, *args):
+        images = dict(code=200, contents=load_fixture('load_software_image.json'))
+        installing = volume_collection(**{'HD1.2': 'installing 50.000 pct', 'HD1.3': 'installing 10.000 pct'})
+        mm = self.manager(volume_collection(), images, *([installing] * 200), timeout=150)
+
+        with self.assertRaises(F5ModuleError) as err:
+            mm.exec_module()
+
+        assert 'Module timeout reached' in str(err.exception)
+        assert mm.waiter.metrics()['waited'] == 150
+
+    def test_check_mode(self, *args):
+        mm = self.manager(volume_collection(), _ansible_check_mode=True)
+
+        results = mm.exec_module()
+
+        assert results['changed'] is True
+        assert mm.client.post.call_count == 0
+        assert [x['status'] for x in results['progress']] == ['waiting', 'waiting']
+
+    def test_activated_state_is_rejected(self, *args):
+        mm = self.manager(state='activated')
+
+        with self.assertRaises(F5ModuleError) as err:
+            mm.exec_module()
+
+        assert "Only one volume can be activated" in str(err.exception)
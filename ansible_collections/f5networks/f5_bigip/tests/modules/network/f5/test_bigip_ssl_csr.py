@@ -69,9 +69,13 @@ class TestManager(unittest.TestCase):
         self.p1 = patch('ansible_collections.f5networks.f5_bigip.plugins.modules.bigip_ssl_csr.send_teem')
         self.m1 = self.p1.start()
         self.m1.return_value = True
+        self.p2 = patch('ansible_collections.f5networks.f5_bigip.plugins.modules.bigip_ssl_csr.perf_report')
+        self.m2 = self.p2.start()
+        self.m2.return_value = {}
 
     def tearDown(self):
         self.p1.stop()
+        self.p2.stop()
 
     def test_create(self, *args):
         set_module_args(dict(
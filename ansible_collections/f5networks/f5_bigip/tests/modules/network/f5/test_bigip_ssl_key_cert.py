@@ -95,9 +95,13 @@ class TestModuleManager(unittest.TestCase):
         self.p1 = patch('ansible_collections.f5networks.f5_bigip.plugins.modules.bigip_ssl_key_cert.send_teem')
         self.m1 = self.p1.start()
         self.m1.return_value = True
+        self.p2 = patch('ansible_collections.f5networks.f5_bigip.plugins.modules.bigip_ssl_key_cert.perf_report')
+        self.m2 = self.p2.start()
+        self.m2.return_value = {}
 
     def tearDown(self):
         self.p1.stop()
+        self.p2.stop()
 
     def test_import_key_no_key_passphrase(self, *args):
         set_module_args(dict(
@@ -19,6 +19,7 @@ from ansible_collections.f5networks.f5_bigip.plugins.module_utils.common import
 from ansible_collections.f5networks.f5_bigip.tests.compat import unittest
 from ansible_collections.f5networks.f5_bigip.tests.compat.mock import Mock, patch
 from ansible_collections.f5networks.f5_bigip.tests.modules.utils import set_module_args
+from ansible_collections.f5networks.f5_bigip.tests.utils.common import FakeClock
 
 
 fixture_path = os.path.join(os.path.dirname(__file__), 'fixtures')
@@ -103,15 +104,19 @@ class TestManager(unittest.TestCase):
 
     def setUp(self):
         self.spec = ArgumentSpec()
-        self.p1 = patch('time.sleep')
-        self.p1.start()
+        self.p1 = FakeClock()
+        self.m1 = self.p1.start()
         self.p2 = patch('ansible_collections.f5networks.f5_bigip.plugins.modules.bigip_ucs.send_teem')
         self.m2 = self.p2.start()
         self.m2.return_value = True
+        self.p3 = patch('ansible_collections.f5networks.f5_bigip.plugins.modules.bigip_ucs.perf_report')
+        self.m3 = self.p3.start()
+        self.m3.return_value = {}
 
     def tearDown(self):
         self.p1.stop()
         self.p2.stop()
+        self.p3.stop()
 
     def test_ucs_default_present(self, *args):
         set_module_args(dict(
@@ -215,3 +220,67 @@ class TestManager(unittest.TestCase):
         with self.assertRaises(F5ModuleError) as res:
             mm.exec_module()
         assert 'Failed to delete' in str(res.exception)
+
+    def test_ucs_load_waits_for_config_load(self, *args):
+        set_module_args(dict(
+            ucs="/root/bigip.localhost.localdomain.ucs",
+            state='installed',
+            task_id='1234',
+            timeout=150
+        ))
+
+        module = AnsibleModule(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode
+        )
+
+        loading = dict(code=200, contents=json.loads(
+            json.dumps(load_fixture('load_sys_mcp_state.json')).replace('full-config-load-succeed', 'none')
+        ))
+        loaded = dict(code=200, contents=load_fixture('load_sys_mcp_state.json'))
+
+        # Override methods to force specific logic in the module to happen
+        mm = ModuleManager(module=module)
+        mm.client.get = Mock(side_effect=[
+            dict(code=503), dict(code=200), loading, dict(code=404),
+            dict(code=200), loading, dict(code=200), loaded
+        ])
+        mm.client.post = Mock()
+
+        results = mm.exec_module()
+
+        assert results['changed'] is True
+        assert results['message'] == 'UCS loaded successfully'
+        assert results['readiness']['ready'] is True
+        assert results['readiness']['probes'] == 4
+        assert self.m1.call_args_list[0][0][0] == 1.5
+        assert mm.client.get.call_args_list[3][0][0] == '/mgmt/tm/task/sys/ucs/1234'
+        mm.client.post.assert_not_called()
+
+    def test_ucs_load_config_load_failed(self, *args):
+        set_module_args(dict(
+            ucs="/root/bigip.localhost.localdomain.ucs",
+            state='installed',
+            task_id='1234',
+            timeout=150
+        ))
+
+        module = AnsibleModule(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode
+        )
+
+        failed = dict(code=200, contents=json.loads(
+            json.dumps(load_fixture('load_sys_mcp_state.json')).replace(
+                'full-config-load-succeed', 'base-config-load-failed'
+            )
+        ))
+
+        # Override methods to force specific logic in the module to happen
+        mm = ModuleManager(module=module)
+        mm.client.get = Mock(side_effect=[dict(code=200), failed, dict(code=404), dict(code=200), failed])
+
+        with self.assertRaises(F5ModuleError) as res:
+            mm.exec_module()
+        assert 'Failed to reload the configuration' in str(res.exception)
+        assert 'base-config-load-failed' in str(res.exception)
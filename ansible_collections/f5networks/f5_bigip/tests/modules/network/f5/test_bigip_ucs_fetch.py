@@ -66,10 +66,14 @@ class TestV1Manager(unittest.TestCase):
         self.p2 = patch('ansible_collections.f5networks.f5_bigip.plugins.modules.bigip_ucs_fetch.send_teem')
         self.m2 = self.p2.start()
         self.m2.return_value = True
+        self.p3 = patch('ansible_collections.f5networks.f5_bigip.plugins.modules.bigip_ucs_fetch.perf_report')
+        self.m3 = self.p3.start()
+        self.m3.return_value = {}
 
     def tearDown(self):
         self.p1.stop()
         self.p2.stop()
+        self.p3.stop()
 
     def test_start_create_task(self, *args):
         task_id = "e7550a12-994b-483f-84ee-761eb9af6750"
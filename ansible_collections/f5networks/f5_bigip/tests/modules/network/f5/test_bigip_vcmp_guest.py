@@ -169,12 +169,16 @@ class TestManager(unittest.TestCase):
         self.p3 = patch('ansible_collections.f5networks.f5_bigip.plugins.modules.bigip_vcmp_guest.send_teem')
         self.m3 = self.p3.start()
         self.m3.return_value = True
+        self.p4 = patch('ansible_collections.f5networks.f5_bigip.plugins.modules.bigip_vcmp_guest.perf_report')
+        self.m4 = self.p4.start()
+        self.m4.return_value = {}
 
     def tearDown(self):
         self.patcher1.stop()
         self.p1.stop()
         self.p2.stop()
         self.p3.stop()
+        self.p4.stop()
 
     def test_create_vcmpguest(self, *args):
         set_module_args(dict(
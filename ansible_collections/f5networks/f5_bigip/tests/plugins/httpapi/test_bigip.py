@@ -8,19 +8,24 @@ __metaclass__ = type
 
 import json
 import os
+import shutil
+import tempfile
+import time
 
 from unittest.mock import (
-    MagicMock, ANY
+    MagicMock, ANY, patch
 )
 from unittest import TestCase
 
 from ansible.errors import AnsibleConnectionFailure
 from ansible.module_utils.six.moves.urllib.error import HTTPError
-from ansible.module_utils.six import StringIO
+from ansible.module_utils.six import StringIO, BytesIO
 from ansible.playbook.play_context import PlayContext
 from ansible.plugins.loader import connection_loader
 
+from ansible_collections.f5networks.f5_bigip.plugins.httpapi.bigip import UploadRanges
 from ansible_collections.f5networks.f5_bigip.plugins.module_utils.common import F5ModuleError
+from ansible_collections.f5networks.f5_bigip.plugins.module_utils.tasks import TaskWaiter
 from ansible_collections.f5networks.f5_bigip.tests.utils.common import (
     connection_response, download_response
 )
@@ -47,6 +52,43 @@ def load_fixture(name):
     return data
 
 
+def ranged_upload(received, fail_at=None):
+    """Returns a send side effect storing uploaded Content-Range slices in received"""
+    failed = []
+
+    def send(url, data, method=None, headers=None):
+        start, end = [int(x) for x in headers['Content-Range'].split('/')[0].split('-')]
+        if fail_at is not None and start <= fail_at <= end and not failed:
+            failed.append((start, end))
+            raise HTTPError('http://bigip.local', 400, '', {}, StringIO('{"errorMessage": "ERROR"}'))
+        received.append((start, end, bytes(data)))
+        return True
+    return send
+
+
+def ranged_download(content, fail_at=None, requested=None, content_length=False, truncate=False):
+    """Returns a send side effect serving Content-Range requests from content"""
+    def send(url, data, headers=None, **kwargs):
+        start, end = [int(x) for x in headers['Content-Range'].split('/')[0].split('-')]
+        if requested is not None:
+            requested.append((start, end))
+        if fail_at is not None and start <= fail_at <= end:
+            raise HTTPError('http://bigip.local', 400, '', {}, StringIO('{"errorMessage": "ERROR"}'))
+        body = content[start:end + 1]
+        if truncate:
+            body = body[:-1]
+        response = MagicMock()
+        response.status = 200
+        response.headers = {
+            'Content-Type': 'application/octet-stream',
+            'Content-Range': '{0}-{1}/{2}'.format(start, start + len(body) - 1, len(content))
+        }
+        if content_length:
+            response.headers['Content-Length'] = str(len(body))
+        return response, BytesIO(body)
+    return send
+
+
 class TestBigIPHttpapi(TestCase):
     def setUp(self):
         self.pc = PlayContext()
@@ -79,6 +121,24 @@ class TestBigIPHttpapi(TestCase):
 
         assert "Authentication process failed, server returned: {'errorMessage': 'ERROR'}" in str(res.exception)
 
+    def test_busy_response_headers_reach_task_waiter(self):
+        self.connection.send.side_effect = [
+            HTTPError('http://bigip.local', 503, '', {'Retry-After': '7'}, StringIO('{"code": 503}')),
+            connection_response({'id': '1', 'results': [{'message': 'success'}]}),
+        ]
+        waiter = TaskWaiter(jitter=0)
+
+        with patch('time.sleep') as sleep:
+            for x in waiter.polls(60):
+                response = self.connection.httpapi.send_request(path='/mgmt/shared/appsvcs/task/1')
+                if waiter.busy(response):
+                    continue
+                break
+
+        assert response['code'] == 200
+        assert waiter.busy_count == 1
+        sleep.assert_called_once_with(7)
+
     def test_login_success_properties_populated(self):
         self.connection.send.return_value = connection_response(
             load_fixture('tmos_auth_response.json')
@@ -97,6 +157,22 @@ class TestBigIPHttpapi(TestCase):
         assert self.connection.httpapi.telemetry() is False
         assert self.connection.httpapi.network_os() == 'f5networks.f5_bigip.bigip'
 
+    def test_queue_telemetry_adds_platform_and_cached_version(self):
+        self.connection.httpapi._teem = MagicMock()
+        self.connection.httpapi.set_option('metadata_ttl', 300)
+        self.connection.httpapi.set_metadata('tmos_version', '15.1.0.1')
+
+        self.connection.httpapi.queue_telemetry(dict(version=None, telemetry=[]))
+        self.connection.httpapi.invalidate_metadata()
+        self.connection.httpapi.queue_telemetry(dict(version=None, telemetry=[]))
+
+        records = [x[0][0] for x in self.connection.httpapi._teem.queue.call_args_list]
+        assert records == [
+            dict(platform='bigip', version='15.1.0.1', telemetry=[]),
+            dict(platform='bigip', version=None, telemetry=[]),
+        ]
+        self.connection.send.assert_not_called()
+
     def test_upload_file(self):
         self.connection.send.return_value = True
         binary_file = os.path.join(fixture_path, 'test_binary_file.mock')
@@ -136,6 +212,64 @@ class TestBigIPHttpapi(TestCase):
         assert 'Failed to upload file too many times.' in str(res.exception)
         assert self.connection.send.call_count == 3
 
+    def test_upload_file_retries_failed_range_only(self):
+        content = os.urandom(8 * 1024 * 1024)
+        src = os.path.join(self.tmpdir(), 'fakefile')
+        with open(src, 'wb') as fh:
+            fh.write(content)
+        received = []
+        self.connection.send.side_effect = ranged_upload(received, fail_at=7 * 1024 * 1024)
+
+        self.connection.httpapi.upload_file('/fake/path/to/upload', src)
+
+        assert self.connection.send.call_count == 3
+        assert [(x[0], x[1]) for x in received] == [(0, 7340031), (7340032, 8388607)]
+        assert b''.join(x[2] for x in received) == content
+
+    def test_upload_file_parallel(self):
+        content = os.urandom(30 * 1024 * 1024 + 123)
+        src = os.path.join(self.tmpdir(), 'fakefile')
+        with open(src, 'wb') as fh:
+            fh.write(content)
+        self.connection.httpapi.get_option = MagicMock(side_effect={'upload_concurrency': 4}.get)
+        received = []
+        self.connection.send.side_effect = ranged_upload(received)
+
+        assert self.connection.httpapi.upload_file('/fake/path/to/upload', src) is True
+
+        # The first range creates the file, the final range completes it.
+        assert received[0][0] == 0
+        assert received[-1][1] == len(content) - 1
+        assert b''.join(x[2] for x in sorted(received)) == content
+
+    def test_upload_file_parallel_failure(self):
+        content = os.urandom(30 * 1024 * 1024)
+        src = os.path.join(self.tmpdir(), 'fakefile')
+        with open(src, 'wb') as fh:
+            fh.write(content)
+        self.connection.httpapi.get_option = MagicMock(side_effect={'upload_concurrency': 4}.get)
+        self.connection.send.side_effect = HTTPError(
+            'http://bigip.local', 400, '', {}, StringIO('{"errorMessage": "ERROR"}')
+        )
+
+        with self.assertRaises(AnsibleConnectionFailure) as res:
+            self.connection.httpapi.upload_file('/fake/path/to/upload', src)
+
+        assert 'Failed to upload file too many times.' in str(res.exception)
+        assert self.connection.send.call_count == 3
+
+    def test_upload_ranges_adapt_chunk_size(self):
+        ranges = UploadRanges(30 * 1024 * 1024)
+        assert ranges.next() == (0, 7 * 1024 * 1024)
+        ranges.adapt(60)
+        assert ranges.chunk_size == 3584 * 1024
+        assert ranges.last() == (30 * 1024 * 1024 - 3584 * 1024, 30 * 1024 * 1024)
+        for x in range(5):
+            ranges.adapt(60)
+        assert ranges.chunk_size == UploadRanges.min_chunk_size
+        ranges.adapt(0.1)
+        assert ranges.chunk_size == 2 * 1024 * 1024
+
     def test_upload_file_no_true_path_no_dest(self):
         self.connection.send.return_value = True
         string_to_upload = 'this is a string to be converted to file contents'
@@ -156,6 +290,15 @@ class TestBigIPHttpapi(TestCase):
             headers={'Content-Range': '0-48/49', 'Content-Type': 'application/octet-stream', 'Connection': 'keep-alive'}
         )
 
+    def test_upload_file_no_true_path_large_payload(self):
+        content = 'ab' * (4 * 1024 * 1024 + 10)
+        received = []
+        self.connection.send.side_effect = ranged_upload(received)
+        self.connection.httpapi.upload_file('/fake/path/to/upload', content, dest='fake_file', true_path=False)
+
+        assert [(x[0], x[1]) for x in received] == [(0, 7340031), (7340032, 8388627)]
+        assert b''.join(x[2] for x in received) == content.encode()
+
     def test_download_file(self):
         self.connection.send.return_value = download_response('ab' * 50000)
         self.connection.httpapi.download_file('/fake/path/to/download/fakefile', '/tmp/fakefile')
@@ -255,6 +398,74 @@ class TestBigIPHttpapi(TestCase):
 
         assert 'Invalid Content-Length value returned: -1 ,the value should be greater than 0' == str(res.exception)
 
+    def test_download_file_parallel(self):
+        content = os.urandom(3 * 1024 * 1024 + 123)
+        self.connection.httpapi.get_option = MagicMock(side_effect={'download_concurrency': 4}.get)
+        self.connection.send.side_effect = ranged_download(content)
+        dest = os.path.join(self.tmpdir(), 'fakefile')
+
+        assert self.connection.httpapi.download_file('/fake/path/to/download/fakefile', dest) is True
+
+        with open(dest, 'rb') as fh:
+            assert fh.read() == content
+        assert not os.path.exists(dest + '.ranges')
+        # The first request only discovers the file size.
+        assert self.connection.send.call_args_list[0][1]['headers']['Content-Range'] == '0-524287/0'
+
+    def test_download_file_parallel_resume(self):
+        content = os.urandom(2 * 1024 * 1024)
+        self.connection.httpapi.get_option = MagicMock(side_effect={'download_concurrency': 2}.get)
+        dest = os.path.join(self.tmpdir(), 'fakefile')
+        requested = []
+        self.connection.send.side_effect = ranged_download(content, fail_at=1024 * 1024, requested=requested)
+
+        with self.assertRaises(HTTPError):
+            self.connection.httpapi.download_file('/fake/path/to/download/fakefile', dest)
+
+        assert os.path.exists(dest + '.ranges')
+        assert [x for x in requested if x[0] <= 1024 * 1024 <= x[1]]
+
+        del requested[:]
+        self.connection.send.side_effect = ranged_download(content, requested=requested)
+        self.connection.httpapi.download_file('/fake/path/to/download/fakefile', dest)
+
+        with open(dest, 'rb') as fh:
+            assert fh.read() == content
+        assert not os.path.exists(dest + '.ranges')
+        # Only the size discovery request and the ranges missing after the failure are sent again.
+        assert requested[0] == (0, 524287)
+        assert sum(x[1] - x[0] + 1 for x in requested[1:]) < len(content)
+
+    def test_download_asm_file_parallel(self):
+        content = os.urandom(1572864)
+        self.connection.httpapi.get_option = MagicMock(side_effect={'download_concurrency': 3}.get)
+        self.connection.send.side_effect = ranged_download(content, content_length=True)
+        dest = os.path.join(self.tmpdir(), 'fakefile')
+
+        self.connection.httpapi.download_asm_file('/fake/path/to/download/fakefile', dest, len(content))
+
+        with open(dest, 'rb') as fh:
+            assert fh.read() == content
+        for call in self.connection.send.call_args_list:
+            assert call[1]['headers']['Content-Range'].endswith('/1572864')
+
+    def test_download_file_parallel_short_range_raises(self):
+        content = os.urandom(1024 * 1024)
+        self.connection.httpapi.get_option = MagicMock(side_effect={'download_concurrency': 2}.get)
+        self.connection.send.side_effect = ranged_download(content, truncate=True)
+        dest = os.path.join(self.tmpdir(), 'fakefile')
+
+        with self.assertRaises(F5ModuleError) as res:
+            self.connection.httpapi.download_file('/fake/path/to/download/fakefile', dest)
+
+        assert 'bytes for range' in str(res.exception)
+        assert os.path.exists(dest + '.ranges')
+
+    def tmpdir(self):
+        path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, path)
+        return path
+
     def test_logout_returns_none(self):
         self.connection._auth = None
         nothing = self.connection.httpapi.logout()
@@ -300,3 +511,132 @@ class TestBigIPHttpapi(TestCase):
 
         self.connection.httpapi.login('FakeUser1', 'fakepass')
         assert self.connection.httpapi.get_user() == 'FakeUser1'
+
+    def test_token_extended_before_expiry(self):
+        self.connection.send.side_effect = [
+            connection_response(load_fixture('tmos_auth_response.json')),
+            connection_response({'timeout': 2400}),
+            connection_response({'kind': 'tm:sys:syscollectionstate'}),
+        ]
+        self.connection.httpapi.login('foo', 'bar')
+        self.connection.httpapi.token_started -= 1100
+        self.connection.httpapi.token_expires -= 1100
+
+        response = self.connection.httpapi.send_request(path='/mgmt/tm/sys', method='GET')
+
+        assert response['code'] == 200
+        url, data = self.connection.send.call_args_list[1][0]
+        assert url == '/mgmt/shared/authz/tokens/P42ZHJN5HS5DH4KM4ENK3AFCLP'
+        assert json.loads(data) == {'timeout': 2300}
+        assert self.connection.httpapi.token_timeout == 2300
+        assert self.connection.httpapi.token_expires - time.time() > 1100
+
+    def test_token_renewed_at_longest_lifetime(self):
+        self.connection.send.side_effect = [
+            connection_response(load_fixture('tmos_auth_response.json')),
+            connection_response(load_fixture('tmos_auth_response.json')),
+            connection_response({'kind': 'tm:sys:syscollectionstate'}),
+        ]
+        self.connection.set_options(direct={'remote_user': 'foo', 'password': 'bar'})
+        self.connection.httpapi.login('foo', 'bar')
+        self.connection.httpapi.token_timeout = 36000
+        self.connection.httpapi.token_expires = time.time() + 60
+
+        self.connection.httpapi.send_request(path='/mgmt/tm/sys', method='GET')
+
+        assert self.connection.send.call_count == 3
+        assert self.connection.send.call_args_list[1][0][0] == '/mgmt/shared/authn/login'
+        assert self.connection.httpapi.token_expires - time.time() > 1100
+
+    def test_token_cache_reused_by_next_connection(self):
+        path = os.path.join(self.tmpdir(), 'tokens.json')
+        self.connection.httpapi.set_option('token_cache', path)
+        self.connection.send.return_value = connection_response(load_fixture('tmos_auth_response.json'))
+        self.connection.httpapi.login('foo', 'bar')
+        self.connection.httpapi.logout()
+        assert self.connection.send.call_count == 1
+        assert oct(os.stat(path).st_mode & 0o777) == '0o600'
+
+        connection = connection_loader.get("httpapi", self.pc, "/dev/null")
+        connection.send = MagicMock()
+        connection.httpapi.set_option('token_cache', path)
+        connection.httpapi.login('foo', 'bar')
+
+        connection.send.assert_not_called()
+        assert connection._auth == {'X-F5-Auth-Token': 'P42ZHJN5HS5DH4KM4ENK3AFCLP'}
+
+        exc = HTTPError('http://bigip.local', 401, '', {}, StringIO('{"errorMessage": "not allowed"}'))
+        connection.httpapi.handle_httperror(exc)
+        with open(path) as fh:
+            assert json.load(fh) == {}
+
+    def test_perf_report_disabled_by_default(self):
+        self.connection.send.return_value = connection_response({'kind': 'tm:sys:syscollectionstate'})
+        self.connection.httpapi.send_request(path='/mgmt/tm/sys', method='GET')
+
+        assert self.connection.httpapi.perf_report(0) is None
+
+    def test_perf_stats_record_requests(self):
+        path = os.path.join(self.tmpdir(), 'trace.json')
+        self.connection.httpapi.set_option('perf_stats', True)
+        self.connection.httpapi.set_option('perf_trace', path)
+        self.connection.httpapi.set_option('perf_trace_format', 'chrome')
+        self.connection.send.side_effect = [
+            connection_response({'name': 'web'}),
+            connection_response({'name': 'app'}),
+            HTTPError('http://bigip.local', 404, '', {}, StringIO('{"code": 404}')),
+        ]
+        started = time.time()
+
+        self.connection.httpapi.send_request(path='/mgmt/tm/ltm/pool/~Common~web', method='GET')
+        self.connection.httpapi.send_request(path='/mgmt/tm/ltm/pool/~Common~app?$select=name', method='GET')
+        self.connection.httpapi.send_request(path='/mgmt/tm/ltm/pool/', method='POST', payload={'name': 'db'})
+        report = self.connection.httpapi.perf_report(started)
+
+        assert report['requests'] == 3
+        assert report['errors'] == 1
+        assert report['bytes_out'] == len('{"name": "db"}')
+        endpoints = dict(((x['method'], x['path']), x) for x in report['top_endpoints'])
+        assert endpoints[('GET', '/mgmt/tm/ltm/pool/{name}')]['count'] == 2
+        assert endpoints[('POST', '/mgmt/tm/ltm/pool/')]['errors'] == 1
+        with open(path) as fh:
+            events = json.loads(fh.read().rstrip().rstrip(',') + ']')
+        assert [x['name'] for x in events] == [
+            'GET /mgmt/tm/ltm/pool/{name}', 'GET /mgmt/tm/ltm/pool/{name}', 'POST /mgmt/tm/ltm/pool/'
+        ]
+        assert events[2]['args']['status'] == 404
+
+    def test_perf_stats_count_auth_refreshes(self):
+        self.connection.httpapi.set_option('perf_stats', True)
+        self.connection.send.side_effect = [
+            connection_response(load_fixture('tmos_auth_response.json')),
+            connection_response({'timeout': 2400}),
+            connection_response({'kind': 'tm:sys:syscollectionstate'}),
+        ]
+        started = time.time()
+        self.connection.httpapi.login('foo', 'bar')
+        self.connection.httpapi.token_started -= 1100
+        self.connection.httpapi.token_expires -= 1100
+
+        self.connection.httpapi.send_request(path='/mgmt/tm/sys', method='GET')
+
+        report = self.connection.httpapi.perf_report(started)
+        assert report['requests'] == 3
+        assert report['auth_refreshes'] == 1
+
+    def test_perf_stats_record_range_status(self):
+        path = os.path.join(self.tmpdir(), 'trace.json')
+        self.connection.httpapi.set_option('perf_stats', True)
+        self.connection.httpapi.set_option('perf_trace', path)
+        self.connection.httpapi.set_option('perf_trace_format', 'chrome')
+        self.connection.send.side_effect = [
+            connection_response({}, status=201),
+            download_response('fake content', status=206),
+        ]
+        binary_file = os.path.join(fixture_path, 'test_binary_file.mock')
+        self.connection.httpapi.upload_file('/fake/path/to/upload', binary_file)
+        self.connection.httpapi._send_range('/fake/path/to/download', 0, 11, 12)
+
+        with open(path) as fh:
+            events = json.loads(fh.read().rstrip().rstrip(',') + ']')
+        assert [x['args']['status'] for x in events] == [201, 206]
@@ -8,6 +8,7 @@ __metaclass__ = type
 
 import json
 import os
+import time
 from unittest.mock import MagicMock
 from unittest import TestCase
 
@@ -154,7 +155,7 @@ class TestBigIPHttpapi(TestCase):
         ]
         mock_response = MagicMock()
         self.connection.httpapi.get_option = mock_response
-        self.connection.httpapi.get_option.return_value = 'RadiusServer'
+        self.connection.httpapi.get_option.side_effect = {'bigiq_provider': 'RadiusServer'}.get
 
         self.connection.httpapi.login('baz', 'bar')
 
@@ -194,7 +195,7 @@ class TestBigIPHttpapi(TestCase):
         ]
         mock_response = MagicMock()
         self.connection.httpapi.get_option = mock_response
-        self.connection.httpapi.get_option.return_value = '15633ac8-362c-4b05-b1f9-f77f3cd8921e'
+        self.connection.httpapi.get_option.side_effect = {'bigiq_provider': '15633ac8-362c-4b05-b1f9-f77f3cd8921e'}.get
 
         self.connection.httpapi.login('baz', 'bar')
 
@@ -268,7 +269,7 @@ class TestBigIPHttpapi(TestCase):
         ]
         mock_response = MagicMock()
         self.connection.httpapi.get_option = mock_response
-        self.connection.httpapi.get_option.return_value = 'local'
+        self.connection.httpapi.get_option.side_effect = {'bigiq_provider': 'local'}.get
 
         self.connection.httpapi.login('baz', 'bar')
         assert self.connection.httpapi.access_token == token_1
@@ -287,7 +288,7 @@ class TestBigIPHttpapi(TestCase):
         ]
         mock_response = MagicMock()
         self.connection.httpapi.get_option = mock_response
-        self.connection.httpapi.get_option.return_value = 'local'
+        self.connection.httpapi.get_option.side_effect = {'bigiq_provider': 'local'}.get
         self.connection.httpapi.login('baz', 'bar')
 
         with self.assertRaises(AnsibleConnectionFailure) as exc:
@@ -304,7 +305,7 @@ class TestBigIPHttpapi(TestCase):
         ]
         mock_response = MagicMock()
         self.connection.httpapi.get_option = mock_response
-        self.connection.httpapi.get_option.return_value = 'local'
+        self.connection.httpapi.get_option.side_effect = {'bigiq_provider': 'local'}.get
         self.connection.httpapi.login('baz', 'bar')
 
         with self.assertRaises(AnsibleConnectionFailure) as exc:
@@ -373,7 +374,7 @@ class TestBigIPHttpapi(TestCase):
         ]
         mock_response = MagicMock()
         self.connection.httpapi.get_option = mock_response
-        self.connection.httpapi.get_option.return_value = 'local'
+        self.connection.httpapi.get_option.side_effect = {'bigiq_provider': 'local'}.get
 
         token_1 = "eyJraWQiOiJkMzExNjIxNC1hOWRkLTQ4NTYtODI0MC05MDY1OTZjZWFkOTgiLCJhbGciOiJSUzM4NCJ9.eyJpc3Mi" \
                   "OiJCSUctSVEiLCJqdGkiOiJnTkNUd2VxLVFkS1ZMNzFraVN4OUZ3Iiwic3ViIjoiYWRtaW4iLCJhdWQiOiIxNzIuM" \
@@ -406,6 +407,53 @@ class TestBigIPHttpapi(TestCase):
         assert res3 is True
         assert self.connection._auth == {'X-F5-Auth-Token': token_2}
 
+    def test_token_refreshed_before_expiry(self):
+        self.connection.send.side_effect = [
+            connection_response(load_fixture('local_auth_response_2.json')),
+            connection_response(load_fixture('refresh_response.json')),
+            connection_response({'items': []}),
+        ]
+        self.connection.httpapi.get_option = MagicMock()
+        self.connection.httpapi.get_option.side_effect = {'bigiq_provider': 'local'}.get
+
+        self.connection.httpapi.login('baz', 'bar')
+        token = self.connection.httpapi.access_token
+        self.connection.httpapi.token_expires = time.time() + 60
+
+        response = self.connection.httpapi.send_request(path='/mgmt/cm/device/licensing/pool/regkey/licenses')
+
+        assert response['code'] == 200
+        assert self.connection.send.call_args_list[1][0][0] == '/mgmt/shared/authn/exchange'
+        assert self.connection.httpapi.access_token != token
+        assert self.connection.httpapi.token_expires - time.time() > 200
+
+    def test_login_and_refresh_send_payload_as_request_body(self):
+        sent = []
+
+        def send(path, data, retries=None, **kwargs):
+            # the signature of the httpapi connection send method
+            sent.append((path, json.loads(data) if data else None, kwargs))
+            return self.mock_send(path, data, **kwargs)
+
+        self.connection.send = send
+        self.mock_send.side_effect = [
+            connection_response(load_fixture('local_auth_response_2.json')),
+            connection_response(load_fixture('refresh_response.json')),
+            connection_response({'items': []}),
+        ]
+        self.connection.httpapi.get_option = MagicMock()
+        self.connection.httpapi.get_option.side_effect = {'bigiq_provider': 'local'}.get
+
+        self.connection.httpapi.login('baz', 'bar')
+        refresh = self.connection.httpapi.refresh_token
+        self.connection.httpapi.token_expires = time.time() + 60
+        response = self.connection.httpapi.send_request(path='/mgmt/cm/device/licensing/pool/regkey/licenses')
+
+        assert response['code'] == 200
+        assert sent[0][:2] == ('/mgmt/shared/authn/login', {'username': 'baz', 'password': 'bar'})
+        assert sent[1][:2] == ('/mgmt/shared/authn/exchange', {'refreshToken': {'token': refresh}})
+        assert all('data' not in x[2] for x in sent)
+
     def test_resonse_to_json_raises(self):
         with self.assertRaises(F5ModuleError) as err:
             self.connection.httpapi._response_to_json('invalid json}')
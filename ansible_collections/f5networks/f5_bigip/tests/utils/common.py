@@ -8,7 +8,7 @@ __metaclass__ = type
 
 import json
 
-from unittest.mock import Mock, MagicMock
+from unittest.mock import Mock, MagicMock, patch
 
 from ansible.module_utils.six import BytesIO
 from ansible_collections.f5networks.f5_bigip.plugins.module_utils.constants import BASE_HEADERS
@@ -39,3 +39,28 @@ def download_response(file, status=200, headers=None):
     else:
         response_mock.headers.update({'Content-Range': content_range})
     return response_mock, response_mock_buffer
+
+
+class FakeClock(object):
+    """Patches time.time and time.sleep, sleeping moves the clock forward instead of waiting
+
+    Waits with a wall-clock deadline then reach it without taking any time. Like a
+    ``time.sleep`` patch, ``start`` returns the mock recording the sleeps.
+    """
+
+    def __init__(self, now=1600000000.0):
+        self.now = now
+        self.sleep = Mock(side_effect=self.advance)
+        self.patches = [patch('time.time', side_effect=lambda: self.now), patch('time.sleep', self.sleep)]
+
+    def advance(self, seconds):
+        self.now += seconds
+
+    def start(self):
+        for item in self.patches:
+            item.start()
+        return self.sleep
+
+    def stop(self):
+        for item in self.patches:
+            item.stop()